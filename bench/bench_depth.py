@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# bench/bench_depth.py
+#
+# depth 프레임 하나 인코딩 비용: 예전 depth 분기 (astype/nan_to_num/clip/정규화 + cv2.imencode gray JPEG, 매 프레임 할당)
+# vs frame_encoding.DepthColorizer (미리 만든 버퍼 + LUT) 의 jpeg(gray/turbo) / png16 / raw16.
+#
+#   python3 bench/bench_depth.py                       # 640x480, 500 프레임
+#   python3 bench/bench_depth.py --width 1280 --height 720 --count 200
+#
+# gray JPEG은 예전 출력과 같은 8-bit 값을 만드는지도 확인한다 (정규화 전 단계 차이로 경계값에서 1 차이는 허용).
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from frame_encoding import DepthColorizer  # noqa: E402
+
+JPEG_QUALITY = 15
+DEPTH_RANGE = (0.1, 2.0)
+
+
+def legacy_depth_jpeg(img_cv: np.ndarray, jpeg_quality: int, min_d: float, max_d: float) -> bytes:
+    """websocket_server_final._encode_image 의 예전 depth 분기 그대로"""
+    img_cv_float = img_cv.astype(np.float32)
+    img_cv_float = np.nan_to_num(img_cv_float, nan=max_d, posinf=max_d, neginf=min_d)
+
+    clipped_depth = np.clip(img_cv_float, min_d, max_d)
+    if (max_d - min_d) == 0: normalized_depth = np.zeros_like(clipped_depth)
+    else: normalized_depth = (clipped_depth - min_d) / (max_d - min_d)
+
+    depth_8bit_gray = (normalized_depth * 255).astype(np.uint8)
+    ret, buffer = cv2.imencode(".jpg", depth_8bit_gray, [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality])
+    if not ret: raise ValueError("cv2.imencode failed")
+    return buffer.tobytes()
+
+
+def make_depth_frames(width: int, height: int, count: int):
+    """프레임마다 조금씩 다른 depth (NaN 구멍 포함) 몇 장을 돌려 씀"""
+    rng = np.random.default_rng(0)
+    frames = []
+    for index in range(min(count, 8)):
+        depth = np.linspace(0.05, 2.5, height, dtype=np.float32)[:, None].repeat(width, axis=1)
+        depth += rng.normal(0.0, 0.01, size=depth.shape).astype(np.float32)
+        depth[:, (index * 40) % width:(index * 40) % width + 60] = 0.4
+        depth[rng.integers(0, height, 500), rng.integers(0, width, 500)] = np.nan
+        frames.append(depth)
+    return frames
+
+
+def timed(label: str, encode, frames, count: int):
+    encode(frames[0]) # 버퍼 생성 등 첫 호출 비용 제외
+    started = time.perf_counter()
+    size = 0
+    for index in range(count):
+        size += len(encode(frames[index % len(frames)]))
+    per_frame_ms = (time.perf_counter() - started) / count * 1000
+    print(f"{label:<22} {per_frame_ms:8.3f} ms/frame  {size / count / 1024:8.1f} KiB/frame")
+    return per_frame_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="depth encode cost: legacy vs DepthColorizer")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--count", type=int, default=500)
+    args = parser.parse_args()
+
+    frames = make_depth_frames(args.width, args.height, args.count)
+    min_d, max_d = DEPTH_RANGE
+
+    # 예전 gray 출력과 같은 값인지 확인
+    gray = DepthColorizer(DEPTH_RANGE, "jpeg", "gray")
+    legacy_float = np.clip(np.nan_to_num(frames[0], nan=max_d, posinf=max_d, neginf=min_d), min_d, max_d)
+    legacy_gray = ((legacy_float - min_d) / (max_d - min_d) * 255).astype(np.uint8)
+    diff = np.abs(gray.colorize(frames[0])[:, :, 0].astype(np.int16) - legacy_gray.astype(np.int16))
+    print(f"gray vs legacy 8-bit: max diff {diff.max()}, differing pixels {np.count_nonzero(diff)}/{diff.size}")
+
+    legacy_ms = timed("legacy gray jpeg", lambda depth: legacy_depth_jpeg(depth, JPEG_QUALITY, min_d, max_d), frames, args.count)
+    for label, colorizer in (
+        ("colorizer gray jpeg", gray),
+        ("colorizer turbo jpeg", DepthColorizer(DEPTH_RANGE, "jpeg", "turbo")),
+        ("colorizer png16", DepthColorizer(DEPTH_RANGE, "png16")),
+        ("colorizer raw16", DepthColorizer(DEPTH_RANGE, "raw16")),
+    ):
+        per_frame_ms = timed(label, lambda depth: colorizer.encode("bench_depth", depth, JPEG_QUALITY), frames, args.count)
+        print(f"{'':<22} {legacy_ms / per_frame_ms:8.2f}x vs legacy")
+
+
+if __name__ == "__main__":
+    main()
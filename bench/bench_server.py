@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# bench/bench_server.py
+#
+# websocket_server_final 전체 경로 벤치마크 (Isaac Sim / ROS 2 / 로봇 없이).
+#   - shm_producer_sim.py 로 shm_mobile_rgb, shm_hand_rgb, shm_map 을 --fps 로 채움
+#   - 서버는 bench/fake_ros.py 의 rclpy 대역 위에서 그대로 실행되고, /image_signal, /slave_info, /robot_to_gui 를 주입
+#   - 클라이언트 수마다 /ws/image, /ws/data, /ws/ros_teleop_bridge 에 합성 클라이언트를 N개씩 붙여 측정
+#
+#   python3 bench/bench_server.py --clients 1 4 16 --duration 10 --output bench_server.json
+#   python3 bench/bench_server.py --clients 8 --fps 60 --slave-hz 500
+#   python3 bench/bench_server.py --clients 4 16 --encoder process     # ENCODER_MODE = "process" 비교
+#   python3 bench/bench_server.py --clients 1 4 16 --replay ./data/data_1 --replay-speed max
+#       녹화한 에피소드를 서버 replay 모드로 재생 (producer / 메시지 주입 없음). 매번 같은 입력이라 websocket 계층 회귀 비교용
+#
+# 측정 항목 (클라이언트 수별): 클라이언트당/전체 frames/s (/ws/image binary는 카메라 하나당 메시지 하나), capture -> 클라이언트 수신 latency 분위수,
+# 카메라별 인코딩 시간 (GET /metrics momad_image_encode_seconds), 서버 프로세스(+ encoder worker) CPU (%)와 클라이언트당 CPU,
+# /ws/data, /ws/ros_teleop_bridge 수신 rate. 결과는 표로 출력하고 --output 이 있으면 JSON으로 저장.
+# 서버 CPU는 /proc/<pid>/stat 기준 (Linux). 다른 OS에서는 null.
+#
+# 클라이언트 수마다 producer와 서버를 새로 띄우므로 단계끼리 latency window/통계가 섞이지 않는다.
+# --serve 는 내부용 (서버 자식 프로세스).
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+
+IMAGE_FRAME_HEADER_FORMAT = "<4sBBHqqI" # websocket_server_final.IMAGE_FRAME_HEADER 와 같아야 함
+SERVER_READY_TIMEOUT_S = 20.0
+
+
+# --- 서버 쪽 (--serve) ---
+def _run_at(rate_hz: float, publish, is_running):
+    period = 1.0 / rate_hz
+    next_tick = time.perf_counter()
+    while is_running():
+        publish()
+        next_tick += period
+        time.sleep(max(0.0, next_tick - time.perf_counter()))
+
+
+def _inject_messages(bus, args):
+    """/image_signal, /slave_info, /robot_to_gui 를 실제 퍼블리셔처럼 각자 주기로 bus에 넣음"""
+    from momad_msgs.msg import ControlValue, GuiValue
+    from std_msgs.msg import Header
+
+    # 서버 노드가 구독을 만들 때까지 대기 (startup_event -> ros2_thread_spin)
+    while "/slave_info" not in bus.subscriptions:
+        time.sleep(0.05)
+    is_running = lambda: bus.ok
+
+    def publish_signal():
+        msg = Header(frame_id="new_images_ready")
+        now_ns = time.time_ns()
+        msg.stamp.sec, msg.stamp.nanosec = divmod(now_ns, 1_000_000_000)
+        bus.publish("/image_signal", msg)
+
+    slave_seq = [0]
+    def publish_slave():
+        slave_seq[0] += 1
+        msg = ControlValue(stamp=time.time())
+        msg.robotarm_state.position[0] = float(slave_seq[0] % 360)
+        bus.publish("/slave_info", msg)
+
+    def publish_gui():
+        msg = GuiValue(battery=100.0 - (time.time() % 100.0), linear_accel=0.5, steer=0.1)
+        bus.publish("/robot_to_gui", msg)
+
+    for rate_hz, publish in ((args.fps, publish_signal), (args.slave_hz, publish_slave), (args.gui_hz, publish_gui)):
+        if rate_hz > 0:
+            threading.Thread(target=_run_at, args=(rate_hz, publish, is_running), daemon=True).start()
+
+
+def serve(args):
+    sys.path.insert(0, BENCH_DIR)
+    import fake_ros
+    bus = fake_ros.install()
+
+    import uvicorn
+    import websocket_server_final as server
+    server.ENCODER_MODE = args.encoder
+    if args.replay:
+        server.REPLAY_EPISODE = args.replay
+        server.REPLAY_SPEED = 0.0 if args.replay_speed.lower() == "max" else float(args.replay_speed)
+        server.REPLAY_LOOP = True # 측정 구간보다 짧은 에피소드도 끊기지 않도록
+    else:
+        threading.Thread(target=_inject_messages, args=(bus, args), daemon=True).start()
+    uvicorn.run(server.app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+# --- 측정 (클라이언트 쪽) ---
+def _process_cpu_seconds(pid: int):
+    """/proc/<pid>/stat 의 utime + stime (초), 자식 프로세스(ENCODER_MODE = "process" worker) 포함. 지원하지 않으면 None"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        total = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
+    for task in os.listdir(f"/proc/{pid}/task"):
+        try:
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                children = f.read().split()
+        except OSError:
+            continue
+        for child in children:
+            total += _process_cpu_seconds(int(child)) or 0.0
+    return total
+
+
+def _http_get(port: int, path: str) -> bytes:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=5) as response:
+        return response.read()
+
+
+_ENCODE_METRIC = re.compile(r'^momad_image_encode_seconds_(sum|count)\{camera="([^"]+)"\} (\S+)$', re.M)
+
+def _encode_totals(port: int) -> dict:
+    """camera -> [sum 초, count] (GET /metrics)"""
+    totals = {}
+    for kind, cam_key, value in _ENCODE_METRIC.findall(_http_get(port, "/metrics").decode()):
+        totals.setdefault(cam_key, [0.0, 0])[0 if kind == "sum" else 1] = float(value)
+    return totals
+
+
+def _latency_summary(values) -> dict:
+    if not values:
+        return {"count": 0}
+    array = np.asarray(values)
+    p50, p95, p99 = np.percentile(array, (50, 95, 99))
+    return {"count": len(values), "p50": round(float(p50), 2), "p95": round(float(p95), 2),
+            "p99": round(float(p99), 2), "max": round(float(array.max()), 2)}
+
+
+class ClientStats:
+    __slots__ = ("messages", "latencies_ms")
+
+    def __init__(self):
+        self.messages = 0
+        self.latencies_ms = []
+
+
+async def _image_client(port: int, stats: ClientStats, measuring: asyncio.Event, stop: asyncio.Event):
+    import struct
+    import websockets
+    header = struct.Struct(IMAGE_FRAME_HEADER_FORMAT)
+    async with websockets.connect(f"ws://127.0.0.1:{port}/ws/image?format=binary", max_size=None) as ws:
+        while not stop.is_set():
+            try:
+                message = await asyncio.wait_for(ws.recv(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+            if isinstance(message, str):
+                payload = json.loads(message)
+                if payload.get("type") == "ping": # adaptive quality가 RTT를 알 수 있도록 실제 클라이언트처럼 응답
+                    await ws.send(json.dumps({"type": "pong", "t": payload.get("t")}))
+                continue
+            if measuring.is_set():
+                capture_stamp_ns = header.unpack_from(message, 0)[4]
+                stats.messages += 1
+                stats.latencies_ms.append((time.time_ns() - capture_stamp_ns) / 1e6)
+
+
+async def _data_client(port: int, stats: ClientStats, measuring: asyncio.Event, stop: asyncio.Event):
+    import websockets
+    async with websockets.connect(f"ws://127.0.0.1:{port}/ws/data", max_size=None) as ws:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(ws.recv(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+            if measuring.is_set():
+                stats.messages += 1
+
+
+async def _teleop_client(port: int, stats: ClientStats, measuring: asyncio.Event, stop: asyncio.Event, command_hz: float):
+    import websockets
+    from teleop_codec import ControlValueRecord, pack_teleop_frame, unpack_teleop_frame
+    async with websockets.connect(f"ws://127.0.0.1:{port}/ws/ros_teleop_bridge?format=binary", max_size=None) as ws:
+        async def send_commands():
+            record = ControlValueRecord()
+            seq = 0
+            while command_hz > 0 and not stop.is_set():
+                seq += 1
+                record.stamp = time.time()
+                await ws.send(pack_teleop_frame(seq, record.pack()))
+                await asyncio.sleep(1.0 / command_hz)
+
+        sender = asyncio.create_task(send_commands())
+        try:
+            while not stop.is_set():
+                try:
+                    message = await asyncio.wait_for(ws.recv(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                if measuring.is_set():
+                    # slave stamp는 주입 시각(time.time()) -> /slave_info 콜백 -> websocket 수신까지
+                    stats.messages += 1
+                    stats.latencies_ms.append((time.time() - unpack_teleop_frame(message)[1][0]) * 1000.0)
+        finally:
+            sender.cancel()
+
+
+async def _measure(port: int, clients: int, warmup: float, duration: float, command_hz: float) -> dict:
+    measuring, stop = asyncio.Event(), asyncio.Event()
+    image_stats = [ClientStats() for _ in range(clients)]
+    data_stats = [ClientStats() for _ in range(clients)]
+    teleop_stats = [ClientStats() for _ in range(clients)]
+    tasks = [asyncio.create_task(_image_client(port, stats, measuring, stop)) for stats in image_stats]
+    tasks += [asyncio.create_task(_data_client(port, stats, measuring, stop)) for stats in data_stats]
+    tasks += [asyncio.create_task(_teleop_client(port, stats, measuring, stop, command_hz)) for stats in teleop_stats]
+
+    await asyncio.sleep(warmup)
+    encode_before = await asyncio.to_thread(_encode_totals, port)
+    measuring.set()
+    started = time.perf_counter()
+    await asyncio.sleep(duration)
+    measuring.clear()
+    elapsed = time.perf_counter() - started
+    encode_after = await asyncio.to_thread(_encode_totals, port)
+    latency_stats = json.loads(await asyncio.to_thread(_http_get, port, "/stats/latency"))
+    stop.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    errors = [repr(result) for result in results if isinstance(result, BaseException)]
+
+    encode = {}
+    for cam_key, (total_s, count) in encode_after.items():
+        before_s, before_count = encode_before.get(cam_key, (0.0, 0))
+        jobs = count - before_count
+        encode[cam_key] = {
+            "jobs_per_s": round(jobs / elapsed, 1),
+            "mean_ms": round((total_s - before_s) / jobs * 1000.0, 2) if jobs else None,
+            "capture_to_encoded_ms": latency_stats["cameras"].get(cam_key, {}).get("encoded", {"count": 0}),
+        }
+
+    def endpoint_summary(stats_list):
+        messages = [stats.messages for stats in stats_list]
+        return {
+            "per_client_msgs_per_s": round(float(np.mean(messages)) / elapsed, 1),
+            "total_msgs_per_s": round(sum(messages) / elapsed, 1),
+            "delivery_ms": _latency_summary([value for stats in stats_list for value in stats.latencies_ms]),
+        }
+
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "image": endpoint_summary(image_stats),
+        "data": endpoint_summary(data_stats),
+        "teleop": endpoint_summary(teleop_stats),
+        "encode": encode,
+        "errors": errors,
+    }
+
+
+def _wait_server_ready(port: int, server: subprocess.Popen):
+    deadline = time.monotonic() + SERVER_READY_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"benchmark server exited with code {server.returncode}")
+        try:
+            _http_get(port, "/stats/images")
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"benchmark server did not answer on port {port} within {SERVER_READY_TIMEOUT_S:.0f}s")
+
+
+def _stop_process(process: subprocess.Popen):
+    if process.poll() is None:
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def run_step(args, clients: int) -> dict:
+    output = None if args.verbose else subprocess.DEVNULL
+    producer = server = None
+    serve_args = [sys.executable, os.path.abspath(__file__), "--serve", "--port", str(args.port), "--fps", str(args.fps),
+                  "--slave-hz", str(args.slave_hz), "--gui-hz", str(args.gui_hz), "--encoder", args.encoder]
+    if args.replay:
+        serve_args += ["--replay", os.path.abspath(args.replay), "--replay-speed", args.replay_speed]
+    else:
+        producer = subprocess.Popen(
+            [sys.executable, os.path.join(REPO_DIR, "shm_producer_sim.py"), "--fps", str(args.fps), "--layout", args.layout],
+            cwd=REPO_DIR, stdout=output, stderr=output)
+    try:
+        if producer is not None:
+            time.sleep(0.5) # 세그먼트 생성 대기
+        server = subprocess.Popen(serve_args, cwd=REPO_DIR, stdout=output, stderr=output)
+        _wait_server_ready(args.port, server)
+
+        cpu_before, client_cpu_before = _process_cpu_seconds(server.pid), time.process_time()
+        started = time.perf_counter()
+        result = asyncio.run(_measure(args.port, clients, args.warmup, args.duration, args.command_hz))
+        wall_s = time.perf_counter() - started
+        cpu_after, client_cpu_after = _process_cpu_seconds(server.pid), time.process_time()
+    finally:
+        if server is not None:
+            _stop_process(server)
+        if producer is not None:
+            _stop_process(producer)
+
+    # CPU는 warmup 포함 클라이언트가 붙어 있던 전체 구간 기준
+    server_cpu = None
+    if cpu_before is not None and cpu_after is not None:
+        server_cpu = round((cpu_after - cpu_before) / wall_s * 100.0, 1)
+    return {
+        "clients": clients,
+        **result,
+        "server_cpu_percent": server_cpu,
+        "server_cpu_percent_per_client": round(server_cpu / clients, 2) if server_cpu is not None else None,
+        "client_cpu_percent": round((client_cpu_after - client_cpu_before) / wall_s * 100.0, 1),
+    }
+
+
+def _print_table(results):
+    print(f"{'clients':>7} {'img msg/s/cl':>12} {'img p50':>8} {'img p95':>8} {'img p99':>8} "
+          f"{'enc ms':>7} {'data/s/cl':>9} {'teleop p50':>10} {'srv cpu%':>8} {'cpu%/cl':>7}")
+    for result in results:
+        delivery = result["image"]["delivery_ms"]
+        encode_ms = [value["mean_ms"] for value in result["encode"].values() if value["mean_ms"] is not None]
+        teleop = result["teleop"]["delivery_ms"]
+        print(f"{result['clients']:>7} {result['image']['per_client_msgs_per_s']:>12.1f} "
+              f"{delivery.get('p50', float('nan')):>8.2f} {delivery.get('p95', float('nan')):>8.2f} "
+              f"{delivery.get('p99', float('nan')):>8.2f} "
+              f"{(sum(encode_ms) / len(encode_ms)) if encode_ms else float('nan'):>7.2f} "
+              f"{result['data']['per_client_msgs_per_s']:>9.1f} {teleop.get('p50', float('nan')):>10.2f} "
+              f"{result['server_cpu_percent'] if result['server_cpu_percent'] is not None else float('nan'):>8.1f} "
+              f"{result['server_cpu_percent_per_client'] if result['server_cpu_percent_per_client'] is not None else float('nan'):>7.2f}")
+        if result["errors"]:
+            print(f"        client errors: {result['errors'][:3]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="websocket_server_final end-to-end benchmark (simulated SHM + ROS)")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16], help="clients per endpoint, one step each")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per step")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds after connecting before measuring")
+    parser.add_argument("--fps", type=float, default=30.0, help="SHM producer and /image_signal rate")
+    parser.add_argument("--layout", choices=("seqlock", "raw"), default="seqlock")
+    parser.add_argument("--encoder", choices=("thread", "process"), default="thread", help="server ENCODER_MODE")
+    parser.add_argument("--slave-hz", type=float, default=200.0, help="/slave_info rate")
+    parser.add_argument("--gui-hz", type=float, default=20.0, help="/robot_to_gui rate")
+    parser.add_argument("--command-hz", type=float, default=100.0, help="teleop commands per client per second")
+    parser.add_argument("--replay", metavar="EPISODE_DIR", help="drive the server from a recorded episode instead of the producer/ROS injection")
+    parser.add_argument("--replay-speed", default="max", help="replay speed: 1 = real time, N = N x, max = no pacing")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--verbose", action="store_true", help="show producer/server output")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+
+    results = []
+    for clients in args.clients:
+        print(f"--- {clients} client(s) per endpoint: warmup {args.warmup:.0f}s, measure {args.duration:.0f}s")
+        results.append(run_step(args, clients))
+    _print_table(results)
+
+    if args.output:
+        config = {key: value for key, value in vars(args).items() if key not in ("serve", "output", "verbose")}
+        with open(args.output, "w") as f:
+            json.dump({"config": config, "results": results}, f, indent=2)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
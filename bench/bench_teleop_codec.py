@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# bench/bench_teleop_codec.py
+#
+# /ws/ros_teleop_bridge 변환 경로 microbenchmark (messages/s).
+#   python3 bench/bench_teleop_codec.py --count 200000
+#
+# recv: JSON text -> ControlValue (+ sensor_data 갱신 값)   legacy: np.array(...).tolist() + 메시지 새로 생성
+# send: ControlValue -> JSON payload                        legacy: slave_info_bridge_callback의 dict/list 재구성
+# momad_msgs가 없으면 같은 필드를 가진 단순 Python 객체로 메시지 생성/대입 비용만 흉내낸다.
+
+import argparse
+import json
+import os
+import sys
+import time
+import types
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from teleop_codec import CONTROL_VALUE_STRUCT, ControlValueRecord, control_value_to_json, pack_control_value_msg  # noqa: E402
+
+try:
+    from momad_msgs.msg import ControlValue, GripperValue, MobileValue, RobotarmValue
+    MSG_SOURCE = "momad_msgs"
+except ImportError:
+    MSG_SOURCE = "plain python objects (momad_msgs not installed)"
+
+    def _plain(name, **defaults):
+        def __init__(self, **kwargs):
+            for key, value in defaults.items():
+                setattr(self, key, value() if callable(value) else value)
+            for key, value in kwargs.items():
+                setattr(self, key, value)
+        return type(name, (), {"__init__": __init__})
+
+    RobotarmValue = _plain("RobotarmValue", position=list, velocity=list, force=list)
+    GripperValue = _plain("GripperValue", position=0.0, velocity=0.0, force=0.0)
+    MobileValue = _plain("MobileValue", linear_accel=0.0, linear_brake=0.0, steer=0.0, gear=True)
+    ControlValue = _plain("ControlValue", stamp=0.0, robotarm_state=RobotarmValue, gripper_state=GripperValue, mobile_state=MobileValue)
+
+
+SAMPLE = {
+    "stamp": 1718000000.125,
+    "RobotarmValue": {"position": [0.1, -12.5, 90.0, 45.25, 90.0, -30.0], "velocity": [0.01] * 6, "force": [0.5] * 6},
+    "GripperValue": {"position": 42.0, "velocity": 0.0, "force": 1.5},
+    "MobileValue": {"linear_accel": 0.3, "linear_brake": 0.0, "steer": -0.2, "gear": True},
+}
+
+
+def legacy_recv(text):
+    data = json.loads(text)
+    msg = ControlValue()
+    msg.stamp = data.get("stamp", 0.0)
+    rv_data = data.get("RobotarmValue", {})
+    msg.robotarm_state = RobotarmValue(
+        position=np.array(rv_data.get("position", [0.0, 0.0, 90.0, 90.0, 90.0, 90.0]), dtype=np.float64).tolist(),
+        velocity=np.array(rv_data.get("velocity", [0.0]*6), dtype=np.float64).tolist(),
+        force=np.array(rv_data.get("force", [0.0]*6), dtype=np.float64).tolist()
+    )
+    gv_data = data.get("GripperValue", {})
+    msg.gripper_state = GripperValue(
+        position=float(gv_data.get("position", 0.0)),
+        velocity=float(gv_data.get("velocity", 0.0)),
+        force=float(gv_data.get("force", 0.0))
+    )
+    mv_data = data.get("MobileValue", {})
+    msg.mobile_state = MobileValue(
+        linear_accel=float(mv_data.get("linear_accel", 0.0)),
+        linear_brake=float(mv_data.get("linear_brake", 0.0)),
+        steer=float(mv_data.get("steer", 0.0)),
+        gear=bool(mv_data.get("gear", True))
+    )
+    return msg, list(msg.robotarm_state.position)
+
+
+def make_recv(record, msg):
+    def recv(text):
+        record.load_json(json.loads(text))
+        record.fill_ros(msg)
+        return msg, tuple(record.arm_position)
+    return recv
+
+
+def legacy_send(msg):
+    return {
+        "stamp": msg.stamp,
+        "RobotarmValue": {
+            "position": list(msg.robotarm_state.position),
+            "velocity": list(msg.robotarm_state.velocity),
+            "force":    list(msg.robotarm_state.force),
+        },
+        "GripperValue": {
+            "position": msg.gripper_state.position,
+            "velocity": msg.gripper_state.velocity,
+            "force":    msg.gripper_state.force,
+        },
+        "MobileValue": {
+            "linear_accel": msg.mobile_state.linear_accel,
+            "linear_brake": msg.mobile_state.linear_brake,
+            "steer": msg.mobile_state.steer,
+            "gear": msg.mobile_state.gear
+        }
+    }
+
+
+def record_send(msg):
+    # 콜백: 메시지 -> packed bytes, 보낼 때: bytes -> dict (여기서는 매 메시지 둘 다 하는 최악의 경우)
+    return control_value_to_json(CONTROL_VALUE_STRUCT.unpack(pack_control_value_msg(msg)))
+
+
+def run(label, func, arg, count):
+    for _ in range(min(count, 1000)):
+        func(arg)
+    started = time.perf_counter()
+    for _ in range(count):
+        func(arg)
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed
+    print(f"{label:<34} {rate:>12,.0f} msg/s   {elapsed / count * 1e6:7.2f} us/msg")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="teleop bridge conversion microbenchmark")
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    text = json.dumps(SAMPLE)
+    record = ControlValueRecord()
+    msg = ControlValue()
+    record.load_json(SAMPLE)
+    record.fill_ros(msg)
+    ros_msg, _ = legacy_recv(text) # legacy 쪽 입력은 list 필드를 가진 메시지
+
+    print(f"messages: {MSG_SOURCE}")
+    before = run("recv legacy (json -> msg)", legacy_recv, text, args.count)
+    after = run("recv record (json -> msg)", make_recv(ControlValueRecord(), ControlValue()), text, args.count)
+    print(f"{'':<34} x{after / before:.2f}")
+    before = run("send legacy (msg -> dict)", legacy_send, ros_msg, args.count)
+    after = run("send record (msg -> bytes -> dict)", record_send, ros_msg, args.count)
+    print(f"{'':<34} x{after / before:.2f}")
+    after = run("callback record (msg -> bytes)", pack_control_value_msg, ros_msg, args.count)
+    print(f"{'':<34} x{after / before:.2f}")
+
+
+if __name__ == "__main__":
+    main()
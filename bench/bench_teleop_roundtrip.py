@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# bench/bench_teleop_roundtrip.py
+#
+# /ws/ros_teleop_bridge round-trip latency: JSON vs binary (?format=binary).
+# master 명령을 보내고, 같은 stamp가 slave 쪽(/slave_info)으로 돌아와 다시 websocket으로 올 때까지의 시간을 잰다.
+#
+#   uvicorn websocket_server_final:app --port 8000            # 서버
+#   python3 bench/bench_teleop_roundtrip.py --loopback          # /master_info_to_robot -> /slave_info 되돌려주는 노드 포함
+#   python3 bench/bench_teleop_roundtrip.py --rate 500 --count 5000 --format binary
+#
+# 실제 로봇/시뮬레이터가 /slave_info를 내보내고 있으면 --loopback 없이 돌려도 되지만,
+# 그 경우 돌아오는 stamp가 보낸 stamp와 같지 않으므로 latency 대신 수신 rate만 출력된다.
+# 서버 없이 --codec-only로 돌리면 메시지 하나 encode/decode 비용만 비교한다.
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import websockets
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from teleop_codec import ControlValueRecord, pack_teleop_frame, unpack_teleop_frame  # noqa: E402
+
+
+def _start_loopback_node():
+    """/master_info_to_robot를 그대로 /slave_info로 다시 퍼블리시하는 rclpy 노드 (별도 스레드에서 spin)"""
+    import rclpy
+    from momad_msgs.msg import ControlValue
+
+    rclpy.init()
+    node = rclpy.create_node("teleop_roundtrip_loopback")
+    publisher = node.create_publisher(ControlValue, "/slave_info", 10)
+    node.create_subscription(ControlValue, "/master_info_to_robot", publisher.publish, 10)
+    thread = threading.Thread(target=rclpy.spin, args=(node,), daemon=True)
+    thread.start()
+
+    def shutdown():
+        node.destroy_node()
+        rclpy.try_shutdown()
+    return shutdown
+
+
+def _command(record: ControlValueRecord, stamp: float, index: int):
+    record.stamp = stamp
+    record.arm_position[0] = float(index % 360)
+    record.mobile[0] = 0.1
+
+
+async def run_client(url: str, fmt: str, rate: float, count: int):
+    uri = f"{url}?format=binary" if fmt == "binary" else url
+    record = ControlValueRecord()
+    sent_at = {}
+    latencies_ms = []
+    received = 0
+    done = asyncio.Event()
+
+    async with websockets.connect(uri, max_size=None) as ws:
+        async def receiver():
+            nonlocal received
+            async for message in ws:
+                received_at = time.perf_counter()
+                if isinstance(message, bytes):
+                    _, values = unpack_teleop_frame(message)
+                    stamp = values[0]
+                else:
+                    stamp = json.loads(message)["stamp"]
+                received += 1
+                started = sent_at.pop(stamp, None)
+                if started is not None:
+                    latencies_ms.append((received_at - started) * 1000.0)
+                    if len(latencies_ms) >= count:
+                        done.set()
+
+        recv_task = asyncio.create_task(receiver())
+        period = 1.0 / rate
+        next_tick = time.perf_counter()
+        started = next_tick
+        for index in range(count):
+            # stamp는 보낸 메시지를 식별하는 용도 (loopback이 그대로 돌려줌)
+            stamp = 1_000_000.0 + index
+            _command(record, stamp, index)
+            sent_at[stamp] = time.perf_counter()
+            if fmt == "binary":
+                await ws.send(pack_teleop_frame(index, record.pack()))
+            else:
+                await ws.send(json.dumps(record.to_json()))
+            next_tick += period
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+        try:
+            await asyncio.wait_for(done.wait(), timeout=2.0)
+        except asyncio.TimeoutError:
+            pass
+        elapsed = time.perf_counter() - started
+        recv_task.cancel()
+
+    print(f"[{fmt}] sent {count} at {rate:.0f} Hz, received {received} slave messages in {elapsed:.2f}s")
+    if latencies_ms:
+        values = np.array(latencies_ms)
+        print(f"[{fmt}] round-trip ms: matched {len(values)}/{count}  p50 {np.percentile(values, 50):.2f}  "
+              f"p90 {np.percentile(values, 90):.2f}  p99 {np.percentile(values, 99):.2f}  max {values.max():.2f}")
+    else:
+        print(f"[{fmt}] no matching stamps came back (is a loopback / slave echo running?)")
+
+
+def codec_only(count: int):
+    record = ControlValueRecord()
+    _command(record, 1.0, 1)
+    text = json.dumps(record.to_json())
+    frame = pack_teleop_frame(1, record.pack())
+    for label, encode, decode in (
+        ("json", lambda: json.dumps(record.to_json()), lambda: record.load_json(json.loads(text))),
+        ("binary", lambda: pack_teleop_frame(1, record.pack()), lambda: record.load_values(unpack_teleop_frame(frame)[1])),
+    ):
+        started = time.perf_counter()
+        for _ in range(count):
+            encode()
+        encode_us = (time.perf_counter() - started) / count * 1e6
+        started = time.perf_counter()
+        for _ in range(count):
+            decode()
+        decode_us = (time.perf_counter() - started) / count * 1e6
+        size = len(text.encode()) if label == "json" else len(frame)
+        print(f"{label:<7} {size:4d} bytes  encode {encode_us:6.2f} us  decode {decode_us:6.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/ws/ros_teleop_bridge round-trip benchmark")
+    parser.add_argument("--url", default="ws://localhost:8000/ws/ros_teleop_bridge")
+    parser.add_argument("--format", choices=("json", "binary", "both"), default="both")
+    parser.add_argument("--rate", type=float, default=100.0, help="commands per second")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--loopback", action="store_true", help="echo /master_info_to_robot back on /slave_info via rclpy")
+    parser.add_argument("--codec-only", action="store_true", help="only compare encode/decode cost, no server")
+    args = parser.parse_args()
+
+    if args.codec_only:
+        codec_only(args.count)
+        return
+
+    shutdown = _start_loopback_node() if args.loopback else None
+    try:
+        for fmt in (("json", "binary") if args.format == "both" else (args.format,)):
+            asyncio.run(run_client(args.url, fmt, args.rate, args.count))
+    finally:
+        if shutdown:
+            shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# bench/fake_ros.py
+#
+# 벤치마크용 rclpy / std_msgs / sensor_msgs / momad_msgs 대역.
+# ROS 2와 momad_msgs가 없는 머신에서 websocket_server_final을 그대로 띄우기 위해 sys.modules에 끼워 넣는다.
+#   import fake_ros; bus = fake_ros.install()       # websocket_server_final import 전에 호출
+#   bus.publish("/slave_info", msg)                  # 구독 콜백은 spin 스레드에서 실행 (실제 executor와 같은 스레드 모델)
+#
+# 서버 코드가 쓰는 API만 흉내낸다 (publisher/subscription/clock/logger/QoS). 서버 실행용이 아니라 벤치마크 전용.
+
+import queue
+import sys
+import threading
+import time
+import types
+
+ARM_JOINTS = 6
+
+
+class FakeBus:
+    """topic -> 콜백 목록. publish()는 어느 스레드에서나 호출 가능하고, 콜백은 spin() 중인 스레드에서 실행"""
+    def __init__(self):
+        self.subscriptions = {}
+        self.published = {} # topic -> 메시지 수 (구독자가 없는 topic 포함)
+        self._pending = queue.Queue()
+        self._lock = threading.Lock()
+        self.ok = False
+
+    def subscribe(self, topic: str, callback):
+        with self._lock:
+            self.subscriptions.setdefault(topic, []).append(callback)
+
+    def publish(self, topic: str, msg):
+        self.published[topic] = self.published.get(topic, 0) + 1
+        for callback in self.subscriptions.get(topic, ()):
+            self._pending.put((callback, msg))
+
+    def spin(self):
+        while self.ok:
+            try:
+                callback, msg = self._pending.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            callback(msg)
+
+
+def _message_class(class_name: str, /, **defaults):
+    """필드 기본값(callable이면 인스턴스마다 새로 생성)을 가진 단순 메시지 클래스"""
+    def __init__(self, **kwargs):
+        for field, default in defaults.items():
+            setattr(self, field, default() if callable(default) else default)
+        for field, value in kwargs.items():
+            setattr(self, field, value)
+
+    def __repr__(self):
+        return f"{class_name}({', '.join(f'{field}={getattr(self, field)!r}' for field in defaults)})"
+    return type(class_name, (), {"__init__": __init__, "__repr__": __repr__})
+
+
+def install() -> FakeBus:
+    bus = FakeBus()
+
+    # --- messages ---
+    Time = _message_class("Time", sec=0, nanosec=0)
+    std_msgs = types.ModuleType("std_msgs")
+    std_msgs_msg = types.ModuleType("std_msgs.msg")
+    std_msgs_msg.Header = _message_class("Header", stamp=Time, frame_id="")
+    std_msgs_msg.Float32 = _message_class("Float32", data=0.0)
+    std_msgs_msg.Float32MultiArray = _message_class("Float32MultiArray", data=list)
+    std_msgs_msg.String = _message_class("String", data="")
+    std_msgs_msg.Bool = _message_class("Bool", data=False)
+    std_msgs.msg = std_msgs_msg
+
+    sensor_msgs = types.ModuleType("sensor_msgs")
+    sensor_msgs_msg = types.ModuleType("sensor_msgs.msg")
+    sensor_msgs_msg.JointState = _message_class("JointState", name=list, position=list, velocity=list, effort=list)
+    sensor_msgs.msg = sensor_msgs_msg
+
+    momad_msgs = types.ModuleType("momad_msgs")
+    momad_msgs_msg = types.ModuleType("momad_msgs.msg")
+    momad_msgs_msg.RobotarmValue = _message_class(
+        "RobotarmValue", position=lambda: [0.0] * ARM_JOINTS, velocity=lambda: [0.0] * ARM_JOINTS, force=lambda: [0.0] * ARM_JOINTS)
+    momad_msgs_msg.GripperValue = _message_class("GripperValue", position=0.0, velocity=0.0, force=0.0)
+    momad_msgs_msg.MobileValue = _message_class("MobileValue", linear_accel=0.0, linear_brake=0.0, steer=0.0, gear=True)
+    momad_msgs_msg.ControlValue = _message_class(
+        "ControlValue", stamp=0.0, robotarm_state=momad_msgs_msg.RobotarmValue,
+        gripper_state=momad_msgs_msg.GripperValue, mobile_state=momad_msgs_msg.MobileValue)
+    momad_msgs_msg.GuiValue = _message_class(
+        "GuiValue", battery=0.0, linear_accel=0.0, steer=0.0, gripper_opening=0.0,
+        joint_angles=lambda: [0.0] * ARM_JOINTS, cartesian_position=lambda: [0.0] * 6, force_torque=lambda: [0.0] * 6)
+    momad_msgs.msg = momad_msgs_msg
+
+    # --- rclpy ---
+    rclpy = types.ModuleType("rclpy")
+    rclpy_node = types.ModuleType("rclpy.node")
+    rclpy_qos = types.ModuleType("rclpy.qos")
+
+    class _ClockTime:
+        def __init__(self, nanoseconds: int):
+            self.nanoseconds = nanoseconds
+
+        def to_msg(self):
+            return Time(sec=self.nanoseconds // 1_000_000_000, nanosec=self.nanoseconds % 1_000_000_000)
+
+    class _Clock:
+        def now(self):
+            return _ClockTime(time.time_ns())
+
+    class _Logger:
+        def __init__(self, name):
+            self.name = name
+
+        def info(self, message): print(f"INFO: [{self.name}] {message}")
+        def warn(self, message): print(f"WARN: [{self.name}] {message}")
+        def error(self, message): print(f"ERROR: [{self.name}] {message}")
+        def debug(self, message): pass
+
+    class _Publisher:
+        def __init__(self, topic):
+            self.topic = topic
+
+        def publish(self, msg):
+            bus.publish(self.topic, msg)
+
+    class Node:
+        def __init__(self, node_name: str, **kwargs):
+            self._name = node_name
+            self.context = types.SimpleNamespace(ok=lambda: bus.ok)
+
+        def create_publisher(self, msg_type, topic, qos):
+            return _Publisher(topic)
+
+        def create_subscription(self, msg_type, topic, callback, qos):
+            bus.subscribe(topic, callback)
+            return (topic, callback)
+
+        def get_logger(self):
+            return _Logger(self._name)
+
+        def get_clock(self):
+            return _Clock()
+
+        def destroy_node(self):
+            pass
+
+    def init(*args, **kwargs):
+        bus.ok = True
+
+    def shutdown(*args, **kwargs):
+        bus.ok = False
+
+    rclpy.init = init
+    rclpy.ok = lambda *args, **kwargs: bus.ok
+    rclpy.shutdown = shutdown
+    rclpy.try_shutdown = shutdown
+    rclpy.spin = lambda node, *args, **kwargs: bus.spin()
+    rclpy.create_node = lambda name, **kwargs: Node(name)
+    rclpy_node.Node = Node
+    rclpy_qos.QoSProfile = lambda **kwargs: kwargs
+    rclpy_qos.ReliabilityPolicy = types.SimpleNamespace(RELIABLE=1, BEST_EFFORT=2)
+    rclpy_qos.HistoryPolicy = types.SimpleNamespace(KEEP_LAST=1, KEEP_ALL=2)
+    rclpy.node = rclpy_node
+    rclpy.qos = rclpy_qos
+
+    sys.modules.update({
+        "rclpy": rclpy, "rclpy.node": rclpy_node, "rclpy.qos": rclpy_qos,
+        "std_msgs": std_msgs, "std_msgs.msg": std_msgs_msg,
+        "sensor_msgs": sensor_msgs, "sensor_msgs.msg": sensor_msgs_msg,
+        "momad_msgs": momad_msgs, "momad_msgs.msg": momad_msgs_msg,
+    })
+    return bus
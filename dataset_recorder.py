@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# dataset_recorder.py
+#
+# 서버 안에서 도는 데이터셋 recorder (/ws/setting 의 start_recording / save_recording / discard_recording).
+#
+#   recorder = DatasetRecorder()
+#   recorder.start(sources, hz=30, file_format="npz", directory="./data", name="data_1", meta={...})
+#   recorder.save()      # 남은 chunk를 쓰고 에피소드 디렉터리를 확정. 저장 경로 반환
+#   recorder.discard()   # 메모리 chunk는 버리고, 이미 디스크로 넘긴 chunk가 있으면 임시 디렉터리만 지움
+#   recorder.status()    # /ws/setting 으로 보내는 record rate / drop 통계
+#
+# - sampling 스레드가 HZ 주기마다 RecordSource.fill()로 미리 할당한 chunk 버퍼의 row 하나를 채운다.
+#   카메라 source는 SHM view에서 chunk row로 바로 복사 (중간 복사본 없음).
+# - chunk가 차면 bounded queue로 writer 스레드에 넘긴다. queue가 차 있으면 그 chunk는 버리고 dropped["queue_full"]에 더한다.
+#   sampling이 밀려서 건너뛴 tick은 dropped["overrun"].
+# - writer 스레드는 chunk를 RECORDER_MEMORY_LIMIT_BYTES까지 메모리에 들고 있다가 넘치면 오래된 것부터
+#   "<name>.partial-<pid>" 디렉터리에 쓴다. 짧은 에피소드는 save 전까지 디스크를 건드리지 않는다.
+# - 에피소드 = 디렉터리 하나: meta.json + 열(column) 단위 데이터
+#     npz:     chunk_00000.npz, chunk_00001.npz, ... (chunk마다 열 이름 -> 배열)
+#     hdf5:    data.h5 (열마다 dataset 하나, chunk 단위로 resize + append). h5py 필요
+#     parquet: data.parquet (chunk마다 row group). 다차원 열은 fixed-size binary (shape/dtype은 meta.json). pyarrow 필요
+#   그 외 형식(json/csv/yaml 등 이미지 배열에 맞지 않는 텍스트 형식)이나 라이브러리가 없으면 npz로 저장하고 status에 남긴다.
+
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+
+import numpy as np
+
+try:
+    import h5py
+except ImportError: # 선택 의존성: 없으면 hdf5 요청은 npz로 저장
+    h5py = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError: # 선택 의존성: 없으면 parquet 요청은 npz로 저장
+    pa = pq = None
+
+RECORDER_MAX_HZ = 1000.0
+RECORDER_CHUNK_SECONDS = 1.0                 # chunk 하나에 담는 시간 (HZ * 이 값 = chunk row 수)
+RECORDER_CHUNK_MAX_BYTES = 64 * 1024 * 1024  # 카메라가 많거나 HZ가 높으면 row 수를 줄여 chunk 크기를 제한
+RECORDER_QUEUE_CHUNKS = 4                    # sampling -> writer queue 크기 (chunk 단위)
+RECORDER_MEMORY_LIMIT_BYTES = 512 * 1024 * 1024
+RECORDER_DEFAULT_FORMAT = "npz"
+RECORDER_FORMATS = ("npz", "hdf5", "h5", "parquet") # 이 밖의 형식은 저장할 수 없음 (hdf5/parquet는 라이브러리가 없으면 npz로)
+
+
+def available_formats():
+    formats = ["npz"]
+    if h5py is not None: formats.append("hdf5")
+    if pq is not None: formats.append("parquet")
+    return formats
+
+
+def resolve_format(file_format: str):
+    """(실제 저장 형식, fallback 사유 또는 None)"""
+    requested = str(file_format or RECORDER_DEFAULT_FORMAT).lower()
+    if requested == "h5": requested = "hdf5"
+    if requested in available_formats():
+        return requested, None
+    if requested in ("hdf5", "parquet"):
+        return RECORDER_DEFAULT_FORMAT, f"{requested} needs {'h5py' if requested == 'hdf5' else 'pyarrow'}; saved as npz"
+    return RECORDER_DEFAULT_FORMAT, f"{requested} is not a columnar format; saved as npz"
+
+
+class RecordSource:
+    """sample 하나에 chunk row 하나를 채우는 source.
+    fill(row)는 row (shape, dtype 배열, 제자리에 씀)를 채우고 값의 stamp (ns, 모르면 0)를, 값이 없으면 None을 반환한다.
+    split(block)은 파일에 쓸 열 {이름: 배열}을 만든다 (기본은 {name: block}). writer 스레드에서 호출"""
+    def __init__(self, name: str, shape, dtype, fill, split=None):
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.fill = fill
+        self.split = split or (lambda block: {name: block})
+
+    @property
+    def row_nbytes(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64)) * self.dtype.itemsize
+
+
+class _Chunk:
+    """sampling 스레드가 채우는 열 버퍼 묶음. rows개까지 채운 뒤 writer로 넘어가면 다시 쓰지 않는다"""
+    def __init__(self, index: int, sources, rows: int):
+        self.index = index
+        self.count = 0
+        self.timestamp_ns = np.zeros(rows, dtype=np.int64)
+        self.data = {source.name: np.empty((rows,) + source.shape, dtype=source.dtype) for source in sources}
+        self.stamp_ns = {source.name: np.zeros(rows, dtype=np.int64) for source in sources}
+        self.valid = {source.name: np.zeros(rows, dtype=bool) for source in sources}
+
+    @property
+    def full(self) -> bool:
+        return self.count == len(self.timestamp_ns)
+
+    @property
+    def nbytes(self) -> int:
+        # 채운 row만 (마지막 chunk는 덜 찬 상태로 넘어감)
+        return sum(array[:self.count].nbytes for array in self.data.values()) + self.count * 8 * (1 + len(self.stamp_ns))
+
+    def columns(self, sources) -> dict:
+        count = self.count
+        columns = {"timestamp_ns": self.timestamp_ns[:count]}
+        for source in sources:
+            columns.update(source.split(self.data[source.name][:count]))
+            columns[f"{source.name}_stamp_ns"] = self.stamp_ns[source.name][:count]
+            columns[f"{source.name}_valid"] = self.valid[source.name][:count]
+        return columns
+
+
+# --- 에피소드 writer (형식별). open은 첫 chunk를 디스크에 쓸 때, close는 save 때 ---
+class _NpzEpisodeWriter:
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.files = []
+
+    def write(self, index: int, columns: dict):
+        filename = f"chunk_{index:05d}.npz"
+        np.savez(os.path.join(self.directory, filename), **columns) # 압축 없음: writer가 sampling rate를 따라가도록
+        self.files.append(filename)
+
+    def close(self):
+        return {"files": self.files}
+
+
+class _Hdf5EpisodeWriter:
+    def __init__(self, directory: str):
+        self.file = h5py.File(os.path.join(directory, "data.h5"), "w")
+
+    def write(self, index: int, columns: dict):
+        for name, array in columns.items():
+            dataset = self.file.get(name)
+            if dataset is None:
+                dataset = self.file.create_dataset(
+                    name, shape=(0,) + array.shape[1:], maxshape=(None,) + array.shape[1:], dtype=array.dtype,
+                    chunks=(max(1, len(array)),) + array.shape[1:],
+                )
+            start = dataset.shape[0]
+            dataset.resize(start + len(array), axis=0)
+            dataset[start:] = array
+
+    def close(self):
+        self.file.close()
+        return {"files": ["data.h5"]}
+
+
+class _ParquetEpisodeWriter:
+    def __init__(self, directory: str):
+        self.path = os.path.join(directory, "data.parquet")
+        self.writer = None
+
+    @staticmethod
+    def _column(array: np.ndarray):
+        if array.ndim == 1:
+            return pa.array(array)
+        # 다차원 열(이미지, 관절 벡터)은 row마다 고정 길이 bytes. 원래 shape/dtype은 meta.json "columns"
+        row_nbytes = array[0].nbytes if len(array) else int(np.prod(array.shape[1:])) * array.dtype.itemsize
+        return pa.FixedSizeBinaryArray.from_buffers(
+            pa.binary(row_nbytes), len(array), [None, pa.py_buffer(np.ascontiguousarray(array))],
+        )
+
+    def write(self, index: int, columns: dict):
+        table = pa.table({name: self._column(array) for name, array in columns.items()})
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table) # chunk 하나 = row group 하나
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        return {"files": ["data.parquet"]}
+
+
+_EPISODE_WRITERS = {"npz": _NpzEpisodeWriter, "hdf5": _Hdf5EpisodeWriter, "parquet": _ParquetEpisodeWriter}
+
+
+def _unique_directory(directory: str, name: str) -> str:
+    path = os.path.join(directory, name)
+    suffix = 1
+    while os.path.exists(path):
+        path = os.path.join(directory, f"{name}_{suffix}")
+        suffix += 1
+    return path
+
+
+class _Episode:
+    """writer 스레드 쪽 에피소드 상태 (메모리 chunk, 디스크로 넘긴 chunk, 열 정보)"""
+    def __init__(self, sources, file_format: str, directory: str, name: str, meta: dict):
+        self.sources = sources
+        self.file_format = file_format
+        self.directory = directory
+        self.name = name
+        self.meta = meta
+        self.pending = []
+        self.pending_bytes = 0
+        self.partial_dir = os.path.join(directory, f".{name}.partial-{os.getpid()}")
+        self.writer = None
+        self.columns = None # {열 이름: {"dtype", "shape"}} (첫 chunk에서)
+        self.rows = 0
+        self.chunks = 0
+        self.bytes_written = 0
+
+    def add(self, chunk: _Chunk):
+        self.pending.append(chunk)
+        self.pending_bytes += chunk.nbytes
+        while self.pending_bytes > RECORDER_MEMORY_LIMIT_BYTES and self.pending:
+            self._write(self.pending.pop(0))
+
+    def _write(self, chunk: _Chunk):
+        columns = chunk.columns(self.sources)
+        if self.writer is None:
+            os.makedirs(self.partial_dir, exist_ok=True)
+            self.writer = _EPISODE_WRITERS[self.file_format](self.partial_dir)
+        if self.columns is None:
+            self.columns = {name: {"dtype": array.dtype.str, "shape": list(array.shape[1:])} for name, array in columns.items()}
+        self.writer.write(self.chunks, columns)
+        self.pending_bytes -= chunk.nbytes
+        self.bytes_written += chunk.nbytes
+        self.rows += chunk.count
+        self.chunks += 1
+
+    def save(self) -> str:
+        for chunk in self.pending:
+            if chunk.count:
+                self._write(chunk)
+        self.pending = []
+        if self.writer is None: # sample이 하나도 없어도 빈 에피소드 디렉터리는 남긴다
+            os.makedirs(self.partial_dir, exist_ok=True)
+            files = {"files": []}
+        else:
+            files = self.writer.close()
+        meta = dict(self.meta, format=self.file_format, rows=self.rows, chunks=self.chunks,
+                    columns=self.columns or {}, **files)
+        with open(os.path.join(self.partial_dir, "meta.json"), "w") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        path = _unique_directory(self.directory, self.name)
+        os.rename(self.partial_dir, path)
+        return path
+
+    def discard(self):
+        self.pending = []
+        self.pending_bytes = 0
+        if self.writer is not None: # 메모리 한도를 넘어 이미 디스크로 넘긴 chunk
+            try:
+                self.writer.close()
+            finally:
+                shutil.rmtree(self.partial_dir, ignore_errors=True)
+
+
+class DatasetRecorder:
+    """start/save/discard는 event loop가 아닌 스레드에서 호출 (sampling 스레드 join, save 완료까지 block)"""
+    def __init__(self):
+        self._lock = threading.Lock() # start/save/discard 직렬화
+        self._queue = queue.Queue(maxsize=RECORDER_QUEUE_CHUNKS)
+        self._stop = threading.Event()
+        self._sampler = None
+        self._writer = threading.Thread(target=self._writer_loop, name="dataset_writer", daemon=True)
+        self._writer.start()
+        self._state = "idle"
+        self._stats = self._new_stats(0.0, None, None, [])
+        self._last_path = None
+        self._error = None
+
+    @staticmethod
+    def _new_stats(hz: float, file_format, fallback, sources) -> dict:
+        return {
+            "target_hz": hz, "format": file_format, "format_fallback": fallback,
+            "sources": [source.name for source in sources],
+            "samples": 0, "started": None, "stopped": None,
+            "dropped": {"overrun": 0, "queue_full": 0, "write_error": 0},
+            "missing": {source.name: 0 for source in sources},
+            "chunks_written": 0, "bytes_written": 0, "spilled": False,
+        }
+
+    @property
+    def recording(self) -> bool:
+        return self._state == "recording"
+
+    def start(self, sources, hz: float, file_format: str, directory: str, name: str, meta: dict = None):
+        with self._lock:
+            if self._state == "recording":
+                raise RuntimeError("already recording")
+            hz = min(max(float(hz), 0.1), RECORDER_MAX_HZ)
+            file_format, fallback = resolve_format(file_format)
+            row_nbytes = sum(source.row_nbytes for source in sources) + 8 * (1 + len(sources))
+            rows = max(1, min(int(hz * RECORDER_CHUNK_SECONDS), RECORDER_CHUNK_MAX_BYTES // max(1, row_nbytes)))
+            os.makedirs(directory, exist_ok=True)
+            episode = _Episode(sources, file_format, directory, name, dict(meta or {}, hz=hz))
+            self._queue.put(("start", episode)) # writer가 이전 에피소드를 다 정리한 뒤에 처리됨
+            self._stats = self._new_stats(hz, file_format, fallback, sources)
+            self._stats["started"] = time.time()
+            self._error = None
+            self._state = "recording"
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, args=(sources, hz, rows), name="dataset_sampler", daemon=True)
+            self._sampler.start()
+
+    def _stop_sampling(self):
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        self._stats["stopped"] = time.time()
+
+    def save(self, timeout: float = None) -> str:
+        """sampling을 멈추고 writer가 에피소드를 확정할 때까지 기다림. 저장 경로 반환 (실패하면 예외).
+        timeout 안에 끝나지 않으면 TimeoutError (writer는 계속 써서 나중에 확정하지만, 아직 저장됐다고 보고하지 않음)"""
+        with self._lock:
+            if self._state != "recording":
+                raise RuntimeError("not recording")
+            self._state = "saving"
+            self._stop_sampling()
+            done = threading.Event()
+            result = {}
+            self._queue.put(("save", (done, result)))
+            finished = done.wait(timeout)
+            self._state = "idle"
+            if not finished: # self._error는 건드리지 않음 (writer가 쓰기 실패로 보고 에피소드를 버리게 됨)
+                raise TimeoutError(f"save did not finish within {timeout}s; episode is still being written (see status last_path)")
+            if "error" in result:
+                raise result["error"]
+            self._last_path = result.get("path")
+            return self._last_path
+
+    def discard(self):
+        with self._lock:
+            if self._state != "recording":
+                raise RuntimeError("not recording")
+            self._stop_sampling()
+            self._queue.put(("discard", None))
+            self._state = "idle"
+
+    def shutdown(self):
+        """서버 종료: 녹화 중이면 버리고 writer 스레드를 내림"""
+        if self.recording:
+            self.discard()
+        self._queue.put(("exit", None))
+
+    def status(self) -> dict:
+        stats = self._stats
+        end = stats["stopped"] or time.time()
+        elapsed = end - stats["started"] if stats["started"] else 0.0
+        return dict(
+            stats, dropped=dict(stats["dropped"]), missing=dict(stats["missing"]),
+            state=self._state, elapsed_s=round(elapsed, 3),
+            # 시작 직후 sample 1개로 rate가 튀지 않도록 최소 한 주기로 나눔
+            rate_hz=round(stats["samples"] / max(elapsed, 1.0 / stats["target_hz"]), 2) if stats["started"] else 0.0,
+            last_path=self._last_path, error=self._error, formats=available_formats(),
+        )
+
+    # --- sampling 스레드 ---
+    def _sample_loop(self, sources, hz: float, rows: int):
+        stats = self._stats
+        period = 1.0 / hz
+        chunk_index = 0
+        chunk = _Chunk(chunk_index, sources, rows)
+        next_tick = time.perf_counter()
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            if now < next_tick:
+                self._stop.wait(next_tick - now)
+                continue
+            behind = int((now - next_tick) / period)
+            if behind: # 한 주기 이상 밀림: 지난 tick은 건너뛰고 drop으로 셈
+                stats["dropped"]["overrun"] += behind
+                next_tick += behind * period
+            next_tick += period
+
+            row = chunk.count
+            chunk.timestamp_ns[row] = time.time_ns()
+            for source in sources:
+                try:
+                    stamp_ns = source.fill(chunk.data[source.name][row])
+                except Exception:
+                    stamp_ns = None
+                if stamp_ns is None:
+                    chunk.data[source.name][row] = 0
+                    stats["missing"][source.name] += 1
+                else:
+                    chunk.stamp_ns[source.name][row] = stamp_ns
+                    chunk.valid[source.name][row] = True
+            chunk.count += 1
+            stats["samples"] += 1
+            if chunk.full:
+                self._hand_off(chunk)
+                chunk_index += 1
+                chunk = _Chunk(chunk_index, sources, rows)
+        if chunk.count:
+            self._hand_off(chunk, block=True) # 마지막 덜 찬 chunk는 save/discard 명령보다 먼저 queue에 들어가야 함
+
+    def _hand_off(self, chunk: _Chunk, block: bool = False):
+        try:
+            self._queue.put(("chunk", chunk), block=block)
+        except queue.Full: # writer(디스크)가 밀림: 이 chunk의 sample은 버림
+            self._stats["dropped"]["queue_full"] += chunk.count
+            self._stats["samples"] -= chunk.count
+
+    # --- writer 스레드 ---
+    def _writer_loop(self):
+        episode = None
+        while True:
+            command, arg = self._queue.get()
+            try:
+                if command == "exit":
+                    return
+                if command == "start":
+                    episode = arg
+                elif command == "chunk" and episode is not None:
+                    if self._error is not None:
+                        self._stats["dropped"]["write_error"] += arg.count
+                        continue
+                    written = episode.chunks
+                    episode.add(arg)
+                    if episode.chunks != written:
+                        self._stats["spilled"] = True
+                elif command == "save":
+                    done, result = arg
+                    try:
+                        if self._error is not None:
+                            raise RuntimeError(self._error)
+                        result["path"] = self._last_path = episode.save()
+                    except Exception as e:
+                        result["error"] = e
+                        self._error = str(e)
+                        episode.discard()
+                    finally:
+                        self._stats["chunks_written"] = episode.chunks
+                        self._stats["bytes_written"] = episode.bytes_written
+                        episode = None
+                        done.set()
+                elif command == "discard" and episode is not None:
+                    episode.discard()
+                    episode = None
+                if episode is not None:
+                    self._stats["chunks_written"] = episode.chunks
+                    self._stats["bytes_written"] = episode.bytes_written
+            except Exception as e: # 디스크 가득 참 등: 이후 chunk는 write_error로 세고 save 때 실패로 보고
+                self._error = str(e)
@@ -1,74 +0,0 @@
-(function(){const Z=document.createElement("link").relList;if(Z&&Z.supports&&Z.supports("modulepreload"))return;for(const X of document.querySelectorAll('link[rel="modulepreload"]'))m(X);new MutationObserver(X=>{for(const V of X)if(V.type==="childList")for(const el of V.addedNodes)el.tagName==="LINK"&&el.rel==="modulepreload"&&m(el)}).observe(document,{childList:!0,subtree:!0});function U(X){const V={};return X.integrity&&(V.integrity=X.integrity),X.referrerPolicy&&(V.referrerPolicy=X.referrerPolicy),X.crossOrigin==="use-credentials"?V.credentials="include":X.crossOrigin==="anonymous"?V.credentials="omit":V.credentials="same-origin",V}function m(X){if(X.ep)return;X.ep=!0;const V=U(X);fetch(X.href,V)}})();function fr(p){return p&&p.__esModule&&Object.prototype.hasOwnProperty.call(p,"default")?p.default:p}var ki={exports:{}},bu={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var F0;function Ry(){if(F0)return bu;F0=1;var p=Symbol.for("react.transitional.element"),Z=Symbol.for("react.fragment");function U(m,X,V){var el=null;if(V!==void 0&&(el=""+V),X.key!==void 0&&(el=""+X.key),"key"in X){V={};for(var yl in X)yl!=="key"&&(V[yl]=X[yl])}else V=X;return X=V.ref,{$$typeof:p,type:m,key:el,ref:X!==void 0?X:null,props:V}}return bu.Fragment=Z,bu.jsx=U,bu.jsxs=U,bu}var I0;function Uy(){return I0||(I0=1,ki.exports=Ry()),ki.exports}var v=Uy(),Fi={exports:{}},J={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var P0;function Hy(){if(P0)return J;P0=1;var p=Symbol.for("react.transitional.element"),Z=Symbol.for("react.portal"),U=Symbol.for("react.fragment"),m=Symbol.for("react.strict_mode"),X=Symbol.for("react.profiler"),V=Symbol.for("react.consumer"),el=Symbol.for("react.context"),yl=Symbol.for("react.forward_ref"),j=Symbol.for("react.suspense"),T=Symbol.for("react.memo"),O=Symbol.for("react.lazy"),P=Symbol.iterator;function ll(f){return f===null||typeof f!="object"?null:(f=P&&f[P]||f["@@iterator"],typeof f=="function"?f:null)}var Sl={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},ml=Object.assign,Rl={};function vl(f,A,M){this.props=f,this.context=A,this.refs=Rl,this.updater=M||Sl}vl.prototype.isReactComponent={},vl.prototype.setState=function(f,A){if(typeof f!="object"&&typeof f!="function"&&f!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,f,A,"setState")},vl.prototype.forceUpdate=function(f){this.updater.enqueueForceUpdate(this,f,"forceUpdate")};function gl(){}gl.prototype=vl.prototype;function El(f,A,M){this.props=f,this.context=A,this.refs=Rl,this.updater=M||Sl}var ol=El.prototype=new gl;ol.constructor=El,ml(ol,vl.prototype),ol.isPureReactComponent=!0;var Al=Array.isArray,K={H:null,A:null,T:null,S:null,V:null},_l=Object.prototype.hasOwnProperty;function Xl(f,A,M,N,H,W){return M=W.ref,{$$typeof:p,type:f,key:A,ref:M!==void 0?M:null,props:W}}function Nl(f,A){return Xl(f.type,A,void 0,void 0,void 0,f.props)}function Ll(f){return typeof f=="object"&&f!==null&&f.$$typeof===p}function rt(f){var A={"=":"=0",":":"=2"};return"$"+f.replace(/[=:]/g,function(M){return A[M]})}var Kl=/\/+/g;function Ol(f,A){return typeof f=="object"&&f!==null&&f.key!=null?rt(""+f.key):A.toString(36)}function Jl(){}function zt(f){switch(f.status){case"fulfilled":return f.value;case"rejected":throw f.reason;default:switch(typeof f.status=="string"?f.then(Jl,Jl):(f.status="pending",f.then(function(A){f.status==="pending"&&(f.status="fulfilled",f.value=A)},function(A){f.status==="pending"&&(f.status="rejected",f.reason=A)})),f.status){case"fulfilled":return f.value;case"rejected":throw f.reason}}throw f}function Ml(f,A,M,N,H){var W=typeof f;(W==="undefined"||W==="boolean")&&(f=null);var G=!1;if(f===null)G=!0;else switch(W){case"bigint":case"string":case"number":G=!0;break;case"object":switch(f.$$typeof){case p:case Z:G=!0;break;case O:return G=f._init,Ml(G(f._payload),A,M,N,H)}}if(G)return H=H(f),G=N===""?"."+Ol(f,0):N,Al(H)?(M="",G!=null&&(M=G.replace(Kl,"$&/")+"/"),Ml(H,A,M,"",function(B){return B})):H!=null&&(Ll(H)&&(H=Nl(H,M+(H.key==null||f&&f.key===H.key?"":(""+H.key).replace(Kl,"$&/")+"/")+G)),A.push(H)),1;G=0;var ql=N===""?".":N+":";if(Al(f))for(var cl=0;cl<f.length;cl++)N=f[cl],W=ql+Ol(N,cl),G+=Ml(N,A,M,W,H);else if(cl=ll(f),typeof cl=="function")for(f=cl.call(f),cl=0;!(N=f.next()).done;)N=N.value,W=ql+Ol(N,cl++),G+=Ml(N,A,M,W,H);else if(W==="object"){if(typeof f.then=="function")return Ml(zt(f),A,M,N,H);throw A=String(f),Error("Objects are not valid as a React child (found: "+(A==="[object Object]"?"object with keys {"+Object.keys(f).join(", ")+"}":A)+"). If you meant to render a collection of children, use an array instead.")}return G}function b(f,A,M){if(f==null)return f;var N=[],H=0;return Ml(f,N,"","",function(W){return A.call(M,W,H++)}),N}function _(f){if(f._status===-1){var A=f._result;A=A(),A.then(function(M){(f._status===0||f._status===-1)&&(f._status=1,f._result=M)},function(M){(f._status===0||f._status===-1)&&(f._status=2,f._result=M)}),f._status===-1&&(f._status=0,f._result=A)}if(f._status===1)return f._result.default;throw f._result}var q=typeof reportError=="function"?reportError:function(f){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var A=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof f=="object"&&f!==null&&typeof f.message=="string"?String(f.message):String(f),error:f});if(!window.dispatchEvent(A))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",f);return}console.error(f)};function z(){}return J.Children={map:b,forEach:function(f,A,M){b(f,function(){A.apply(this,arguments)},M)},count:function(f){var A=0;return b(f,function(){A++}),A},toArray:function(f){return b(f,function(A){return A})||[]},only:function(f){if(!Ll(f))throw Error("React.Children.only expected to receive a single React element child.");return f}},J.Component=vl,J.Fragment=U,J.Profiler=X,J.PureComponent=El,J.StrictMode=m,J.Suspense=j,J.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=K,J.__COMPILER_RUNTIME={__proto__:null,c:function(f){return K.H.useMemoCache(f)}},J.cache=function(f){return function(){return f.apply(null,arguments)}},J.cloneElement=function(f,A,M){if(f==null)throw Error("The argument must be a React element, but you passed "+f+".");var N=ml({},f.props),H=f.key,W=void 0;if(A!=null)for(G in A.ref!==void 0&&(W=void 0),A.key!==void 0&&(H=""+A.key),A)!_l.call(A,G)||G==="key"||G==="__self"||G==="__source"||G==="ref"&&A.ref===void 0||(N[G]=A[G]);var G=arguments.length-2;if(G===1)N.children=M;else if(1<G){for(var ql=Array(G),cl=0;cl<G;cl++)ql[cl]=arguments[cl+2];N.children=ql}return Xl(f.type,H,void 0,void 0,W,N)},J.createContext=function(f){return f={$$typeof:el,_currentValue:f,_currentValue2:f,_threadCount:0,Provider:null,Consumer:null},f.Provider=f,f.Consumer={$$typeof:V,_context:f},f},J.createElement=function(f,A,M){var N,H={},W=null;if(A!=null)for(N in A.key!==void 0&&(W=""+A.key),A)_l.call(A,N)&&N!=="key"&&N!=="__self"&&N!=="__source"&&(H[N]=A[N]);var G=arguments.length-2;if(G===1)H.children=M;else if(1<G){for(var ql=Array(G),cl=0;cl<G;cl++)ql[cl]=arguments[cl+2];H.children=ql}if(f&&f.defaultProps)for(N in G=f.defaultProps,G)H[N]===void 0&&(H[N]=G[N]);return Xl(f,W,void 0,void 0,null,H)},J.createRef=function(){return{current:null}},J.forwardRef=function(f){return{$$typeof:yl,render:f}},J.isValidElement=Ll,J.lazy=function(f){return{$$typeof:O,_payload:{_status:-1,_result:f},_init:_}},J.memo=function(f,A){return{$$typeof:T,type:f,compare:A===void 0?null:A}},J.startTransition=function(f){var A=K.T,M={};K.T=M;try{var N=f(),H=K.S;H!==null&&H(M,N),typeof N=="object"&&N!==null&&typeof N.then=="function"&&N.then(z,q)}catch(W){q(W)}finally{K.T=A}},J.unstable_useCacheRefresh=function(){return K.H.useCacheRefresh()},J.use=function(f){return K.H.use(f)},J.useActionState=function(f,A,M){return K.H.useActionState(f,A,M)},J.useCallback=function(f,A){return K.H.useCallback(f,A)},J.useContext=function(f){return K.H.useContext(f)},J.useDebugValue=function(){},J.useDeferredValue=function(f,A){return K.H.useDeferredValue(f,A)},J.useEffect=function(f,A,M){var N=K.H;if(typeof M=="function")throw Error("useEffect CRUD overload is not enabled in this build of React.");return N.useEffect(f,A)},J.useId=function(){return K.H.useId()},J.useImperativeHandle=function(f,A,M){return K.H.useImperativeHandle(f,A,M)},J.useInsertionEffect=function(f,A){return K.H.useInsertionEffect(f,A)},J.useLayoutEffect=function(f,A){return K.H.useLayoutEffect(f,A)},J.useMemo=function(f,A){return K.H.useMemo(f,A)},J.useOptimistic=function(f,A){return K.H.useOptimistic(f,A)},J.useReducer=function(f,A,M){return K.H.useReducer(f,A,M)},J.useRef=function(f){return K.H.useRef(f)},J.useState=function(f){return K.H.useState(f)},J.useSyncExternalStore=function(f,A,M){return K.H.useSyncExternalStore(f,A,M)},J.useTransition=function(){return K.H.useTransition()},J.version="19.1.0",J}var lr;function af(){return lr||(lr=1,Fi.exports=Hy()),Fi.exports}var L=af();const qy=fr(L);var Ii={exports:{}},Su={},Pi={exports:{}},lf={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var tr;function By(){return tr||(tr=1,function(p){function Z(b,_){var q=b.length;b.push(_);l:for(;0<q;){var z=q-1>>>1,f=b[z];if(0<X(f,_))b[z]=_,b[q]=f,q=z;else break l}}function U(b){return b.length===0?null:b[0]}function m(b){if(b.length===0)return null;var _=b[0],q=b.pop();if(q!==_){b[0]=q;l:for(var z=0,f=b.length,A=f>>>1;z<A;){var M=2*(z+1)-1,N=b[M],H=M+1,W=b[H];if(0>X(N,q))H<f&&0>X(W,N)?(b[z]=W,b[H]=q,z=H):(b[z]=N,b[M]=q,z=M);else if(H<f&&0>X(W,q))b[z]=W,b[H]=q,z=H;else break l}}return _}function X(b,_){var q=b.sortIndex-_.sortIndex;return q!==0?q:b.id-_.id}if(p.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var V=performance;p.unstable_now=function(){return V.now()}}else{var el=Date,yl=el.now();p.unstable_now=function(){return el.now()-yl}}var j=[],T=[],O=1,P=null,ll=3,Sl=!1,ml=!1,Rl=!1,vl=!1,gl=typeof setTimeout=="function"?setTimeout:null,El=typeof clearTimeout=="function"?clearTimeout:null,ol=typeof setImmediate<"u"?setImmediate:null;function Al(b){for(var _=U(T);_!==null;){if(_.callback===null)m(T);else if(_.startTime<=b)m(T),_.sortIndex=_.expirationTime,Z(j,_);else break;_=U(T)}}function K(b){if(Rl=!1,Al(b),!ml)if(U(j)!==null)ml=!0,_l||(_l=!0,Ol());else{var _=U(T);_!==null&&Ml(K,_.startTime-b)}}var _l=!1,Xl=-1,Nl=5,Ll=-1;function rt(){return vl?!0:!(p.unstable_now()-Ll<Nl)}function Kl(){if(vl=!1,_l){var b=p.unstable_now();Ll=b;var _=!0;try{l:{ml=!1,Rl&&(Rl=!1,El(Xl),Xl=-1),Sl=!0;var q=ll;try{t:{for(Al(b),P=U(j);P!==null&&!(P.expirationTime>b&&rt());){var z=P.callback;if(typeof z=="function"){P.callback=null,ll=P.priorityLevel;var f=z(P.expirationTime<=b);if(b=p.unstable_now(),typeof f=="function"){P.callback=f,Al(b),_=!0;break t}P===U(j)&&m(j),Al(b)}else m(j);P=U(j)}if(P!==null)_=!0;else{var A=U(T);A!==null&&Ml(K,A.startTime-b),_=!1}}break l}finally{P=null,ll=q,Sl=!1}_=void 0}}finally{_?Ol():_l=!1}}}var Ol;if(typeof ol=="function")Ol=function(){ol(Kl)};else if(typeof MessageChannel<"u"){var Jl=new MessageChannel,zt=Jl.port2;Jl.port1.onmessage=Kl,Ol=function(){zt.postMessage(null)}}else Ol=function(){gl(Kl,0)};function Ml(b,_){Xl=gl(function(){b(p.unstable_now())},_)}p.unstable_IdlePriority=5,p.unstable_ImmediatePriority=1,p.unstable_LowPriority=4,p.unstable_NormalPriority=3,p.unstable_Profiling=null,p.unstable_UserBlockingPriority=2,p.unstable_cancelCallback=function(b){b.callback=null},p.unstable_forceFrameRate=function(b){0>b||125<b?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Nl=0<b?Math.floor(1e3/b):5},p.unstable_getCurrentPriorityLevel=function(){return ll},p.unstable_next=function(b){switch(ll){case 1:case 2:case 3:var _=3;break;default:_=ll}var q=ll;ll=_;try{return b()}finally{ll=q}},p.unstable_requestPaint=function(){vl=!0},p.unstable_runWithPriority=function(b,_){switch(b){case 1:case 2:case 3:case 4:case 5:break;default:b=3}var q=ll;ll=b;try{return _()}finally{ll=q}},p.unstable_scheduleCallback=function(b,_,q){var z=p.unstable_now();switch(typeof q=="object"&&q!==null?(q=q.delay,q=typeof q=="number"&&0<q?z+q:z):q=z,b){case 1:var f=-1;break;case 2:f=250;break;case 5:f=1073741823;break;case 4:f=1e4;break;default:f=5e3}return f=q+f,b={id:O++,callback:_,priorityLevel:b,startTime:q,expirationTime:f,sortIndex:-1},q>z?(b.sortIndex=q,Z(T,b),U(j)===null&&b===U(T)&&(Rl?(El(Xl),Xl=-1):Rl=!0,Ml(K,q-z))):(b.sortIndex=f,Z(j,b),ml||Sl||(ml=!0,_l||(_l=!0,Ol()))),b},p.unstable_shouldYield=rt,p.unstable_wrapCallback=function(b){var _=ll;return function(){var q=ll;ll=_;try{return b.apply(this,arguments)}finally{ll=q}}}}(lf)),lf}var ar;function Yy(){return ar||(ar=1,Pi.exports=By()),Pi.exports}var tf={exports:{}},Wl={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var er;function Cy(){if(er)return Wl;er=1;var p=af();function Z(j){var T="https://react.dev/errors/"+j;if(1<arguments.length){T+="?args[]="+encodeURIComponent(arguments[1]);for(var O=2;O<arguments.length;O++)T+="&args[]="+encodeURIComponent(arguments[O])}return"Minified React error #"+j+"; visit "+T+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function U(){}var m={d:{f:U,r:function(){throw Error(Z(522))},D:U,C:U,L:U,m:U,X:U,S:U,M:U},p:0,findDOMNode:null},X=Symbol.for("react.portal");function V(j,T,O){var P=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:X,key:P==null?null:""+P,children:j,containerInfo:T,implementation:O}}var el=p.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function yl(j,T){if(j==="font")return"";if(typeof T=="string")return T==="use-credentials"?T:""}return Wl.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=m,Wl.createPortal=function(j,T){var O=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!T||T.nodeType!==1&&T.nodeType!==9&&T.nodeType!==11)throw Error(Z(299));return V(j,T,null,O)},Wl.flushSync=function(j){var T=el.T,O=m.p;try{if(el.T=null,m.p=2,j)return j()}finally{el.T=T,m.p=O,m.d.f()}},Wl.preconnect=function(j,T){typeof j=="string"&&(T?(T=T.crossOrigin,T=typeof T=="string"?T==="use-credentials"?T:"":void 0):T=null,m.d.C(j,T))},Wl.prefetchDNS=function(j){typeof j=="string"&&m.d.D(j)},Wl.preinit=function(j,T){if(typeof j=="string"&&T&&typeof T.as=="string"){var O=T.as,P=yl(O,T.crossOrigin),ll=typeof T.integrity=="string"?T.integrity:void 0,Sl=typeof T.fetchPriority=="string"?T.fetchPriority:void 0;O==="style"?m.d.S(j,typeof T.precedence=="string"?T.precedence:void 0,{crossOrigin:P,integrity:ll,fetchPriority:Sl}):O==="script"&&m.d.X(j,{crossOrigin:P,integrity:ll,fetchPriority:Sl,nonce:typeof T.nonce=="string"?T.nonce:void 0})}},Wl.preinitModule=function(j,T){if(typeof j=="string")if(typeof T=="object"&&T!==null){if(T.as==null||T.as==="script"){var O=yl(T.as,T.crossOrigin);m.d.M(j,{crossOrigin:O,integrity:typeof T.integrity=="string"?T.integrity:void 0,nonce:typeof T.nonce=="string"?T.nonce:void 0})}}else T==null&&m.d.M(j)},Wl.preload=function(j,T){if(typeof j=="string"&&typeof T=="object"&&T!==null&&typeof T.as=="string"){var O=T.as,P=yl(O,T.crossOrigin);m.d.L(j,O,{crossOrigin:P,integrity:typeof T.integrity=="string"?T.integrity:void 0,nonce:typeof T.nonce=="string"?T.nonce:void 0,type:typeof T.type=="string"?T.type:void 0,fetchPriority:typeof T.fetchPriority=="string"?T.fetchPriority:void 0,referrerPolicy:typeof T.referrerPolicy=="string"?T.referrerPolicy:void 0,imageSrcSet:typeof T.imageSrcSet=="string"?T.imageSrcSet:void 0,imageSizes:typeof T.imageSizes=="string"?T.imageSizes:void 0,media:typeof T.media=="string"?T.media:void 0})}},Wl.preloadModule=function(j,T){if(typeof j=="string")if(T){var O=yl(T.as,T.crossOrigin);m.d.m(j,{as:typeof T.as=="string"&&T.as!=="script"?T.as:void 0,crossOrigin:O,integrity:typeof T.integrity=="string"?T.integrity:void 0})}else m.d.m(j)},Wl.requestFormReset=function(j){m.d.r(j)},Wl.unstable_batchedUpdates=function(j,T){return j(T)},Wl.useFormState=function(j,T,O){return el.H.useFormState(j,T,O)},Wl.useFormStatus=function(){return el.H.useHostTransitionStatus()},Wl.version="19.1.0",Wl}var ur;function Gy(){if(ur)return tf.exports;ur=1;function p(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(p)}catch(Z){console.error(Z)}}return p(),tf.exports=Cy(),tf.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var nr;function Xy(){if(nr)return Su;nr=1;var p=Yy(),Z=af(),U=Gy();function m(l){var t="https://react.dev/errors/"+l;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var a=2;a<arguments.length;a++)t+="&args[]="+encodeURIComponent(arguments[a])}return"Minified React error #"+l+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function X(l){return!(!l||l.nodeType!==1&&l.nodeType!==9&&l.nodeType!==11)}function V(l){var t=l,a=l;if(l.alternate)for(;t.return;)t=t.return;else{l=t;do t=l,(t.flags&4098)!==0&&(a=t.return),l=t.return;while(l)}return t.tag===3?a:null}function el(l){if(l.tag===13){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function yl(l){if(V(l)!==l)throw Error(m(188))}function j(l){var t=l.alternate;if(!t){if(t=V(l),t===null)throw Error(m(188));return t!==l?null:l}for(var a=l,e=t;;){var u=a.return;if(u===null)break;var n=u.alternate;if(n===null){if(e=u.return,e!==null){a=e;continue}break}if(u.child===n.child){for(n=u.child;n;){if(n===a)return yl(u),l;if(n===e)return yl(u),t;n=n.sibling}throw Error(m(188))}if(a.return!==e.return)a=u,e=n;else{for(var c=!1,i=u.child;i;){if(i===a){c=!0,a=u,e=n;break}if(i===e){c=!0,e=u,a=n;break}i=i.sibling}if(!c){for(i=n.child;i;){if(i===a){c=!0,a=n,e=u;break}if(i===e){c=!0,e=n,a=u;break}i=i.sibling}if(!c)throw Error(m(189))}}if(a.alternate!==e)throw Error(m(190))}if(a.tag!==3)throw Error(m(188));return a.stateNode.current===a?l:t}function T(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l;for(l=l.child;l!==null;){if(t=T(l),t!==null)return t;l=l.sibling}return null}var O=Object.assign,P=Symbol.for("react.element"),ll=Symbol.for("react.transitional.element"),Sl=Symbol.for("react.portal"),ml=Symbol.for("react.fragment"),Rl=Symbol.for("react.strict_mode"),vl=Symbol.for("react.profiler"),gl=Symbol.for("react.provider"),El=Symbol.for("react.consumer"),ol=Symbol.for("react.context"),Al=Symbol.for("react.forward_ref"),K=Symbol.for("react.suspense"),_l=Symbol.for("react.suspense_list"),Xl=Symbol.for("react.memo"),Nl=Symbol.for("react.lazy"),Ll=Symbol.for("react.activity"),rt=Symbol.for("react.memo_cache_sentinel"),Kl=Symbol.iterator;function Ol(l){return l===null||typeof l!="object"?null:(l=Kl&&l[Kl]||l["@@iterator"],typeof l=="function"?l:null)}var Jl=Symbol.for("react.client.reference");function zt(l){if(l==null)return null;if(typeof l=="function")return l.$$typeof===Jl?null:l.displayName||l.name||null;if(typeof l=="string")return l;switch(l){case ml:return"Fragment";case vl:return"Profiler";case Rl:return"StrictMode";case K:return"Suspense";case _l:return"SuspenseList";case Ll:return"Activity"}if(typeof l=="object")switch(l.$$typeof){case Sl:return"Portal";case ol:return(l.displayName||"Context")+".Provider";case El:return(l._context.displayName||"Context")+".Consumer";case Al:var t=l.render;return l=l.displayName,l||(l=t.displayName||t.name||"",l=l!==""?"ForwardRef("+l+")":"ForwardRef"),l;case Xl:return t=l.displayName||null,t!==null?t:zt(l.type)||"Memo";case Nl:t=l._payload,l=l._init;try{return zt(l(t))}catch{}}return null}var Ml=Array.isArray,b=Z.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,_=U.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,q={pending:!1,data:null,method:null,action:null},z=[],f=-1;function A(l){return{current:l}}function M(l){0>f||(l.current=z[f],z[f]=null,f--)}function N(l,t){f++,z[f]=l.current,l.current=t}var H=A(null),W=A(null),G=A(null),ql=A(null);function cl(l,t){switch(N(G,t),N(W,l),N(H,null),t.nodeType){case 9:case 11:l=(l=t.documentElement)&&(l=l.namespaceURI)?z0(l):0;break;default:if(l=t.tagName,t=t.namespaceURI)t=z0(t),l=_0(t,l);else switch(l){case"svg":l=1;break;case"math":l=2;break;default:l=0}}M(H),N(H,l)}function B(){M(H),M(W),M(G)}function xe(l){l.memoizedState!==null&&N(ql,l);var t=H.current,a=_0(t,l.type);t!==a&&(N(W,l),N(H,a))}function xu(l){W.current===l&&(M(H),M(W)),ql.current===l&&(M(ql),yu._currentValue=q)}var Bn=Object.prototype.hasOwnProperty,Yn=p.unstable_scheduleCallback,Cn=p.unstable_cancelCallback,or=p.unstable_shouldYield,rr=p.unstable_requestPaint,_t=p.unstable_now,dr=p.unstable_getCurrentPriorityLevel,ef=p.unstable_ImmediatePriority,uf=p.unstable_UserBlockingPriority,Tu=p.unstable_NormalPriority,yr=p.unstable_LowPriority,nf=p.unstable_IdlePriority,mr=p.log,vr=p.unstable_setDisableYieldValue,Te=null,at=null;function wt(l){if(typeof mr=="function"&&vr(l),at&&typeof at.setStrictMode=="function")try{at.setStrictMode(Te,l)}catch{}}var et=Math.clz32?Math.clz32:br,hr=Math.log,gr=Math.LN2;function br(l){return l>>>=0,l===0?32:31-(hr(l)/gr|0)|0}var Eu=256,Au=4194304;function ga(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return l&4194048;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function pu(l,t,a){var e=l.pendingLanes;if(e===0)return 0;var u=0,n=l.suspendedLanes,c=l.pingedLanes;l=l.warmLanes;var i=e&134217727;return i!==0?(e=i&~n,e!==0?u=ga(e):(c&=i,c!==0?u=ga(c):a||(a=i&~l,a!==0&&(u=ga(a))))):(i=e&~n,i!==0?u=ga(i):c!==0?u=ga(c):a||(a=e&~l,a!==0&&(u=ga(a)))),u===0?0:t!==0&&t!==u&&(t&n)===0&&(n=u&-u,a=t&-t,n>=a||n===32&&(a&4194048)!==0)?t:u}function Ee(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function Sr(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function cf(){var l=Eu;return Eu<<=1,(Eu&4194048)===0&&(Eu=256),l}function ff(){var l=Au;return Au<<=1,(Au&62914560)===0&&(Au=4194304),l}function Gn(l){for(var t=[],a=0;31>a;a++)t.push(l);return t}function Ae(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function xr(l,t,a,e,u,n){var c=l.pendingLanes;l.pendingLanes=a,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=a,l.entangledLanes&=a,l.errorRecoveryDisabledLanes&=a,l.shellSuspendCounter=0;var i=l.entanglements,s=l.expirationTimes,y=l.hiddenUpdates;for(a=c&~a;0<a;){var S=31-et(a),E=1<<S;i[S]=0,s[S]=-1;var h=y[S];if(h!==null)for(y[S]=null,S=0;S<h.length;S++){var g=h[S];g!==null&&(g.lane&=-536870913)}a&=~E}e!==0&&sf(l,e,0),n!==0&&u===0&&l.tag!==0&&(l.suspendedLanes|=n&~(c&~t))}function sf(l,t,a){l.pendingLanes|=t,l.suspendedLanes&=~t;var e=31-et(t);l.entangledLanes|=t,l.entanglements[e]=l.entanglements[e]|1073741824|a&4194090}function of(l,t){var a=l.entangledLanes|=t;for(l=l.entanglements;a;){var e=31-et(a),u=1<<e;u&t|l[e]&t&&(l[e]|=t),a&=~u}}function Xn(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function Qn(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function rf(){var l=_.p;return l!==0?l:(l=window.event,l===void 0?32:K0(l.type))}function Tr(l,t){var a=_.p;try{return _.p=l,t()}finally{_.p=a}}var $t=Math.random().toString(36).slice(2),wl="__reactFiber$"+$t,Fl="__reactProps$"+$t,qa="__reactContainer$"+$t,Zn="__reactEvents$"+$t,Er="__reactListeners$"+$t,Ar="__reactHandles$"+$t,df="__reactResources$"+$t,pe="__reactMarker$"+$t;function Vn(l){delete l[wl],delete l[Fl],delete l[Zn],delete l[Er],delete l[Ar]}function Ba(l){var t=l[wl];if(t)return t;for(var a=l.parentNode;a;){if(t=a[qa]||a[wl]){if(a=t.alternate,t.child!==null||a!==null&&a.child!==null)for(l=D0(l);l!==null;){if(a=l[wl])return a;l=D0(l)}return t}l=a,a=l.parentNode}return null}function Ya(l){if(l=l[wl]||l[qa]){var t=l.tag;if(t===5||t===6||t===13||t===26||t===27||t===3)return l}return null}function ze(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(m(33))}function Ca(l){var t=l[df];return t||(t=l[df]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Bl(l){l[pe]=!0}var yf=new Set,mf={};function ba(l,t){Ga(l,t),Ga(l+"Capture",t)}function Ga(l,t){for(mf[l]=t,l=0;l<t.length;l++)yf.add(t[l])}var pr=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),vf={},hf={};function zr(l){return Bn.call(hf,l)?!0:Bn.call(vf,l)?!1:pr.test(l)?hf[l]=!0:(vf[l]=!0,!1)}function zu(l,t,a){if(zr(t))if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var e=t.toLowerCase().slice(0,5);if(e!=="data-"&&e!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+a)}}function _u(l,t,a){if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+a)}}function Rt(l,t,a,e){if(e===null)l.removeAttribute(a);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(a);return}l.setAttributeNS(t,a,""+e)}}var Ln,gf;function Xa(l){if(Ln===void 0)try{throw Error()}catch(a){var t=a.stack.trim().match(/\n( *(at )?)/);Ln=t&&t[1]||"",gf=-1<a.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<a.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Ln+l+gf}var Kn=!1;function Jn(l,t){if(!l||Kn)return"";Kn=!0;var a=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var e={DetermineComponentFrameRoot:function(){try{if(t){var E=function(){throw Error()};if(Object.defineProperty(E.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(E,[])}catch(g){var h=g}Reflect.construct(l,[],E)}else{try{E.call()}catch(g){h=g}l.call(E.prototype)}}else{try{throw Error()}catch(g){h=g}(E=l())&&typeof E.catch=="function"&&E.catch(function(){})}}catch(g){if(g&&h&&typeof g.stack=="string")return[g.stack,h.stack]}return[null,null]}};e.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var u=Object.getOwnPropertyDescriptor(e.DetermineComponentFrameRoot,"name");u&&u.configurable&&Object.defineProperty(e.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=e.DetermineComponentFrameRoot(),c=n[0],i=n[1];if(c&&i){var s=c.split(`
-`),y=i.split(`
-`);for(u=e=0;e<s.length&&!s[e].includes("DetermineComponentFrameRoot");)e++;for(;u<y.length&&!y[u].includes("DetermineComponentFrameRoot");)u++;if(e===s.length||u===y.length)for(e=s.length-1,u=y.length-1;1<=e&&0<=u&&s[e]!==y[u];)u--;for(;1<=e&&0<=u;e--,u--)if(s[e]!==y[u]){if(e!==1||u!==1)do if(e--,u--,0>u||s[e]!==y[u]){var S=`
-`+s[e].replace(" at new "," at ");return l.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",l.displayName)),S}while(1<=e&&0<=u);break}}}finally{Kn=!1,Error.prepareStackTrace=a}return(a=l?l.displayName||l.name:"")?Xa(a):""}function _r(l){switch(l.tag){case 26:case 27:case 5:return Xa(l.type);case 16:return Xa("Lazy");case 13:return Xa("Suspense");case 19:return Xa("SuspenseList");case 0:case 15:return Jn(l.type,!1);case 11:return Jn(l.type.render,!1);case 1:return Jn(l.type,!0);case 31:return Xa("Activity");default:return""}}function bf(l){try{var t="";do t+=_r(l),l=l.return;while(l);return t}catch(a){return`
-Error generating stack: `+a.message+`
-`+a.stack}}function dt(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function Sf(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Nr(l){var t=Sf(l)?"checked":"value",a=Object.getOwnPropertyDescriptor(l.constructor.prototype,t),e=""+l[t];if(!l.hasOwnProperty(t)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var u=a.get,n=a.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return u.call(this)},set:function(c){e=""+c,n.call(this,c)}}),Object.defineProperty(l,t,{enumerable:a.enumerable}),{getValue:function(){return e},setValue:function(c){e=""+c},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function Nu(l){l._valueTracker||(l._valueTracker=Nr(l))}function xf(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var a=t.getValue(),e="";return l&&(e=Sf(l)?l.checked?"true":"false":l.value),l=e,l!==a?(t.setValue(l),!0):!1}function Ou(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var Or=/[\n"\\]/g;function yt(l){return l.replace(Or,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function wn(l,t,a,e,u,n,c,i){l.name="",c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.type=c:l.removeAttribute("type"),t!=null?c==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+dt(t)):l.value!==""+dt(t)&&(l.value=""+dt(t)):c!=="submit"&&c!=="reset"||l.removeAttribute("value"),t!=null?$n(l,c,dt(t)):a!=null?$n(l,c,dt(a)):e!=null&&l.removeAttribute("value"),u==null&&n!=null&&(l.defaultChecked=!!n),u!=null&&(l.checked=u&&typeof u!="function"&&typeof u!="symbol"),i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?l.name=""+dt(i):l.removeAttribute("name")}function Tf(l,t,a,e,u,n,c,i){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||a!=null){if(!(n!=="submit"&&n!=="reset"||t!=null))return;a=a!=null?""+dt(a):"",t=t!=null?""+dt(t):a,i||t===l.value||(l.value=t),l.defaultValue=t}e=e??u,e=typeof e!="function"&&typeof e!="symbol"&&!!e,l.checked=i?l.checked:!!e,l.defaultChecked=!!e,c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"&&(l.name=c)}function $n(l,t,a){t==="number"&&Ou(l.ownerDocument)===l||l.defaultValue===""+a||(l.defaultValue=""+a)}function Qa(l,t,a,e){if(l=l.options,t){t={};for(var u=0;u<a.length;u++)t["$"+a[u]]=!0;for(a=0;a<l.length;a++)u=t.hasOwnProperty("$"+l[a].value),l[a].selected!==u&&(l[a].selected=u),u&&e&&(l[a].defaultSelected=!0)}else{for(a=""+dt(a),t=null,u=0;u<l.length;u++){if(l[u].value===a){l[u].selected=!0,e&&(l[u].defaultSelected=!0);return}t!==null||l[u].disabled||(t=l[u])}t!==null&&(t.selected=!0)}}function Ef(l,t,a){if(t!=null&&(t=""+dt(t),t!==l.value&&(l.value=t),a==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=a!=null?""+dt(a):""}function Af(l,t,a,e){if(t==null){if(e!=null){if(a!=null)throw Error(m(92));if(Ml(e)){if(1<e.length)throw Error(m(93));e=e[0]}a=e}a==null&&(a=""),t=a}a=dt(t),l.defaultValue=a,e=l.textContent,e===a&&e!==""&&e!==null&&(l.value=e)}function Za(l,t){if(t){var a=l.firstChild;if(a&&a===l.lastChild&&a.nodeType===3){a.nodeValue=t;return}}l.textContent=t}var Mr=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function pf(l,t,a){var e=t.indexOf("--")===0;a==null||typeof a=="boolean"||a===""?e?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":e?l.setProperty(t,a):typeof a!="number"||a===0||Mr.has(t)?t==="float"?l.cssFloat=a:l[t]=(""+a).trim():l[t]=a+"px"}function zf(l,t,a){if(t!=null&&typeof t!="object")throw Error(m(62));if(l=l.style,a!=null){for(var e in a)!a.hasOwnProperty(e)||t!=null&&t.hasOwnProperty(e)||(e.indexOf("--")===0?l.setProperty(e,""):e==="float"?l.cssFloat="":l[e]="");for(var u in t)e=t[u],t.hasOwnProperty(u)&&a[u]!==e&&pf(l,u,e)}else for(var n in t)t.hasOwnProperty(n)&&pf(l,n,t[n])}function Wn(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Dr=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),jr=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Mu(l){return jr.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}var kn=null;function Fn(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var Va=null,La=null;function _f(l){var t=Ya(l);if(t&&(l=t.stateNode)){var a=l[Fl]||null;l:switch(l=t.stateNode,t.type){case"input":if(wn(l,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name),t=a.name,a.type==="radio"&&t!=null){for(a=l;a.parentNode;)a=a.parentNode;for(a=a.querySelectorAll('input[name="'+yt(""+t)+'"][type="radio"]'),t=0;t<a.length;t++){var e=a[t];if(e!==l&&e.form===l.form){var u=e[Fl]||null;if(!u)throw Error(m(90));wn(e,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name)}}for(t=0;t<a.length;t++)e=a[t],e.form===l.form&&xf(e)}break l;case"textarea":Ef(l,a.value,a.defaultValue);break l;case"select":t=a.value,t!=null&&Qa(l,!!a.multiple,t,!1)}}}var In=!1;function Nf(l,t,a){if(In)return l(t,a);In=!0;try{var e=l(t);return e}finally{if(In=!1,(Va!==null||La!==null)&&(vn(),Va&&(t=Va,l=La,La=Va=null,_f(t),l)))for(t=0;t<l.length;t++)_f(l[t])}}function _e(l,t){var a=l.stateNode;if(a===null)return null;var e=a[Fl]||null;if(e===null)return null;a=e[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(e=!e.disabled)||(l=l.type,e=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!e;break l;default:l=!1}if(l)return null;if(a&&typeof a!="function")throw Error(m(231,t,typeof a));return a}var Ut=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Pn=!1;if(Ut)try{var Ne={};Object.defineProperty(Ne,"passive",{get:function(){Pn=!0}}),window.addEventListener("test",Ne,Ne),window.removeEventListener("test",Ne,Ne)}catch{Pn=!1}var Wt=null,lc=null,Du=null;function Of(){if(Du)return Du;var l,t=lc,a=t.length,e,u="value"in Wt?Wt.value:Wt.textContent,n=u.length;for(l=0;l<a&&t[l]===u[l];l++);var c=a-l;for(e=1;e<=c&&t[a-e]===u[n-e];e++);return Du=u.slice(l,1<e?1-e:void 0)}function ju(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function Ru(){return!0}function Mf(){return!1}function Il(l){function t(a,e,u,n,c){this._reactName=a,this._targetInst=u,this.type=e,this.nativeEvent=n,this.target=c,this.currentTarget=null;for(var i in l)l.hasOwnProperty(i)&&(a=l[i],this[i]=a?a(n):n[i]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?Ru:Mf,this.isPropagationStopped=Mf,this}return O(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var a=this.nativeEvent;a&&(a.preventDefault?a.preventDefault():typeof a.returnValue!="unknown"&&(a.returnValue=!1),this.isDefaultPrevented=Ru)},stopPropagation:function(){var a=this.nativeEvent;a&&(a.stopPropagation?a.stopPropagation():typeof a.cancelBubble!="unknown"&&(a.cancelBubble=!0),this.isPropagationStopped=Ru)},persist:function(){},isPersistent:Ru}),t}var Sa={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Uu=Il(Sa),Oe=O({},Sa,{view:0,detail:0}),Rr=Il(Oe),tc,ac,Me,Hu=O({},Oe,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:uc,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==Me&&(Me&&l.type==="mousemove"?(tc=l.screenX-Me.screenX,ac=l.screenY-Me.screenY):ac=tc=0,Me=l),tc)},movementY:function(l){return"movementY"in l?l.movementY:ac}}),Df=Il(Hu),Ur=O({},Hu,{dataTransfer:0}),Hr=Il(Ur),qr=O({},Oe,{relatedTarget:0}),ec=Il(qr),Br=O({},Sa,{animationName:0,elapsedTime:0,pseudoElement:0}),Yr=Il(Br),Cr=O({},Sa,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),Gr=Il(Cr),Xr=O({},Sa,{data:0}),jf=Il(Xr),Qr={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Zr={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Vr={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Lr(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=Vr[l])?!!t[l]:!1}function uc(){return Lr}var Kr=O({},Oe,{key:function(l){if(l.key){var t=Qr[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=ju(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?Zr[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:uc,charCode:function(l){return l.type==="keypress"?ju(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?ju(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),Jr=Il(Kr),wr=O({},Hu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Rf=Il(wr),$r=O({},Oe,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:uc}),Wr=Il($r),kr=O({},Sa,{propertyName:0,elapsedTime:0,pseudoElement:0}),Fr=Il(kr),Ir=O({},Hu,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),Pr=Il(Ir),ld=O({},Sa,{newState:0,oldState:0}),td=Il(ld),ad=[9,13,27,32],nc=Ut&&"CompositionEvent"in window,De=null;Ut&&"documentMode"in document&&(De=document.documentMode);var ed=Ut&&"TextEvent"in window&&!De,Uf=Ut&&(!nc||De&&8<De&&11>=De),Hf=" ",qf=!1;function Bf(l,t){switch(l){case"keyup":return ad.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Yf(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var Ka=!1;function ud(l,t){switch(l){case"compositionend":return Yf(t);case"keypress":return t.which!==32?null:(qf=!0,Hf);case"textInput":return l=t.data,l===Hf&&qf?null:l;default:return null}}function nd(l,t){if(Ka)return l==="compositionend"||!nc&&Bf(l,t)?(l=Of(),Du=lc=Wt=null,Ka=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Uf&&t.locale!=="ko"?null:t.data;default:return null}}var cd={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Cf(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!cd[l.type]:t==="textarea"}function Gf(l,t,a,e){Va?La?La.push(e):La=[e]:Va=e,t=Tn(t,"onChange"),0<t.length&&(a=new Uu("onChange","change",null,a,e),l.push({event:a,listeners:t}))}var je=null,Re=null;function id(l){x0(l,0)}function qu(l){var t=ze(l);if(xf(t))return l}function Xf(l,t){if(l==="change")return t}var Qf=!1;if(Ut){var cc;if(Ut){var ic="oninput"in document;if(!ic){var Zf=document.createElement("div");Zf.setAttribute("oninput","return;"),ic=typeof Zf.oninput=="function"}cc=ic}else cc=!1;Qf=cc&&(!document.documentMode||9<document.documentMode)}function Vf(){je&&(je.detachEvent("onpropertychange",Lf),Re=je=null)}function Lf(l){if(l.propertyName==="value"&&qu(Re)){var t=[];Gf(t,Re,l,Fn(l)),Nf(id,t)}}function fd(l,t,a){l==="focusin"?(Vf(),je=t,Re=a,je.attachEvent("onpropertychange",Lf)):l==="focusout"&&Vf()}function sd(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return qu(Re)}function od(l,t){if(l==="click")return qu(t)}function rd(l,t){if(l==="input"||l==="change")return qu(t)}function dd(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var ut=typeof Object.is=="function"?Object.is:dd;function Ue(l,t){if(ut(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var a=Object.keys(l),e=Object.keys(t);if(a.length!==e.length)return!1;for(e=0;e<a.length;e++){var u=a[e];if(!Bn.call(t,u)||!ut(l[u],t[u]))return!1}return!0}function Kf(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function Jf(l,t){var a=Kf(l);l=0;for(var e;a;){if(a.nodeType===3){if(e=l+a.textContent.length,l<=t&&e>=t)return{node:a,offset:t-l};l=e}l:{for(;a;){if(a.nextSibling){a=a.nextSibling;break l}a=a.parentNode}a=void 0}a=Kf(a)}}function wf(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?wf(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function $f(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=Ou(l.document);t instanceof l.HTMLIFrameElement;){try{var a=typeof t.contentWindow.location.href=="string"}catch{a=!1}if(a)l=t.contentWindow;else break;t=Ou(l.document)}return t}function fc(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var yd=Ut&&"documentMode"in document&&11>=document.documentMode,Ja=null,sc=null,He=null,oc=!1;function Wf(l,t,a){var e=a.window===a?a.document:a.nodeType===9?a:a.ownerDocument;oc||Ja==null||Ja!==Ou(e)||(e=Ja,"selectionStart"in e&&fc(e)?e={start:e.selectionStart,end:e.selectionEnd}:(e=(e.ownerDocument&&e.ownerDocument.defaultView||window).getSelection(),e={anchorNode:e.anchorNode,anchorOffset:e.anchorOffset,focusNode:e.focusNode,focusOffset:e.focusOffset}),He&&Ue(He,e)||(He=e,e=Tn(sc,"onSelect"),0<e.length&&(t=new Uu("onSelect","select",null,t,a),l.push({event:t,listeners:e}),t.target=Ja)))}function xa(l,t){var a={};return a[l.toLowerCase()]=t.toLowerCase(),a["Webkit"+l]="webkit"+t,a["Moz"+l]="moz"+t,a}var wa={animationend:xa("Animation","AnimationEnd"),animationiteration:xa("Animation","AnimationIteration"),animationstart:xa("Animation","AnimationStart"),transitionrun:xa("Transition","TransitionRun"),transitionstart:xa("Transition","TransitionStart"),transitioncancel:xa("Transition","TransitionCancel"),transitionend:xa("Transition","TransitionEnd")},rc={},kf={};Ut&&(kf=document.createElement("div").style,"AnimationEvent"in window||(delete wa.animationend.animation,delete wa.animationiteration.animation,delete wa.animationstart.animation),"TransitionEvent"in window||delete wa.transitionend.transition);function Ta(l){if(rc[l])return rc[l];if(!wa[l])return l;var t=wa[l],a;for(a in t)if(t.hasOwnProperty(a)&&a in kf)return rc[l]=t[a];return l}var Ff=Ta("animationend"),If=Ta("animationiteration"),Pf=Ta("animationstart"),md=Ta("transitionrun"),vd=Ta("transitionstart"),hd=Ta("transitioncancel"),ls=Ta("transitionend"),ts=new Map,dc="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");dc.push("scrollEnd");function Tt(l,t){ts.set(l,t),ba(t,[l])}var as=new WeakMap;function mt(l,t){if(typeof l=="object"&&l!==null){var a=as.get(l);return a!==void 0?a:(t={value:l,source:t,stack:bf(t)},as.set(l,t),t)}return{value:l,source:t,stack:bf(t)}}var vt=[],$a=0,yc=0;function Bu(){for(var l=$a,t=yc=$a=0;t<l;){var a=vt[t];vt[t++]=null;var e=vt[t];vt[t++]=null;var u=vt[t];vt[t++]=null;var n=vt[t];if(vt[t++]=null,e!==null&&u!==null){var c=e.pending;c===null?u.next=u:(u.next=c.next,c.next=u),e.pending=u}n!==0&&es(a,u,n)}}function Yu(l,t,a,e){vt[$a++]=l,vt[$a++]=t,vt[$a++]=a,vt[$a++]=e,yc|=e,l.lanes|=e,l=l.alternate,l!==null&&(l.lanes|=e)}function mc(l,t,a,e){return Yu(l,t,a,e),Cu(l)}function Wa(l,t){return Yu(l,null,null,t),Cu(l)}function es(l,t,a){l.lanes|=a;var e=l.alternate;e!==null&&(e.lanes|=a);for(var u=!1,n=l.return;n!==null;)n.childLanes|=a,e=n.alternate,e!==null&&(e.childLanes|=a),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(u=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,u&&t!==null&&(u=31-et(a),l=n.hiddenUpdates,e=l[u],e===null?l[u]=[t]:e.push(t),t.lane=a|536870912),n):null}function Cu(l){if(50<nu)throw nu=0,xi=null,Error(m(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var ka={};function gd(l,t,a,e){this.tag=l,this.key=a,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=e,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function nt(l,t,a,e){return new gd(l,t,a,e)}function vc(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Ht(l,t){var a=l.alternate;return a===null?(a=nt(l.tag,t,l.key,l.mode),a.elementType=l.elementType,a.type=l.type,a.stateNode=l.stateNode,a.alternate=l,l.alternate=a):(a.pendingProps=t,a.type=l.type,a.flags=0,a.subtreeFlags=0,a.deletions=null),a.flags=l.flags&65011712,a.childLanes=l.childLanes,a.lanes=l.lanes,a.child=l.child,a.memoizedProps=l.memoizedProps,a.memoizedState=l.memoizedState,a.updateQueue=l.updateQueue,t=l.dependencies,a.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},a.sibling=l.sibling,a.index=l.index,a.ref=l.ref,a.refCleanup=l.refCleanup,a}function us(l,t){l.flags&=65011714;var a=l.alternate;return a===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=a.childLanes,l.lanes=a.lanes,l.child=a.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=a.memoizedProps,l.memoizedState=a.memoizedState,l.updateQueue=a.updateQueue,l.type=a.type,t=a.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function Gu(l,t,a,e,u,n){var c=0;if(e=l,typeof l=="function")vc(l)&&(c=1);else if(typeof l=="string")c=Sy(l,a,H.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case Ll:return l=nt(31,a,t,u),l.elementType=Ll,l.lanes=n,l;case ml:return Ea(a.children,u,n,t);case Rl:c=8,u|=24;break;case vl:return l=nt(12,a,t,u|2),l.elementType=vl,l.lanes=n,l;case K:return l=nt(13,a,t,u),l.elementType=K,l.lanes=n,l;case _l:return l=nt(19,a,t,u),l.elementType=_l,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case gl:case ol:c=10;break l;case El:c=9;break l;case Al:c=11;break l;case Xl:c=14;break l;case Nl:c=16,e=null;break l}c=29,a=Error(m(130,l===null?"null":typeof l,"")),e=null}return t=nt(c,a,t,u),t.elementType=l,t.type=e,t.lanes=n,t}function Ea(l,t,a,e){return l=nt(7,l,e,t),l.lanes=a,l}function hc(l,t,a){return l=nt(6,l,null,t),l.lanes=a,l}function gc(l,t,a){return t=nt(4,l.children!==null?l.children:[],l.key,t),t.lanes=a,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var Fa=[],Ia=0,Xu=null,Qu=0,ht=[],gt=0,Aa=null,qt=1,Bt="";function pa(l,t){Fa[Ia++]=Qu,Fa[Ia++]=Xu,Xu=l,Qu=t}function ns(l,t,a){ht[gt++]=qt,ht[gt++]=Bt,ht[gt++]=Aa,Aa=l;var e=qt;l=Bt;var u=32-et(e)-1;e&=~(1<<u),a+=1;var n=32-et(t)+u;if(30<n){var c=u-u%5;n=(e&(1<<c)-1).toString(32),e>>=c,u-=c,qt=1<<32-et(t)+u|a<<u|e,Bt=n+l}else qt=1<<n|a<<u|e,Bt=l}function bc(l){l.return!==null&&(pa(l,1),ns(l,1,0))}function Sc(l){for(;l===Xu;)Xu=Fa[--Ia],Fa[Ia]=null,Qu=Fa[--Ia],Fa[Ia]=null;for(;l===Aa;)Aa=ht[--gt],ht[gt]=null,Bt=ht[--gt],ht[gt]=null,qt=ht[--gt],ht[gt]=null}var kl=null,xl=null,al=!1,za=null,Nt=!1,xc=Error(m(519));function _a(l){var t=Error(m(418,""));throw Ye(mt(t,l)),xc}function cs(l){var t=l.stateNode,a=l.type,e=l.memoizedProps;switch(t[wl]=l,t[Fl]=e,a){case"dialog":F("cancel",t),F("close",t);break;case"iframe":case"object":case"embed":F("load",t);break;case"video":case"audio":for(a=0;a<iu.length;a++)F(iu[a],t);break;case"source":F("error",t);break;case"img":case"image":case"link":F("error",t),F("load",t);break;case"details":F("toggle",t);break;case"input":F("invalid",t),Tf(t,e.value,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name,!0),Nu(t);break;case"select":F("invalid",t);break;case"textarea":F("invalid",t),Af(t,e.value,e.defaultValue,e.children),Nu(t)}a=e.children,typeof a!="string"&&typeof a!="number"&&typeof a!="bigint"||t.textContent===""+a||e.suppressHydrationWarning===!0||p0(t.textContent,a)?(e.popover!=null&&(F("beforetoggle",t),F("toggle",t)),e.onScroll!=null&&F("scroll",t),e.onScrollEnd!=null&&F("scrollend",t),e.onClick!=null&&(t.onclick=En),t=!0):t=!1,t||_a(l)}function is(l){for(kl=l.return;kl;)switch(kl.tag){case 5:case 13:Nt=!1;return;case 27:case 3:Nt=!0;return;default:kl=kl.return}}function qe(l){if(l!==kl)return!1;if(!al)return is(l),al=!0,!1;var t=l.tag,a;if((a=t!==3&&t!==27)&&((a=t===5)&&(a=l.type,a=!(a!=="form"&&a!=="button")||Bi(l.type,l.memoizedProps)),a=!a),a&&xl&&_a(l),is(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(m(317));l:{for(l=l.nextSibling,t=0;l;){if(l.nodeType===8)if(a=l.data,a==="/$"){if(t===0){xl=At(l.nextSibling);break l}t--}else a!=="$"&&a!=="$!"&&a!=="$?"||t++;l=l.nextSibling}xl=null}}else t===27?(t=xl,ra(l.type)?(l=Xi,Xi=null,xl=l):xl=t):xl=kl?At(l.stateNode.nextSibling):null;return!0}function Be(){xl=kl=null,al=!1}function fs(){var l=za;return l!==null&&(tt===null?tt=l:tt.push.apply(tt,l),za=null),l}function Ye(l){za===null?za=[l]:za.push(l)}var Tc=A(null),Na=null,Yt=null;function kt(l,t,a){N(Tc,t._currentValue),t._currentValue=a}function Ct(l){l._currentValue=Tc.current,M(Tc)}function Ec(l,t,a){for(;l!==null;){var e=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,e!==null&&(e.childLanes|=t)):e!==null&&(e.childLanes&t)!==t&&(e.childLanes|=t),l===a)break;l=l.return}}function Ac(l,t,a,e){var u=l.child;for(u!==null&&(u.return=l);u!==null;){var n=u.dependencies;if(n!==null){var c=u.child;n=n.firstContext;l:for(;n!==null;){var i=n;n=u;for(var s=0;s<t.length;s++)if(i.context===t[s]){n.lanes|=a,i=n.alternate,i!==null&&(i.lanes|=a),Ec(n.return,a,l),e||(c=null);break l}n=i.next}}else if(u.tag===18){if(c=u.return,c===null)throw Error(m(341));c.lanes|=a,n=c.alternate,n!==null&&(n.lanes|=a),Ec(c,a,l),c=null}else c=u.child;if(c!==null)c.return=u;else for(c=u;c!==null;){if(c===l){c=null;break}if(u=c.sibling,u!==null){u.return=c.return,c=u;break}c=c.return}u=c}}function Ce(l,t,a,e){l=null;for(var u=t,n=!1;u!==null;){if(!n){if((u.flags&524288)!==0)n=!0;else if((u.flags&262144)!==0)break}if(u.tag===10){var c=u.alternate;if(c===null)throw Error(m(387));if(c=c.memoizedProps,c!==null){var i=u.type;ut(u.pendingProps.value,c.value)||(l!==null?l.push(i):l=[i])}}else if(u===ql.current){if(c=u.alternate,c===null)throw Error(m(387));c.memoizedState.memoizedState!==u.memoizedState.memoizedState&&(l!==null?l.push(yu):l=[yu])}u=u.return}l!==null&&Ac(t,l,a,e),t.flags|=262144}function Zu(l){for(l=l.firstContext;l!==null;){if(!ut(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Oa(l){Na=l,Yt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function $l(l){return ss(Na,l)}function Vu(l,t){return Na===null&&Oa(l),ss(l,t)}function ss(l,t){var a=t._currentValue;if(t={context:t,memoizedValue:a,next:null},Yt===null){if(l===null)throw Error(m(308));Yt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else Yt=Yt.next=t;return a}var bd=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(a,e){l.push(e)}};this.abort=function(){t.aborted=!0,l.forEach(function(a){return a()})}},Sd=p.unstable_scheduleCallback,xd=p.unstable_NormalPriority,Ul={$$typeof:ol,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function pc(){return{controller:new bd,data:new Map,refCount:0}}function Ge(l){l.refCount--,l.refCount===0&&Sd(xd,function(){l.controller.abort()})}var Xe=null,zc=0,Pa=0,le=null;function Td(l,t){if(Xe===null){var a=Xe=[];zc=0,Pa=Ni(),le={status:"pending",value:void 0,then:function(e){a.push(e)}}}return zc++,t.then(os,os),t}function os(){if(--zc===0&&Xe!==null){le!==null&&(le.status="fulfilled");var l=Xe;Xe=null,Pa=0,le=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Ed(l,t){var a=[],e={status:"pending",value:null,reason:null,then:function(u){a.push(u)}};return l.then(function(){e.status="fulfilled",e.value=t;for(var u=0;u<a.length;u++)(0,a[u])(t)},function(u){for(e.status="rejected",e.reason=u,u=0;u<a.length;u++)(0,a[u])(void 0)}),e}var rs=b.S;b.S=function(l,t){typeof t=="object"&&t!==null&&typeof t.then=="function"&&Td(l,t),rs!==null&&rs(l,t)};var Ma=A(null);function _c(){var l=Ma.current;return l!==null?l:dl.pooledCache}function Lu(l,t){t===null?N(Ma,Ma.current):N(Ma,t.pool)}function ds(){var l=_c();return l===null?null:{parent:Ul._currentValue,pool:l}}var Qe=Error(m(460)),ys=Error(m(474)),Ku=Error(m(542)),Nc={then:function(){}};function ms(l){return l=l.status,l==="fulfilled"||l==="rejected"}function Ju(){}function vs(l,t,a){switch(a=l[a],a===void 0?l.push(t):a!==t&&(t.then(Ju,Ju),t=a),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,gs(l),l;default:if(typeof t.status=="string")t.then(Ju,Ju);else{if(l=dl,l!==null&&100<l.shellSuspendCounter)throw Error(m(482));l=t,l.status="pending",l.then(function(e){if(t.status==="pending"){var u=t;u.status="fulfilled",u.value=e}},function(e){if(t.status==="pending"){var u=t;u.status="rejected",u.reason=e}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,gs(l),l}throw Ze=t,Qe}}var Ze=null;function hs(){if(Ze===null)throw Error(m(459));var l=Ze;return Ze=null,l}function gs(l){if(l===Qe||l===Ku)throw Error(m(483))}var Ft=!1;function Oc(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Mc(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function It(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function Pt(l,t,a){var e=l.updateQueue;if(e===null)return null;if(e=e.shared,(ul&2)!==0){var u=e.pending;return u===null?t.next=t:(t.next=u.next,u.next=t),e.pending=t,t=Cu(l),es(l,null,a),t}return Yu(l,e,t,a),Cu(l)}function Ve(l,t,a){if(t=t.updateQueue,t!==null&&(t=t.shared,(a&4194048)!==0)){var e=t.lanes;e&=l.pendingLanes,a|=e,t.lanes=a,of(l,a)}}function Dc(l,t){var a=l.updateQueue,e=l.alternate;if(e!==null&&(e=e.updateQueue,a===e)){var u=null,n=null;if(a=a.firstBaseUpdate,a!==null){do{var c={lane:a.lane,tag:a.tag,payload:a.payload,callback:null,next:null};n===null?u=n=c:n=n.next=c,a=a.next}while(a!==null);n===null?u=n=t:n=n.next=t}else u=n=t;a={baseState:e.baseState,firstBaseUpdate:u,lastBaseUpdate:n,shared:e.shared,callbacks:e.callbacks},l.updateQueue=a;return}l=a.lastBaseUpdate,l===null?a.firstBaseUpdate=t:l.next=t,a.lastBaseUpdate=t}var jc=!1;function Le(){if(jc){var l=le;if(l!==null)throw l}}function Ke(l,t,a,e){jc=!1;var u=l.updateQueue;Ft=!1;var n=u.firstBaseUpdate,c=u.lastBaseUpdate,i=u.shared.pending;if(i!==null){u.shared.pending=null;var s=i,y=s.next;s.next=null,c===null?n=y:c.next=y,c=s;var S=l.alternate;S!==null&&(S=S.updateQueue,i=S.lastBaseUpdate,i!==c&&(i===null?S.firstBaseUpdate=y:i.next=y,S.lastBaseUpdate=s))}if(n!==null){var E=u.baseState;c=0,S=y=s=null,i=n;do{var h=i.lane&-536870913,g=h!==i.lane;if(g?(I&h)===h:(e&h)===h){h!==0&&h===Pa&&(jc=!0),S!==null&&(S=S.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});l:{var Q=l,Y=i;h=t;var sl=a;switch(Y.tag){case 1:if(Q=Y.payload,typeof Q=="function"){E=Q.call(sl,E,h);break l}E=Q;break l;case 3:Q.flags=Q.flags&-65537|128;case 0:if(Q=Y.payload,h=typeof Q=="function"?Q.call(sl,E,h):Q,h==null)break l;E=O({},E,h);break l;case 2:Ft=!0}}h=i.callback,h!==null&&(l.flags|=64,g&&(l.flags|=8192),g=u.callbacks,g===null?u.callbacks=[h]:g.push(h))}else g={lane:h,tag:i.tag,payload:i.payload,callback:i.callback,next:null},S===null?(y=S=g,s=E):S=S.next=g,c|=h;if(i=i.next,i===null){if(i=u.shared.pending,i===null)break;g=i,i=g.next,g.next=null,u.lastBaseUpdate=g,u.shared.pending=null}}while(!0);S===null&&(s=E),u.baseState=s,u.firstBaseUpdate=y,u.lastBaseUpdate=S,n===null&&(u.shared.lanes=0),ia|=c,l.lanes=c,l.memoizedState=E}}function bs(l,t){if(typeof l!="function")throw Error(m(191,l));l.call(t)}function Ss(l,t){var a=l.callbacks;if(a!==null)for(l.callbacks=null,l=0;l<a.length;l++)bs(a[l],t)}var te=A(null),wu=A(0);function xs(l,t){l=Kt,N(wu,l),N(te,t),Kt=l|t.baseLanes}function Rc(){N(wu,Kt),N(te,te.current)}function Uc(){Kt=wu.current,M(te),M(wu)}var la=0,w=null,il=null,Dl=null,$u=!1,ae=!1,Da=!1,Wu=0,Je=0,ee=null,Ad=0;function pl(){throw Error(m(321))}function Hc(l,t){if(t===null)return!1;for(var a=0;a<t.length&&a<l.length;a++)if(!ut(l[a],t[a]))return!1;return!0}function qc(l,t,a,e,u,n){return la=n,w=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,b.H=l===null||l.memoizedState===null?eo:uo,Da=!1,n=a(e,u),Da=!1,ae&&(n=Es(t,a,e,u)),Ts(l),n}function Ts(l){b.H=tn;var t=il!==null&&il.next!==null;if(la=0,Dl=il=w=null,$u=!1,Je=0,ee=null,t)throw Error(m(300));l===null||Yl||(l=l.dependencies,l!==null&&Zu(l)&&(Yl=!0))}function Es(l,t,a,e){w=l;var u=0;do{if(ae&&(ee=null),Je=0,ae=!1,25<=u)throw Error(m(301));if(u+=1,Dl=il=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}b.H=Dd,n=t(a,e)}while(ae);return n}function pd(){var l=b.H,t=l.useState()[0];return t=typeof t.then=="function"?we(t):t,l=l.useState()[0],(il!==null?il.memoizedState:null)!==l&&(w.flags|=1024),t}function Bc(){var l=Wu!==0;return Wu=0,l}function Yc(l,t,a){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~a}function Cc(l){if($u){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}$u=!1}la=0,Dl=il=w=null,ae=!1,Je=Wu=0,ee=null}function Pl(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Dl===null?w.memoizedState=Dl=l:Dl=Dl.next=l,Dl}function jl(){if(il===null){var l=w.alternate;l=l!==null?l.memoizedState:null}else l=il.next;var t=Dl===null?w.memoizedState:Dl.next;if(t!==null)Dl=t,il=l;else{if(l===null)throw w.alternate===null?Error(m(467)):Error(m(310));il=l,l={memoizedState:il.memoizedState,baseState:il.baseState,baseQueue:il.baseQueue,queue:il.queue,next:null},Dl===null?w.memoizedState=Dl=l:Dl=Dl.next=l}return Dl}function Gc(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function we(l){var t=Je;return Je+=1,ee===null&&(ee=[]),l=vs(ee,l,t),t=w,(Dl===null?t.memoizedState:Dl.next)===null&&(t=t.alternate,b.H=t===null||t.memoizedState===null?eo:uo),l}function ku(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return we(l);if(l.$$typeof===ol)return $l(l)}throw Error(m(438,String(l)))}function Xc(l){var t=null,a=w.updateQueue;if(a!==null&&(t=a.memoCache),t==null){var e=w.alternate;e!==null&&(e=e.updateQueue,e!==null&&(e=e.memoCache,e!=null&&(t={data:e.data.map(function(u){return u.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),a===null&&(a=Gc(),w.updateQueue=a),a.memoCache=t,a=t.data[t.index],a===void 0)for(a=t.data[t.index]=Array(l),e=0;e<l;e++)a[e]=rt;return t.index++,a}function Gt(l,t){return typeof t=="function"?t(l):t}function Fu(l){var t=jl();return Qc(t,il,l)}function Qc(l,t,a){var e=l.queue;if(e===null)throw Error(m(311));e.lastRenderedReducer=a;var u=l.baseQueue,n=e.pending;if(n!==null){if(u!==null){var c=u.next;u.next=n.next,n.next=c}t.baseQueue=u=n,e.pending=null}if(n=l.baseState,u===null)l.memoizedState=n;else{t=u.next;var i=c=null,s=null,y=t,S=!1;do{var E=y.lane&-536870913;if(E!==y.lane?(I&E)===E:(la&E)===E){var h=y.revertLane;if(h===0)s!==null&&(s=s.next={lane:0,revertLane:0,action:y.action,hasEagerState:y.hasEagerState,eagerState:y.eagerState,next:null}),E===Pa&&(S=!0);else if((la&h)===h){y=y.next,h===Pa&&(S=!0);continue}else E={lane:0,revertLane:y.revertLane,action:y.action,hasEagerState:y.hasEagerState,eagerState:y.eagerState,next:null},s===null?(i=s=E,c=n):s=s.next=E,w.lanes|=h,ia|=h;E=y.action,Da&&a(n,E),n=y.hasEagerState?y.eagerState:a(n,E)}else h={lane:E,revertLane:y.revertLane,action:y.action,hasEagerState:y.hasEagerState,eagerState:y.eagerState,next:null},s===null?(i=s=h,c=n):s=s.next=h,w.lanes|=E,ia|=E;y=y.next}while(y!==null&&y!==t);if(s===null?c=n:s.next=i,!ut(n,l.memoizedState)&&(Yl=!0,S&&(a=le,a!==null)))throw a;l.memoizedState=n,l.baseState=c,l.baseQueue=s,e.lastRenderedState=n}return u===null&&(e.lanes=0),[l.memoizedState,e.dispatch]}function Zc(l){var t=jl(),a=t.queue;if(a===null)throw Error(m(311));a.lastRenderedReducer=l;var e=a.dispatch,u=a.pending,n=t.memoizedState;if(u!==null){a.pending=null;var c=u=u.next;do n=l(n,c.action),c=c.next;while(c!==u);ut(n,t.memoizedState)||(Yl=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),a.lastRenderedState=n}return[n,e]}function As(l,t,a){var e=w,u=jl(),n=al;if(n){if(a===void 0)throw Error(m(407));a=a()}else a=t();var c=!ut((il||u).memoizedState,a);c&&(u.memoizedState=a,Yl=!0),u=u.queue;var i=_s.bind(null,e,u,l);if($e(2048,8,i,[l]),u.getSnapshot!==t||c||Dl!==null&&Dl.memoizedState.tag&1){if(e.flags|=2048,ue(9,Iu(),zs.bind(null,e,u,a,t),null),dl===null)throw Error(m(349));n||(la&124)!==0||ps(e,t,a)}return a}function ps(l,t,a){l.flags|=16384,l={getSnapshot:t,value:a},t=w.updateQueue,t===null?(t=Gc(),w.updateQueue=t,t.stores=[l]):(a=t.stores,a===null?t.stores=[l]:a.push(l))}function zs(l,t,a,e){t.value=a,t.getSnapshot=e,Ns(t)&&Os(l)}function _s(l,t,a){return a(function(){Ns(t)&&Os(l)})}function Ns(l){var t=l.getSnapshot;l=l.value;try{var a=t();return!ut(l,a)}catch{return!0}}function Os(l){var t=Wa(l,2);t!==null&&ot(t,l,2)}function Vc(l){var t=Pl();if(typeof l=="function"){var a=l;if(l=a(),Da){wt(!0);try{a()}finally{wt(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:l},t}function Ms(l,t,a,e){return l.baseState=a,Qc(l,il,typeof e=="function"?e:Gt)}function zd(l,t,a,e,u){if(ln(l))throw Error(m(485));if(l=t.action,l!==null){var n={payload:u,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(c){n.listeners.push(c)}};b.T!==null?a(!0):n.isTransition=!1,e(n),a=t.pending,a===null?(n.next=t.pending=n,Ds(t,n)):(n.next=a.next,t.pending=a.next=n)}}function Ds(l,t){var a=t.action,e=t.payload,u=l.state;if(t.isTransition){var n=b.T,c={};b.T=c;try{var i=a(u,e),s=b.S;s!==null&&s(c,i),js(l,t,i)}catch(y){Lc(l,t,y)}finally{b.T=n}}else try{n=a(u,e),js(l,t,n)}catch(y){Lc(l,t,y)}}function js(l,t,a){a!==null&&typeof a=="object"&&typeof a.then=="function"?a.then(function(e){Rs(l,t,e)},function(e){return Lc(l,t,e)}):Rs(l,t,a)}function Rs(l,t,a){t.status="fulfilled",t.value=a,Us(t),l.state=a,t=l.pending,t!==null&&(a=t.next,a===t?l.pending=null:(a=a.next,t.next=a,Ds(l,a)))}function Lc(l,t,a){var e=l.pending;if(l.pending=null,e!==null){e=e.next;do t.status="rejected",t.reason=a,Us(t),t=t.next;while(t!==e)}l.action=null}function Us(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function Hs(l,t){return t}function qs(l,t){if(al){var a=dl.formState;if(a!==null){l:{var e=w;if(al){if(xl){t:{for(var u=xl,n=Nt;u.nodeType!==8;){if(!n){u=null;break t}if(u=At(u.nextSibling),u===null){u=null;break t}}n=u.data,u=n==="F!"||n==="F"?u:null}if(u){xl=At(u.nextSibling),e=u.data==="F!";break l}}_a(e)}e=!1}e&&(t=a[0])}}return a=Pl(),a.memoizedState=a.baseState=t,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Hs,lastRenderedState:t},a.queue=e,a=lo.bind(null,w,e),e.dispatch=a,e=Vc(!1),n=Wc.bind(null,w,!1,e.queue),e=Pl(),u={state:t,dispatch:null,action:l,pending:null},e.queue=u,a=zd.bind(null,w,u,n,a),u.dispatch=a,e.memoizedState=l,[t,a,!1]}function Bs(l){var t=jl();return Ys(t,il,l)}function Ys(l,t,a){if(t=Qc(l,t,Hs)[0],l=Fu(Gt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var e=we(t)}catch(c){throw c===Qe?Ku:c}else e=t;t=jl();var u=t.queue,n=u.dispatch;return a!==t.memoizedState&&(w.flags|=2048,ue(9,Iu(),_d.bind(null,u,a),null)),[e,n,l]}function _d(l,t){l.action=t}function Cs(l){var t=jl(),a=il;if(a!==null)return Ys(t,a,l);jl(),t=t.memoizedState,a=jl();var e=a.queue.dispatch;return a.memoizedState=l,[t,e,!1]}function ue(l,t,a,e){return l={tag:l,create:a,deps:e,inst:t,next:null},t=w.updateQueue,t===null&&(t=Gc(),w.updateQueue=t),a=t.lastEffect,a===null?t.lastEffect=l.next=l:(e=a.next,a.next=l,l.next=e,t.lastEffect=l),l}function Iu(){return{destroy:void 0,resource:void 0}}function Gs(){return jl().memoizedState}function Pu(l,t,a,e){var u=Pl();e=e===void 0?null:e,w.flags|=l,u.memoizedState=ue(1|t,Iu(),a,e)}function $e(l,t,a,e){var u=jl();e=e===void 0?null:e;var n=u.memoizedState.inst;il!==null&&e!==null&&Hc(e,il.memoizedState.deps)?u.memoizedState=ue(t,n,a,e):(w.flags|=l,u.memoizedState=ue(1|t,n,a,e))}function Xs(l,t){Pu(8390656,8,l,t)}function Qs(l,t){$e(2048,8,l,t)}function Zs(l,t){return $e(4,2,l,t)}function Vs(l,t){return $e(4,4,l,t)}function Ls(l,t){if(typeof t=="function"){l=l();var a=t(l);return function(){typeof a=="function"?a():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function Ks(l,t,a){a=a!=null?a.concat([l]):null,$e(4,4,Ls.bind(null,t,l),a)}function Kc(){}function Js(l,t){var a=jl();t=t===void 0?null:t;var e=a.memoizedState;return t!==null&&Hc(t,e[1])?e[0]:(a.memoizedState=[l,t],l)}function ws(l,t){var a=jl();t=t===void 0?null:t;var e=a.memoizedState;if(t!==null&&Hc(t,e[1]))return e[0];if(e=l(),Da){wt(!0);try{l()}finally{wt(!1)}}return a.memoizedState=[e,t],e}function Jc(l,t,a){return a===void 0||(la&1073741824)!==0?l.memoizedState=t:(l.memoizedState=a,l=Fo(),w.lanes|=l,ia|=l,a)}function $s(l,t,a,e){return ut(a,t)?a:te.current!==null?(l=Jc(l,a,e),ut(l,t)||(Yl=!0),l):(la&42)===0?(Yl=!0,l.memoizedState=a):(l=Fo(),w.lanes|=l,ia|=l,t)}function Ws(l,t,a,e,u){var n=_.p;_.p=n!==0&&8>n?n:8;var c=b.T,i={};b.T=i,Wc(l,!1,t,a);try{var s=u(),y=b.S;if(y!==null&&y(i,s),s!==null&&typeof s=="object"&&typeof s.then=="function"){var S=Ed(s,e);We(l,t,S,st(l))}else We(l,t,e,st(l))}catch(E){We(l,t,{then:function(){},status:"rejected",reason:E},st())}finally{_.p=n,b.T=c}}function Nd(){}function wc(l,t,a,e){if(l.tag!==5)throw Error(m(476));var u=ks(l).queue;Ws(l,u,t,q,a===null?Nd:function(){return Fs(l),a(e)})}function ks(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:q,baseState:q,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:q},next:null};var a={};return t.next={memoizedState:a,baseState:a,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:a},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function Fs(l){var t=ks(l).next.queue;We(l,t,{},st())}function $c(){return $l(yu)}function Is(){return jl().memoizedState}function Ps(){return jl().memoizedState}function Od(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var a=st();l=It(a);var e=Pt(t,l,a);e!==null&&(ot(e,t,a),Ve(e,t,a)),t={cache:pc()},l.payload=t;return}t=t.return}}function Md(l,t,a){var e=st();a={lane:e,revertLane:0,action:a,hasEagerState:!1,eagerState:null,next:null},ln(l)?to(t,a):(a=mc(l,t,a,e),a!==null&&(ot(a,l,e),ao(a,t,e)))}function lo(l,t,a){var e=st();We(l,t,a,e)}function We(l,t,a,e){var u={lane:e,revertLane:0,action:a,hasEagerState:!1,eagerState:null,next:null};if(ln(l))to(t,u);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var c=t.lastRenderedState,i=n(c,a);if(u.hasEagerState=!0,u.eagerState=i,ut(i,c))return Yu(l,t,u,0),dl===null&&Bu(),!1}catch{}finally{}if(a=mc(l,t,u,e),a!==null)return ot(a,l,e),ao(a,t,e),!0}return!1}function Wc(l,t,a,e){if(e={lane:2,revertLane:Ni(),action:e,hasEagerState:!1,eagerState:null,next:null},ln(l)){if(t)throw Error(m(479))}else t=mc(l,a,e,2),t!==null&&ot(t,l,2)}function ln(l){var t=l.alternate;return l===w||t!==null&&t===w}function to(l,t){ae=$u=!0;var a=l.pending;a===null?t.next=t:(t.next=a.next,a.next=t),l.pending=t}function ao(l,t,a){if((a&4194048)!==0){var e=t.lanes;e&=l.pendingLanes,a|=e,t.lanes=a,of(l,a)}}var tn={readContext:$l,use:ku,useCallback:pl,useContext:pl,useEffect:pl,useImperativeHandle:pl,useLayoutEffect:pl,useInsertionEffect:pl,useMemo:pl,useReducer:pl,useRef:pl,useState:pl,useDebugValue:pl,useDeferredValue:pl,useTransition:pl,useSyncExternalStore:pl,useId:pl,useHostTransitionStatus:pl,useFormState:pl,useActionState:pl,useOptimistic:pl,useMemoCache:pl,useCacheRefresh:pl},eo={readContext:$l,use:ku,useCallback:function(l,t){return Pl().memoizedState=[l,t===void 0?null:t],l},useContext:$l,useEffect:Xs,useImperativeHandle:function(l,t,a){a=a!=null?a.concat([l]):null,Pu(4194308,4,Ls.bind(null,t,l),a)},useLayoutEffect:function(l,t){return Pu(4194308,4,l,t)},useInsertionEffect:function(l,t){Pu(4,2,l,t)},useMemo:function(l,t){var a=Pl();t=t===void 0?null:t;var e=l();if(Da){wt(!0);try{l()}finally{wt(!1)}}return a.memoizedState=[e,t],e},useReducer:function(l,t,a){var e=Pl();if(a!==void 0){var u=a(t);if(Da){wt(!0);try{a(t)}finally{wt(!1)}}}else u=t;return e.memoizedState=e.baseState=u,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:u},e.queue=l,l=l.dispatch=Md.bind(null,w,l),[e.memoizedState,l]},useRef:function(l){var t=Pl();return l={current:l},t.memoizedState=l},useState:function(l){l=Vc(l);var t=l.queue,a=lo.bind(null,w,t);return t.dispatch=a,[l.memoizedState,a]},useDebugValue:Kc,useDeferredValue:function(l,t){var a=Pl();return Jc(a,l,t)},useTransition:function(){var l=Vc(!1);return l=Ws.bind(null,w,l.queue,!0,!1),Pl().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,a){var e=w,u=Pl();if(al){if(a===void 0)throw Error(m(407));a=a()}else{if(a=t(),dl===null)throw Error(m(349));(I&124)!==0||ps(e,t,a)}u.memoizedState=a;var n={value:a,getSnapshot:t};return u.queue=n,Xs(_s.bind(null,e,n,l),[l]),e.flags|=2048,ue(9,Iu(),zs.bind(null,e,n,a,t),null),a},useId:function(){var l=Pl(),t=dl.identifierPrefix;if(al){var a=Bt,e=qt;a=(e&~(1<<32-et(e)-1)).toString(32)+a,t="«"+t+"R"+a,a=Wu++,0<a&&(t+="H"+a.toString(32)),t+="»"}else a=Ad++,t="«"+t+"r"+a.toString(32)+"»";return l.memoizedState=t},useHostTransitionStatus:$c,useFormState:qs,useActionState:qs,useOptimistic:function(l){var t=Pl();t.memoizedState=t.baseState=l;var a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=a,t=Wc.bind(null,w,!0,a),a.dispatch=t,[l,t]},useMemoCache:Xc,useCacheRefresh:function(){return Pl().memoizedState=Od.bind(null,w)}},uo={readContext:$l,use:ku,useCallback:Js,useContext:$l,useEffect:Qs,useImperativeHandle:Ks,useInsertionEffect:Zs,useLayoutEffect:Vs,useMemo:ws,useReducer:Fu,useRef:Gs,useState:function(){return Fu(Gt)},useDebugValue:Kc,useDeferredValue:function(l,t){var a=jl();return $s(a,il.memoizedState,l,t)},useTransition:function(){var l=Fu(Gt)[0],t=jl().memoizedState;return[typeof l=="boolean"?l:we(l),t]},useSyncExternalStore:As,useId:Is,useHostTransitionStatus:$c,useFormState:Bs,useActionState:Bs,useOptimistic:function(l,t){var a=jl();return Ms(a,il,l,t)},useMemoCache:Xc,useCacheRefresh:Ps},Dd={readContext:$l,use:ku,useCallback:Js,useContext:$l,useEffect:Qs,useImperativeHandle:Ks,useInsertionEffect:Zs,useLayoutEffect:Vs,useMemo:ws,useReducer:Zc,useRef:Gs,useState:function(){return Zc(Gt)},useDebugValue:Kc,useDeferredValue:function(l,t){var a=jl();return il===null?Jc(a,l,t):$s(a,il.memoizedState,l,t)},useTransition:function(){var l=Zc(Gt)[0],t=jl().memoizedState;return[typeof l=="boolean"?l:we(l),t]},useSyncExternalStore:As,useId:Is,useHostTransitionStatus:$c,useFormState:Cs,useActionState:Cs,useOptimistic:function(l,t){var a=jl();return il!==null?Ms(a,il,l,t):(a.baseState=l,[l,a.queue.dispatch])},useMemoCache:Xc,useCacheRefresh:Ps},ne=null,ke=0;function an(l){var t=ke;return ke+=1,ne===null&&(ne=[]),vs(ne,l,t)}function Fe(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function en(l,t){throw t.$$typeof===P?Error(m(525)):(l=Object.prototype.toString.call(t),Error(m(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function no(l){var t=l._init;return t(l._payload)}function co(l){function t(r,o){if(l){var d=r.deletions;d===null?(r.deletions=[o],r.flags|=16):d.push(o)}}function a(r,o){if(!l)return null;for(;o!==null;)t(r,o),o=o.sibling;return null}function e(r){for(var o=new Map;r!==null;)r.key!==null?o.set(r.key,r):o.set(r.index,r),r=r.sibling;return o}function u(r,o){return r=Ht(r,o),r.index=0,r.sibling=null,r}function n(r,o,d){return r.index=d,l?(d=r.alternate,d!==null?(d=d.index,d<o?(r.flags|=67108866,o):d):(r.flags|=67108866,o)):(r.flags|=1048576,o)}function c(r){return l&&r.alternate===null&&(r.flags|=67108866),r}function i(r,o,d,x){return o===null||o.tag!==6?(o=hc(d,r.mode,x),o.return=r,o):(o=u(o,d),o.return=r,o)}function s(r,o,d,x){var D=d.type;return D===ml?S(r,o,d.props.children,x,d.key):o!==null&&(o.elementType===D||typeof D=="object"&&D!==null&&D.$$typeof===Nl&&no(D)===o.type)?(o=u(o,d.props),Fe(o,d),o.return=r,o):(o=Gu(d.type,d.key,d.props,null,r.mode,x),Fe(o,d),o.return=r,o)}function y(r,o,d,x){return o===null||o.tag!==4||o.stateNode.containerInfo!==d.containerInfo||o.stateNode.implementation!==d.implementation?(o=gc(d,r.mode,x),o.return=r,o):(o=u(o,d.children||[]),o.return=r,o)}function S(r,o,d,x,D){return o===null||o.tag!==7?(o=Ea(d,r.mode,x,D),o.return=r,o):(o=u(o,d),o.return=r,o)}function E(r,o,d){if(typeof o=="string"&&o!==""||typeof o=="number"||typeof o=="bigint")return o=hc(""+o,r.mode,d),o.return=r,o;if(typeof o=="object"&&o!==null){switch(o.$$typeof){case ll:return d=Gu(o.type,o.key,o.props,null,r.mode,d),Fe(d,o),d.return=r,d;case Sl:return o=gc(o,r.mode,d),o.return=r,o;case Nl:var x=o._init;return o=x(o._payload),E(r,o,d)}if(Ml(o)||Ol(o))return o=Ea(o,r.mode,d,null),o.return=r,o;if(typeof o.then=="function")return E(r,an(o),d);if(o.$$typeof===ol)return E(r,Vu(r,o),d);en(r,o)}return null}function h(r,o,d,x){var D=o!==null?o.key:null;if(typeof d=="string"&&d!==""||typeof d=="number"||typeof d=="bigint")return D!==null?null:i(r,o,""+d,x);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case ll:return d.key===D?s(r,o,d,x):null;case Sl:return d.key===D?y(r,o,d,x):null;case Nl:return D=d._init,d=D(d._payload),h(r,o,d,x)}if(Ml(d)||Ol(d))return D!==null?null:S(r,o,d,x,null);if(typeof d.then=="function")return h(r,o,an(d),x);if(d.$$typeof===ol)return h(r,o,Vu(r,d),x);en(r,d)}return null}function g(r,o,d,x,D){if(typeof x=="string"&&x!==""||typeof x=="number"||typeof x=="bigint")return r=r.get(d)||null,i(o,r,""+x,D);if(typeof x=="object"&&x!==null){switch(x.$$typeof){case ll:return r=r.get(x.key===null?d:x.key)||null,s(o,r,x,D);case Sl:return r=r.get(x.key===null?d:x.key)||null,y(o,r,x,D);case Nl:var $=x._init;return x=$(x._payload),g(r,o,d,x,D)}if(Ml(x)||Ol(x))return r=r.get(d)||null,S(o,r,x,D,null);if(typeof x.then=="function")return g(r,o,d,an(x),D);if(x.$$typeof===ol)return g(r,o,d,Vu(o,x),D);en(o,x)}return null}function Q(r,o,d,x){for(var D=null,$=null,R=o,C=o=0,Gl=null;R!==null&&C<d.length;C++){R.index>C?(Gl=R,R=null):Gl=R.sibling;var tl=h(r,R,d[C],x);if(tl===null){R===null&&(R=Gl);break}l&&R&&tl.alternate===null&&t(r,R),o=n(tl,o,C),$===null?D=tl:$.sibling=tl,$=tl,R=Gl}if(C===d.length)return a(r,R),al&&pa(r,C),D;if(R===null){for(;C<d.length;C++)R=E(r,d[C],x),R!==null&&(o=n(R,o,C),$===null?D=R:$.sibling=R,$=R);return al&&pa(r,C),D}for(R=e(R);C<d.length;C++)Gl=g(R,r,C,d[C],x),Gl!==null&&(l&&Gl.alternate!==null&&R.delete(Gl.key===null?C:Gl.key),o=n(Gl,o,C),$===null?D=Gl:$.sibling=Gl,$=Gl);return l&&R.forEach(function(ha){return t(r,ha)}),al&&pa(r,C),D}function Y(r,o,d,x){if(d==null)throw Error(m(151));for(var D=null,$=null,R=o,C=o=0,Gl=null,tl=d.next();R!==null&&!tl.done;C++,tl=d.next()){R.index>C?(Gl=R,R=null):Gl=R.sibling;var ha=h(r,R,tl.value,x);if(ha===null){R===null&&(R=Gl);break}l&&R&&ha.alternate===null&&t(r,R),o=n(ha,o,C),$===null?D=ha:$.sibling=ha,$=ha,R=Gl}if(tl.done)return a(r,R),al&&pa(r,C),D;if(R===null){for(;!tl.done;C++,tl=d.next())tl=E(r,tl.value,x),tl!==null&&(o=n(tl,o,C),$===null?D=tl:$.sibling=tl,$=tl);return al&&pa(r,C),D}for(R=e(R);!tl.done;C++,tl=d.next())tl=g(R,r,C,tl.value,x),tl!==null&&(l&&tl.alternate!==null&&R.delete(tl.key===null?C:tl.key),o=n(tl,o,C),$===null?D=tl:$.sibling=tl,$=tl);return l&&R.forEach(function(jy){return t(r,jy)}),al&&pa(r,C),D}function sl(r,o,d,x){if(typeof d=="object"&&d!==null&&d.type===ml&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case ll:l:{for(var D=d.key;o!==null;){if(o.key===D){if(D=d.type,D===ml){if(o.tag===7){a(r,o.sibling),x=u(o,d.props.children),x.return=r,r=x;break l}}else if(o.elementType===D||typeof D=="object"&&D!==null&&D.$$typeof===Nl&&no(D)===o.type){a(r,o.sibling),x=u(o,d.props),Fe(x,d),x.return=r,r=x;break l}a(r,o);break}else t(r,o);o=o.sibling}d.type===ml?(x=Ea(d.props.children,r.mode,x,d.key),x.return=r,r=x):(x=Gu(d.type,d.key,d.props,null,r.mode,x),Fe(x,d),x.return=r,r=x)}return c(r);case Sl:l:{for(D=d.key;o!==null;){if(o.key===D)if(o.tag===4&&o.stateNode.containerInfo===d.containerInfo&&o.stateNode.implementation===d.implementation){a(r,o.sibling),x=u(o,d.children||[]),x.return=r,r=x;break l}else{a(r,o);break}else t(r,o);o=o.sibling}x=gc(d,r.mode,x),x.return=r,r=x}return c(r);case Nl:return D=d._init,d=D(d._payload),sl(r,o,d,x)}if(Ml(d))return Q(r,o,d,x);if(Ol(d)){if(D=Ol(d),typeof D!="function")throw Error(m(150));return d=D.call(d),Y(r,o,d,x)}if(typeof d.then=="function")return sl(r,o,an(d),x);if(d.$$typeof===ol)return sl(r,o,Vu(r,d),x);en(r,d)}return typeof d=="string"&&d!==""||typeof d=="number"||typeof d=="bigint"?(d=""+d,o!==null&&o.tag===6?(a(r,o.sibling),x=u(o,d),x.return=r,r=x):(a(r,o),x=hc(d,r.mode,x),x.return=r,r=x),c(r)):a(r,o)}return function(r,o,d,x){try{ke=0;var D=sl(r,o,d,x);return ne=null,D}catch(R){if(R===Qe||R===Ku)throw R;var $=nt(29,R,null,r.mode);return $.lanes=x,$.return=r,$}finally{}}}var ce=co(!0),io=co(!1),bt=A(null),Ot=null;function ta(l){var t=l.alternate;N(Hl,Hl.current&1),N(bt,l),Ot===null&&(t===null||te.current!==null||t.memoizedState!==null)&&(Ot=l)}function fo(l){if(l.tag===22){if(N(Hl,Hl.current),N(bt,l),Ot===null){var t=l.alternate;t!==null&&t.memoizedState!==null&&(Ot=l)}}else aa()}function aa(){N(Hl,Hl.current),N(bt,bt.current)}function Xt(l){M(bt),Ot===l&&(Ot=null),M(Hl)}var Hl=A(0);function un(l){for(var t=l;t!==null;){if(t.tag===13){var a=t.memoizedState;if(a!==null&&(a=a.dehydrated,a===null||a.data==="$?"||Gi(a)))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function kc(l,t,a,e){t=l.memoizedState,a=a(e,t),a=a==null?t:O({},t,a),l.memoizedState=a,l.lanes===0&&(l.updateQueue.baseState=a)}var Fc={enqueueSetState:function(l,t,a){l=l._reactInternals;var e=st(),u=It(e);u.payload=t,a!=null&&(u.callback=a),t=Pt(l,u,e),t!==null&&(ot(t,l,e),Ve(t,l,e))},enqueueReplaceState:function(l,t,a){l=l._reactInternals;var e=st(),u=It(e);u.tag=1,u.payload=t,a!=null&&(u.callback=a),t=Pt(l,u,e),t!==null&&(ot(t,l,e),Ve(t,l,e))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var a=st(),e=It(a);e.tag=2,t!=null&&(e.callback=t),t=Pt(l,e,a),t!==null&&(ot(t,l,a),Ve(t,l,a))}};function so(l,t,a,e,u,n,c){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(e,n,c):t.prototype&&t.prototype.isPureReactComponent?!Ue(a,e)||!Ue(u,n):!0}function oo(l,t,a,e){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(a,e),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(a,e),t.state!==l&&Fc.enqueueReplaceState(t,t.state,null)}function ja(l,t){var a=t;if("ref"in t){a={};for(var e in t)e!=="ref"&&(a[e]=t[e])}if(l=l.defaultProps){a===t&&(a=O({},a));for(var u in l)a[u]===void 0&&(a[u]=l[u])}return a}var nn=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)};function ro(l){nn(l)}function yo(l){console.error(l)}function mo(l){nn(l)}function cn(l,t){try{var a=l.onUncaughtError;a(t.value,{componentStack:t.stack})}catch(e){setTimeout(function(){throw e})}}function vo(l,t,a){try{var e=l.onCaughtError;e(a.value,{componentStack:a.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(u){setTimeout(function(){throw u})}}function Ic(l,t,a){return a=It(a),a.tag=3,a.payload={element:null},a.callback=function(){cn(l,t)},a}function ho(l){return l=It(l),l.tag=3,l}function go(l,t,a,e){var u=a.type.getDerivedStateFromError;if(typeof u=="function"){var n=e.value;l.payload=function(){return u(n)},l.callback=function(){vo(t,a,e)}}var c=a.stateNode;c!==null&&typeof c.componentDidCatch=="function"&&(l.callback=function(){vo(t,a,e),typeof u!="function"&&(fa===null?fa=new Set([this]):fa.add(this));var i=e.stack;this.componentDidCatch(e.value,{componentStack:i!==null?i:""})})}function jd(l,t,a,e,u){if(a.flags|=32768,e!==null&&typeof e=="object"&&typeof e.then=="function"){if(t=a.alternate,t!==null&&Ce(t,a,u,!0),a=bt.current,a!==null){switch(a.tag){case 13:return Ot===null?Ei():a.alternate===null&&Tl===0&&(Tl=3),a.flags&=-257,a.flags|=65536,a.lanes=u,e===Nc?a.flags|=16384:(t=a.updateQueue,t===null?a.updateQueue=new Set([e]):t.add(e),pi(l,e,u)),!1;case 22:return a.flags|=65536,e===Nc?a.flags|=16384:(t=a.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([e])},a.updateQueue=t):(a=t.retryQueue,a===null?t.retryQueue=new Set([e]):a.add(e)),pi(l,e,u)),!1}throw Error(m(435,a.tag))}return pi(l,e,u),Ei(),!1}if(al)return t=bt.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=u,e!==xc&&(l=Error(m(422),{cause:e}),Ye(mt(l,a)))):(e!==xc&&(t=Error(m(423),{cause:e}),Ye(mt(t,a))),l=l.current.alternate,l.flags|=65536,u&=-u,l.lanes|=u,e=mt(e,a),u=Ic(l.stateNode,e,u),Dc(l,u),Tl!==4&&(Tl=2)),!1;var n=Error(m(520),{cause:e});if(n=mt(n,a),uu===null?uu=[n]:uu.push(n),Tl!==4&&(Tl=2),t===null)return!0;e=mt(e,a),a=t;do{switch(a.tag){case 3:return a.flags|=65536,l=u&-u,a.lanes|=l,l=Ic(a.stateNode,e,l),Dc(a,l),!1;case 1:if(t=a.type,n=a.stateNode,(a.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(fa===null||!fa.has(n))))return a.flags|=65536,u&=-u,a.lanes|=u,u=ho(u),go(u,l,a,e),Dc(a,u),!1}a=a.return}while(a!==null);return!1}var bo=Error(m(461)),Yl=!1;function Ql(l,t,a,e){t.child=l===null?io(t,null,a,e):ce(t,l.child,a,e)}function So(l,t,a,e,u){a=a.render;var n=t.ref;if("ref"in e){var c={};for(var i in e)i!=="ref"&&(c[i]=e[i])}else c=e;return Oa(t),e=qc(l,t,a,c,n,u),i=Bc(),l!==null&&!Yl?(Yc(l,t,u),Qt(l,t,u)):(al&&i&&bc(t),t.flags|=1,Ql(l,t,e,u),t.child)}function xo(l,t,a,e,u){if(l===null){var n=a.type;return typeof n=="function"&&!vc(n)&&n.defaultProps===void 0&&a.compare===null?(t.tag=15,t.type=n,To(l,t,n,e,u)):(l=Gu(a.type,null,e,t,t.mode,u),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!ci(l,u)){var c=n.memoizedProps;if(a=a.compare,a=a!==null?a:Ue,a(c,e)&&l.ref===t.ref)return Qt(l,t,u)}return t.flags|=1,l=Ht(n,e),l.ref=t.ref,l.return=t,t.child=l}function To(l,t,a,e,u){if(l!==null){var n=l.memoizedProps;if(Ue(n,e)&&l.ref===t.ref)if(Yl=!1,t.pendingProps=e=n,ci(l,u))(l.flags&131072)!==0&&(Yl=!0);else return t.lanes=l.lanes,Qt(l,t,u)}return Pc(l,t,a,e,u)}function Eo(l,t,a){var e=t.pendingProps,u=e.children,n=l!==null?l.memoizedState:null;if(e.mode==="hidden"){if((t.flags&128)!==0){if(e=n!==null?n.baseLanes|a:a,l!==null){for(u=t.child=l.child,n=0;u!==null;)n=n|u.lanes|u.childLanes,u=u.sibling;t.childLanes=n&~e}else t.childLanes=0,t.child=null;return Ao(l,t,e,a)}if((a&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&Lu(t,n!==null?n.cachePool:null),n!==null?xs(t,n):Rc(),fo(t);else return t.lanes=t.childLanes=536870912,Ao(l,t,n!==null?n.baseLanes|a:a,a)}else n!==null?(Lu(t,n.cachePool),xs(t,n),aa(),t.memoizedState=null):(l!==null&&Lu(t,null),Rc(),aa());return Ql(l,t,u,a),t.child}function Ao(l,t,a,e){var u=_c();return u=u===null?null:{parent:Ul._currentValue,pool:u},t.memoizedState={baseLanes:a,cachePool:u},l!==null&&Lu(t,null),Rc(),fo(t),l!==null&&Ce(l,t,e,!0),null}function fn(l,t){var a=t.ref;if(a===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof a!="function"&&typeof a!="object")throw Error(m(284));(l===null||l.ref!==a)&&(t.flags|=4194816)}}function Pc(l,t,a,e,u){return Oa(t),a=qc(l,t,a,e,void 0,u),e=Bc(),l!==null&&!Yl?(Yc(l,t,u),Qt(l,t,u)):(al&&e&&bc(t),t.flags|=1,Ql(l,t,a,u),t.child)}function po(l,t,a,e,u,n){return Oa(t),t.updateQueue=null,a=Es(t,e,a,u),Ts(l),e=Bc(),l!==null&&!Yl?(Yc(l,t,n),Qt(l,t,n)):(al&&e&&bc(t),t.flags|=1,Ql(l,t,a,n),t.child)}function zo(l,t,a,e,u){if(Oa(t),t.stateNode===null){var n=ka,c=a.contextType;typeof c=="object"&&c!==null&&(n=$l(c)),n=new a(e,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=Fc,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=e,n.state=t.memoizedState,n.refs={},Oc(t),c=a.contextType,n.context=typeof c=="object"&&c!==null?$l(c):ka,n.state=t.memoizedState,c=a.getDerivedStateFromProps,typeof c=="function"&&(kc(t,a,c,e),n.state=t.memoizedState),typeof a.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(c=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),c!==n.state&&Fc.enqueueReplaceState(n,n.state,null),Ke(t,e,n,u),Le(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),e=!0}else if(l===null){n=t.stateNode;var i=t.memoizedProps,s=ja(a,i);n.props=s;var y=n.context,S=a.contextType;c=ka,typeof S=="object"&&S!==null&&(c=$l(S));var E=a.getDerivedStateFromProps;S=typeof E=="function"||typeof n.getSnapshotBeforeUpdate=="function",i=t.pendingProps!==i,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i||y!==c)&&oo(t,n,e,c),Ft=!1;var h=t.memoizedState;n.state=h,Ke(t,e,n,u),Le(),y=t.memoizedState,i||h!==y||Ft?(typeof E=="function"&&(kc(t,a,E,e),y=t.memoizedState),(s=Ft||so(t,a,s,e,h,y,c))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=e,t.memoizedState=y),n.props=e,n.state=y,n.context=c,e=s):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),e=!1)}else{n=t.stateNode,Mc(l,t),c=t.memoizedProps,S=ja(a,c),n.props=S,E=t.pendingProps,h=n.context,y=a.contextType,s=ka,typeof y=="object"&&y!==null&&(s=$l(y)),i=a.getDerivedStateFromProps,(y=typeof i=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c!==E||h!==s)&&oo(t,n,e,s),Ft=!1,h=t.memoizedState,n.state=h,Ke(t,e,n,u),Le();var g=t.memoizedState;c!==E||h!==g||Ft||l!==null&&l.dependencies!==null&&Zu(l.dependencies)?(typeof i=="function"&&(kc(t,a,i,e),g=t.memoizedState),(S=Ft||so(t,a,S,e,h,g,s)||l!==null&&l.dependencies!==null&&Zu(l.dependencies))?(y||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(e,g,s),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(e,g,s)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||c===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),t.memoizedProps=e,t.memoizedState=g),n.props=e,n.state=g,n.context=s,e=S):(typeof n.componentDidUpdate!="function"||c===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),e=!1)}return n=e,fn(l,t),e=(t.flags&128)!==0,n||e?(n=t.stateNode,a=e&&typeof a.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&e?(t.child=ce(t,l.child,null,u),t.child=ce(t,null,a,u)):Ql(l,t,a,u),t.memoizedState=n.state,l=t.child):l=Qt(l,t,u),l}function _o(l,t,a,e){return Be(),t.flags|=256,Ql(l,t,a,e),t.child}var li={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function ti(l){return{baseLanes:l,cachePool:ds()}}function ai(l,t,a){return l=l!==null?l.childLanes&~a:0,t&&(l|=St),l}function No(l,t,a){var e=t.pendingProps,u=!1,n=(t.flags&128)!==0,c;if((c=n)||(c=l!==null&&l.memoizedState===null?!1:(Hl.current&2)!==0),c&&(u=!0,t.flags&=-129),c=(t.flags&32)!==0,t.flags&=-33,l===null){if(al){if(u?ta(t):aa(),al){var i=xl,s;if(s=i){l:{for(s=i,i=Nt;s.nodeType!==8;){if(!i){i=null;break l}if(s=At(s.nextSibling),s===null){i=null;break l}}i=s}i!==null?(t.memoizedState={dehydrated:i,treeContext:Aa!==null?{id:qt,overflow:Bt}:null,retryLane:536870912,hydrationErrors:null},s=nt(18,null,null,0),s.stateNode=i,s.return=t,t.child=s,kl=t,xl=null,s=!0):s=!1}s||_a(t)}if(i=t.memoizedState,i!==null&&(i=i.dehydrated,i!==null))return Gi(i)?t.lanes=32:t.lanes=536870912,null;Xt(t)}return i=e.children,e=e.fallback,u?(aa(),u=t.mode,i=sn({mode:"hidden",children:i},u),e=Ea(e,u,a,null),i.return=t,e.return=t,i.sibling=e,t.child=i,u=t.child,u.memoizedState=ti(a),u.childLanes=ai(l,c,a),t.memoizedState=li,e):(ta(t),ei(t,i))}if(s=l.memoizedState,s!==null&&(i=s.dehydrated,i!==null)){if(n)t.flags&256?(ta(t),t.flags&=-257,t=ui(l,t,a)):t.memoizedState!==null?(aa(),t.child=l.child,t.flags|=128,t=null):(aa(),u=e.fallback,i=t.mode,e=sn({mode:"visible",children:e.children},i),u=Ea(u,i,a,null),u.flags|=2,e.return=t,u.return=t,e.sibling=u,t.child=e,ce(t,l.child,null,a),e=t.child,e.memoizedState=ti(a),e.childLanes=ai(l,c,a),t.memoizedState=li,t=u);else if(ta(t),Gi(i)){if(c=i.nextSibling&&i.nextSibling.dataset,c)var y=c.dgst;c=y,e=Error(m(419)),e.stack="",e.digest=c,Ye({value:e,source:null,stack:null}),t=ui(l,t,a)}else if(Yl||Ce(l,t,a,!1),c=(a&l.childLanes)!==0,Yl||c){if(c=dl,c!==null&&(e=a&-a,e=(e&42)!==0?1:Xn(e),e=(e&(c.suspendedLanes|a))!==0?0:e,e!==0&&e!==s.retryLane))throw s.retryLane=e,Wa(l,e),ot(c,l,e),bo;i.data==="$?"||Ei(),t=ui(l,t,a)}else i.data==="$?"?(t.flags|=192,t.child=l.child,t=null):(l=s.treeContext,xl=At(i.nextSibling),kl=t,al=!0,za=null,Nt=!1,l!==null&&(ht[gt++]=qt,ht[gt++]=Bt,ht[gt++]=Aa,qt=l.id,Bt=l.overflow,Aa=t),t=ei(t,e.children),t.flags|=4096);return t}return u?(aa(),u=e.fallback,i=t.mode,s=l.child,y=s.sibling,e=Ht(s,{mode:"hidden",children:e.children}),e.subtreeFlags=s.subtreeFlags&65011712,y!==null?u=Ht(y,u):(u=Ea(u,i,a,null),u.flags|=2),u.return=t,e.return=t,e.sibling=u,t.child=e,e=u,u=t.child,i=l.child.memoizedState,i===null?i=ti(a):(s=i.cachePool,s!==null?(y=Ul._currentValue,s=s.parent!==y?{parent:y,pool:y}:s):s=ds(),i={baseLanes:i.baseLanes|a,cachePool:s}),u.memoizedState=i,u.childLanes=ai(l,c,a),t.memoizedState=li,e):(ta(t),a=l.child,l=a.sibling,a=Ht(a,{mode:"visible",children:e.children}),a.return=t,a.sibling=null,l!==null&&(c=t.deletions,c===null?(t.deletions=[l],t.flags|=16):c.push(l)),t.child=a,t.memoizedState=null,a)}function ei(l,t){return t=sn({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function sn(l,t){return l=nt(22,l,null,t),l.lanes=0,l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},l}function ui(l,t,a){return ce(t,l.child,null,a),l=ei(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Oo(l,t,a){l.lanes|=t;var e=l.alternate;e!==null&&(e.lanes|=t),Ec(l.return,t,a)}function ni(l,t,a,e,u){var n=l.memoizedState;n===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:e,tail:a,tailMode:u}:(n.isBackwards=t,n.rendering=null,n.renderingStartTime=0,n.last=e,n.tail=a,n.tailMode=u)}function Mo(l,t,a){var e=t.pendingProps,u=e.revealOrder,n=e.tail;if(Ql(l,t,e.children,a),e=Hl.current,(e&2)!==0)e=e&1|2,t.flags|=128;else{if(l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Oo(l,a,t);else if(l.tag===19)Oo(l,a,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}e&=1}switch(N(Hl,e),u){case"forwards":for(a=t.child,u=null;a!==null;)l=a.alternate,l!==null&&un(l)===null&&(u=a),a=a.sibling;a=u,a===null?(u=t.child,t.child=null):(u=a.sibling,a.sibling=null),ni(t,!1,u,a,n);break;case"backwards":for(a=null,u=t.child,t.child=null;u!==null;){if(l=u.alternate,l!==null&&un(l)===null){t.child=u;break}l=u.sibling,u.sibling=a,a=u,u=l}ni(t,!0,a,null,n);break;case"together":ni(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Qt(l,t,a){if(l!==null&&(t.dependencies=l.dependencies),ia|=t.lanes,(a&t.childLanes)===0)if(l!==null){if(Ce(l,t,a,!1),(a&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(m(153));if(t.child!==null){for(l=t.child,a=Ht(l,l.pendingProps),t.child=a,a.return=t;l.sibling!==null;)l=l.sibling,a=a.sibling=Ht(l,l.pendingProps),a.return=t;a.sibling=null}return t.child}function ci(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&Zu(l)))}function Rd(l,t,a){switch(t.tag){case 3:cl(t,t.stateNode.containerInfo),kt(t,Ul,l.memoizedState.cache),Be();break;case 27:case 5:xe(t);break;case 4:cl(t,t.stateNode.containerInfo);break;case 10:kt(t,t.type,t.memoizedProps.value);break;case 13:var e=t.memoizedState;if(e!==null)return e.dehydrated!==null?(ta(t),t.flags|=128,null):(a&t.child.childLanes)!==0?No(l,t,a):(ta(t),l=Qt(l,t,a),l!==null?l.sibling:null);ta(t);break;case 19:var u=(l.flags&128)!==0;if(e=(a&t.childLanes)!==0,e||(Ce(l,t,a,!1),e=(a&t.childLanes)!==0),u){if(e)return Mo(l,t,a);t.flags|=128}if(u=t.memoizedState,u!==null&&(u.rendering=null,u.tail=null,u.lastEffect=null),N(Hl,Hl.current),e)break;return null;case 22:case 23:return t.lanes=0,Eo(l,t,a);case 24:kt(t,Ul,l.memoizedState.cache)}return Qt(l,t,a)}function Do(l,t,a){if(l!==null)if(l.memoizedProps!==t.pendingProps)Yl=!0;else{if(!ci(l,a)&&(t.flags&128)===0)return Yl=!1,Rd(l,t,a);Yl=(l.flags&131072)!==0}else Yl=!1,al&&(t.flags&1048576)!==0&&ns(t,Qu,t.index);switch(t.lanes=0,t.tag){case 16:l:{l=t.pendingProps;var e=t.elementType,u=e._init;if(e=u(e._payload),t.type=e,typeof e=="function")vc(e)?(l=ja(e,l),t.tag=1,t=zo(null,t,e,l,a)):(t.tag=0,t=Pc(null,t,e,l,a));else{if(e!=null){if(u=e.$$typeof,u===Al){t.tag=11,t=So(null,t,e,l,a);break l}else if(u===Xl){t.tag=14,t=xo(null,t,e,l,a);break l}}throw t=zt(e)||e,Error(m(306,t,""))}}return t;case 0:return Pc(l,t,t.type,t.pendingProps,a);case 1:return e=t.type,u=ja(e,t.pendingProps),zo(l,t,e,u,a);case 3:l:{if(cl(t,t.stateNode.containerInfo),l===null)throw Error(m(387));e=t.pendingProps;var n=t.memoizedState;u=n.element,Mc(l,t),Ke(t,e,null,a);var c=t.memoizedState;if(e=c.cache,kt(t,Ul,e),e!==n.cache&&Ac(t,[Ul],a,!0),Le(),e=c.element,n.isDehydrated)if(n={element:e,isDehydrated:!1,cache:c.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=_o(l,t,e,a);break l}else if(e!==u){u=mt(Error(m(424)),t),Ye(u),t=_o(l,t,e,a);break l}else{switch(l=t.stateNode.containerInfo,l.nodeType){case 9:l=l.body;break;default:l=l.nodeName==="HTML"?l.ownerDocument.body:l}for(xl=At(l.firstChild),kl=t,al=!0,za=null,Nt=!0,a=io(t,null,e,a),t.child=a;a;)a.flags=a.flags&-3|4096,a=a.sibling}else{if(Be(),e===u){t=Qt(l,t,a);break l}Ql(l,t,e,a)}t=t.child}return t;case 26:return fn(l,t),l===null?(a=H0(t.type,null,t.pendingProps,null))?t.memoizedState=a:al||(a=t.type,l=t.pendingProps,e=An(G.current).createElement(a),e[wl]=t,e[Fl]=l,Vl(e,a,l),Bl(e),t.stateNode=e):t.memoizedState=H0(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return xe(t),l===null&&al&&(e=t.stateNode=j0(t.type,t.pendingProps,G.current),kl=t,Nt=!0,u=xl,ra(t.type)?(Xi=u,xl=At(e.firstChild)):xl=u),Ql(l,t,t.pendingProps.children,a),fn(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&al&&((u=e=xl)&&(e=cy(e,t.type,t.pendingProps,Nt),e!==null?(t.stateNode=e,kl=t,xl=At(e.firstChild),Nt=!1,u=!0):u=!1),u||_a(t)),xe(t),u=t.type,n=t.pendingProps,c=l!==null?l.memoizedProps:null,e=n.children,Bi(u,n)?e=null:c!==null&&Bi(u,c)&&(t.flags|=32),t.memoizedState!==null&&(u=qc(l,t,pd,null,null,a),yu._currentValue=u),fn(l,t),Ql(l,t,e,a),t.child;case 6:return l===null&&al&&((l=a=xl)&&(a=iy(a,t.pendingProps,Nt),a!==null?(t.stateNode=a,kl=t,xl=null,l=!0):l=!1),l||_a(t)),null;case 13:return No(l,t,a);case 4:return cl(t,t.stateNode.containerInfo),e=t.pendingProps,l===null?t.child=ce(t,null,e,a):Ql(l,t,e,a),t.child;case 11:return So(l,t,t.type,t.pendingProps,a);case 7:return Ql(l,t,t.pendingProps,a),t.child;case 8:return Ql(l,t,t.pendingProps.children,a),t.child;case 12:return Ql(l,t,t.pendingProps.children,a),t.child;case 10:return e=t.pendingProps,kt(t,t.type,e.value),Ql(l,t,e.children,a),t.child;case 9:return u=t.type._context,e=t.pendingProps.children,Oa(t),u=$l(u),e=e(u),t.flags|=1,Ql(l,t,e,a),t.child;case 14:return xo(l,t,t.type,t.pendingProps,a);case 15:return To(l,t,t.type,t.pendingProps,a);case 19:return Mo(l,t,a);case 31:return e=t.pendingProps,a=t.mode,e={mode:e.mode,children:e.children},l===null?(a=sn(e,a),a.ref=t.ref,t.child=a,a.return=t,t=a):(a=Ht(l.child,e),a.ref=t.ref,t.child=a,a.return=t,t=a),t;case 22:return Eo(l,t,a);case 24:return Oa(t),e=$l(Ul),l===null?(u=_c(),u===null&&(u=dl,n=pc(),u.pooledCache=n,n.refCount++,n!==null&&(u.pooledCacheLanes|=a),u=n),t.memoizedState={parent:e,cache:u},Oc(t),kt(t,Ul,u)):((l.lanes&a)!==0&&(Mc(l,t),Ke(t,null,null,a),Le()),u=l.memoizedState,n=t.memoizedState,u.parent!==e?(u={parent:e,cache:e},t.memoizedState=u,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=u),kt(t,Ul,e)):(e=n.cache,kt(t,Ul,e),e!==u.cache&&Ac(t,[Ul],a,!0))),Ql(l,t,t.pendingProps.children,a),t.child;case 29:throw t.pendingProps}throw Error(m(156,t.tag))}function Zt(l){l.flags|=4}function jo(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!G0(t)){if(t=bt.current,t!==null&&((I&4194048)===I?Ot!==null:(I&62914560)!==I&&(I&536870912)===0||t!==Ot))throw Ze=Nc,ys;l.flags|=8192}}function on(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?ff():536870912,l.lanes|=t,oe|=t)}function Ie(l,t){if(!al)switch(l.tailMode){case"hidden":t=l.tail;for(var a=null;t!==null;)t.alternate!==null&&(a=t),t=t.sibling;a===null?l.tail=null:a.sibling=null;break;case"collapsed":a=l.tail;for(var e=null;a!==null;)a.alternate!==null&&(e=a),a=a.sibling;e===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:e.sibling=null}}function bl(l){var t=l.alternate!==null&&l.alternate.child===l.child,a=0,e=0;if(t)for(var u=l.child;u!==null;)a|=u.lanes|u.childLanes,e|=u.subtreeFlags&65011712,e|=u.flags&65011712,u.return=l,u=u.sibling;else for(u=l.child;u!==null;)a|=u.lanes|u.childLanes,e|=u.subtreeFlags,e|=u.flags,u.return=l,u=u.sibling;return l.subtreeFlags|=e,l.childLanes=a,t}function Ud(l,t,a){var e=t.pendingProps;switch(Sc(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return bl(t),null;case 1:return bl(t),null;case 3:return a=t.stateNode,e=null,l!==null&&(e=l.memoizedState.cache),t.memoizedState.cache!==e&&(t.flags|=2048),Ct(Ul),B(),a.pendingContext&&(a.context=a.pendingContext,a.pendingContext=null),(l===null||l.child===null)&&(qe(t)?Zt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,fs())),bl(t),null;case 26:return a=t.memoizedState,l===null?(Zt(t),a!==null?(bl(t),jo(t,a)):(bl(t),t.flags&=-16777217)):a?a!==l.memoizedState?(Zt(t),bl(t),jo(t,a)):(bl(t),t.flags&=-16777217):(l.memoizedProps!==e&&Zt(t),bl(t),t.flags&=-16777217),null;case 27:xu(t),a=G.current;var u=t.type;if(l!==null&&t.stateNode!=null)l.memoizedProps!==e&&Zt(t);else{if(!e){if(t.stateNode===null)throw Error(m(166));return bl(t),null}l=H.current,qe(t)?cs(t):(l=j0(u,e,a),t.stateNode=l,Zt(t))}return bl(t),null;case 5:if(xu(t),a=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==e&&Zt(t);else{if(!e){if(t.stateNode===null)throw Error(m(166));return bl(t),null}if(l=H.current,qe(t))cs(t);else{switch(u=An(G.current),l){case 1:l=u.createElementNS("http://www.w3.org/2000/svg",a);break;case 2:l=u.createElementNS("http://www.w3.org/1998/Math/MathML",a);break;default:switch(a){case"svg":l=u.createElementNS("http://www.w3.org/2000/svg",a);break;case"math":l=u.createElementNS("http://www.w3.org/1998/Math/MathML",a);break;case"script":l=u.createElement("div"),l.innerHTML="<script><\/script>",l=l.removeChild(l.firstChild);break;case"select":l=typeof e.is=="string"?u.createElement("select",{is:e.is}):u.createElement("select"),e.multiple?l.multiple=!0:e.size&&(l.size=e.size);break;default:l=typeof e.is=="string"?u.createElement(a,{is:e.is}):u.createElement(a)}}l[wl]=t,l[Fl]=e;l:for(u=t.child;u!==null;){if(u.tag===5||u.tag===6)l.appendChild(u.stateNode);else if(u.tag!==4&&u.tag!==27&&u.child!==null){u.child.return=u,u=u.child;continue}if(u===t)break l;for(;u.sibling===null;){if(u.return===null||u.return===t)break l;u=u.return}u.sibling.return=u.return,u=u.sibling}t.stateNode=l;l:switch(Vl(l,a,e),a){case"button":case"input":case"select":case"textarea":l=!!e.autoFocus;break l;case"img":l=!0;break l;default:l=!1}l&&Zt(t)}}return bl(t),t.flags&=-16777217,null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==e&&Zt(t);else{if(typeof e!="string"&&t.stateNode===null)throw Error(m(166));if(l=G.current,qe(t)){if(l=t.stateNode,a=t.memoizedProps,e=null,u=kl,u!==null)switch(u.tag){case 27:case 5:e=u.memoizedProps}l[wl]=t,l=!!(l.nodeValue===a||e!==null&&e.suppressHydrationWarning===!0||p0(l.nodeValue,a)),l||_a(t)}else l=An(l).createTextNode(e),l[wl]=t,t.stateNode=l}return bl(t),null;case 13:if(e=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(u=qe(t),e!==null&&e.dehydrated!==null){if(l===null){if(!u)throw Error(m(318));if(u=t.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(m(317));u[wl]=t}else Be(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;bl(t),u=!1}else u=fs(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=u),u=!0;if(!u)return t.flags&256?(Xt(t),t):(Xt(t),null)}if(Xt(t),(t.flags&128)!==0)return t.lanes=a,t;if(a=e!==null,l=l!==null&&l.memoizedState!==null,a){e=t.child,u=null,e.alternate!==null&&e.alternate.memoizedState!==null&&e.alternate.memoizedState.cachePool!==null&&(u=e.alternate.memoizedState.cachePool.pool);var n=null;e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(n=e.memoizedState.cachePool.pool),n!==u&&(e.flags|=2048)}return a!==l&&a&&(t.child.flags|=8192),on(t,t.updateQueue),bl(t),null;case 4:return B(),l===null&&ji(t.stateNode.containerInfo),bl(t),null;case 10:return Ct(t.type),bl(t),null;case 19:if(M(Hl),u=t.memoizedState,u===null)return bl(t),null;if(e=(t.flags&128)!==0,n=u.rendering,n===null)if(e)Ie(u,!1);else{if(Tl!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=un(l),n!==null){for(t.flags|=128,Ie(u,!1),l=n.updateQueue,t.updateQueue=l,on(t,l),t.subtreeFlags=0,l=a,a=t.child;a!==null;)us(a,l),a=a.sibling;return N(Hl,Hl.current&1|2),t.child}l=l.sibling}u.tail!==null&&_t()>yn&&(t.flags|=128,e=!0,Ie(u,!1),t.lanes=4194304)}else{if(!e)if(l=un(n),l!==null){if(t.flags|=128,e=!0,l=l.updateQueue,t.updateQueue=l,on(t,l),Ie(u,!0),u.tail===null&&u.tailMode==="hidden"&&!n.alternate&&!al)return bl(t),null}else 2*_t()-u.renderingStartTime>yn&&a!==536870912&&(t.flags|=128,e=!0,Ie(u,!1),t.lanes=4194304);u.isBackwards?(n.sibling=t.child,t.child=n):(l=u.last,l!==null?l.sibling=n:t.child=n,u.last=n)}return u.tail!==null?(t=u.tail,u.rendering=t,u.tail=t.sibling,u.renderingStartTime=_t(),t.sibling=null,l=Hl.current,N(Hl,e?l&1|2:l&1),t):(bl(t),null);case 22:case 23:return Xt(t),Uc(),e=t.memoizedState!==null,l!==null?l.memoizedState!==null!==e&&(t.flags|=8192):e&&(t.flags|=8192),e?(a&536870912)!==0&&(t.flags&128)===0&&(bl(t),t.subtreeFlags&6&&(t.flags|=8192)):bl(t),a=t.updateQueue,a!==null&&on(t,a.retryQueue),a=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),e=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),e!==a&&(t.flags|=2048),l!==null&&M(Ma),null;case 24:return a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Ct(Ul),bl(t),null;case 25:return null;case 30:return null}throw Error(m(156,t.tag))}function Hd(l,t){switch(Sc(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Ct(Ul),B(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return xu(t),null;case 13:if(Xt(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(m(340));Be()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return M(Hl),null;case 4:return B(),null;case 10:return Ct(t.type),null;case 22:case 23:return Xt(t),Uc(),l!==null&&M(Ma),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Ct(Ul),null;case 25:return null;default:return null}}function Ro(l,t){switch(Sc(t),t.tag){case 3:Ct(Ul),B();break;case 26:case 27:case 5:xu(t);break;case 4:B();break;case 13:Xt(t);break;case 19:M(Hl);break;case 10:Ct(t.type);break;case 22:case 23:Xt(t),Uc(),l!==null&&M(Ma);break;case 24:Ct(Ul)}}function Pe(l,t){try{var a=t.updateQueue,e=a!==null?a.lastEffect:null;if(e!==null){var u=e.next;a=u;do{if((a.tag&l)===l){e=void 0;var n=a.create,c=a.inst;e=n(),c.destroy=e}a=a.next}while(a!==u)}}catch(i){rl(t,t.return,i)}}function ea(l,t,a){try{var e=t.updateQueue,u=e!==null?e.lastEffect:null;if(u!==null){var n=u.next;e=n;do{if((e.tag&l)===l){var c=e.inst,i=c.destroy;if(i!==void 0){c.destroy=void 0,u=t;var s=a,y=i;try{y()}catch(S){rl(u,s,S)}}}e=e.next}while(e!==n)}}catch(S){rl(t,t.return,S)}}function Uo(l){var t=l.updateQueue;if(t!==null){var a=l.stateNode;try{Ss(t,a)}catch(e){rl(l,l.return,e)}}}function Ho(l,t,a){a.props=ja(l.type,l.memoizedProps),a.state=l.memoizedState;try{a.componentWillUnmount()}catch(e){rl(l,t,e)}}function lu(l,t){try{var a=l.ref;if(a!==null){switch(l.tag){case 26:case 27:case 5:var e=l.stateNode;break;case 30:e=l.stateNode;break;default:e=l.stateNode}typeof a=="function"?l.refCleanup=a(e):a.current=e}}catch(u){rl(l,t,u)}}function Mt(l,t){var a=l.ref,e=l.refCleanup;if(a!==null)if(typeof e=="function")try{e()}catch(u){rl(l,t,u)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof a=="function")try{a(null)}catch(u){rl(l,t,u)}else a.current=null}function qo(l){var t=l.type,a=l.memoizedProps,e=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":a.autoFocus&&e.focus();break l;case"img":a.src?e.src=a.src:a.srcSet&&(e.srcset=a.srcSet)}}catch(u){rl(l,l.return,u)}}function ii(l,t,a){try{var e=l.stateNode;ty(e,l.type,a,t),e[Fl]=t}catch(u){rl(l,l.return,u)}}function Bo(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&ra(l.type)||l.tag===4}function fi(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||Bo(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&ra(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function si(l,t,a){var e=l.tag;if(e===5||e===6)l=l.stateNode,t?(a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a).insertBefore(l,t):(t=a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a,t.appendChild(l),a=a._reactRootContainer,a!=null||t.onclick!==null||(t.onclick=En));else if(e!==4&&(e===27&&ra(l.type)&&(a=l.stateNode,t=null),l=l.child,l!==null))for(si(l,t,a),l=l.sibling;l!==null;)si(l,t,a),l=l.sibling}function rn(l,t,a){var e=l.tag;if(e===5||e===6)l=l.stateNode,t?a.insertBefore(l,t):a.appendChild(l);else if(e!==4&&(e===27&&ra(l.type)&&(a=l.stateNode),l=l.child,l!==null))for(rn(l,t,a),l=l.sibling;l!==null;)rn(l,t,a),l=l.sibling}function Yo(l){var t=l.stateNode,a=l.memoizedProps;try{for(var e=l.type,u=t.attributes;u.length;)t.removeAttributeNode(u[0]);Vl(t,e,a),t[wl]=l,t[Fl]=a}catch(n){rl(l,l.return,n)}}var Vt=!1,zl=!1,oi=!1,Co=typeof WeakSet=="function"?WeakSet:Set,Cl=null;function qd(l,t){if(l=l.containerInfo,Hi=Mn,l=$f(l),fc(l)){if("selectionStart"in l)var a={start:l.selectionStart,end:l.selectionEnd};else l:{a=(a=l.ownerDocument)&&a.defaultView||window;var e=a.getSelection&&a.getSelection();if(e&&e.rangeCount!==0){a=e.anchorNode;var u=e.anchorOffset,n=e.focusNode;e=e.focusOffset;try{a.nodeType,n.nodeType}catch{a=null;break l}var c=0,i=-1,s=-1,y=0,S=0,E=l,h=null;t:for(;;){for(var g;E!==a||u!==0&&E.nodeType!==3||(i=c+u),E!==n||e!==0&&E.nodeType!==3||(s=c+e),E.nodeType===3&&(c+=E.nodeValue.length),(g=E.firstChild)!==null;)h=E,E=g;for(;;){if(E===l)break t;if(h===a&&++y===u&&(i=c),h===n&&++S===e&&(s=c),(g=E.nextSibling)!==null)break;E=h,h=E.parentNode}E=g}a=i===-1||s===-1?null:{start:i,end:s}}else a=null}a=a||{start:0,end:0}}else a=null;for(qi={focusedElem:l,selectionRange:a},Mn=!1,Cl=t;Cl!==null;)if(t=Cl,l=t.child,(t.subtreeFlags&1024)!==0&&l!==null)l.return=t,Cl=l;else for(;Cl!==null;){switch(t=Cl,n=t.alternate,l=t.flags,t.tag){case 0:break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,a=t,u=n.memoizedProps,n=n.memoizedState,e=a.stateNode;try{var Q=ja(a.type,u,a.elementType===a.type);l=e.getSnapshotBeforeUpdate(Q,n),e.__reactInternalSnapshotBeforeUpdate=l}catch(Y){rl(a,a.return,Y)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,a=l.nodeType,a===9)Ci(l);else if(a===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":Ci(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(m(163))}if(l=t.sibling,l!==null){l.return=t.return,Cl=l;break}Cl=t.return}}function Go(l,t,a){var e=a.flags;switch(a.tag){case 0:case 11:case 15:ua(l,a),e&4&&Pe(5,a);break;case 1:if(ua(l,a),e&4)if(l=a.stateNode,t===null)try{l.componentDidMount()}catch(c){rl(a,a.return,c)}else{var u=ja(a.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(u,t,l.__reactInternalSnapshotBeforeUpdate)}catch(c){rl(a,a.return,c)}}e&64&&Uo(a),e&512&&lu(a,a.return);break;case 3:if(ua(l,a),e&64&&(l=a.updateQueue,l!==null)){if(t=null,a.child!==null)switch(a.child.tag){case 27:case 5:t=a.child.stateNode;break;case 1:t=a.child.stateNode}try{Ss(l,t)}catch(c){rl(a,a.return,c)}}break;case 27:t===null&&e&4&&Yo(a);case 26:case 5:ua(l,a),t===null&&e&4&&qo(a),e&512&&lu(a,a.return);break;case 12:ua(l,a);break;case 13:ua(l,a),e&4&&Zo(l,a),e&64&&(l=a.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(a=Ld.bind(null,a),fy(l,a))));break;case 22:if(e=a.memoizedState!==null||Vt,!e){t=t!==null&&t.memoizedState!==null||zl,u=Vt;var n=zl;Vt=e,(zl=t)&&!n?na(l,a,(a.subtreeFlags&8772)!==0):ua(l,a),Vt=u,zl=n}break;case 30:break;default:ua(l,a)}}function Xo(l){var t=l.alternate;t!==null&&(l.alternate=null,Xo(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&Vn(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var hl=null,lt=!1;function Lt(l,t,a){for(a=a.child;a!==null;)Qo(l,t,a),a=a.sibling}function Qo(l,t,a){if(at&&typeof at.onCommitFiberUnmount=="function")try{at.onCommitFiberUnmount(Te,a)}catch{}switch(a.tag){case 26:zl||Mt(a,t),Lt(l,t,a),a.memoizedState?a.memoizedState.count--:a.stateNode&&(a=a.stateNode,a.parentNode.removeChild(a));break;case 27:zl||Mt(a,t);var e=hl,u=lt;ra(a.type)&&(hl=a.stateNode,lt=!1),Lt(l,t,a),su(a.stateNode),hl=e,lt=u;break;case 5:zl||Mt(a,t);case 6:if(e=hl,u=lt,hl=null,Lt(l,t,a),hl=e,lt=u,hl!==null)if(lt)try{(hl.nodeType===9?hl.body:hl.nodeName==="HTML"?hl.ownerDocument.body:hl).removeChild(a.stateNode)}catch(n){rl(a,t,n)}else try{hl.removeChild(a.stateNode)}catch(n){rl(a,t,n)}break;case 18:hl!==null&&(lt?(l=hl,M0(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,a.stateNode),gu(l)):M0(hl,a.stateNode));break;case 4:e=hl,u=lt,hl=a.stateNode.containerInfo,lt=!0,Lt(l,t,a),hl=e,lt=u;break;case 0:case 11:case 14:case 15:zl||ea(2,a,t),zl||ea(4,a,t),Lt(l,t,a);break;case 1:zl||(Mt(a,t),e=a.stateNode,typeof e.componentWillUnmount=="function"&&Ho(a,t,e)),Lt(l,t,a);break;case 21:Lt(l,t,a);break;case 22:zl=(e=zl)||a.memoizedState!==null,Lt(l,t,a),zl=e;break;default:Lt(l,t,a)}}function Zo(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{gu(l)}catch(a){rl(t,t.return,a)}}function Bd(l){switch(l.tag){case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new Co),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new Co),t;default:throw Error(m(435,l.tag))}}function ri(l,t){var a=Bd(l);t.forEach(function(e){var u=Kd.bind(null,l,e);a.has(e)||(a.add(e),e.then(u,u))})}function ct(l,t){var a=t.deletions;if(a!==null)for(var e=0;e<a.length;e++){var u=a[e],n=l,c=t,i=c;l:for(;i!==null;){switch(i.tag){case 27:if(ra(i.type)){hl=i.stateNode,lt=!1;break l}break;case 5:hl=i.stateNode,lt=!1;break l;case 3:case 4:hl=i.stateNode.containerInfo,lt=!0;break l}i=i.return}if(hl===null)throw Error(m(160));Qo(n,c,u),hl=null,lt=!1,n=u.alternate,n!==null&&(n.return=null),u.return=null}if(t.subtreeFlags&13878)for(t=t.child;t!==null;)Vo(t,l),t=t.sibling}var Et=null;function Vo(l,t){var a=l.alternate,e=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:ct(t,l),it(l),e&4&&(ea(3,l,l.return),Pe(3,l),ea(5,l,l.return));break;case 1:ct(t,l),it(l),e&512&&(zl||a===null||Mt(a,a.return)),e&64&&Vt&&(l=l.updateQueue,l!==null&&(e=l.callbacks,e!==null&&(a=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=a===null?e:a.concat(e))));break;case 26:var u=Et;if(ct(t,l),it(l),e&512&&(zl||a===null||Mt(a,a.return)),e&4){var n=a!==null?a.memoizedState:null;if(e=l.memoizedState,a===null)if(e===null)if(l.stateNode===null){l:{e=l.type,a=l.memoizedProps,u=u.ownerDocument||u;t:switch(e){case"title":n=u.getElementsByTagName("title")[0],(!n||n[pe]||n[wl]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=u.createElement(e),u.head.insertBefore(n,u.querySelector("head > title"))),Vl(n,e,a),n[wl]=l,Bl(n),e=n;break l;case"link":var c=Y0("link","href",u).get(e+(a.href||""));if(c){for(var i=0;i<c.length;i++)if(n=c[i],n.getAttribute("href")===(a.href==null||a.href===""?null:a.href)&&n.getAttribute("rel")===(a.rel==null?null:a.rel)&&n.getAttribute("title")===(a.title==null?null:a.title)&&n.getAttribute("crossorigin")===(a.crossOrigin==null?null:a.crossOrigin)){c.splice(i,1);break t}}n=u.createElement(e),Vl(n,e,a),u.head.appendChild(n);break;case"meta":if(c=Y0("meta","content",u).get(e+(a.content||""))){for(i=0;i<c.length;i++)if(n=c[i],n.getAttribute("content")===(a.content==null?null:""+a.content)&&n.getAttribute("name")===(a.name==null?null:a.name)&&n.getAttribute("property")===(a.property==null?null:a.property)&&n.getAttribute("http-equiv")===(a.httpEquiv==null?null:a.httpEquiv)&&n.getAttribute("charset")===(a.charSet==null?null:a.charSet)){c.splice(i,1);break t}}n=u.createElement(e),Vl(n,e,a),u.head.appendChild(n);break;default:throw Error(m(468,e))}n[wl]=l,Bl(n),e=n}l.stateNode=e}else C0(u,l.type,l.stateNode);else l.stateNode=B0(u,e,l.memoizedProps);else n!==e?(n===null?a.stateNode!==null&&(a=a.stateNode,a.parentNode.removeChild(a)):n.count--,e===null?C0(u,l.type,l.stateNode):B0(u,e,l.memoizedProps)):e===null&&l.stateNode!==null&&ii(l,l.memoizedProps,a.memoizedProps)}break;case 27:ct(t,l),it(l),e&512&&(zl||a===null||Mt(a,a.return)),a!==null&&e&4&&ii(l,l.memoizedProps,a.memoizedProps);break;case 5:if(ct(t,l),it(l),e&512&&(zl||a===null||Mt(a,a.return)),l.flags&32){u=l.stateNode;try{Za(u,"")}catch(g){rl(l,l.return,g)}}e&4&&l.stateNode!=null&&(u=l.memoizedProps,ii(l,u,a!==null?a.memoizedProps:u)),e&1024&&(oi=!0);break;case 6:if(ct(t,l),it(l),e&4){if(l.stateNode===null)throw Error(m(162));e=l.memoizedProps,a=l.stateNode;try{a.nodeValue=e}catch(g){rl(l,l.return,g)}}break;case 3:if(_n=null,u=Et,Et=pn(t.containerInfo),ct(t,l),Et=u,it(l),e&4&&a!==null&&a.memoizedState.isDehydrated)try{gu(t.containerInfo)}catch(g){rl(l,l.return,g)}oi&&(oi=!1,Lo(l));break;case 4:e=Et,Et=pn(l.stateNode.containerInfo),ct(t,l),it(l),Et=e;break;case 12:ct(t,l),it(l);break;case 13:ct(t,l),it(l),l.child.flags&8192&&l.memoizedState!==null!=(a!==null&&a.memoizedState!==null)&&(gi=_t()),e&4&&(e=l.updateQueue,e!==null&&(l.updateQueue=null,ri(l,e)));break;case 22:u=l.memoizedState!==null;var s=a!==null&&a.memoizedState!==null,y=Vt,S=zl;if(Vt=y||u,zl=S||s,ct(t,l),zl=S,Vt=y,it(l),e&8192)l:for(t=l.stateNode,t._visibility=u?t._visibility&-2:t._visibility|1,u&&(a===null||s||Vt||zl||Ra(l)),a=null,t=l;;){if(t.tag===5||t.tag===26){if(a===null){s=a=t;try{if(n=s.stateNode,u)c=n.style,typeof c.setProperty=="function"?c.setProperty("display","none","important"):c.display="none";else{i=s.stateNode;var E=s.memoizedProps.style,h=E!=null&&E.hasOwnProperty("display")?E.display:null;i.style.display=h==null||typeof h=="boolean"?"":(""+h).trim()}}catch(g){rl(s,s.return,g)}}}else if(t.tag===6){if(a===null){s=t;try{s.stateNode.nodeValue=u?"":s.memoizedProps}catch(g){rl(s,s.return,g)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;a===t&&(a=null),t=t.return}a===t&&(a=null),t.sibling.return=t.return,t=t.sibling}e&4&&(e=l.updateQueue,e!==null&&(a=e.retryQueue,a!==null&&(e.retryQueue=null,ri(l,a))));break;case 19:ct(t,l),it(l),e&4&&(e=l.updateQueue,e!==null&&(l.updateQueue=null,ri(l,e)));break;case 30:break;case 21:break;default:ct(t,l),it(l)}}function it(l){var t=l.flags;if(t&2){try{for(var a,e=l.return;e!==null;){if(Bo(e)){a=e;break}e=e.return}if(a==null)throw Error(m(160));switch(a.tag){case 27:var u=a.stateNode,n=fi(l);rn(l,n,u);break;case 5:var c=a.stateNode;a.flags&32&&(Za(c,""),a.flags&=-33);var i=fi(l);rn(l,i,c);break;case 3:case 4:var s=a.stateNode.containerInfo,y=fi(l);si(l,y,s);break;default:throw Error(m(161))}}catch(S){rl(l,l.return,S)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function Lo(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;Lo(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function ua(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)Go(l,t.alternate,t),t=t.sibling}function Ra(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:ea(4,t,t.return),Ra(t);break;case 1:Mt(t,t.return);var a=t.stateNode;typeof a.componentWillUnmount=="function"&&Ho(t,t.return,a),Ra(t);break;case 27:su(t.stateNode);case 26:case 5:Mt(t,t.return),Ra(t);break;case 22:t.memoizedState===null&&Ra(t);break;case 30:Ra(t);break;default:Ra(t)}l=l.sibling}}function na(l,t,a){for(a=a&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var e=t.alternate,u=l,n=t,c=n.flags;switch(n.tag){case 0:case 11:case 15:na(u,n,a),Pe(4,n);break;case 1:if(na(u,n,a),e=n,u=e.stateNode,typeof u.componentDidMount=="function")try{u.componentDidMount()}catch(y){rl(e,e.return,y)}if(e=n,u=e.updateQueue,u!==null){var i=e.stateNode;try{var s=u.shared.hiddenCallbacks;if(s!==null)for(u.shared.hiddenCallbacks=null,u=0;u<s.length;u++)bs(s[u],i)}catch(y){rl(e,e.return,y)}}a&&c&64&&Uo(n),lu(n,n.return);break;case 27:Yo(n);case 26:case 5:na(u,n,a),a&&e===null&&c&4&&qo(n),lu(n,n.return);break;case 12:na(u,n,a);break;case 13:na(u,n,a),a&&c&4&&Zo(u,n);break;case 22:n.memoizedState===null&&na(u,n,a),lu(n,n.return);break;case 30:break;default:na(u,n,a)}t=t.sibling}}function di(l,t){var a=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==a&&(l!=null&&l.refCount++,a!=null&&Ge(a))}function yi(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Ge(l))}function Dt(l,t,a,e){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)Ko(l,t,a,e),t=t.sibling}function Ko(l,t,a,e){var u=t.flags;switch(t.tag){case 0:case 11:case 15:Dt(l,t,a,e),u&2048&&Pe(9,t);break;case 1:Dt(l,t,a,e);break;case 3:Dt(l,t,a,e),u&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Ge(l)));break;case 12:if(u&2048){Dt(l,t,a,e),l=t.stateNode;try{var n=t.memoizedProps,c=n.id,i=n.onPostCommit;typeof i=="function"&&i(c,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(s){rl(t,t.return,s)}}else Dt(l,t,a,e);break;case 13:Dt(l,t,a,e);break;case 23:break;case 22:n=t.stateNode,c=t.alternate,t.memoizedState!==null?n._visibility&2?Dt(l,t,a,e):tu(l,t):n._visibility&2?Dt(l,t,a,e):(n._visibility|=2,ie(l,t,a,e,(t.subtreeFlags&10256)!==0)),u&2048&&di(c,t);break;case 24:Dt(l,t,a,e),u&2048&&yi(t.alternate,t);break;default:Dt(l,t,a,e)}}function ie(l,t,a,e,u){for(u=u&&(t.subtreeFlags&10256)!==0,t=t.child;t!==null;){var n=l,c=t,i=a,s=e,y=c.flags;switch(c.tag){case 0:case 11:case 15:ie(n,c,i,s,u),Pe(8,c);break;case 23:break;case 22:var S=c.stateNode;c.memoizedState!==null?S._visibility&2?ie(n,c,i,s,u):tu(n,c):(S._visibility|=2,ie(n,c,i,s,u)),u&&y&2048&&di(c.alternate,c);break;case 24:ie(n,c,i,s,u),u&&y&2048&&yi(c.alternate,c);break;default:ie(n,c,i,s,u)}t=t.sibling}}function tu(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var a=l,e=t,u=e.flags;switch(e.tag){case 22:tu(a,e),u&2048&&di(e.alternate,e);break;case 24:tu(a,e),u&2048&&yi(e.alternate,e);break;default:tu(a,e)}t=t.sibling}}var au=8192;function fe(l){if(l.subtreeFlags&au)for(l=l.child;l!==null;)Jo(l),l=l.sibling}function Jo(l){switch(l.tag){case 26:fe(l),l.flags&au&&l.memoizedState!==null&&Ty(Et,l.memoizedState,l.memoizedProps);break;case 5:fe(l);break;case 3:case 4:var t=Et;Et=pn(l.stateNode.containerInfo),fe(l),Et=t;break;case 22:l.memoizedState===null&&(t=l.alternate,t!==null&&t.memoizedState!==null?(t=au,au=16777216,fe(l),au=t):fe(l));break;default:fe(l)}}function wo(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function eu(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var e=t[a];Cl=e,Wo(e,l)}wo(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)$o(l),l=l.sibling}function $o(l){switch(l.tag){case 0:case 11:case 15:eu(l),l.flags&2048&&ea(9,l,l.return);break;case 3:eu(l);break;case 12:eu(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,dn(l)):eu(l);break;default:eu(l)}}function dn(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var e=t[a];Cl=e,Wo(e,l)}wo(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:ea(8,t,t.return),dn(t);break;case 22:a=t.stateNode,a._visibility&2&&(a._visibility&=-3,dn(t));break;default:dn(t)}l=l.sibling}}function Wo(l,t){for(;Cl!==null;){var a=Cl;switch(a.tag){case 0:case 11:case 15:ea(8,a,t);break;case 23:case 22:if(a.memoizedState!==null&&a.memoizedState.cachePool!==null){var e=a.memoizedState.cachePool.pool;e!=null&&e.refCount++}break;case 24:Ge(a.memoizedState.cache)}if(e=a.child,e!==null)e.return=a,Cl=e;else l:for(a=l;Cl!==null;){e=Cl;var u=e.sibling,n=e.return;if(Xo(e),e===a){Cl=null;break l}if(u!==null){u.return=n,Cl=u;break l}Cl=n}}}var Yd={getCacheForType:function(l){var t=$l(Ul),a=t.data.get(l);return a===void 0&&(a=l(),t.data.set(l,a)),a}},Cd=typeof WeakMap=="function"?WeakMap:Map,ul=0,dl=null,k=null,I=0,nl=0,ft=null,ca=!1,se=!1,mi=!1,Kt=0,Tl=0,ia=0,Ua=0,vi=0,St=0,oe=0,uu=null,tt=null,hi=!1,gi=0,yn=1/0,mn=null,fa=null,Zl=0,sa=null,re=null,de=0,bi=0,Si=null,ko=null,nu=0,xi=null;function st(){if((ul&2)!==0&&I!==0)return I&-I;if(b.T!==null){var l=Pa;return l!==0?l:Ni()}return rf()}function Fo(){St===0&&(St=(I&536870912)===0||al?cf():536870912);var l=bt.current;return l!==null&&(l.flags|=32),St}function ot(l,t,a){(l===dl&&(nl===2||nl===9)||l.cancelPendingCommit!==null)&&(ye(l,0),oa(l,I,St,!1)),Ae(l,a),((ul&2)===0||l!==dl)&&(l===dl&&((ul&2)===0&&(Ua|=a),Tl===4&&oa(l,I,St,!1)),jt(l))}function Io(l,t,a){if((ul&6)!==0)throw Error(m(327));var e=!a&&(t&124)===0&&(t&l.expiredLanes)===0||Ee(l,t),u=e?Qd(l,t):Ai(l,t,!0),n=e;do{if(u===0){se&&!e&&oa(l,t,0,!1);break}else{if(a=l.current.alternate,n&&!Gd(a)){u=Ai(l,t,!1),n=!1;continue}if(u===2){if(n=t,l.errorRecoveryDisabledLanes&n)var c=0;else c=l.pendingLanes&-536870913,c=c!==0?c:c&536870912?536870912:0;if(c!==0){t=c;l:{var i=l;u=uu;var s=i.current.memoizedState.isDehydrated;if(s&&(ye(i,c).flags|=256),c=Ai(i,c,!1),c!==2){if(mi&&!s){i.errorRecoveryDisabledLanes|=n,Ua|=n,u=4;break l}n=tt,tt=u,n!==null&&(tt===null?tt=n:tt.push.apply(tt,n))}u=c}if(n=!1,u!==2)continue}}if(u===1){ye(l,0),oa(l,t,0,!0);break}l:{switch(e=l,n=u,n){case 0:case 1:throw Error(m(345));case 4:if((t&4194048)!==t)break;case 6:oa(e,t,St,!ca);break l;case 2:tt=null;break;case 3:case 5:break;default:throw Error(m(329))}if((t&62914560)===t&&(u=gi+300-_t(),10<u)){if(oa(e,t,St,!ca),pu(e,0,!0)!==0)break l;e.timeoutHandle=N0(Po.bind(null,e,a,tt,mn,hi,t,St,Ua,oe,ca,n,2,-0,0),u);break l}Po(e,a,tt,mn,hi,t,St,Ua,oe,ca,n,0,-0,0)}}break}while(!0);jt(l)}function Po(l,t,a,e,u,n,c,i,s,y,S,E,h,g){if(l.timeoutHandle=-1,E=t.subtreeFlags,(E&8192||(E&16785408)===16785408)&&(du={stylesheets:null,count:0,unsuspend:xy},Jo(t),E=Ey(),E!==null)){l.cancelPendingCommit=E(c0.bind(null,l,t,n,a,e,u,c,i,s,S,1,h,g)),oa(l,n,c,!y);return}c0(l,t,n,a,e,u,c,i,s)}function Gd(l){for(var t=l;;){var a=t.tag;if((a===0||a===11||a===15)&&t.flags&16384&&(a=t.updateQueue,a!==null&&(a=a.stores,a!==null)))for(var e=0;e<a.length;e++){var u=a[e],n=u.getSnapshot;u=u.value;try{if(!ut(n(),u))return!1}catch{return!1}}if(a=t.child,t.subtreeFlags&16384&&a!==null)a.return=t,t=a;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function oa(l,t,a,e){t&=~vi,t&=~Ua,l.suspendedLanes|=t,l.pingedLanes&=~t,e&&(l.warmLanes|=t),e=l.expirationTimes;for(var u=t;0<u;){var n=31-et(u),c=1<<n;e[n]=-1,u&=~c}a!==0&&sf(l,a,t)}function vn(){return(ul&6)===0?(cu(0),!1):!0}function Ti(){if(k!==null){if(nl===0)var l=k.return;else l=k,Yt=Na=null,Cc(l),ne=null,ke=0,l=k;for(;l!==null;)Ro(l.alternate,l),l=l.return;k=null}}function ye(l,t){var a=l.timeoutHandle;a!==-1&&(l.timeoutHandle=-1,ey(a)),a=l.cancelPendingCommit,a!==null&&(l.cancelPendingCommit=null,a()),Ti(),dl=l,k=a=Ht(l.current,null),I=t,nl=0,ft=null,ca=!1,se=Ee(l,t),mi=!1,oe=St=vi=Ua=ia=Tl=0,tt=uu=null,hi=!1,(t&8)!==0&&(t|=t&32);var e=l.entangledLanes;if(e!==0)for(l=l.entanglements,e&=t;0<e;){var u=31-et(e),n=1<<u;t|=l[u],e&=~n}return Kt=t,Bu(),a}function l0(l,t){w=null,b.H=tn,t===Qe||t===Ku?(t=hs(),nl=3):t===ys?(t=hs(),nl=4):nl=t===bo?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,ft=t,k===null&&(Tl=1,cn(l,mt(t,l.current)))}function t0(){var l=b.H;return b.H=tn,l===null?tn:l}function a0(){var l=b.A;return b.A=Yd,l}function Ei(){Tl=4,ca||(I&4194048)!==I&&bt.current!==null||(se=!0),(ia&134217727)===0&&(Ua&134217727)===0||dl===null||oa(dl,I,St,!1)}function Ai(l,t,a){var e=ul;ul|=2;var u=t0(),n=a0();(dl!==l||I!==t)&&(mn=null,ye(l,t)),t=!1;var c=Tl;l:do try{if(nl!==0&&k!==null){var i=k,s=ft;switch(nl){case 8:Ti(),c=6;break l;case 3:case 2:case 9:case 6:bt.current===null&&(t=!0);var y=nl;if(nl=0,ft=null,me(l,i,s,y),a&&se){c=0;break l}break;default:y=nl,nl=0,ft=null,me(l,i,s,y)}}Xd(),c=Tl;break}catch(S){l0(l,S)}while(!0);return t&&l.shellSuspendCounter++,Yt=Na=null,ul=e,b.H=u,b.A=n,k===null&&(dl=null,I=0,Bu()),c}function Xd(){for(;k!==null;)e0(k)}function Qd(l,t){var a=ul;ul|=2;var e=t0(),u=a0();dl!==l||I!==t?(mn=null,yn=_t()+500,ye(l,t)):se=Ee(l,t);l:do try{if(nl!==0&&k!==null){t=k;var n=ft;t:switch(nl){case 1:nl=0,ft=null,me(l,t,n,1);break;case 2:case 9:if(ms(n)){nl=0,ft=null,u0(t);break}t=function(){nl!==2&&nl!==9||dl!==l||(nl=7),jt(l)},n.then(t,t);break l;case 3:nl=7;break l;case 4:nl=5;break l;case 7:ms(n)?(nl=0,ft=null,u0(t)):(nl=0,ft=null,me(l,t,n,7));break;case 5:var c=null;switch(k.tag){case 26:c=k.memoizedState;case 5:case 27:var i=k;if(!c||G0(c)){nl=0,ft=null;var s=i.sibling;if(s!==null)k=s;else{var y=i.return;y!==null?(k=y,hn(y)):k=null}break t}}nl=0,ft=null,me(l,t,n,5);break;case 6:nl=0,ft=null,me(l,t,n,6);break;case 8:Ti(),Tl=6;break l;default:throw Error(m(462))}}Zd();break}catch(S){l0(l,S)}while(!0);return Yt=Na=null,b.H=e,b.A=u,ul=a,k!==null?0:(dl=null,I=0,Bu(),Tl)}function Zd(){for(;k!==null&&!or();)e0(k)}function e0(l){var t=Do(l.alternate,l,Kt);l.memoizedProps=l.pendingProps,t===null?hn(l):k=t}function u0(l){var t=l,a=t.alternate;switch(t.tag){case 15:case 0:t=po(a,t,t.pendingProps,t.type,void 0,I);break;case 11:t=po(a,t,t.pendingProps,t.type.render,t.ref,I);break;case 5:Cc(t);default:Ro(a,t),t=k=us(t,Kt),t=Do(a,t,Kt)}l.memoizedProps=l.pendingProps,t===null?hn(l):k=t}function me(l,t,a,e){Yt=Na=null,Cc(t),ne=null,ke=0;var u=t.return;try{if(jd(l,u,t,a,I)){Tl=1,cn(l,mt(a,l.current)),k=null;return}}catch(n){if(u!==null)throw k=u,n;Tl=1,cn(l,mt(a,l.current)),k=null;return}t.flags&32768?(al||e===1?l=!0:se||(I&536870912)!==0?l=!1:(ca=l=!0,(e===2||e===9||e===3||e===6)&&(e=bt.current,e!==null&&e.tag===13&&(e.flags|=16384))),n0(t,l)):hn(t)}function hn(l){var t=l;do{if((t.flags&32768)!==0){n0(t,ca);return}l=t.return;var a=Ud(t.alternate,t,Kt);if(a!==null){k=a;return}if(t=t.sibling,t!==null){k=t;return}k=t=l}while(t!==null);Tl===0&&(Tl=5)}function n0(l,t){do{var a=Hd(l.alternate,l);if(a!==null){a.flags&=32767,k=a;return}if(a=l.return,a!==null&&(a.flags|=32768,a.subtreeFlags=0,a.deletions=null),!t&&(l=l.sibling,l!==null)){k=l;return}k=l=a}while(l!==null);Tl=6,k=null}function c0(l,t,a,e,u,n,c,i,s){l.cancelPendingCommit=null;do gn();while(Zl!==0);if((ul&6)!==0)throw Error(m(327));if(t!==null){if(t===l.current)throw Error(m(177));if(n=t.lanes|t.childLanes,n|=yc,xr(l,a,n,c,i,s),l===dl&&(k=dl=null,I=0),re=t,sa=l,de=a,bi=n,Si=u,ko=e,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,Jd(Tu,function(){return r0(),null})):(l.callbackNode=null,l.callbackPriority=0),e=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||e){e=b.T,b.T=null,u=_.p,_.p=2,c=ul,ul|=4;try{qd(l,t,a)}finally{ul=c,_.p=u,b.T=e}}Zl=1,i0(),f0(),s0()}}function i0(){if(Zl===1){Zl=0;var l=sa,t=re,a=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||a){a=b.T,b.T=null;var e=_.p;_.p=2;var u=ul;ul|=4;try{Vo(t,l);var n=qi,c=$f(l.containerInfo),i=n.focusedElem,s=n.selectionRange;if(c!==i&&i&&i.ownerDocument&&wf(i.ownerDocument.documentElement,i)){if(s!==null&&fc(i)){var y=s.start,S=s.end;if(S===void 0&&(S=y),"selectionStart"in i)i.selectionStart=y,i.selectionEnd=Math.min(S,i.value.length);else{var E=i.ownerDocument||document,h=E&&E.defaultView||window;if(h.getSelection){var g=h.getSelection(),Q=i.textContent.length,Y=Math.min(s.start,Q),sl=s.end===void 0?Y:Math.min(s.end,Q);!g.extend&&Y>sl&&(c=sl,sl=Y,Y=c);var r=Jf(i,Y),o=Jf(i,sl);if(r&&o&&(g.rangeCount!==1||g.anchorNode!==r.node||g.anchorOffset!==r.offset||g.focusNode!==o.node||g.focusOffset!==o.offset)){var d=E.createRange();d.setStart(r.node,r.offset),g.removeAllRanges(),Y>sl?(g.addRange(d),g.extend(o.node,o.offset)):(d.setEnd(o.node,o.offset),g.addRange(d))}}}}for(E=[],g=i;g=g.parentNode;)g.nodeType===1&&E.push({element:g,left:g.scrollLeft,top:g.scrollTop});for(typeof i.focus=="function"&&i.focus(),i=0;i<E.length;i++){var x=E[i];x.element.scrollLeft=x.left,x.element.scrollTop=x.top}}Mn=!!Hi,qi=Hi=null}finally{ul=u,_.p=e,b.T=a}}l.current=t,Zl=2}}function f0(){if(Zl===2){Zl=0;var l=sa,t=re,a=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||a){a=b.T,b.T=null;var e=_.p;_.p=2;var u=ul;ul|=4;try{Go(l,t.alternate,t)}finally{ul=u,_.p=e,b.T=a}}Zl=3}}function s0(){if(Zl===4||Zl===3){Zl=0,rr();var l=sa,t=re,a=de,e=ko;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Zl=5:(Zl=0,re=sa=null,o0(l,l.pendingLanes));var u=l.pendingLanes;if(u===0&&(fa=null),Qn(a),t=t.stateNode,at&&typeof at.onCommitFiberRoot=="function")try{at.onCommitFiberRoot(Te,t,void 0,(t.current.flags&128)===128)}catch{}if(e!==null){t=b.T,u=_.p,_.p=2,b.T=null;try{for(var n=l.onRecoverableError,c=0;c<e.length;c++){var i=e[c];n(i.value,{componentStack:i.stack})}}finally{b.T=t,_.p=u}}(de&3)!==0&&gn(),jt(l),u=l.pendingLanes,(a&4194090)!==0&&(u&42)!==0?l===xi?nu++:(nu=0,xi=l):nu=0,cu(0)}}function o0(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,Ge(t)))}function gn(l){return i0(),f0(),s0(),r0()}function r0(){if(Zl!==5)return!1;var l=sa,t=bi;bi=0;var a=Qn(de),e=b.T,u=_.p;try{_.p=32>a?32:a,b.T=null,a=Si,Si=null;var n=sa,c=de;if(Zl=0,re=sa=null,de=0,(ul&6)!==0)throw Error(m(331));var i=ul;if(ul|=4,$o(n.current),Ko(n,n.current,c,a),ul=i,cu(0,!1),at&&typeof at.onPostCommitFiberRoot=="function")try{at.onPostCommitFiberRoot(Te,n)}catch{}return!0}finally{_.p=u,b.T=e,o0(l,t)}}function d0(l,t,a){t=mt(a,t),t=Ic(l.stateNode,t,2),l=Pt(l,t,2),l!==null&&(Ae(l,2),jt(l))}function rl(l,t,a){if(l.tag===3)d0(l,l,a);else for(;t!==null;){if(t.tag===3){d0(t,l,a);break}else if(t.tag===1){var e=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof e.componentDidCatch=="function"&&(fa===null||!fa.has(e))){l=mt(a,l),a=ho(2),e=Pt(t,a,2),e!==null&&(go(a,e,t,l),Ae(e,2),jt(e));break}}t=t.return}}function pi(l,t,a){var e=l.pingCache;if(e===null){e=l.pingCache=new Cd;var u=new Set;e.set(t,u)}else u=e.get(t),u===void 0&&(u=new Set,e.set(t,u));u.has(a)||(mi=!0,u.add(a),l=Vd.bind(null,l,t,a),t.then(l,l))}function Vd(l,t,a){var e=l.pingCache;e!==null&&e.delete(t),l.pingedLanes|=l.suspendedLanes&a,l.warmLanes&=~a,dl===l&&(I&a)===a&&(Tl===4||Tl===3&&(I&62914560)===I&&300>_t()-gi?(ul&2)===0&&ye(l,0):vi|=a,oe===I&&(oe=0)),jt(l)}function y0(l,t){t===0&&(t=ff()),l=Wa(l,t),l!==null&&(Ae(l,t),jt(l))}function Ld(l){var t=l.memoizedState,a=0;t!==null&&(a=t.retryLane),y0(l,a)}function Kd(l,t){var a=0;switch(l.tag){case 13:var e=l.stateNode,u=l.memoizedState;u!==null&&(a=u.retryLane);break;case 19:e=l.stateNode;break;case 22:e=l.stateNode._retryCache;break;default:throw Error(m(314))}e!==null&&e.delete(t),y0(l,a)}function Jd(l,t){return Yn(l,t)}var bn=null,ve=null,zi=!1,Sn=!1,_i=!1,Ha=0;function jt(l){l!==ve&&l.next===null&&(ve===null?bn=ve=l:ve=ve.next=l),Sn=!0,zi||(zi=!0,$d())}function cu(l,t){if(!_i&&Sn){_i=!0;do for(var a=!1,e=bn;e!==null;){if(l!==0){var u=e.pendingLanes;if(u===0)var n=0;else{var c=e.suspendedLanes,i=e.pingedLanes;n=(1<<31-et(42|l)+1)-1,n&=u&~(c&~i),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(a=!0,g0(e,n))}else n=I,n=pu(e,e===dl?n:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),(n&3)===0||Ee(e,n)||(a=!0,g0(e,n));e=e.next}while(a);_i=!1}}function wd(){m0()}function m0(){Sn=zi=!1;var l=0;Ha!==0&&(ay()&&(l=Ha),Ha=0);for(var t=_t(),a=null,e=bn;e!==null;){var u=e.next,n=v0(e,t);n===0?(e.next=null,a===null?bn=u:a.next=u,u===null&&(ve=a)):(a=e,(l!==0||(n&3)!==0)&&(Sn=!0)),e=u}cu(l)}function v0(l,t){for(var a=l.suspendedLanes,e=l.pingedLanes,u=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var c=31-et(n),i=1<<c,s=u[c];s===-1?((i&a)===0||(i&e)!==0)&&(u[c]=Sr(i,t)):s<=t&&(l.expiredLanes|=i),n&=~i}if(t=dl,a=I,a=pu(l,l===t?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),e=l.callbackNode,a===0||l===t&&(nl===2||nl===9)||l.cancelPendingCommit!==null)return e!==null&&e!==null&&Cn(e),l.callbackNode=null,l.callbackPriority=0;if((a&3)===0||Ee(l,a)){if(t=a&-a,t===l.callbackPriority)return t;switch(e!==null&&Cn(e),Qn(a)){case 2:case 8:a=uf;break;case 32:a=Tu;break;case 268435456:a=nf;break;default:a=Tu}return e=h0.bind(null,l),a=Yn(a,e),l.callbackPriority=t,l.callbackNode=a,t}return e!==null&&e!==null&&Cn(e),l.callbackPriority=2,l.callbackNode=null,2}function h0(l,t){if(Zl!==0&&Zl!==5)return l.callbackNode=null,l.callbackPriority=0,null;var a=l.callbackNode;if(gn()&&l.callbackNode!==a)return null;var e=I;return e=pu(l,l===dl?e:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),e===0?null:(Io(l,e,t),v0(l,_t()),l.callbackNode!=null&&l.callbackNode===a?h0.bind(null,l):null)}function g0(l,t){if(gn())return null;Io(l,t,!0)}function $d(){uy(function(){(ul&6)!==0?Yn(ef,wd):m0()})}function Ni(){return Ha===0&&(Ha=cf()),Ha}function b0(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:Mu(""+l)}function S0(l,t){var a=t.ownerDocument.createElement("input");return a.name=t.name,a.value=t.value,l.id&&a.setAttribute("form",l.id),t.parentNode.insertBefore(a,t),l=new FormData(l),a.parentNode.removeChild(a),l}function Wd(l,t,a,e,u){if(t==="submit"&&a&&a.stateNode===u){var n=b0((u[Fl]||null).action),c=e.submitter;c&&(t=(t=c[Fl]||null)?b0(t.formAction):c.getAttribute("formAction"),t!==null&&(n=t,c=null));var i=new Uu("action","action",null,e,u);l.push({event:i,listeners:[{instance:null,listener:function(){if(e.defaultPrevented){if(Ha!==0){var s=c?S0(u,c):new FormData(u);wc(a,{pending:!0,data:s,method:u.method,action:n},null,s)}}else typeof n=="function"&&(i.preventDefault(),s=c?S0(u,c):new FormData(u),wc(a,{pending:!0,data:s,method:u.method,action:n},n,s))},currentTarget:u}]})}}for(var Oi=0;Oi<dc.length;Oi++){var Mi=dc[Oi],kd=Mi.toLowerCase(),Fd=Mi[0].toUpperCase()+Mi.slice(1);Tt(kd,"on"+Fd)}Tt(Ff,"onAnimationEnd"),Tt(If,"onAnimationIteration"),Tt(Pf,"onAnimationStart"),Tt("dblclick","onDoubleClick"),Tt("focusin","onFocus"),Tt("focusout","onBlur"),Tt(md,"onTransitionRun"),Tt(vd,"onTransitionStart"),Tt(hd,"onTransitionCancel"),Tt(ls,"onTransitionEnd"),Ga("onMouseEnter",["mouseout","mouseover"]),Ga("onMouseLeave",["mouseout","mouseover"]),Ga("onPointerEnter",["pointerout","pointerover"]),Ga("onPointerLeave",["pointerout","pointerover"]),ba("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),ba("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),ba("onBeforeInput",["compositionend","keypress","textInput","paste"]),ba("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),ba("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),ba("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var iu="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Id=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(iu));function x0(l,t){t=(t&4)!==0;for(var a=0;a<l.length;a++){var e=l[a],u=e.event;e=e.listeners;l:{var n=void 0;if(t)for(var c=e.length-1;0<=c;c--){var i=e[c],s=i.instance,y=i.currentTarget;if(i=i.listener,s!==n&&u.isPropagationStopped())break l;n=i,u.currentTarget=y;try{n(u)}catch(S){nn(S)}u.currentTarget=null,n=s}else for(c=0;c<e.length;c++){if(i=e[c],s=i.instance,y=i.currentTarget,i=i.listener,s!==n&&u.isPropagationStopped())break l;n=i,u.currentTarget=y;try{n(u)}catch(S){nn(S)}u.currentTarget=null,n=s}}}}function F(l,t){var a=t[Zn];a===void 0&&(a=t[Zn]=new Set);var e=l+"__bubble";a.has(e)||(T0(t,l,2,!1),a.add(e))}function Di(l,t,a){var e=0;t&&(e|=4),T0(a,l,e,t)}var xn="_reactListening"+Math.random().toString(36).slice(2);function ji(l){if(!l[xn]){l[xn]=!0,yf.forEach(function(a){a!=="selectionchange"&&(Id.has(a)||Di(a,!1,l),Di(a,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[xn]||(t[xn]=!0,Di("selectionchange",!1,t))}}function T0(l,t,a,e){switch(K0(t)){case 2:var u=zy;break;case 8:u=_y;break;default:u=Ki}a=u.bind(null,t,a,l),u=void 0,!Pn||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(u=!0),e?u!==void 0?l.addEventListener(t,a,{capture:!0,passive:u}):l.addEventListener(t,a,!0):u!==void 0?l.addEventListener(t,a,{passive:u}):l.addEventListener(t,a,!1)}function Ri(l,t,a,e,u){var n=e;if((t&1)===0&&(t&2)===0&&e!==null)l:for(;;){if(e===null)return;var c=e.tag;if(c===3||c===4){var i=e.stateNode.containerInfo;if(i===u)break;if(c===4)for(c=e.return;c!==null;){var s=c.tag;if((s===3||s===4)&&c.stateNode.containerInfo===u)return;c=c.return}for(;i!==null;){if(c=Ba(i),c===null)return;if(s=c.tag,s===5||s===6||s===26||s===27){e=n=c;continue l}i=i.parentNode}}e=e.return}Nf(function(){var y=n,S=Fn(a),E=[];l:{var h=ts.get(l);if(h!==void 0){var g=Uu,Q=l;switch(l){case"keypress":if(ju(a)===0)break l;case"keydown":case"keyup":g=Jr;break;case"focusin":Q="focus",g=ec;break;case"focusout":Q="blur",g=ec;break;case"beforeblur":case"afterblur":g=ec;break;case"click":if(a.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=Df;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=Hr;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=Wr;break;case Ff:case If:case Pf:g=Yr;break;case ls:g=Fr;break;case"scroll":case"scrollend":g=Rr;break;case"wheel":g=Pr;break;case"copy":case"cut":case"paste":g=Gr;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=Rf;break;case"toggle":case"beforetoggle":g=td}var Y=(t&4)!==0,sl=!Y&&(l==="scroll"||l==="scrollend"),r=Y?h!==null?h+"Capture":null:h;Y=[];for(var o=y,d;o!==null;){var x=o;if(d=x.stateNode,x=x.tag,x!==5&&x!==26&&x!==27||d===null||r===null||(x=_e(o,r),x!=null&&Y.push(fu(o,x,d))),sl)break;o=o.return}0<Y.length&&(h=new g(h,Q,null,a,S),E.push({event:h,listeners:Y}))}}if((t&7)===0){l:{if(h=l==="mouseover"||l==="pointerover",g=l==="mouseout"||l==="pointerout",h&&a!==kn&&(Q=a.relatedTarget||a.fromElement)&&(Ba(Q)||Q[qa]))break l;if((g||h)&&(h=S.window===S?S:(h=S.ownerDocument)?h.defaultView||h.parentWindow:window,g?(Q=a.relatedTarget||a.toElement,g=y,Q=Q?Ba(Q):null,Q!==null&&(sl=V(Q),Y=Q.tag,Q!==sl||Y!==5&&Y!==27&&Y!==6)&&(Q=null)):(g=null,Q=y),g!==Q)){if(Y=Df,x="onMouseLeave",r="onMouseEnter",o="mouse",(l==="pointerout"||l==="pointerover")&&(Y=Rf,x="onPointerLeave",r="onPointerEnter",o="pointer"),sl=g==null?h:ze(g),d=Q==null?h:ze(Q),h=new Y(x,o+"leave",g,a,S),h.target=sl,h.relatedTarget=d,x=null,Ba(S)===y&&(Y=new Y(r,o+"enter",Q,a,S),Y.target=d,Y.relatedTarget=sl,x=Y),sl=x,g&&Q)t:{for(Y=g,r=Q,o=0,d=Y;d;d=he(d))o++;for(d=0,x=r;x;x=he(x))d++;for(;0<o-d;)Y=he(Y),o--;for(;0<d-o;)r=he(r),d--;for(;o--;){if(Y===r||r!==null&&Y===r.alternate)break t;Y=he(Y),r=he(r)}Y=null}else Y=null;g!==null&&E0(E,h,g,Y,!1),Q!==null&&sl!==null&&E0(E,sl,Q,Y,!0)}}l:{if(h=y?ze(y):window,g=h.nodeName&&h.nodeName.toLowerCase(),g==="select"||g==="input"&&h.type==="file")var D=Xf;else if(Cf(h))if(Qf)D=rd;else{D=sd;var $=fd}else g=h.nodeName,!g||g.toLowerCase()!=="input"||h.type!=="checkbox"&&h.type!=="radio"?y&&Wn(y.elementType)&&(D=Xf):D=od;if(D&&(D=D(l,y))){Gf(E,D,a,S);break l}$&&$(l,h,y),l==="focusout"&&y&&h.type==="number"&&y.memoizedProps.value!=null&&$n(h,"number",h.value)}switch($=y?ze(y):window,l){case"focusin":(Cf($)||$.contentEditable==="true")&&(Ja=$,sc=y,He=null);break;case"focusout":He=sc=Ja=null;break;case"mousedown":oc=!0;break;case"contextmenu":case"mouseup":case"dragend":oc=!1,Wf(E,a,S);break;case"selectionchange":if(yd)break;case"keydown":case"keyup":Wf(E,a,S)}var R;if(nc)l:{switch(l){case"compositionstart":var C="onCompositionStart";break l;case"compositionend":C="onCompositionEnd";break l;case"compositionupdate":C="onCompositionUpdate";break l}C=void 0}else Ka?Bf(l,a)&&(C="onCompositionEnd"):l==="keydown"&&a.keyCode===229&&(C="onCompositionStart");C&&(Uf&&a.locale!=="ko"&&(Ka||C!=="onCompositionStart"?C==="onCompositionEnd"&&Ka&&(R=Of()):(Wt=S,lc="value"in Wt?Wt.value:Wt.textContent,Ka=!0)),$=Tn(y,C),0<$.length&&(C=new jf(C,l,null,a,S),E.push({event:C,listeners:$}),R?C.data=R:(R=Yf(a),R!==null&&(C.data=R)))),(R=ed?ud(l,a):nd(l,a))&&(C=Tn(y,"onBeforeInput"),0<C.length&&($=new jf("onBeforeInput","beforeinput",null,a,S),E.push({event:$,listeners:C}),$.data=R)),Wd(E,l,y,a,S)}x0(E,t)})}function fu(l,t,a){return{instance:l,listener:t,currentTarget:a}}function Tn(l,t){for(var a=t+"Capture",e=[];l!==null;){var u=l,n=u.stateNode;if(u=u.tag,u!==5&&u!==26&&u!==27||n===null||(u=_e(l,a),u!=null&&e.unshift(fu(l,u,n)),u=_e(l,t),u!=null&&e.push(fu(l,u,n))),l.tag===3)return e;l=l.return}return[]}function he(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function E0(l,t,a,e,u){for(var n=t._reactName,c=[];a!==null&&a!==e;){var i=a,s=i.alternate,y=i.stateNode;if(i=i.tag,s!==null&&s===e)break;i!==5&&i!==26&&i!==27||y===null||(s=y,u?(y=_e(a,n),y!=null&&c.unshift(fu(a,y,s))):u||(y=_e(a,n),y!=null&&c.push(fu(a,y,s)))),a=a.return}c.length!==0&&l.push({event:t,listeners:c})}var Pd=/\r\n?/g,ly=/\u0000|\uFFFD/g;function A0(l){return(typeof l=="string"?l:""+l).replace(Pd,`
-`).replace(ly,"")}function p0(l,t){return t=A0(t),A0(l)===t}function En(){}function fl(l,t,a,e,u,n){switch(a){case"children":typeof e=="string"?t==="body"||t==="textarea"&&e===""||Za(l,e):(typeof e=="number"||typeof e=="bigint")&&t!=="body"&&Za(l,""+e);break;case"className":_u(l,"class",e);break;case"tabIndex":_u(l,"tabindex",e);break;case"dir":case"role":case"viewBox":case"width":case"height":_u(l,a,e);break;case"style":zf(l,e,n);break;case"data":if(t!=="object"){_u(l,"data",e);break}case"src":case"href":if(e===""&&(t!=="a"||a!=="href")){l.removeAttribute(a);break}if(e==null||typeof e=="function"||typeof e=="symbol"||typeof e=="boolean"){l.removeAttribute(a);break}e=Mu(""+e),l.setAttribute(a,e);break;case"action":case"formAction":if(typeof e=="function"){l.setAttribute(a,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(a==="formAction"?(t!=="input"&&fl(l,t,"name",u.name,u,null),fl(l,t,"formEncType",u.formEncType,u,null),fl(l,t,"formMethod",u.formMethod,u,null),fl(l,t,"formTarget",u.formTarget,u,null)):(fl(l,t,"encType",u.encType,u,null),fl(l,t,"method",u.method,u,null),fl(l,t,"target",u.target,u,null)));if(e==null||typeof e=="symbol"||typeof e=="boolean"){l.removeAttribute(a);break}e=Mu(""+e),l.setAttribute(a,e);break;case"onClick":e!=null&&(l.onclick=En);break;case"onScroll":e!=null&&F("scroll",l);break;case"onScrollEnd":e!=null&&F("scrollend",l);break;case"dangerouslySetInnerHTML":if(e!=null){if(typeof e!="object"||!("__html"in e))throw Error(m(61));if(a=e.__html,a!=null){if(u.children!=null)throw Error(m(60));l.innerHTML=a}}break;case"multiple":l.multiple=e&&typeof e!="function"&&typeof e!="symbol";break;case"muted":l.muted=e&&typeof e!="function"&&typeof e!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(e==null||typeof e=="function"||typeof e=="boolean"||typeof e=="symbol"){l.removeAttribute("xlink:href");break}a=Mu(""+e),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",a);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":e!=null&&typeof e!="function"&&typeof e!="symbol"?l.setAttribute(a,""+e):l.removeAttribute(a);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":e&&typeof e!="function"&&typeof e!="symbol"?l.setAttribute(a,""):l.removeAttribute(a);break;case"capture":case"download":e===!0?l.setAttribute(a,""):e!==!1&&e!=null&&typeof e!="function"&&typeof e!="symbol"?l.setAttribute(a,e):l.removeAttribute(a);break;case"cols":case"rows":case"size":case"span":e!=null&&typeof e!="function"&&typeof e!="symbol"&&!isNaN(e)&&1<=e?l.setAttribute(a,e):l.removeAttribute(a);break;case"rowSpan":case"start":e==null||typeof e=="function"||typeof e=="symbol"||isNaN(e)?l.removeAttribute(a):l.setAttribute(a,e);break;case"popover":F("beforetoggle",l),F("toggle",l),zu(l,"popover",e);break;case"xlinkActuate":Rt(l,"http://www.w3.org/1999/xlink","xlink:actuate",e);break;case"xlinkArcrole":Rt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",e);break;case"xlinkRole":Rt(l,"http://www.w3.org/1999/xlink","xlink:role",e);break;case"xlinkShow":Rt(l,"http://www.w3.org/1999/xlink","xlink:show",e);break;case"xlinkTitle":Rt(l,"http://www.w3.org/1999/xlink","xlink:title",e);break;case"xlinkType":Rt(l,"http://www.w3.org/1999/xlink","xlink:type",e);break;case"xmlBase":Rt(l,"http://www.w3.org/XML/1998/namespace","xml:base",e);break;case"xmlLang":Rt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",e);break;case"xmlSpace":Rt(l,"http://www.w3.org/XML/1998/namespace","xml:space",e);break;case"is":zu(l,"is",e);break;case"innerText":case"textContent":break;default:(!(2<a.length)||a[0]!=="o"&&a[0]!=="O"||a[1]!=="n"&&a[1]!=="N")&&(a=Dr.get(a)||a,zu(l,a,e))}}function Ui(l,t,a,e,u,n){switch(a){case"style":zf(l,e,n);break;case"dangerouslySetInnerHTML":if(e!=null){if(typeof e!="object"||!("__html"in e))throw Error(m(61));if(a=e.__html,a!=null){if(u.children!=null)throw Error(m(60));l.innerHTML=a}}break;case"children":typeof e=="string"?Za(l,e):(typeof e=="number"||typeof e=="bigint")&&Za(l,""+e);break;case"onScroll":e!=null&&F("scroll",l);break;case"onScrollEnd":e!=null&&F("scrollend",l);break;case"onClick":e!=null&&(l.onclick=En);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!mf.hasOwnProperty(a))l:{if(a[0]==="o"&&a[1]==="n"&&(u=a.endsWith("Capture"),t=a.slice(2,u?a.length-7:void 0),n=l[Fl]||null,n=n!=null?n[a]:null,typeof n=="function"&&l.removeEventListener(t,n,u),typeof e=="function")){typeof n!="function"&&n!==null&&(a in l?l[a]=null:l.hasAttribute(a)&&l.removeAttribute(a)),l.addEventListener(t,e,u);break l}a in l?l[a]=e:e===!0?l.setAttribute(a,""):zu(l,a,e)}}}function Vl(l,t,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":F("error",l),F("load",l);var e=!1,u=!1,n;for(n in a)if(a.hasOwnProperty(n)){var c=a[n];if(c!=null)switch(n){case"src":e=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(m(137,t));default:fl(l,t,n,c,a,null)}}u&&fl(l,t,"srcSet",a.srcSet,a,null),e&&fl(l,t,"src",a.src,a,null);return;case"input":F("invalid",l);var i=n=c=u=null,s=null,y=null;for(e in a)if(a.hasOwnProperty(e)){var S=a[e];if(S!=null)switch(e){case"name":u=S;break;case"type":c=S;break;case"checked":s=S;break;case"defaultChecked":y=S;break;case"value":n=S;break;case"defaultValue":i=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(m(137,t));break;default:fl(l,t,e,S,a,null)}}Tf(l,n,i,s,y,c,u,!1),Nu(l);return;case"select":F("invalid",l),e=c=n=null;for(u in a)if(a.hasOwnProperty(u)&&(i=a[u],i!=null))switch(u){case"value":n=i;break;case"defaultValue":c=i;break;case"multiple":e=i;default:fl(l,t,u,i,a,null)}t=n,a=c,l.multiple=!!e,t!=null?Qa(l,!!e,t,!1):a!=null&&Qa(l,!!e,a,!0);return;case"textarea":F("invalid",l),n=u=e=null;for(c in a)if(a.hasOwnProperty(c)&&(i=a[c],i!=null))switch(c){case"value":e=i;break;case"defaultValue":u=i;break;case"children":n=i;break;case"dangerouslySetInnerHTML":if(i!=null)throw Error(m(91));break;default:fl(l,t,c,i,a,null)}Af(l,e,u,n),Nu(l);return;case"option":for(s in a)if(a.hasOwnProperty(s)&&(e=a[s],e!=null))switch(s){case"selected":l.selected=e&&typeof e!="function"&&typeof e!="symbol";break;default:fl(l,t,s,e,a,null)}return;case"dialog":F("beforetoggle",l),F("toggle",l),F("cancel",l),F("close",l);break;case"iframe":case"object":F("load",l);break;case"video":case"audio":for(e=0;e<iu.length;e++)F(iu[e],l);break;case"image":F("error",l),F("load",l);break;case"details":F("toggle",l);break;case"embed":case"source":case"link":F("error",l),F("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(y in a)if(a.hasOwnProperty(y)&&(e=a[y],e!=null))switch(y){case"children":case"dangerouslySetInnerHTML":throw Error(m(137,t));default:fl(l,t,y,e,a,null)}return;default:if(Wn(t)){for(S in a)a.hasOwnProperty(S)&&(e=a[S],e!==void 0&&Ui(l,t,S,e,a,void 0));return}}for(i in a)a.hasOwnProperty(i)&&(e=a[i],e!=null&&fl(l,t,i,e,a,null))}function ty(l,t,a,e){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,c=null,i=null,s=null,y=null,S=null;for(g in a){var E=a[g];if(a.hasOwnProperty(g)&&E!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":s=E;default:e.hasOwnProperty(g)||fl(l,t,g,null,e,E)}}for(var h in e){var g=e[h];if(E=a[h],e.hasOwnProperty(h)&&(g!=null||E!=null))switch(h){case"type":n=g;break;case"name":u=g;break;case"checked":y=g;break;case"defaultChecked":S=g;break;case"value":c=g;break;case"defaultValue":i=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(m(137,t));break;default:g!==E&&fl(l,t,h,g,e,E)}}wn(l,c,i,s,y,S,n,u);return;case"select":g=c=i=h=null;for(n in a)if(s=a[n],a.hasOwnProperty(n)&&s!=null)switch(n){case"value":break;case"multiple":g=s;default:e.hasOwnProperty(n)||fl(l,t,n,null,e,s)}for(u in e)if(n=e[u],s=a[u],e.hasOwnProperty(u)&&(n!=null||s!=null))switch(u){case"value":h=n;break;case"defaultValue":i=n;break;case"multiple":c=n;default:n!==s&&fl(l,t,u,n,e,s)}t=i,a=c,e=g,h!=null?Qa(l,!!a,h,!1):!!e!=!!a&&(t!=null?Qa(l,!!a,t,!0):Qa(l,!!a,a?[]:"",!1));return;case"textarea":g=h=null;for(i in a)if(u=a[i],a.hasOwnProperty(i)&&u!=null&&!e.hasOwnProperty(i))switch(i){case"value":break;case"children":break;default:fl(l,t,i,null,e,u)}for(c in e)if(u=e[c],n=a[c],e.hasOwnProperty(c)&&(u!=null||n!=null))switch(c){case"value":h=u;break;case"defaultValue":g=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(m(91));break;default:u!==n&&fl(l,t,c,u,e,n)}Ef(l,h,g);return;case"option":for(var Q in a)if(h=a[Q],a.hasOwnProperty(Q)&&h!=null&&!e.hasOwnProperty(Q))switch(Q){case"selected":l.selected=!1;break;default:fl(l,t,Q,null,e,h)}for(s in e)if(h=e[s],g=a[s],e.hasOwnProperty(s)&&h!==g&&(h!=null||g!=null))switch(s){case"selected":l.selected=h&&typeof h!="function"&&typeof h!="symbol";break;default:fl(l,t,s,h,e,g)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var Y in a)h=a[Y],a.hasOwnProperty(Y)&&h!=null&&!e.hasOwnProperty(Y)&&fl(l,t,Y,null,e,h);for(y in e)if(h=e[y],g=a[y],e.hasOwnProperty(y)&&h!==g&&(h!=null||g!=null))switch(y){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(m(137,t));break;default:fl(l,t,y,h,e,g)}return;default:if(Wn(t)){for(var sl in a)h=a[sl],a.hasOwnProperty(sl)&&h!==void 0&&!e.hasOwnProperty(sl)&&Ui(l,t,sl,void 0,e,h);for(S in e)h=e[S],g=a[S],!e.hasOwnProperty(S)||h===g||h===void 0&&g===void 0||Ui(l,t,S,h,e,g);return}}for(var r in a)h=a[r],a.hasOwnProperty(r)&&h!=null&&!e.hasOwnProperty(r)&&fl(l,t,r,null,e,h);for(E in e)h=e[E],g=a[E],!e.hasOwnProperty(E)||h===g||h==null&&g==null||fl(l,t,E,h,e,g)}var Hi=null,qi=null;function An(l){return l.nodeType===9?l:l.ownerDocument}function z0(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function _0(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Bi(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Yi=null;function ay(){var l=window.event;return l&&l.type==="popstate"?l===Yi?!1:(Yi=l,!0):(Yi=null,!1)}var N0=typeof setTimeout=="function"?setTimeout:void 0,ey=typeof clearTimeout=="function"?clearTimeout:void 0,O0=typeof Promise=="function"?Promise:void 0,uy=typeof queueMicrotask=="function"?queueMicrotask:typeof O0<"u"?function(l){return O0.resolve(null).then(l).catch(ny)}:N0;function ny(l){setTimeout(function(){throw l})}function ra(l){return l==="head"}function M0(l,t){var a=t,e=0,u=0;do{var n=a.nextSibling;if(l.removeChild(a),n&&n.nodeType===8)if(a=n.data,a==="/$"){if(0<e&&8>e){a=e;var c=l.ownerDocument;if(a&1&&su(c.documentElement),a&2&&su(c.body),a&4)for(a=c.head,su(a),c=a.firstChild;c;){var i=c.nextSibling,s=c.nodeName;c[pe]||s==="SCRIPT"||s==="STYLE"||s==="LINK"&&c.rel.toLowerCase()==="stylesheet"||a.removeChild(c),c=i}}if(u===0){l.removeChild(n),gu(t);return}u--}else a==="$"||a==="$?"||a==="$!"?u++:e=a.charCodeAt(0)-48;else e=0;a=n}while(a);gu(t)}function Ci(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var a=t;switch(t=t.nextSibling,a.nodeName){case"HTML":case"HEAD":case"BODY":Ci(a),Vn(a);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(a.rel.toLowerCase()==="stylesheet")continue}l.removeChild(a)}}function cy(l,t,a,e){for(;l.nodeType===1;){var u=a;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!e&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(e){if(!l[pe])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==u.rel||l.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||l.getAttribute("title")!==(u.title==null?null:u.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(u.src==null?null:u.src)||l.getAttribute("type")!==(u.type==null?null:u.type)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=At(l.nextSibling),l===null)break}return null}function iy(l,t,a){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!a||(l=At(l.nextSibling),l===null))return null;return l}function Gi(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState==="complete"}function fy(l,t){var a=l.ownerDocument;if(l.data!=="$?"||a.readyState==="complete")t();else{var e=function(){t(),a.removeEventListener("DOMContentLoaded",e)};a.addEventListener("DOMContentLoaded",e),l._reactRetry=e}}function At(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="F!"||t==="F")break;if(t==="/$")return null}}return l}var Xi=null;function D0(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="$"||a==="$!"||a==="$?"){if(t===0)return l;t--}else a==="/$"&&t++}l=l.previousSibling}return null}function j0(l,t,a){switch(t=An(a),l){case"html":if(l=t.documentElement,!l)throw Error(m(452));return l;case"head":if(l=t.head,!l)throw Error(m(453));return l;case"body":if(l=t.body,!l)throw Error(m(454));return l;default:throw Error(m(451))}}function su(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);Vn(l)}var xt=new Map,R0=new Set;function pn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var Jt=_.d;_.d={f:sy,r:oy,D:ry,C:dy,L:yy,m:my,X:hy,S:vy,M:gy};function sy(){var l=Jt.f(),t=vn();return l||t}function oy(l){var t=Ya(l);t!==null&&t.tag===5&&t.type==="form"?Fs(t):Jt.r(l)}var ge=typeof document>"u"?null:document;function U0(l,t,a){var e=ge;if(e&&typeof t=="string"&&t){var u=yt(t);u='link[rel="'+l+'"][href="'+u+'"]',typeof a=="string"&&(u+='[crossorigin="'+a+'"]'),R0.has(u)||(R0.add(u),l={rel:l,crossOrigin:a,href:t},e.querySelector(u)===null&&(t=e.createElement("link"),Vl(t,"link",l),Bl(t),e.head.appendChild(t)))}}function ry(l){Jt.D(l),U0("dns-prefetch",l,null)}function dy(l,t){Jt.C(l,t),U0("preconnect",l,t)}function yy(l,t,a){Jt.L(l,t,a);var e=ge;if(e&&l&&t){var u='link[rel="preload"][as="'+yt(t)+'"]';t==="image"&&a&&a.imageSrcSet?(u+='[imagesrcset="'+yt(a.imageSrcSet)+'"]',typeof a.imageSizes=="string"&&(u+='[imagesizes="'+yt(a.imageSizes)+'"]')):u+='[href="'+yt(l)+'"]';var n=u;switch(t){case"style":n=be(l);break;case"script":n=Se(l)}xt.has(n)||(l=O({rel:"preload",href:t==="image"&&a&&a.imageSrcSet?void 0:l,as:t},a),xt.set(n,l),e.querySelector(u)!==null||t==="style"&&e.querySelector(ou(n))||t==="script"&&e.querySelector(ru(n))||(t=e.createElement("link"),Vl(t,"link",l),Bl(t),e.head.appendChild(t)))}}function my(l,t){Jt.m(l,t);var a=ge;if(a&&l){var e=t&&typeof t.as=="string"?t.as:"script",u='link[rel="modulepreload"][as="'+yt(e)+'"][href="'+yt(l)+'"]',n=u;switch(e){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=Se(l)}if(!xt.has(n)&&(l=O({rel:"modulepreload",href:l},t),xt.set(n,l),a.querySelector(u)===null)){switch(e){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(a.querySelector(ru(n)))return}e=a.createElement("link"),Vl(e,"link",l),Bl(e),a.head.appendChild(e)}}}function vy(l,t,a){Jt.S(l,t,a);var e=ge;if(e&&l){var u=Ca(e).hoistableStyles,n=be(l);t=t||"default";var c=u.get(n);if(!c){var i={loading:0,preload:null};if(c=e.querySelector(ou(n)))i.loading=5;else{l=O({rel:"stylesheet",href:l,"data-precedence":t},a),(a=xt.get(n))&&Qi(l,a);var s=c=e.createElement("link");Bl(s),Vl(s,"link",l),s._p=new Promise(function(y,S){s.onload=y,s.onerror=S}),s.addEventListener("load",function(){i.loading|=1}),s.addEventListener("error",function(){i.loading|=2}),i.loading|=4,zn(c,t,e)}c={type:"stylesheet",instance:c,count:1,state:i},u.set(n,c)}}}function hy(l,t){Jt.X(l,t);var a=ge;if(a&&l){var e=Ca(a).hoistableScripts,u=Se(l),n=e.get(u);n||(n=a.querySelector(ru(u)),n||(l=O({src:l,async:!0},t),(t=xt.get(u))&&Zi(l,t),n=a.createElement("script"),Bl(n),Vl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},e.set(u,n))}}function gy(l,t){Jt.M(l,t);var a=ge;if(a&&l){var e=Ca(a).hoistableScripts,u=Se(l),n=e.get(u);n||(n=a.querySelector(ru(u)),n||(l=O({src:l,async:!0,type:"module"},t),(t=xt.get(u))&&Zi(l,t),n=a.createElement("script"),Bl(n),Vl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},e.set(u,n))}}function H0(l,t,a,e){var u=(u=G.current)?pn(u):null;if(!u)throw Error(m(446));switch(l){case"meta":case"title":return null;case"style":return typeof a.precedence=="string"&&typeof a.href=="string"?(t=be(a.href),a=Ca(u).hoistableStyles,e=a.get(t),e||(e={type:"style",instance:null,count:0,state:null},a.set(t,e)),e):{type:"void",instance:null,count:0,state:null};case"link":if(a.rel==="stylesheet"&&typeof a.href=="string"&&typeof a.precedence=="string"){l=be(a.href);var n=Ca(u).hoistableStyles,c=n.get(l);if(c||(u=u.ownerDocument||u,c={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,c),(n=u.querySelector(ou(l)))&&!n._p&&(c.instance=n,c.state.loading=5),xt.has(l)||(a={rel:"preload",as:"style",href:a.href,crossOrigin:a.crossOrigin,integrity:a.integrity,media:a.media,hrefLang:a.hrefLang,referrerPolicy:a.referrerPolicy},xt.set(l,a),n||by(u,l,a,c.state))),t&&e===null)throw Error(m(528,""));return c}if(t&&e!==null)throw Error(m(529,""));return null;case"script":return t=a.async,a=a.src,typeof a=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=Se(a),a=Ca(u).hoistableScripts,e=a.get(t),e||(e={type:"script",instance:null,count:0,state:null},a.set(t,e)),e):{type:"void",instance:null,count:0,state:null};default:throw Error(m(444,l))}}function be(l){return'href="'+yt(l)+'"'}function ou(l){return'link[rel="stylesheet"]['+l+"]"}function q0(l){return O({},l,{"data-precedence":l.precedence,precedence:null})}function by(l,t,a,e){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?e.loading=1:(t=l.createElement("link"),e.preload=t,t.addEventListener("load",function(){return e.loading|=1}),t.addEventListener("error",function(){return e.loading|=2}),Vl(t,"link",a),Bl(t),l.head.appendChild(t))}function Se(l){return'[src="'+yt(l)+'"]'}function ru(l){return"script[async]"+l}function B0(l,t,a){if(t.count++,t.instance===null)switch(t.type){case"style":var e=l.querySelector('style[data-href~="'+yt(a.href)+'"]');if(e)return t.instance=e,Bl(e),e;var u=O({},a,{"data-href":a.href,"data-precedence":a.precedence,href:null,precedence:null});return e=(l.ownerDocument||l).createElement("style"),Bl(e),Vl(e,"style",u),zn(e,a.precedence,l),t.instance=e;case"stylesheet":u=be(a.href);var n=l.querySelector(ou(u));if(n)return t.state.loading|=4,t.instance=n,Bl(n),n;e=q0(a),(u=xt.get(u))&&Qi(e,u),n=(l.ownerDocument||l).createElement("link"),Bl(n);var c=n;return c._p=new Promise(function(i,s){c.onload=i,c.onerror=s}),Vl(n,"link",e),t.state.loading|=4,zn(n,a.precedence,l),t.instance=n;case"script":return n=Se(a.src),(u=l.querySelector(ru(n)))?(t.instance=u,Bl(u),u):(e=a,(u=xt.get(n))&&(e=O({},a),Zi(e,u)),l=l.ownerDocument||l,u=l.createElement("script"),Bl(u),Vl(u,"link",e),l.head.appendChild(u),t.instance=u);case"void":return null;default:throw Error(m(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(e=t.instance,t.state.loading|=4,zn(e,a.precedence,l));return t.instance}function zn(l,t,a){for(var e=a.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=e.length?e[e.length-1]:null,n=u,c=0;c<e.length;c++){var i=e[c];if(i.dataset.precedence===t)n=i;else if(n!==u)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=a.nodeType===9?a.head:a,t.insertBefore(l,t.firstChild))}function Qi(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function Zi(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var _n=null;function Y0(l,t,a){if(_n===null){var e=new Map,u=_n=new Map;u.set(a,e)}else u=_n,e=u.get(a),e||(e=new Map,u.set(a,e));if(e.has(l))return e;for(e.set(l,null),a=a.getElementsByTagName(l),u=0;u<a.length;u++){var n=a[u];if(!(n[pe]||n[wl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var c=n.getAttribute(t)||"";c=l+c;var i=e.get(c);i?i.push(n):e.set(c,[n])}}return e}function C0(l,t,a){l=l.ownerDocument||l,l.head.insertBefore(a,t==="title"?l.querySelector("head > title"):null)}function Sy(l,t,a){if(a===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function G0(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}var du=null;function xy(){}function Ty(l,t,a){if(du===null)throw Error(m(475));var e=du;if(t.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(t.state.loading&4)===0){if(t.instance===null){var u=be(a.href),n=l.querySelector(ou(u));if(n){l=n._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(e.count++,e=Nn.bind(e),l.then(e,e)),t.state.loading|=4,t.instance=n,Bl(n);return}n=l.ownerDocument||l,a=q0(a),(u=xt.get(u))&&Qi(a,u),n=n.createElement("link"),Bl(n);var c=n;c._p=new Promise(function(i,s){c.onload=i,c.onerror=s}),Vl(n,"link",a),t.instance=n}e.stylesheets===null&&(e.stylesheets=new Map),e.stylesheets.set(t,l),(l=t.state.preload)&&(t.state.loading&3)===0&&(e.count++,t=Nn.bind(e),l.addEventListener("load",t),l.addEventListener("error",t))}}function Ey(){if(du===null)throw Error(m(475));var l=du;return l.stylesheets&&l.count===0&&Vi(l,l.stylesheets),0<l.count?function(t){var a=setTimeout(function(){if(l.stylesheets&&Vi(l,l.stylesheets),l.unsuspend){var e=l.unsuspend;l.unsuspend=null,e()}},6e4);return l.unsuspend=t,function(){l.unsuspend=null,clearTimeout(a)}}:null}function Nn(){if(this.count--,this.count===0){if(this.stylesheets)Vi(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var On=null;function Vi(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,On=new Map,t.forEach(Ay,l),On=null,Nn.call(l))}function Ay(l,t){if(!(t.state.loading&4)){var a=On.get(l);if(a)var e=a.get(null);else{a=new Map,On.set(l,a);for(var u=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var c=u[n];(c.nodeName==="LINK"||c.getAttribute("media")!=="not all")&&(a.set(c.dataset.precedence,c),e=c)}e&&a.set(null,e)}u=t.instance,c=u.getAttribute("data-precedence"),n=a.get(c)||e,n===e&&a.set(null,u),a.set(c,u),this.count++,e=Nn.bind(this),u.addEventListener("load",e),u.addEventListener("error",e),n?n.parentNode.insertBefore(u,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(u,l.firstChild)),t.state.loading|=4}}var yu={$$typeof:ol,Provider:null,Consumer:null,_currentValue:q,_currentValue2:q,_threadCount:0};function py(l,t,a,e,u,n,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Gn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Gn(0),this.hiddenUpdates=Gn(null),this.identifierPrefix=e,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=c,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function X0(l,t,a,e,u,n,c,i,s,y,S,E){return l=new py(l,t,a,c,i,s,y,E),t=1,n===!0&&(t|=24),n=nt(3,null,null,t),l.current=n,n.stateNode=l,t=pc(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:e,isDehydrated:a,cache:t},Oc(n),l}function Q0(l){return l?(l=ka,l):ka}function Z0(l,t,a,e,u,n){u=Q0(u),e.context===null?e.context=u:e.pendingContext=u,e=It(t),e.payload={element:a},n=n===void 0?null:n,n!==null&&(e.callback=n),a=Pt(l,e,t),a!==null&&(ot(a,l,t),Ve(a,l,t))}function V0(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var a=l.retryLane;l.retryLane=a!==0&&a<t?a:t}}function Li(l,t){V0(l,t),(l=l.alternate)&&V0(l,t)}function L0(l){if(l.tag===13){var t=Wa(l,67108864);t!==null&&ot(t,l,67108864),Li(l,67108864)}}var Mn=!0;function zy(l,t,a,e){var u=b.T;b.T=null;var n=_.p;try{_.p=2,Ki(l,t,a,e)}finally{_.p=n,b.T=u}}function _y(l,t,a,e){var u=b.T;b.T=null;var n=_.p;try{_.p=8,Ki(l,t,a,e)}finally{_.p=n,b.T=u}}function Ki(l,t,a,e){if(Mn){var u=Ji(e);if(u===null)Ri(l,t,e,Dn,a),J0(l,e);else if(Oy(u,l,t,a,e))e.stopPropagation();else if(J0(l,e),t&4&&-1<Ny.indexOf(l)){for(;u!==null;){var n=Ya(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var c=ga(n.pendingLanes);if(c!==0){var i=n;for(i.pendingLanes|=2,i.entangledLanes|=2;c;){var s=1<<31-et(c);i.entanglements[1]|=s,c&=~s}jt(n),(ul&6)===0&&(yn=_t()+500,cu(0))}}break;case 13:i=Wa(n,2),i!==null&&ot(i,n,2),vn(),Li(n,2)}if(n=Ji(e),n===null&&Ri(l,t,e,Dn,a),n===u)break;u=n}u!==null&&e.stopPropagation()}else Ri(l,t,e,null,a)}}function Ji(l){return l=Fn(l),wi(l)}var Dn=null;function wi(l){if(Dn=null,l=Ba(l),l!==null){var t=V(l);if(t===null)l=null;else{var a=t.tag;if(a===13){if(l=el(t),l!==null)return l;l=null}else if(a===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Dn=l,null}function K0(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(dr()){case ef:return 2;case uf:return 8;case Tu:case yr:return 32;case nf:return 268435456;default:return 32}default:return 32}}var $i=!1,da=null,ya=null,ma=null,mu=new Map,vu=new Map,va=[],Ny="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function J0(l,t){switch(l){case"focusin":case"focusout":da=null;break;case"dragenter":case"dragleave":ya=null;break;case"mouseover":case"mouseout":ma=null;break;case"pointerover":case"pointerout":mu.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":vu.delete(t.pointerId)}}function hu(l,t,a,e,u,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:a,eventSystemFlags:e,nativeEvent:n,targetContainers:[u]},t!==null&&(t=Ya(t),t!==null&&L0(t)),l):(l.eventSystemFlags|=e,t=l.targetContainers,u!==null&&t.indexOf(u)===-1&&t.push(u),l)}function Oy(l,t,a,e,u){switch(t){case"focusin":return da=hu(da,l,t,a,e,u),!0;case"dragenter":return ya=hu(ya,l,t,a,e,u),!0;case"mouseover":return ma=hu(ma,l,t,a,e,u),!0;case"pointerover":var n=u.pointerId;return mu.set(n,hu(mu.get(n)||null,l,t,a,e,u)),!0;case"gotpointercapture":return n=u.pointerId,vu.set(n,hu(vu.get(n)||null,l,t,a,e,u)),!0}return!1}function w0(l){var t=Ba(l.target);if(t!==null){var a=V(t);if(a!==null){if(t=a.tag,t===13){if(t=el(a),t!==null){l.blockedOn=t,Tr(l.priority,function(){if(a.tag===13){var e=st();e=Xn(e);var u=Wa(a,e);u!==null&&ot(u,a,e),Li(a,e)}});return}}else if(t===3&&a.stateNode.current.memoizedState.isDehydrated){l.blockedOn=a.tag===3?a.stateNode.containerInfo:null;return}}}l.blockedOn=null}function jn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var a=Ji(l.nativeEvent);if(a===null){a=l.nativeEvent;var e=new a.constructor(a.type,a);kn=e,a.target.dispatchEvent(e),kn=null}else return t=Ya(a),t!==null&&L0(t),l.blockedOn=a,!1;t.shift()}return!0}function $0(l,t,a){jn(l)&&a.delete(t)}function My(){$i=!1,da!==null&&jn(da)&&(da=null),ya!==null&&jn(ya)&&(ya=null),ma!==null&&jn(ma)&&(ma=null),mu.forEach($0),vu.forEach($0)}function Rn(l,t){l.blockedOn===t&&(l.blockedOn=null,$i||($i=!0,p.unstable_scheduleCallback(p.unstable_NormalPriority,My)))}var Un=null;function W0(l){Un!==l&&(Un=l,p.unstable_scheduleCallback(p.unstable_NormalPriority,function(){Un===l&&(Un=null);for(var t=0;t<l.length;t+=3){var a=l[t],e=l[t+1],u=l[t+2];if(typeof e!="function"){if(wi(e||a)===null)continue;break}var n=Ya(a);n!==null&&(l.splice(t,3),t-=3,wc(n,{pending:!0,data:u,method:a.method,action:e},e,u))}}))}function gu(l){function t(s){return Rn(s,l)}da!==null&&Rn(da,l),ya!==null&&Rn(ya,l),ma!==null&&Rn(ma,l),mu.forEach(t),vu.forEach(t);for(var a=0;a<va.length;a++){var e=va[a];e.blockedOn===l&&(e.blockedOn=null)}for(;0<va.length&&(a=va[0],a.blockedOn===null);)w0(a),a.blockedOn===null&&va.shift();if(a=(l.ownerDocument||l).$$reactFormReplay,a!=null)for(e=0;e<a.length;e+=3){var u=a[e],n=a[e+1],c=u[Fl]||null;if(typeof n=="function")c||W0(a);else if(c){var i=null;if(n&&n.hasAttribute("formAction")){if(u=n,c=n[Fl]||null)i=c.formAction;else if(wi(u)!==null)continue}else i=c.action;typeof i=="function"?a[e+1]=i:(a.splice(e,3),e-=3),W0(a)}}}function Wi(l){this._internalRoot=l}Hn.prototype.render=Wi.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(m(409));var a=t.current,e=st();Z0(a,e,l,t,null,null)},Hn.prototype.unmount=Wi.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;Z0(l.current,2,null,l,null,null),vn(),t[qa]=null}};function Hn(l){this._internalRoot=l}Hn.prototype.unstable_scheduleHydration=function(l){if(l){var t=rf();l={blockedOn:null,target:l,priority:t};for(var a=0;a<va.length&&t!==0&&t<va[a].priority;a++);va.splice(a,0,l),a===0&&w0(l)}};var k0=Z.version;if(k0!=="19.1.0")throw Error(m(527,k0,"19.1.0"));_.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(m(188)):(l=Object.keys(l).join(","),Error(m(268,l)));return l=j(t),l=l!==null?T(l):null,l=l===null?null:l.stateNode,l};var Dy={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:b,reconcilerVersion:"19.1.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var qn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!qn.isDisabled&&qn.supportsFiber)try{Te=qn.inject(Dy),at=qn}catch{}}return Su.createRoot=function(l,t){if(!X(l))throw Error(m(299));var a=!1,e="",u=ro,n=yo,c=mo,i=null;return t!=null&&(t.unstable_strictMode===!0&&(a=!0),t.identifierPrefix!==void 0&&(e=t.identifierPrefix),t.onUncaughtError!==void 0&&(u=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(c=t.onRecoverableError),t.unstable_transitionCallbacks!==void 0&&(i=t.unstable_transitionCallbacks)),t=X0(l,1,!1,null,null,a,e,u,n,c,i,null),l[qa]=t.current,ji(l),new Wi(t)},Su.hydrateRoot=function(l,t,a){if(!X(l))throw Error(m(299));var e=!1,u="",n=ro,c=yo,i=mo,s=null,y=null;return a!=null&&(a.unstable_strictMode===!0&&(e=!0),a.identifierPrefix!==void 0&&(u=a.identifierPrefix),a.onUncaughtError!==void 0&&(n=a.onUncaughtError),a.onCaughtError!==void 0&&(c=a.onCaughtError),a.onRecoverableError!==void 0&&(i=a.onRecoverableError),a.unstable_transitionCallbacks!==void 0&&(s=a.unstable_transitionCallbacks),a.formState!==void 0&&(y=a.formState)),t=X0(l,1,!0,t,a??null,e,u,n,c,i,s,y),t.context=Q0(null),a=t.current,e=st(),e=Xn(e),u=It(e),u.callback=null,Pt(a,u,e),a=e,t.current.lanes=a,Ae(t,a),jt(t),l[qa]=t.current,ji(l),new Hn(t)},Su.version="19.1.0",Su}var cr;function Qy(){if(cr)return Ii.exports;cr=1;function p(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(p)}catch(Z){console.error(Z)}}return p(),Ii.exports=Xy(),Ii.exports}var Zy=Qy();const Vy=fr(Zy);/**
- * @license lucide-react v0.485.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ly=p=>p.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),Ky=p=>p.replace(/^([A-Z])|[\s-_]+(\w)/g,(Z,U,m)=>m?m.toUpperCase():U.toLowerCase()),ir=p=>{const Z=Ky(p);return Z.charAt(0).toUpperCase()+Z.slice(1)},sr=(...p)=>p.filter((Z,U,m)=>!!Z&&Z.trim()!==""&&m.indexOf(Z)===U).join(" ").trim();/**
- * @license lucide-react v0.485.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var Jy={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.485.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const wy=L.forwardRef(({color:p="currentColor",size:Z=24,strokeWidth:U=2,absoluteStrokeWidth:m,className:X="",children:V,iconNode:el,...yl},j)=>L.createElement("svg",{ref:j,...Jy,width:Z,height:Z,stroke:p,strokeWidth:m?Number(U)*24/Number(Z):U,className:sr("lucide",X),...yl},[...el.map(([T,O])=>L.createElement(T,O)),...Array.isArray(V)?V:[V]]));/**
- * @license lucide-react v0.485.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const $y=(p,Z)=>{const U=L.forwardRef(({className:m,...X},V)=>L.createElement(wy,{ref:V,iconNode:Z,className:sr(`lucide-${Ly(ir(p))}`,`lucide-${p}`,m),...X}));return U.displayName=ir(p),U};/**
- * @license lucide-react v0.485.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Wy=[["circle",{cx:"12",cy:"9",r:"1",key:"124mty"}],["circle",{cx:"19",cy:"9",r:"1",key:"1ruzo2"}],["circle",{cx:"5",cy:"9",r:"1",key:"1a8b28"}],["circle",{cx:"12",cy:"15",r:"1",key:"1e56xg"}],["circle",{cx:"19",cy:"15",r:"1",key:"1a92ep"}],["circle",{cx:"5",cy:"15",r:"1",key:"5r1jwy"}]],ky=$y("grip-horizontal",Wy);function Fy({robotStatus:p="E-STOP",speed:Z=0,steeringAngle:U=0,battery:m=100,jointAngles:X=[0,0,0,0,0,0],cartesianCoords:V=[0,0,0,0,0,0],jointCurrents:el=[0,0,0,0,0,0],gripperOpening:yl=0}){const j=O=>O<=20?"text-red-600":"text-gray-800",T=O=>O<=20?"bg-red-600":"bg-green-500";return v.jsxs("div",{className:"bg-white rounded-lg shadow-md p-6 w-full h-full border border-gray-200",children:[v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("span",{className:"text-2xl font-bold text-gray-800",children:"Robot Status"}),v.jsx("span",{className:`px-3 py-1 rounded-full text-sm font-medium ${p==="E-STOP"?"bg-red-100 text-red-700":"bg-green-100 text-green-700"}`,children:p})]}),v.jsxs("div",{className:"space-y-5",children:[v.jsxs("div",{className:"pt-3 mt-4 border-t border-gray-300 space-y-2",children:[v.jsx("h3",{className:"text-xl font-semibold text-gray-800",children:"Mobile Robot"}),v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("span",{className:"text-lg text-gray-800 font-medium",children:"Linear Velocity:"}),v.jsxs("span",{className:"text-lg text-gray-800 font-mono",children:[Z.toFixed(2)," m/s"]})]}),v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("span",{className:"text-lg text-gray-800 font-medium",children:"Angular Velocity:"}),v.jsxs("span",{className:"text-lg text-gray-800 font-mono",children:[U.toFixed(2)," rad/s"]})]}),v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("span",{className:"text-lg text-gray-800 font-medium",children:"Battery:"}),v.jsxs("div",{className:"flex items-center",children:[v.jsx("div",{className:"w-24 bg-gray-200 rounded-full h-2.5 mr-2",children:v.jsx("div",{className:`h-2.5 rounded-full ${T(m)}`,style:{width:`${m}%`}})}),v.jsxs("span",{className:`text-lg font-medium ${j(m)}`,children:[m.toFixed(1),"%"]})]})]})]}),v.jsxs("div",{className:"pt-3 mt-4 border-t border-gray-100 space-y-2 last:mb-0",children:[v.jsx("h3",{className:"text-xl font-semibold text-gray-800",children:"Robot Arm"}),v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("span",{className:"text-lg text-gray-800 font-medium",children:"Joint Position:"}),v.jsxs("span",{className:"text-lg text-gray-800 font-mono",children:["[",X.map(O=>`${O.toFixed(1)}°`).join(", "),"]"]})]}),v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("span",{className:"text-lg text-gray-800 font-medium",children:"Cartesian Position:"}),v.jsxs("span",{className:"text-lg text-gray-800 font-mono",children:["[",V.map(O=>O.toFixed(2)).join(", "),"]"]})]}),v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("span",{className:"text-lg text-gray-800 font-medium",children:"Joint Current:"}),v.jsxs("span",{className:"text-lg text-gray-800 font-mono",children:["[",el.map(O=>O.toFixed(2)).join(", "),"]"]})]}),v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("span",{className:"text-lg text-gray-800 font-medium",children:"Gripper Opening:"}),v.jsxs("div",{className:"flex items-center space-x-2 text-sm",children:[v.jsx(ky,{className:"text-blue-600 w-4 h-4"}),v.jsxs("span",{className:"text-lg text-gray-800 font-mono",children:[yl.toFixed(1)," mm"]})]})]})]})]})]})}function Iy({cameraImages:p={}}){return v.jsxs("div",{className:"bg-white rounded-lg shadow-md p-6 max-w-full mx-auto border border-gray-200",children:[v.jsx("h2",{className:"text-2xl font-bold text-gray-800 mb-4 pb-2 border-b border-gray-200",children:"Sensor Status"}),v.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4",children:[v.jsxs("div",{className:"flex flex-col",children:[v.jsx("div",{className:"flex justify-between items-center mb-2",children:v.jsx("span",{className:"text-sm text-gray-700 font-medium mt-1.5",children:"Camera 1 RGB"})}),v.jsx("img",{src:p.mobile_rgb||"",alt:"Camera 1 RGB",className:"w-full h-auto rounded-lg object-cover"})]}),v.jsxs("div",{className:"flex flex-col",children:[v.jsx("div",{className:"flex justify-between items-center mb-2",children:v.jsx("span",{className:"text-sm text-gray-700 font-medium mt-1.5",children:"Camera 2 RGB"})}),v.jsx("img",{src:p.hand_rgb||"",alt:"Camera 2 RGB",className:"w-full h-auto rounded-lg object-cover"})]}),v.jsxs("div",{className:"flex flex-col",children:[v.jsx("div",{className:"flex justify-between items-center mb-2",children:v.jsx("span",{className:"text-sm text-gray-700 font-medium mt-1.5",children:"Map"})}),v.jsx("img",{src:p.map||"",alt:"map",className:"w-full h-auto rounded-lg object-cover"})]})]})]})}function Py({angle:p=0,onAngleChange:Z=()=>{},accel:U=0,brake:m=0,gearStatus:X="중립",jointValues:V=[0,0,0,0,0,0]}){const T=(p-90)*Math.PI/180,O=Math.cos(T)*38.5,P=Math.sin(T)*38.5,ll=()=>{const ml=[];for(let vl=0;vl<360;vl+=10){const gl=(vl-90)*Math.PI/180,El=50+Math.cos(gl)*39/44*50,ol=50+Math.sin(gl)*39/44*50,Al=50+Math.cos(gl)*44/44*50,K=50+Math.sin(gl)*44/44*50;ml.push(v.jsx("line",{x1:`${El}%`,y1:`${ol}%`,x2:`${Al}%`,y2:`${K}%`,stroke:"#ccc",strokeWidth:"1.25"},vl))}return ml},Sl=()=>[{deg:0,label:"0°"},{deg:90,label:"90°"},{deg:180,label:"180°"},{deg:270,label:"-90°"}].map(({deg:Rl,label:vl})=>{const gl=(Rl-90)*Math.PI/180,El=52,ol=50+Math.cos(gl)*El/44*50,Al=50+Math.sin(gl)*El/44*50;return v.jsx("text",{x:`${ol}%`,y:`${Al}%`,textAnchor:"middle",dominantBaseline:"middle",fontSize:"9",fill:"#666",children:vl},vl)});return v.jsxs("div",{className:"bg-white rounded-lg shadow-md p-6 w-full h-full border border-gray-200",children:[v.jsx("h2",{className:"text-2xl font-bold text-gray-800 mb-4 pb-2 border-b border-gray-200",children:"Controller Input"}),v.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-7",children:[v.jsxs("div",{className:"flex flex-col items-center justify-center text-center",children:[v.jsx("p",{className:"text-xl text-gray-700 font-semibold mb-3",children:"Angular Velocity Input"}),v.jsxs("div",{className:"relative w-44 h-44 bg-gray-100 rounded-full border border-gray-300",children:[v.jsxs("svg",{className:"absolute top-0 left-0 w-full h-full",children:[ll(),v.jsx("line",{x1:"50%",y1:"50%",x2:`${50+O/44*50}%`,y2:`${50+P/44*50}%`,stroke:"blue",strokeWidth:"2.5"}),Sl()]}),v.jsx("div",{className:"absolute bg-blue-500 rounded-full transform -translate-x-1/2 -translate-y-1/2",style:{width:`${5.5*2}px`,height:`${5.5*2}px`,top:`calc(50% + ${P}px)`,left:`calc(50% + ${O}px)`}}),v.jsxs("p",{className:"absolute left-1/2 bottom-1.5 transform -translate-x-1/2 text-sm font-mono",children:[p.toFixed(1),"°"]})]})]}),v.jsxs("div",{className:"flex flex-col justify-center px-4",children:[v.jsx("p",{className:"text-xl text-gray-700 font-semibold mb-4 text-center",children:"Pedal Input"}),v.jsxs("div",{className:"scale-[1.1] origin-center",children:[v.jsxs("div",{className:"mb-5",children:[v.jsx("p",{className:"text-sm text-gray-500 mb-2",children:"Accel"}),v.jsx("div",{className:"w-full bg-gray-200 rounded-full h-3",children:v.jsx("div",{className:"bg-green-500 h-3 rounded-full transition-all duration-200",style:{width:`${U}%`}})}),v.jsxs("p",{className:"text-right text-xs text-gray-600 mt-1",children:[U,"%"]})]}),v.jsxs("div",{children:[v.jsx("p",{className:"text-sm text-gray-500 mb-2",children:"Brake"}),v.jsx("div",{className:"w-full bg-gray-200 rounded-full h-3",children:v.jsx("div",{className:"bg-red-500 h-3 rounded-full transition-all duration-200",style:{width:`${m}%`}})}),v.jsxs("p",{className:"text-right text-xs text-gray-600 mt-1",children:[m,"%"]})]})]})]})]}),v.jsxs("div",{className:"mt-10 pt-5 border-t border-gray-100",children:[v.jsx("p",{className:"text-xl text-gray-700 font-medium mb-2",children:"Master Robotarm Joint Position"}),v.jsx("div",{className:"grid grid-cols-6 gap-2",children:V.map((ml,Rl)=>v.jsx("div",{className:"bg-blue-50 p-2 rounded text-center text-blue-700 font-mono text-sm",children:ml.toFixed(1)},Rl))})]})]})}function pt({label:p,value:Z,onChange:U}){return v.jsxs("button",{type:"button",onClick:()=>U(!Z),"aria-pressed":Z,className:["px-4 py-2 rounded-full border text-sm font-medium transition-colors duration-150 flex items-center gap-1.5",Z?"bg-blue-600 border-blue-600 text-white hover:bg-blue-700":"bg-white border-gray-300 text-gray-700 hover:bg-gray-50"].join(" "),children:[v.jsx("span",{children:p}),v.jsx("span",{className:`w-2.5 h-2.5 rounded-full ${Z?"bg-white":"bg-gray-300"}`})]})}function lm(){const[p,Z]=L.useState(null);L.useEffect(()=>{const z=window.location.origin.replace(/^http/,"ws"),f=new WebSocket(`${z}/ws/setting`);return f.onopen=()=>console.log("✅ /ws/setting 연결됨"),f.onmessage=A=>console.log("서버 응답:",A.data),f.onerror=A=>console.error("WebSocket 에러:",A),f.onclose=()=>console.log("❌ /ws/setting 연결 종료됨"),Z(f),()=>f.close()},[]);const U=p&&p.readyState===WebSocket.OPEN,[m,X]=L.useState(""),[V,el]=L.useState(""),[yl,j]=L.useState(""),[T,O]=L.useState(""),[P,ll]=L.useState(""),[Sl,ml]=L.useState("json"),[Rl,vl]=L.useState({test1:"",validation:"",test2:""}),[gl,El]=L.useState({position:!1,velocity:!1,current:!1,gripper:!1}),[ol,Al]=L.useState({linearVelocity:!1,angularVelocity:!1,odom:!1}),[K,_l]=L.useState({camera1:!1,camera2:!1,lidar:!1,map:!1}),Xl=()=>{const z={type:"dataset_setting",Hertz:m,robotArm:gl,mobile:ol,sensors:K,savePath:V,saveTask:yl,fileName:P,fileFormat:Sl};U?(p.send(JSON.stringify(z)),console.log("📤 저장 전송:",z)):alert("⚠️ WebSocket 연결이 아직 준비되지 않았습니다.")},[Nl,Ll]=L.useState(!1),[rt,Kl]=L.useState(null),[Ol,Jl]=L.useState(0),zt=z=>{const f=Math.floor(z/3600),A=Math.floor(z%3600/60),M=z%60;return f>0?`${f}:${String(A).padStart(2,"0")}:${String(M).padStart(2,"0")}`:`${A}:${String(M).padStart(2,"0")}`};L.useEffect(()=>{if(!Nl||!rt){Jl(0);return}const z=setInterval(()=>{Jl(Math.floor((Date.now()-rt)/1e3))},1e3);return()=>clearInterval(z)},[Nl,rt]);const Ml=()=>{const z=!Nl;if(U)if(b({type:"start_recording"}),Ll(z),z){const f=Date.now();Kl(f),Jl(0)}else Kl(null),Jl(0);else alert("⚠️ WebSocket 연결이 아직 준비되지 않았습니다.")},b=z=>!p||p.readyState!==WebSocket.OPEN?(console.warn("WS not ready"),!1):(p.send(JSON.stringify(z)),!0),_=()=>{b({type:"save_recording"}),Ll(!1),Kl(null),Jl(0)},q=()=>{b({type:"discard_recording"}),Ll(!1),Kl(null),Jl(0)};return v.jsxs("div",{className:"bg-white rounded-lg shadow-md p-5 border border-gray-200 space-y-5",children:[v.jsxs("div",{children:[v.jsx("div",{className:"flex items-center justify-between",children:v.jsx("h2",{className:"text-2xl font-bold text-gray-800",children:"Dataset setting"})}),v.jsx("div",{className:"border-b border-gray-200 mt-2"})]}),v.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-[5.4fr_4.6fr] gap-4",children:[v.jsxs("div",{className:"space-y-6",children:[v.jsxs("section",{className:"space-y-2",children:[v.jsx("h3",{className:"text-lg font-semibold text-gray-800",children:"Robot arm"}),v.jsxs("div",{className:"flex flex-wrap gap-2",children:[v.jsx(pt,{label:"Position",value:gl.position,onChange:z=>El(f=>({...f,position:z}))}),v.jsx(pt,{label:"Velocity",value:gl.velocity,onChange:z=>El(f=>({...f,velocity:z}))}),v.jsx(pt,{label:"Current",value:gl.current,onChange:z=>El(f=>({...f,current:z}))}),v.jsx(pt,{label:"Gripper",value:gl.gripper,onChange:z=>El(f=>({...f,gripper:z}))})]})]}),v.jsxs("section",{className:"space-y-2",children:[v.jsx("h3",{className:"text-lg font-semibold text-gray-800",children:"Mobile"}),v.jsxs("div",{className:"flex flex-wrap gap-2",children:[v.jsx(pt,{label:"Linear velocity",value:ol.linearVelocity,onChange:z=>Al(f=>({...f,linearVelocity:z}))}),v.jsx(pt,{label:"Angular velocity",value:ol.angularVelocity,onChange:z=>Al(f=>({...f,angularVelocity:z}))}),v.jsx(pt,{label:"Odom",value:ol.odom,onChange:z=>Al(f=>({...f,odom:z}))})]})]}),v.jsxs("section",{className:"space-y-2",children:[v.jsx("h3",{className:"text-lg font-semibold text-gray-800",children:"Sensor data"}),v.jsxs("div",{className:"flex flex-wrap gap-2",children:[v.jsx(pt,{label:"Camera 1",value:K.camera1,onChange:z=>_l(f=>({...f,camera1:z}))}),v.jsx(pt,{label:"Camera 2",value:K.camera2,onChange:z=>_l(f=>({...f,camera2:z}))}),v.jsx(pt,{label:"Map",value:K.map,onChange:z=>_l(f=>({...f,map:z}))}),v.jsx(pt,{label:"Lidar",value:K.lidar,onChange:z=>_l(f=>({...f,lidar:z}))})]})]})]}),v.jsxs("div",{className:"space-y-2",children:[v.jsxs("section",{className:"space-y-2",children:[v.jsx("h3",{className:"text-lg font-semibold text-gray-800",children:"Data Save Settings"}),v.jsxs("div",{className:"grid grid-cols-10 gap-4",children:[v.jsxs("div",{className:"col-span-7",children:[v.jsx("label",{className:"block text-sm font-medium text-gray-700 mb-1",children:"Save Path"}),v.jsx("input",{type:"text",placeholder:"/home",value:V,onChange:z=>el(z.target.value),className:"w-full border border-gray-300 rounded-md px-3 py-1 text-gray-800 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500"})]}),v.jsxs("div",{className:"col-span-3",children:[v.jsx("label",{className:"block text-sm font-medium text-gray-700 mb-1",children:"Save Hz"}),v.jsx("input",{type:"number",placeholder:"10",value:m,onChange:z=>X(z.target.value),className:"w-full border border-gray-300 rounded-md px-3 py-1 text-gray-800 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500",min:1,step:1})]})]}),v.jsxs("div",{className:"grid grid-cols-10 gap-4",children:[v.jsxs("div",{className:"col-span-7",children:[v.jsx("label",{className:"block text-sm font-medium text-gray-700 mb-1",children:"File Name"}),v.jsx("input",{type:"text",placeholder:"data_1",value:P,onChange:z=>ll(z.target.value),className:"w-full border border-gray-300 rounded-md px-3 py-1 text-gray-800 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500"})]}),v.jsxs("div",{className:"col-span-3",children:[v.jsx("label",{className:"block text-sm font-medium text-gray-700 mb-1",children:"File Format"}),v.jsxs("select",{value:Sl,onChange:z=>ml(z.target.value),className:"w-full border border-gray-300 rounded-md px-3 py-1 text-gray-800 bg-white focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500",children:[v.jsx("option",{value:"json",children:"json"}),v.jsx("option",{value:"csv",children:"csv"}),v.jsx("option",{value:"yaml",children:"yaml"}),v.jsx("option",{value:"hdf5",children:"hdf5"})]})]})]})]}),v.jsxs("section",{className:"space-y-1",children:[v.jsx("label",{className:"text-lg font-semibold text-gray-800",children:"Task Description"}),v.jsx("input",{type:"text",placeholder:"pick and place a red cube",value:yl,onChange:z=>j(z.target.value),className:"w-full border border-gray-300 rounded-md px-3 py-1 text-gray-800 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500"})]}),v.jsxs("section",{className:"flex items-center space-x-2",children:[v.jsx("label",{className:"text-lg font-semibold text-gray-800",children:"Robot Size (m):"}),v.jsx("input",{type:"text",placeholder:"0.6",value:T,onChange:z=>O(z.target.value),className:"border border-gray-300 rounded-md px-2 py-1 text-gray-800 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500 w-24"})]})]})]}),v.jsx("div",{className:"pt-2",children:v.jsxs("div",{className:"flex gap-3",children:[v.jsx("button",{onClick:Xl,disabled:!U,className:`flex-[4] py-3 rounded-md font-semibold transition ${U?"bg-blue-600 text-white hover:bg-blue-700":"bg-gray-300 text-gray-600 cursor-not-allowed"}`,children:"Saving settings"}),v.jsx("div",{className:"flex-[6]",children:Nl?v.jsxs("div",{className:"flex gap-3",children:[v.jsxs("button",{onClick:_,className:"flex-1 py-3 rounded-md font-semibold bg-blue-600 text-white hover:bg-blue-700 transition",children:["Saving recording",v.jsxs("span",{className:"ml-2 text-sm font-normal text-gray-200",children:["(",zt(Ol),")"]})]}),v.jsx("button",{onClick:q,className:"flex-1 py-3 rounded-md font-semibold bg-red-600 text-white hover:bg-red-700 transition",children:"Discard recording"})]}):v.jsx("button",{onClick:Ml,disabled:!U,className:`w-full py-3 rounded-md font-semibold transition ${U?"bg-emerald-600 text-white hover:bg-emerald-700":"bg-gray-300 text-gray-600 cursor-not-allowed"}`,title:'서버에 "getting_data" 변수를 토글 전송',children:"Recording start"})})]})})]})}function tm(){const[p,Z]=L.useState("joystick"),[U,m]=L.useState("E-STOP"),[X,V]=L.useState(85),[el,yl]=L.useState(0),[j,T]=L.useState(0),[O,P]=L.useState([0,0,0,0,0,0]),[ll,Sl]=L.useState([0,0,0,0,0,0]),[ml,Rl]=L.useState(30),[vl,gl]=L.useState([0,0,0,0,0,0]),[El,ol]=L.useState(0),[Al,K]=L.useState(0),[_l,Xl]=L.useState(0),[Nl,Ll]=L.useState("중립"),[rt,Kl]=L.useState([0,0,0,0,0,0]),[Ol,Jl]=L.useState({}),[zt,Ml]=L.useState(30),[b,_]=L.useState(29.8),[q,z]=L.useState(12.3),[f,A]=L.useState(11.5),[M,N]=L.useState([]),H=W=>{const G=new Date().toLocaleTimeString();N(ql=>[`[${G}] ${W}`,...ql.slice(0,49)])};return L.useEffect(()=>{const W=window.location.origin.replace(/^http/,"ws"),G=new WebSocket(`${W}/ws/data`),ql=new WebSocket(`${W}/ws/image`);return ql.onmessage=cl=>{try{const B=JSON.parse(cl.data);B.images&&Jl(xe=>({...xe,...B.images}))}catch(B){console.error("Image WebSocket error:",B)}},G.onmessage=cl=>{try{const B=JSON.parse(cl.data);B.robot_status!==void 0&&m(B.robot_status),B.battery!==void 0&&V(B.battery),B.linear_speed!==void 0&&yl(B.linear_speed),B.angular_speed!==void 0&&T(B.angular_speed),B.gripper_opening!==void 0&&Rl(B.gripper_opening),B.joint_angles!==void 0&&P(B.joint_angles),B.cartesian_position!==void 0&&Sl(B.cartesian_position),B.force_sensor&&gl(B.force_sensor),B.master_joint_angles!==void 0&&Kl(B.master_joint_angles),B.angle!==void 0&&ol(B.angle),B.accel!==void 0&&K(B.accel),B.brake!==void 0&&Xl(B.brake),B.gear_status!==void 0&&Ll(B.gear_status),B.camera1_fps!==void 0&&Ml(B.camera1_fps),B.camera2_fps!==void 0&&_(B.camera2_fps),B.camera1_latency!==void 0&&z(B.camera1_latency),B.camera2_latency!==void 0&&A(B.camera2_latency),B.log!==void 0&&H(B.log),H("ROS 메시지 수신됨")}catch(B){console.error("Data WebSocket error:",B)}},()=>{ql.close(),G.close()}},[]),v.jsxs("div",{className:"bg-gray-100 min-h-screen p-12",children:[" ",v.jsx("h1",{className:"text-4xl font-semibold text-center text-gray-800 mb-10",children:"Mobile Manipulator Driver"})," ",v.jsx("div",{className:"w-full mb-6",children:v.jsx(Iy,{cameraImages:Ol})}),v.jsxs("div",{className:"flex flex-col lg:flex-row gap-6 w-full",children:[v.jsx("div",{className:"lg:flex-[3]",children:v.jsx(Fy,{robotStatus:U,speed:el,steeringAngle:j,battery:X,jointAngles:O,jointCurrents:vl,cartesianCoords:ll,gripperOpening:ml})}),v.jsx("div",{className:"lg:flex-[3] flex flex-col gap-2",children:v.jsx(Py,{angle:El,onAngleChange:()=>{},accel:Al,brake:_l,gearStatus:Nl,jointValues:rt})}),v.jsx("div",{className:"lg:flex-[4] flex items-stretch",children:v.jsx(lm,{})})]})]})}const am=Vy.createRoot(document.getElementById("root"));am.render(v.jsx(qy.StrictMode,{children:v.jsx(tm,{})}));
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# downsample.py
+#
+# 그래프용 시계열 decimation (모양을 유지하면서 점 개수를 줄임). numpy 벡터 연산만 사용.
+#
+#   indices = minmax_indices(y, 1000)          # bucket마다 최솟값/최댓값 두 점 (spike가 사라지지 않음)
+#   indices = lttb_indices(t, y, 1000)         # Largest-Triangle-Three-Buckets (선 모양을 가장 잘 유지)
+#   t[indices[:, c]], y[indices[:, c], c]      # 열(c)마다 고른 점
+#
+# y는 (n,) 또는 (n, c). 결과는 (m, c) 원본 index (열마다 따로 고르므로 열마다 시각이 다를 수 있음), 각 열 안에서 시간순.
+# bucket은 sample 개수 기준으로 나눔 (sample 간격이 고르지 않아도 점 개수는 요청한 만큼)
+
+import numpy as np
+
+
+def _as_columns(y: np.ndarray) -> np.ndarray:
+    y = np.asarray(y)
+    return y[:, None] if y.ndim == 1 else y.reshape(len(y), int(np.prod(y.shape[1:])))
+
+
+def _all_indices(n: int, columns: int) -> np.ndarray:
+    return np.repeat(np.arange(n)[:, None], columns, axis=1)
+
+
+def _bucket_matrix(start: int, stop: int, buckets: int):
+    """[start, stop)을 buckets개의 연속 구간으로 나눈 (buckets, max_len) index 행렬.
+    짧은 bucket은 마지막 index를 반복해서 채우므로 argmin/argmax 결과는 항상 그 bucket 안"""
+    edges = np.linspace(start, stop, buckets + 1).astype(np.int64)
+    lengths = np.maximum(edges[1:] - edges[:-1], 1)
+    offsets = np.minimum(np.arange(lengths.max())[None, :], (lengths - 1)[:, None])
+    return edges[:-1, None] + offsets, edges
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """bucket (n_out // 2개)마다 최솟값과 최댓값 index를 시간순으로. 점 개수가 n_out 이하면 전부"""
+    y = _as_columns(y)
+    n, columns = y.shape
+    buckets = n_out // 2
+    if n <= n_out or buckets < 1:
+        return _all_indices(n, columns)
+    matrix, _ = _bucket_matrix(0, n, buckets)
+    values = y[matrix]                                  # (buckets, max_len, c)
+    rows = np.arange(buckets)[:, None]
+    low = matrix[rows, np.argmin(values, axis=1)]       # (buckets, c)
+    high = matrix[rows, np.argmax(values, axis=1)]
+    pair = np.stack((np.minimum(low, high), np.maximum(low, high)), axis=1) # bucket 안에서 시간순
+    return pair.reshape(buckets * 2, columns)
+
+
+def lttb_indices(t: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets (Steinarsson 2013). 처음/마지막 점은 항상 포함.
+    bucket마다 (이전에 고른 점, 후보, 다음 bucket 평균)의 삼각형 넓이가 가장 큰 후보를 고른다.
+    이전 점에 의존하므로 bucket 순서대로 진행하되, bucket 안의 후보들과 모든 열은 한 번에 계산"""
+    t = np.asarray(t, dtype=np.float64)
+    y = _as_columns(y).astype(np.float64, copy=False)
+    n, columns = y.shape
+    if n <= n_out or n_out < 3:
+        return _all_indices(n, columns)
+    buckets = n_out - 2
+    matrix, edges = _bucket_matrix(1, n - 1, buckets)
+    t = t - t[0] # 큰 unix 시각끼리 곱할 때 정밀도 손실 방지
+
+    # 다음 bucket 평균 (마지막 bucket 다음은 마지막 점)
+    counts = (edges[1:] - edges[:-1])[:, None]
+    mean_t = np.add.reduceat(t[1:n - 1], edges[:-1] - 1) / counts[:, 0]
+    mean_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1, axis=0) / counts
+    next_t = np.append(mean_t[1:], t[-1])
+    next_y = np.vstack((mean_y[1:], y[-1:]))
+
+    candidates_t = t[matrix]                            # (buckets, max_len)
+    candidates_y = y[matrix]                            # (buckets, max_len, c)
+    selected = np.empty((n_out, columns), dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    column_index = np.arange(columns)
+    anchor = np.zeros(columns, dtype=np.int64)
+    for bucket in range(buckets):
+        anchor_t, anchor_y = t[anchor], y[anchor, column_index]
+        # 삼각형 넓이 x2 (절댓값만 비교하므로 1/2 생략)
+        area = np.abs(
+            (anchor_t - next_t[bucket]) * (candidates_y[bucket] - anchor_y)
+            - (anchor_t[None, :] - candidates_t[bucket][:, None]) * (next_y[bucket] - anchor_y)
+        )
+        anchor = matrix[bucket, np.argmax(area, axis=0)]
+        selected[bucket + 1] = anchor
+    return selected
+
+
+DECIMATORS = {
+    "minmax": lambda t, y, n_out: minmax_indices(y, n_out),
+    "lttb": lttb_indices,
+}
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# encoder_workers.py
+#
+# 프로세스 모드 JPEG encoder (websocket_server_final.ENCODER_MODE = "process").
+# 인코딩을 서버(uvicorn event loop, rclpy spin, websocket 핸들러)와 다른 프로세스에서 돌려 GIL을 나눠 쓰지 않게 한다.
+#
+#   pool = ProcessEncoderPool(SHM_CONFIG)
+#   future = pool.submit("mobile_rgb", variants)      # concurrent.futures.Future
+#   changed, encoded, trace, stats, jpeg_bytes = future.result()
+#
+# - 카메라마다 worker 프로세스 하나 (spawn). 같은 카메라는 항상 같은 worker로 가므로 변화 감지 cache가 그대로 유지된다.
+# - worker는 SHM_CONFIG 세그먼트에 이름으로 직접 attach (픽셀은 프로세스 간에 복사되지 않음). 결과 JPEG bytes만 pipe로 돌아옴.
+#   producer가 세그먼트를 다시 만들면 worker도 따로 감지해서 다시 attach (shm_protocol.SegmentAttachment).
+# - 변화가 없어 이전과 같은 결과면 bytes를 다시 보내지 않고 changed=False만 보낸다 (서버가 직전 결과를 재사용).
+# - trace는 perf_counter_ns (Linux에서는 CLOCK_MONOTONIC이라 프로세스가 달라도 같은 기준).
+# - worker가 죽으면(BrokenProcessPool) 다음 submit에서 그 카메라 worker만 다시 띄운다.
+
+import concurrent.futures
+import multiprocessing
+import signal
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+from frame_encoding import make_camera_encoder, new_encode_stats
+from shm_protocol import SegmentAttachment
+
+WORKER_SHM_CHECK_INTERVAL_S = 0.5 # 서버 SHM_CHECK_INTERVAL_S와 같은 주기로 producer 재시작 확인
+
+# worker 프로세스 안의 상태 (_init_worker에서 생성)
+_worker = None
+
+
+class _WorkerState:
+    def __init__(self, cam_id_key: str, config: dict):
+        self.cam_id_key = cam_id_key
+        # 서버와 같은 판별 (seqlock이면 헤더의 shape/dtype, 헤더가 없으면 SHM_CONFIG shape/dtype)
+        self.segment = SegmentAttachment(config["name"], config.get("shape"), config.get("dtype"))
+        self.checked_at = 0.0
+        self.jpeg_bytes = 0
+        self.encoder = make_camera_encoder(cam_id_key, config, on_encoded=self._count_bytes)
+        self.last_sent = None
+
+    def _count_bytes(self, size: int):
+        self.jpeg_bytes += size
+
+    def check_segment(self) -> bool:
+        """WORKER_SHM_CHECK_INTERVAL_S마다 producer 시작/재시작/종료를 확인하고 필요하면 다시 attach. attach 상태면 True"""
+        now = time.monotonic()
+        if now - self.checked_at >= WORKER_SHM_CHECK_INTERVAL_S:
+            self.checked_at = now
+            if self.segment.changed() and self.segment.refresh() in ("attached", "reattached"):
+                self.encoder.reset()
+        return self.segment.attached
+
+    def take_counters(self):
+        stats, jpeg_bytes = self.encoder.stats, self.jpeg_bytes
+        self.encoder.stats = new_encode_stats()
+        self.jpeg_bytes = 0
+        return stats, jpeg_bytes
+
+
+def _init_worker(cam_id_key: str, config: dict):
+    global _worker
+    signal.signal(signal.SIGINT, signal.SIG_IGN) # Ctrl+C는 서버 프로세스가 처리하고 pool을 내림
+    _worker = _WorkerState(cam_id_key, config)
+
+
+def encode_camera(variants):
+    """worker 프로세스에서 실행. (changed, {variant: JPEG bytes} | {} | None, trace, stats 증가분, JPEG 바이트 증가분)
+    세그먼트가 아직 없으면 {}. changed=False면 encoded는 None (직전 결과와 같음)"""
+    state = _worker
+    trace = {}
+    if not state.check_segment():
+        stats, jpeg_bytes = state.take_counters()
+        return True, {}, trace, stats, jpeg_bytes
+    segment = state.segment
+    if segment.reader is not None:
+        encoded = state.encoder.encode_seqlock(segment.reader, variants, trace)
+    else:
+        img_cv, reusable, signature = state.encoder.read_raw(segment.view, variants, trace)
+        encoded = reusable if img_cv is None else state.encoder.encode_copy(img_cv, variants, reusable, signature)
+    trace["encoded"] = time.perf_counter_ns()
+    changed = encoded is not state.last_sent
+    state.last_sent = encoded
+    stats, jpeg_bytes = state.take_counters()
+    return changed, (encoded if changed else None), trace, stats, jpeg_bytes
+
+
+class ProcessEncoderPool:
+    """카메라별 단일 worker ProcessPoolExecutor 묶음"""
+    def __init__(self, shm_config: dict):
+        self._context = multiprocessing.get_context("spawn") # 서버는 스레드가 많으므로 fork 대신 spawn
+        self._initargs = {key: (key, dict(config)) for key, config in shm_config.items()} # SHM_CONFIG 항목은 pickle 가능
+        self._executors = {key: self._new_executor(key) for key in shm_config}
+
+    def _new_executor(self, cam_id_key: str):
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=self._context, initializer=_init_worker, initargs=self._initargs[cam_id_key],
+        )
+
+    def submit(self, cam_id_key: str, variants) -> concurrent.futures.Future:
+        try:
+            return self._executors[cam_id_key].submit(encode_camera, variants)
+        except BrokenProcessPool:
+            self._executors[cam_id_key].shutdown(wait=False, cancel_futures=True)
+            self._executors[cam_id_key] = self._new_executor(cam_id_key)
+            return self._executors[cam_id_key].submit(encode_camera, variants)
+
+    def shutdown(self, wait: bool = False):
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
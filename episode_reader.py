@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# episode_reader.py
+#
+# dataset_recorder.py 가 저장한 에피소드 디렉터리를 다시 읽음 (서버 replay 모드, 오프라인 분석).
+#
+#   episode = EpisodeReader("./data/data_1")
+#   episode.meta, episode.rows, episode.columns      # meta.json ({열 이름: {"dtype", "shape"}} 포함)
+#   for block in episode.blocks():                   # 연속된 row 묶음마다 {열 이름: 배열} (녹화 chunk 단위)
+#       block["timestamp_ns"], block["camera1"], block["camera1_valid"], ...
+#   episode.close()
+#
+# 형식별 읽기 방식 (큰 카메라 열을 한 번에 메모리에 올리지 않도록):
+#   npz:     np.savez는 압축 없이(ZIP_STORED) 저장하므로 zip 안의 .npy 데이터 위치를 찾아 np.memmap으로 연다.
+#            page cache에서 row 단위로 읽히므로 에피소드 크기와 상관없이 RSS가 늘지 않는다. 압축된 npz는 일반 로드로 fallback
+#   hdf5:    h5py dataset을 block 단위로 slice해서 읽음 (h5py 필요)
+#   parquet: memory_map=True 로 row group(= 녹화 chunk) 단위로 읽고, 다차원 열(fixed-size binary)은 복사 없이 view (pyarrow 필요)
+
+import json
+import os
+import struct
+import zipfile
+
+import numpy as np
+
+try:
+    import h5py
+except ImportError: # 선택 의존성: 없으면 hdf5 에피소드는 읽을 수 없음
+    h5py = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError: # 선택 의존성: 없으면 parquet 에피소드는 읽을 수 없음
+    pq = None
+
+# zip local file header: signature, version, flags, method, time, date, crc, sizes, name_len, extra_len
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+_ZIP_LOCAL_MAGIC = b"PK\x03\x04"
+
+
+def _npy_memmap(path: str, offset: int):
+    """offset 위치에서 시작하는 .npy (zip 안 member 포함)를 read-only memmap으로"""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        data_offset = f.tell()
+    if dtype.hasobject:
+        raise ValueError(f"{path}: object arrays cannot be memory-mapped")
+    if int(np.prod(shape, dtype=np.int64)) == 0: # 길이 0인 배열은 mmap할 수 없음
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=data_offset, shape=shape, order="F" if fortran_order else "C")
+
+
+def load_npz_mmap(path: str) -> dict:
+    """{이름: 배열}. 압축 없는 member는 memmap, 압축된 member는 일반 로드"""
+    arrays = {}
+    with zipfile.ZipFile(path) as archive:
+        members = archive.infolist()
+        compressed = []
+        for info in members:
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                compressed.append((name, info.filename))
+                continue
+            with open(path, "rb") as f:
+                f.seek(info.header_offset)
+                header = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+            if header[0] != _ZIP_LOCAL_MAGIC:
+                raise ValueError(f"{path}: bad zip local header for {info.filename}")
+            name_len, extra_len = header[-2:]
+            arrays[name] = _npy_memmap(path, info.header_offset + _ZIP_LOCAL_HEADER.size + name_len + extra_len)
+        if compressed:
+            with np.load(path) as npz:
+                for name, _ in compressed:
+                    arrays[name] = npz[name]
+    return arrays
+
+
+class EpisodeReader:
+    """에피소드 디렉터리 하나. blocks()는 여러 번 호출해도 처음부터 다시 읽는다 (replay loop)"""
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.file_format = self.meta.get("format", "npz")
+        self.rows = int(self.meta.get("rows", 0))
+        self.columns = self.meta.get("columns", {})
+        self.hz = float(self.meta.get("hz", 0.0))
+        self._h5 = None
+        if self.file_format == "hdf5":
+            if h5py is None:
+                raise RuntimeError("hdf5 episode needs h5py")
+            self._h5 = h5py.File(os.path.join(path, "data.h5"), "r")
+        elif self.file_format == "parquet":
+            if pq is None:
+                raise RuntimeError("parquet episode needs pyarrow")
+        elif self.file_format != "npz":
+            raise ValueError(f"unsupported episode format {self.file_format!r}")
+
+    @property
+    def duration_s(self) -> float:
+        return self.rows / self.hz if self.hz else 0.0
+
+    def blocks(self):
+        if self.file_format == "npz":
+            for filename in self.meta.get("files", []):
+                yield load_npz_mmap(os.path.join(self.path, filename))
+        elif self.file_format == "hdf5":
+            rows = max(1, int(self.hz)) # 녹화 chunk와 같은 1초 단위
+            for start in range(0, self.rows, rows):
+                yield {name: dataset[start:start + rows] for name, dataset in self._h5.items()}
+        else:
+            parquet = pq.ParquetFile(os.path.join(self.path, "data.parquet"), memory_map=True)
+            for group in range(parquet.num_row_groups):
+                table = parquet.read_row_group(group)
+                yield {name: self._parquet_column(name, table.column(name).combine_chunks()) for name in table.column_names}
+
+    def _parquet_column(self, name: str, column) -> np.ndarray:
+        info = self.columns.get(name)
+        if not info or not info["shape"]:
+            return column.to_numpy(zero_copy_only=False)
+        # fixed-size binary: row마다 shape/dtype 배열 하나 (dataset_recorder._ParquetEpisodeWriter._column)
+        dtype = np.dtype(info["dtype"])
+        row_nbytes = column.type.byte_width
+        data = np.frombuffer(column.buffers()[1], dtype=np.uint8)[column.offset * row_nbytes:(column.offset + len(column)) * row_nbytes]
+        return data.view(dtype).reshape((len(column),) + tuple(info["shape"]))
+
+    def close(self):
+        if self._h5 is not None:
+            self._h5.close()
+            self._h5 = None
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# frame_encoding.py
+#
+# SHM 카메라 프레임 -> JPEG variant 인코딩 (변화 감지 / 이전 결과 재사용 포함).
+# websocket_server_final의 encoder 스레드와 encoder_workers.py의 worker 프로세스가 같이 사용하므로
+# rclpy / FastAPI에 의존하지 않는다.
+#
+#   encoder = CameraEncoder("mobile_rgb", stride=8)
+#   encoded = encoder.encode_seqlock(reader, variants, trace)   # {variant: JPEG bytes}
+#
+# variant = (ladder level, roi, size). 카메라 하나에 대해 encode_*()는 한 번에 하나만 호출해야 한다 (cache가 카메라별).
+# depth 카메라("depth"가 들어간 key, float32 m 단위)는 DepthColorizer를 거쳐 컬러맵 JPEG / 16-bit PNG / raw uint16으로 나간다.
+
+import time
+import zlib
+
+import cv2
+import numpy as np
+import simplejpeg
+
+# 적응형 JPEG ladder: /ws/image 클라이언트마다 측정한 송신 시간/RTT에 따라 level을 오르내린다.
+# 각 level은 그 level을 받는 클라이언트가 있을 때만 인코딩 (JPEG_DEFAULT_LEVEL = 기존 quality 15, 원본 해상도)
+JPEG_LADDER = (
+    {"quality": 10, "scale": 0.5},
+    {"quality": 15, "scale": 1.0},
+    {"quality": 40, "scale": 1.0},
+    {"quality": 70, "scale": 1.0},
+)
+JPEG_DEFAULT_LEVEL = 1
+
+# 변화 감지: 세그먼트를 stride 간격으로 샘플링한 crc32가 이전과 같으면 복사/인코딩 없이 이전 JPEG 재사용
+# (작은 변화를 놓치는 경우를 대비해 CHANGE_DETECT_MAX_REUSE_S마다 한 번은 강제로 다시 인코딩)
+# SHM_CONFIG 항목에 "change_detect_stride"를 넣으면 카메라별로 덮어씀 (0이면 끔)
+CHANGE_DETECT_SAMPLE_STRIDE = 8
+CHANGE_DETECT_MAX_REUSE_S = 1.0
+
+
+# depth 카메라 설정 (SHM_CONFIG 항목에서 카메라별로 지정)
+#   "depth_range": (min_m, max_m)   이 범위를 컬러맵 0..255에 매핑 (범위 밖은 끝값, NaN/+inf는 max 쪽)
+#   "depth_format": "jpeg"          컬러맵(또는 gray) JPEG. ladder quality/scale 적용
+#                   "png16"         uint16 mm 단위 16-bit PNG (무손실, 0 = 측정값 없음)
+#                   "raw16"         uint16 mm 단위 little-endian raw (height x width x 2 bytes)
+#   "depth_colormap": "turbo" 등 cv2.COLORMAP_* 이름, 또는 "gray" (예전 grayscale 출력)
+DEPTH_DEFAULT_RANGE = (0.1, 2.0)
+DEPTH_FORMATS = {"jpeg": "image/jpeg", "png16": "image/png", "raw16": "application/octet-stream"} # format -> MIME
+DEPTH_DEFAULT_FORMAT = "jpeg"
+DEPTH_DEFAULT_COLORMAP = "turbo"
+DEPTH_PNG_COMPRESSION = 1 # 0-9. 높이면 크기는 조금 줄고 인코딩은 크게 느려짐
+DEPTH_MAX_MM = 65535
+
+
+def new_encode_stats() -> dict:
+    """카메라별 인코딩(variant 단위)/스킵(변화 없음)/torn(인코딩 중 덮어써짐) 횟수"""
+    return {"encoded": 0, "skipped": 0, "torn": 0}
+
+
+def sample_signature(img: np.ndarray, stride: int) -> int:
+    """stride 간격으로 샘플링한 픽셀의 crc32 (640x480x3, stride 8 기준 약 14KB만 읽음)"""
+    return zlib.crc32(np.ascontiguousarray(img[::stride, ::stride]))
+
+
+def encode_image(cam_id_key: str, img_cv: np.ndarray, jpeg_quality: int, scale: float = 1.0, roi=None, size=None):
+    """RGB 이미지 하나를 (roi로 자르고 size/scale로 줄여서) JPEG로 인코딩 (depth는 DepthColorizer.encode)"""
+    img_to_encode = img_cv
+    if roi is not None: # 클라이언트가 요청한 영역만 (이미지 밖은 잘라냄)
+        x, y, width, height = roi
+        img_to_encode = img_to_encode[y:y + height, x:x + width]
+        if img_to_encode.size == 0:
+            raise ValueError(f"roi {roi} is outside of image {cam_id_key} {img_cv.shape}")
+    height, width = img_to_encode.shape[:2]
+    out_width, out_height = size if size is not None else (width, height)
+    out_width, out_height = max(1, round(out_width * scale)), max(1, round(out_height * scale)) # ladder의 저해상도 level
+    if (out_width, out_height) != (width, height):
+        img_to_encode = cv2.resize(img_to_encode, (out_width, out_height), interpolation=cv2.INTER_AREA)
+    img_to_encode = np.ascontiguousarray(img_to_encode) # roi만 자른 경우 simplejpeg용으로 연속 메모리 필요
+    return simplejpeg.encode_jpeg(
+        img_to_encode, quality=jpeg_quality, colorspace='RGB', colorsubsampling='420'
+    )
+
+
+def _colormap_lut(colormap: str) -> np.ndarray:
+    """0..255 -> 색 lookup table. (256, 3) RGB, "gray"면 (256, 1)"""
+    ramp = np.arange(256, dtype=np.uint8)
+    if colormap == "gray":
+        return ramp.reshape(256, 1)
+    cv2_colormap = getattr(cv2, f"COLORMAP_{colormap.upper()}", None)
+    if cv2_colormap is None:
+        raise ValueError(f"unknown depth colormap: {colormap}")
+    return np.ascontiguousarray(cv2.applyColorMap(ramp.reshape(256, 1), cv2_colormap)[:, 0, ::-1]) # BGR -> RGB
+
+
+class DepthColorizer:
+    """depth(float32, m) -> JPEG/PNG/raw. 출력 크기별 버퍼를 한 번만 만들고 매 프레임 제자리에서 계산한다
+    (예전 코드의 astype/nan_to_num/clip/정규화마다 생기던 프레임 크기 배열 할당 없음). 한 번에 한 스레드에서만 사용"""
+    def __init__(self, depth_range=DEPTH_DEFAULT_RANGE, depth_format: str = DEPTH_DEFAULT_FORMAT, colormap: str = DEPTH_DEFAULT_COLORMAP):
+        min_m, max_m = (float(value) for value in depth_range)
+        if not max_m > min_m:
+            raise ValueError(f"depth_range must be (min, max) with max > min, got {depth_range}")
+        if depth_format not in DEPTH_FORMATS:
+            raise ValueError(f"depth_format must be one of {list(DEPTH_FORMATS)}, got {depth_format}")
+        self.min_m = min_m
+        self.max_m = max_m
+        self.depth_format = depth_format
+        self.mime = DEPTH_FORMATS[depth_format]
+        self.lut = _colormap_lut(colormap)
+        self._index_scale = 255.0 / (max_m - min_m)
+        self._buffers = {} # (height, width) -> {"work": f32, "index": u8, "mm": u16, "out": u8 (H, W, C), "resized": f32}
+
+    def _buffers_for(self, height: int, width: int) -> dict:
+        buffers = self._buffers.get((height, width))
+        if buffers is None:
+            buffers = {
+                "work": np.empty((height, width), dtype=np.float32),
+                "index": np.empty((height, width), dtype=np.uint8),
+                "mm": np.empty((height, width), dtype="<u2"),
+                "out": np.empty((height, width, self.lut.shape[1]), dtype=np.uint8),
+                "resized": np.empty((height, width), dtype=np.float32),
+            }
+            self._buffers[(height, width)] = buffers
+        return buffers
+
+    def colorize(self, depth: np.ndarray) -> np.ndarray:
+        """(H, W, 3) RGB 또는 (H, W, 1) gray. 반환값은 내부 버퍼이므로 다음 호출 전에 사용할 것"""
+        buffers = self._buffers_for(*depth.shape[:2])
+        work = buffers["work"]
+        np.subtract(depth, self.min_m, out=work)
+        np.multiply(work, self._index_scale, out=work)
+        np.nan_to_num(work, copy=False, nan=255.0, posinf=255.0, neginf=0.0)
+        np.clip(work, 0.0, 255.0, out=work)
+        np.copyto(buffers["index"], work, casting="unsafe") # 소수점 버림 (예전 astype(np.uint8)과 같음)
+        np.take(self.lut, buffers["index"], axis=0, out=buffers["out"])
+        return buffers["out"]
+
+    def to_millimeters(self, depth: np.ndarray) -> np.ndarray:
+        """uint16 mm (0 = NaN/inf/음수, 65.535 m 이상은 65535). 반환값은 내부 버퍼"""
+        buffers = self._buffers_for(*depth.shape[:2])
+        work = buffers["work"]
+        np.multiply(depth, 1000.0, out=work)
+        np.nan_to_num(work, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        np.clip(work, 0.0, DEPTH_MAX_MM, out=work)
+        np.copyto(buffers["mm"], work, casting="unsafe")
+        return buffers["mm"]
+
+    def encode(self, cam_id_key: str, depth: np.ndarray, jpeg_quality: int, scale: float = 1.0, roi=None, size=None) -> bytes:
+        if roi is not None:
+            x, y, width, height = roi
+            depth = depth[y:y + height, x:x + width]
+            if depth.size == 0:
+                raise ValueError(f"roi {roi} is outside of image {cam_id_key}")
+        height, width = depth.shape[:2]
+        out_width, out_height = size if size is not None else (width, height)
+        out_width, out_height = max(1, round(out_width * scale)), max(1, round(out_height * scale))
+        if (out_width, out_height) != (width, height): # depth 값은 섞지 않도록 nearest
+            resized = self._buffers_for(out_height, out_width)["resized"]
+            depth = cv2.resize(depth, (out_width, out_height), dst=resized, interpolation=cv2.INTER_NEAREST)
+        if self.depth_format == "jpeg":
+            image = self.colorize(depth)
+            return simplejpeg.encode_jpeg(
+                image, quality=jpeg_quality, colorspace='GRAY' if image.shape[2] == 1 else 'RGB', colorsubsampling='420'
+            )
+        millimeters = self.to_millimeters(depth)
+        if self.depth_format == "raw16":
+            return millimeters.tobytes()
+        ret, buffer = cv2.imencode(".png", millimeters, [
+            int(cv2.IMWRITE_PNG_COMPRESSION), DEPTH_PNG_COMPRESSION, int(cv2.IMWRITE_PNG_STRATEGY), cv2.IMWRITE_PNG_STRATEGY_RLE,
+        ])
+        if not ret: raise ValueError(f"cv2.imencode failed for 16-bit depth PNG {cam_id_key}")
+        return buffer.tobytes()
+
+
+def make_depth_colorizer(cam_id_key: str, config: dict):
+    """SHM_CONFIG 항목 -> DepthColorizer (depth 카메라가 아니면 None)"""
+    if "depth" not in cam_id_key:
+        return None
+    return DepthColorizer(
+        config.get("depth_range", DEPTH_DEFAULT_RANGE),
+        config.get("depth_format", DEPTH_DEFAULT_FORMAT),
+        config.get("depth_colormap", DEPTH_DEFAULT_COLORMAP),
+    )
+
+
+class CameraEncoder:
+    """카메라 하나의 인코딩 cache (마지막으로 인코딩한 픽셀의 signature/frame_id와 variant별 JPEG).
+    stats: 횟수를 더할 dict (new_encode_stats() 형식), on_encoded: 새로 인코딩한 JPEG 크기를 받는 callback,
+    depth: depth 카메라면 DepthColorizer (make_camera_encoder가 SHM_CONFIG로 만들어 줌)"""
+    def __init__(self, cam_id_key: str, stride: int = CHANGE_DETECT_SAMPLE_STRIDE, stats: dict = None, on_encoded=None,
+                 depth: DepthColorizer = None):
+        self.cam_id_key = cam_id_key
+        self.stride = stride
+        self.depth = depth
+        self.stats = stats if stats is not None else new_encode_stats()
+        self.on_encoded = on_encoded
+        # frame_id: seqlock 세그먼트의 (generation, frame_seq). 같으면 producer가 새 프레임을 쓰지 않은 것
+        # jpeg: {variant: JPEG bytes} (같은 픽셀에 대해 이미 인코딩한 variant들)
+        self.signature = None
+        self.frame_id = None
+        self.jpeg = {}
+        self.encoded_at = 0.0
+
+    def reset(self):
+        """세그먼트에 다시 attach했을 때: producer가 바뀌었으므로 frame_id/signature가 우연히 같아도 이전 결과를 쓰지 않음"""
+        self.signature = None
+        self.frame_id = None
+        self.jpeg = {}
+
+    def _can_reuse(self, signature) -> bool:
+        return signature is not None and signature == self.signature and bool(self.jpeg) \
+            and time.monotonic() - self.encoded_at < CHANGE_DETECT_MAX_REUSE_S
+
+    def _encode_variants(self, img_cv: np.ndarray, variants, reusable: dict):
+        """reusable(같은 픽셀로 이미 인코딩된 variant)에 없는 variant만 인코딩해서 {variant: bytes}로 반환"""
+        encoded = dict(reusable)
+        for variant in variants:
+            if variant in encoded:
+                continue
+            level, roi, size = variant
+            ladder_step = JPEG_LADDER[level]
+            if self.depth is not None:
+                jpeg_bytes = self.depth.encode(self.cam_id_key, img_cv, ladder_step["quality"], ladder_step["scale"], roi, size)
+            else:
+                jpeg_bytes = encode_image(self.cam_id_key, img_cv, ladder_step["quality"], ladder_step["scale"], roi, size)
+            encoded[variant] = jpeg_bytes
+            self.stats["encoded"] += 1
+            if self.on_encoded is not None:
+                self.on_encoded(len(jpeg_bytes))
+        return encoded
+
+    def _store(self, signature, frame_id, encoded: dict, refreshed: bool):
+        self.signature = signature
+        self.frame_id = frame_id
+        self.jpeg = encoded
+        if refreshed: # 픽셀을 새로 읽어 처음부터 인코딩한 경우에만 재사용 시간 갱신
+            self.encoded_at = time.monotonic()
+
+    def encode_seqlock(self, reader, variants, trace: dict):
+        """seqlock 세그먼트: 최신 완성 슬롯을 복사 없이 바로 인코딩하고, 인코딩 후 슬롯이 덮어써졌으면 버린다.
+        인코딩 중 세그먼트가 닫히지 않도록 호출하는 쪽에서 보장해야 함. trace에 "shm_read" 시각(perf_counter_ns) 기록"""
+        for _ in range(2): # torn frame이면 최신 슬롯으로 한 번 더 시도
+            frame = reader.read_latest()
+            if frame is None: # producer가 아직 프레임을 하나도 완성하지 않음
+                return self.jpeg
+            frame_seq, _, view = frame
+            trace["shm_read"] = time.perf_counter_ns() # zero-copy: view를 얻은 시점
+            frame_id = (reader.current_generation(), frame_seq)
+            if frame_id == self.frame_id: # producer가 새 프레임을 쓰지 않음
+                reusable, signature = self.jpeg, self.signature
+            else:
+                signature = sample_signature(view, self.stride) if self.stride else None
+                reusable = self.jpeg if self._can_reuse(signature) else {}
+            if all(variant in reusable for variant in variants):
+                if not reader.is_valid(frame_seq):
+                    self.stats["torn"] += 1
+                    continue
+                self.frame_id = frame_id
+                self.stats["skipped"] += 1
+                return reusable
+            encoded = self._encode_variants(view, variants, reusable) # zero-copy: SHM view를 그대로 인코딩
+            if not reader.is_valid(frame_seq): # 인코딩 도중 producer가 이 슬롯을 다시 씀
+                self.stats["torn"] += 1
+                continue
+            self._store(signature, frame_id, encoded, refreshed=not reusable)
+            return encoded
+        return self.jpeg
+
+    def read_raw(self, shm_view: np.ndarray, variants, trace: dict):
+        """헤더 없는 기존 레이아웃 1단계 (세그먼트를 잡은 상태에서): producer와 동기화 수단이 없으므로 복사.
+        (복사본 또는 None, reusable, signature). 복사본이 None이면 변화가 없어 reusable을 그대로 쓰면 됨"""
+        signature = sample_signature(shm_view, self.stride) if self.stride else None
+        reusable = self.jpeg if self._can_reuse(signature) else {}
+        if all(variant in reusable for variant in variants):
+            self.stats["skipped"] += 1
+            trace["shm_read"] = time.perf_counter_ns()
+            return None, reusable, signature
+        img_cv = shm_view.copy() # 중요: SHM에서 로컬로 복사
+        trace["shm_read"] = time.perf_counter_ns()
+        return img_cv, reusable, signature
+
+    def encode_copy(self, img_cv: np.ndarray, variants, reusable: dict, signature):
+        """기존 레이아웃 2단계 (세그먼트 lock 밖에서): read_raw()가 복사한 이미지를 인코딩"""
+        encoded = self._encode_variants(img_cv, variants, reusable)
+        self._store(signature, None, encoded, refreshed=not reusable)
+        return encoded
+
+
+def make_camera_encoder(cam_id_key: str, config: dict, stats: dict = None, on_encoded=None) -> CameraEncoder:
+    """SHM_CONFIG 항목의 change_detect_stride / depth 설정으로 CameraEncoder 생성 (서버 스레드 모드와 worker 프로세스 공용)"""
+    return CameraEncoder(
+        cam_id_key, config.get("change_detect_stride", CHANGE_DETECT_SAMPLE_STRIDE), stats=stats, on_encoded=on_encoded,
+        depth=make_depth_colorizer(cam_id_key, config),
+    )
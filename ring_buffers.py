@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# ring_buffers.py
+#
+# 최근 N초를 메모리에 들고 있는 시간 인덱스 ring (DVR / scrub-back 용).
+#
+#   frames = FrameRing(max_frames=1800, max_bytes=64 << 20, max_age_s=30)
+#   frames.append(time.time_ns(), jpeg_bytes, capture_stamp_ns)    # 이미 인코딩된 bytes를 참조로 보관 (복사 없음)
+#   frames.at(t_ns)                  # t_ns 시점에 화면에 있던 프레임 (그 이전 마지막 프레임)
+#   frames.range(start_ns, end_ns)   # 구간 안의 프레임들
+#
+#   telemetry = TelemetryRing(CONTROL_VALUE_DTYPE, capacity=30000)
+#   telemetry.append(time.time_ns(), packed_bytes)      # 미리 할당한 structured array에 row 하나를 덮어씀
+#   t_ns, records = telemetry.range(start_ns, end_ns)   # 복사본 (numpy)
+#
+# 인덱스 시각은 호출하는 쪽이 정하는 wall clock ns (서버 수신 시각). 카메라/telemetry ring이 같은 기준이라
+# 같은 시각으로 맞춰 볼 수 있다. 시각이 뒤로 가면 (시계 보정) 직전 시각으로 맞춰 단조 증가를 유지한다.
+# append/조회는 여러 스레드에서 호출해도 된다 (ring마다 lock, 조회는 필요한 만큼만 복사하고 바로 놓음).
+
+import threading
+
+import numpy as np
+
+
+class _RingIndex:
+    """원형 배열 위의 단조 증가 timestamp. 논리 index 0 = 가장 오래된 항목"""
+    def __init__(self, capacity: int):
+        self.capacity = int(capacity)
+        self.stamps = np.zeros(self.capacity, dtype=np.int64)
+        self.start = 0
+        self.count = 0
+
+    def push(self, stamp_ns: int) -> int:
+        """새 항목의 slot (가득 차 있으면 가장 오래된 slot을 덮어씀). 덮어쓴 경우 호출하는 쪽이 그 slot을 정리"""
+        if self.count:
+            stamp_ns = max(stamp_ns, int(self.stamps[self.slot(self.count - 1)]))
+        if self.count == self.capacity:
+            slot = self.start
+            self.start = (self.start + 1) % self.capacity
+        else:
+            slot = (self.start + self.count) % self.capacity
+            self.count += 1
+        self.stamps[slot] = stamp_ns
+        return slot
+
+    def pop_oldest(self) -> int:
+        slot = self.start
+        self.start = (self.start + 1) % self.capacity
+        self.count -= 1
+        return slot
+
+    def slot(self, index: int) -> int:
+        return (self.start + index) % self.capacity
+
+    def oldest(self):
+        return int(self.stamps[self.start]) if self.count else None
+
+    def newest(self):
+        return int(self.stamps[self.slot(self.count - 1)]) if self.count else None
+
+    def search(self, stamp_ns: int, side: str) -> int:
+        """np.searchsorted와 같은 의미의 논리 index (원형 배열을 두 구간으로 나눠 이분 탐색)"""
+        first = self.stamps[self.start:min(self.start + self.count, self.capacity)]
+        second = self.stamps[:self.count - len(first)]
+        in_second = len(second) and (stamp_ns >= second[0] if side == "right" else stamp_ns > first[-1])
+        if in_second:
+            return len(first) + int(np.searchsorted(second, stamp_ns, side=side))
+        return int(np.searchsorted(first, stamp_ns, side=side))
+
+    def slots(self, begin: int, end: int) -> np.ndarray:
+        """논리 index [begin, end)의 slot 번호"""
+        return (self.start + np.arange(begin, end)) % self.capacity
+
+
+class FrameRing:
+    """카메라 하나의 인코딩된 프레임 ring. max_frames개 / max_bytes / max_age_s 중 먼저 닿는 한도에서 오래된 것부터 버림"""
+    def __init__(self, max_frames: int, max_bytes: int, max_age_s: float):
+        self._index = _RingIndex(max_frames)
+        self._frames = [None] * self._index.capacity
+        self._capture_stamps = np.zeros(self._index.capacity, dtype=np.int64)
+        self._seqs = np.zeros(self._index.capacity, dtype=np.int64)
+        self._lock = threading.Lock()
+        self.max_bytes = int(max_bytes)
+        self.max_age_ns = int(max_age_s * 1_000_000_000)
+        self.nbytes = 0
+        self.appended = 0
+        self.evicted = 0
+
+    def __len__(self):
+        return self._index.count
+
+    def append(self, stamp_ns: int, data: bytes, capture_stamp_ns: int = 0) -> bool:
+        """False면 저장하지 않음 (비어 있거나 직전과 같은 bytes 객체 = encoder가 변화 없음으로 재사용한 프레임)"""
+        if not data or len(data) > self.max_bytes:
+            return False
+        with self._lock:
+            index = self._index
+            if index.count and self._frames[index.slot(index.count - 1)] is data:
+                return False
+            while index.count and (self.nbytes + len(data) > self.max_bytes or index.oldest() < stamp_ns - self.max_age_ns):
+                self._drop(index.pop_oldest())
+            if index.count == index.capacity:
+                self._drop(index.start) # push가 이 slot을 덮어씀
+            slot = index.push(stamp_ns)
+            self._frames[slot] = data
+            self._capture_stamps[slot] = capture_stamp_ns
+            self.appended += 1
+            self._seqs[slot] = self.appended
+            self.nbytes += len(data)
+            return True
+
+    def _drop(self, slot: int):
+        self.nbytes -= len(self._frames[slot])
+        self._frames[slot] = None
+        self.evicted += 1
+
+    def _entry(self, slot: int):
+        return int(self._index.stamps[slot]), int(self._capture_stamps[slot]), int(self._seqs[slot]), self._frames[slot]
+
+    def at(self, stamp_ns: int = None):
+        """(t_ns, capture_stamp_ns, seq, bytes): stamp_ns 이전(포함) 마지막 프레임. None이면 최신. 없으면 None"""
+        with self._lock:
+            index = self._index
+            if not index.count:
+                return None
+            position = index.count if stamp_ns is None else index.search(stamp_ns, "right")
+            if position == 0:
+                return None
+            return self._entry(index.slot(position - 1))
+
+    def range(self, start_ns: int, end_ns: int, limit: int = None):
+        """[(t_ns, capture_stamp_ns, seq, bytes)] for start_ns <= t_ns <= end_ns (limit이면 처음 limit개)"""
+        with self._lock:
+            index = self._index
+            begin, end = index.search(start_ns, "left"), index.search(end_ns, "right")
+            if limit is not None:
+                end = min(end, begin + limit)
+            return [self._entry(int(slot)) for slot in index.slots(begin, max(begin, end))]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"frames": self._index.count, "bytes": self.nbytes, "oldest_ns": self._index.oldest(),
+                    "newest_ns": self._index.newest(), "appended": self.appended, "evicted": self.evicted}
+
+
+class TelemetryRing:
+    """고정 dtype record ring. capacity * dtype.itemsize 바이트를 처음에 한 번 할당"""
+    def __init__(self, dtype, capacity: int):
+        self._index = _RingIndex(capacity)
+        self.dtype = np.dtype(dtype)
+        self.records = np.zeros(self._index.capacity, dtype=self.dtype)
+        self._raw = self.records.view(np.uint8) # packed bytes를 그대로 덮어쓰기 위한 view
+        self._lock = threading.Lock()
+        self.appended = 0
+
+    def __len__(self):
+        return self._index.count
+
+    @property
+    def nbytes(self) -> int:
+        return self.records.nbytes + self._index.stamps.nbytes
+
+    def append(self, stamp_ns: int, record):
+        """record: dtype과 같은 layout의 packed bytes, 또는 필드 순서대로의 tuple"""
+        with self._lock:
+            slot = self._index.push(stamp_ns)
+            if isinstance(record, (bytes, bytearray, memoryview)):
+                offset = slot * self.dtype.itemsize
+                self._raw[offset:offset + self.dtype.itemsize] = np.frombuffer(record, dtype=np.uint8)
+            else:
+                self.records[slot] = record
+            self.appended += 1
+
+    def at(self, stamp_ns: int = None):
+        """(t_ns, record 복사본): stamp_ns 이전(포함) 마지막 sample. None이면 최신. 없으면 None"""
+        with self._lock:
+            index = self._index
+            position = index.count if stamp_ns is None else index.search(stamp_ns, "right")
+            if position == 0:
+                return None
+            slot = index.slot(position - 1)
+            return int(index.stamps[slot]), self.records[slot].copy()
+
+    def range(self, start_ns: int, end_ns: int):
+        """(t_ns 배열, records 배열) for start_ns <= t_ns <= end_ns (복사본)"""
+        with self._lock:
+            index = self._index
+            slots = index.slots(index.search(start_ns, "left"), index.search(end_ns, "right"))
+            return index.stamps[slots], self.records[slots]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"samples": self._index.count, "capacity": self._index.capacity, "bytes": self.nbytes,
+                    "oldest_ns": self._index.oldest(), "newest_ns": self._index.newest(), "appended": self.appended}
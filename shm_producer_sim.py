@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# shm_producer_sim.py
+#
+# Isaac Sim 없이 카메라 SHM 세그먼트를 채워주는 로컬 producer.
+#   python3 shm_producer_sim.py --fps 30                 # seqlock 레이아웃 (기본)
+#   python3 shm_producer_sim.py --layout raw             # 헤더 없는 기존 레이아웃
+#   python3 shm_producer_sim.py --signal                 # rclpy가 있으면 /image_signal도 퍼블리시
+#   python3 shm_producer_sim.py --verify --duration 5    # 같은 프로세스에서 reader로 torn frame 검사
+#   python3 shm_producer_sim.py --depth-segments shm_mobile_depth shm_hand_depth   # float32 depth(m)도 (ENABLE_DEPTH_STREAMS)
+
+import argparse
+import signal
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from shm_protocol import DEFAULT_NUM_SLOTS, SeqlockReader, SeqlockWriter
+
+IMAGE_WIDTH = 640
+IMAGE_HEIGHT = 480
+RGB_CHANNELS = 3
+
+# websocket_server_final.SHM_CONFIG와 같은 세그먼트 이름
+DEFAULT_SEGMENTS = ("shm_mobile_rgb", "shm_hand_rgb", "shm_map")
+DEPTH_MAX_M = 2.5
+
+
+def make_frame(out: np.ndarray, frame_seq: int, segment_index: int):
+    """움직이는 세로 막대가 있는 그라디언트. 첫/마지막 행에 frame_seq를 찍어 torn frame을 검출할 수 있게 함"""
+    height, width = out.shape[:2]
+    out[:] = (segment_index * 60) % 256
+    bar_x = (frame_seq * 8) % width
+    out[:, bar_x:bar_x + 16] = 255
+    out[0] = frame_seq % 256
+    out[height - 1] = frame_seq % 256
+
+
+def make_depth_frame(out: np.ndarray, frame_seq: int, segment_index: int):
+    """float32 depth (m): 위->아래로 멀어지는 바닥 + 움직이는 가까운 물체, 측정 실패(NaN) 구멍 몇 개"""
+    height, width = out.shape[:2]
+    out[:] = np.linspace(0.2, DEPTH_MAX_M, height, dtype=np.float32)[:, None]
+    bar_x = (frame_seq * 8 + segment_index * 100) % width
+    out[:, bar_x:bar_x + 40] = 0.3
+    out[height // 2:height // 2 + 8, ::37] = np.nan
+
+
+class RawWriter:
+    """헤더 없는 기존 레이아웃: 세그먼트 전체가 픽셀 (torn frame 방지 없음)"""
+    def __init__(self, name: str, shape, dtype):
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        try:
+            stale = shared_memory.SharedMemory(name=name, create=False)
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.view = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+        self.frame_seq = 0
+
+    def begin_write(self):
+        return self.frame_seq + 1, self.view
+
+    def commit(self, frame_seq: int, stamp_ns: int):
+        self.frame_seq = frame_seq
+
+    def release(self):
+        self.view = None
+
+
+def _make_signal_publisher():
+    """rclpy가 설치돼 있으면 /image_signal 퍼블리셔를 만든다 (없으면 None)"""
+    try:
+        import rclpy
+        from std_msgs.msg import Header
+    except ImportError:
+        print("WARN: rclpy not available; /image_signal will not be published.")
+        return None, None
+    rclpy.init()
+    node = rclpy.create_node("shm_producer_sim")
+    publisher = node.create_publisher(Header, "/image_signal", 10)
+
+    def publish(stamp_ns: int):
+        msg = Header()
+        msg.stamp.sec = stamp_ns // 1_000_000_000
+        msg.stamp.nanosec = stamp_ns % 1_000_000_000
+        msg.frame_id = "new_images_ready"
+        publisher.publish(msg)
+
+    def shutdown():
+        node.destroy_node()
+        rclpy.try_shutdown()
+
+    return publish, shutdown
+
+
+def _verify_loop(readers, stop_event: threading.Event, results: dict):
+    """seqlock reader로 계속 읽으면서, 유효하다고 판정된 프레임이 실제로 찢어지지 않았는지 확인"""
+    while not stop_event.is_set():
+        for reader in readers:
+            frame = reader.read_latest()
+            if frame is None:
+                continue
+            frame_seq, _, view = frame
+            first_row, last_row = int(view[0, 0, 0]), int(view[-1, 0, 0])
+            if not reader.is_valid(frame_seq):
+                results["rejected"] += 1
+                continue
+            results["checked"] += 1
+            if first_row != last_row:
+                results["torn_accepted"] += 1
+        time.sleep(0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local SHM camera producer stand-in")
+    parser.add_argument("--segments", nargs="+", default=list(DEFAULT_SEGMENTS))
+    parser.add_argument("--depth-segments", nargs="*", default=[], help="float32 (height, width) depth segments")
+    parser.add_argument("--width", type=int, default=IMAGE_WIDTH)
+    parser.add_argument("--height", type=int, default=IMAGE_HEIGHT)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--layout", choices=("seqlock", "raw"), default="seqlock")
+    parser.add_argument("--slots", type=int, default=DEFAULT_NUM_SLOTS)
+    parser.add_argument("--duration", type=float, default=0.0, help="seconds to run (0 = until Ctrl+C)")
+    parser.add_argument("--signal", action="store_true", help="publish /image_signal via rclpy")
+    parser.add_argument("--verify", action="store_true", help="read back with SeqlockReader and check for torn frames")
+    args = parser.parse_args()
+
+    rgb_shape = (args.height, args.width, RGB_CHANNELS)
+    depth_shape = (args.height, args.width)
+    writers, segments, fillers = [], [], []
+    for name, shape, dtype, filler in (
+        [(name, rgb_shape, np.uint8, make_frame) for name in args.segments]
+        + [(name, depth_shape, np.float32, make_depth_frame) for name in args.depth_segments]
+    ):
+        if args.layout == "seqlock":
+            shm, writer = SeqlockWriter.create(name, shape, dtype, num_slots=args.slots, generation=time.time_ns())
+        else:
+            writer = RawWriter(name, shape, dtype)
+            shm = writer.shm
+        writers.append(writer)
+        fillers.append(filler)
+        segments.append(shm)
+        print(f"INFO: Created SHM '{name}' ({args.layout}, {shm.size} bytes)")
+
+    publish_signal, shutdown_ros = _make_signal_publisher() if args.signal else (None, None)
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    verify_results = {"checked": 0, "rejected": 0, "torn_accepted": 0}
+    readers, verify_thread = [], None
+    if args.verify:
+        if args.layout != "seqlock":
+            parser.error("--verify requires --layout seqlock")
+        readers = [SeqlockReader(shm.buf) for shm in segments[:len(args.segments)]] # 검사는 RGB 세그먼트만
+        verify_thread = threading.Thread(target=_verify_loop, args=(readers, stop_event, verify_results), daemon=True)
+        verify_thread.start()
+
+    period = 1.0 / args.fps if args.fps > 0 else 0.0
+    started = time.perf_counter()
+    next_tick = started
+    frames = 0
+    try:
+        while not stop_event.is_set():
+            if args.duration and time.perf_counter() - started >= args.duration:
+                break
+            stamp_ns = time.time_ns()
+            for index, (writer, filler) in enumerate(zip(writers, fillers)):
+                frame_seq, view = writer.begin_write()
+                filler(view, frame_seq, index)
+                writer.commit(frame_seq, stamp_ns)
+            frames += 1
+            if publish_signal:
+                publish_signal(stamp_ns)
+            if period:
+                next_tick += period
+                time.sleep(max(0.0, next_tick - time.perf_counter()))
+    finally:
+        stop_event.set()
+        if verify_thread:
+            verify_thread.join(timeout=1.0)
+        elapsed = time.perf_counter() - started
+        print(f"INFO: Wrote {frames} frames per segment in {elapsed:.2f}s ({frames / elapsed if elapsed else 0:.1f} fps)")
+        if args.verify:
+            print(f"INFO: Verify: {verify_results}")
+        for reader in readers:
+            reader.release()
+        for writer in writers:
+            writer.release()
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+        if shutdown_ros:
+            shutdown_ros()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# shm_protocol.py
+#
+# Seqlock ring layout for camera shared memory segments.
+#
+#   [header 64B][slot table: num_slots x (seq u64, stamp_ns u64)][pad][slot 0]...[slot N-1]
+#
+# Producer (frame n = 1, 2, ...):
+#   slot = n % num_slots
+#   slot.seq = 2n - 1 (odd: 쓰는 중) -> 픽셀 쓰기 -> slot.stamp_ns, slot.seq = 2n (even: 완료) -> header.latest_seq = n
+# Consumer:
+#   n = header.latest_seq, slot.seq == 2n 이면 slot을 복사 없이 view로 사용.
+#   사용이 끝난 뒤 slot.seq가 여전히 2n이면 그 동안 producer가 덮어쓰지 않은 것 (torn frame 아님).
+#
+# 헤더가 없는 기존 레이아웃(픽셀만 있는 세그먼트)은 is_seqlock_segment()가 False를 반환하므로
+# 서버 쪽에서 그대로 fallback 한다.
+#
+# consumer는 SegmentAttachment로 세그먼트마다 따로 attach한다. shape/dtype은 seqlock 헤더에서 읽고 (해상도를 바꿔도 consumer
+# 설정을 고칠 필요 없음), producer가 세그먼트를 다시 만들거나 (inode 변경) 헤더를 다시 초기화하면 (generation 변경) 다시 attach.
+
+import os
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+SEQLOCK_MAGIC = b"MMSHMRNG"
+SEQLOCK_VERSION = 1
+MAX_NDIM = 4
+DEFAULT_NUM_SLOTS = 2
+
+# magic, version, num_slots, dtype str, ndim, shape[4], slot_nbytes, generation, latest_seq
+HEADER = struct.Struct("<8sHH8sI4IQQQ")
+_LATEST_SEQ_OFFSET = HEADER.size - 8
+_GENERATION_OFFSET = HEADER.size - 16
+SLOT_ENTRY_SIZE = 16
+ALIGNMENT = 64
+
+
+def _align(value: int) -> int:
+    return (value + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class SeqlockLayout:
+    """세그먼트 안의 헤더/슬롯 배치 계산"""
+    def __init__(self, shape, dtype, num_slots: int = DEFAULT_NUM_SLOTS):
+        self.shape = tuple(int(dim) for dim in shape)
+        self.dtype = np.dtype(dtype)
+        self.num_slots = int(num_slots)
+        if not 1 <= len(self.shape) <= MAX_NDIM:
+            raise ValueError(f"shape must have 1..{MAX_NDIM} dimensions, got {self.shape}")
+        if self.num_slots < 2:
+            raise ValueError("seqlock layout needs at least 2 slots")
+        self.slot_nbytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        self.slot_stride = _align(self.slot_nbytes)
+        self.data_offset = _align(HEADER.size + self.num_slots * SLOT_ENTRY_SIZE)
+
+    @property
+    def segment_size(self) -> int:
+        return self.data_offset + self.num_slots * self.slot_stride
+
+    def slot_offset(self, slot: int) -> int:
+        return self.data_offset + slot * self.slot_stride
+
+    def pack_header(self, generation: int = 0, latest_seq: int = 0) -> bytes:
+        padded_shape = list(self.shape) + [0] * (MAX_NDIM - len(self.shape))
+        return HEADER.pack(
+            SEQLOCK_MAGIC, SEQLOCK_VERSION, self.num_slots, self.dtype.str.encode("ascii"),
+            len(self.shape), *padded_shape, self.slot_nbytes, generation, latest_seq,
+        )
+
+    @classmethod
+    def from_buffer(cls, buf):
+        """세그먼트 헤더에서 레이아웃을 읽는다. seqlock 세그먼트가 아니면 ValueError"""
+        if len(buf) < HEADER.size:
+            raise ValueError("buffer too small for seqlock header")
+        magic, version, num_slots, dtype_str, ndim, *rest = HEADER.unpack_from(buf, 0)
+        if magic != SEQLOCK_MAGIC:
+            raise ValueError("not a seqlock segment (bad magic)")
+        if version != SEQLOCK_VERSION:
+            raise ValueError(f"unsupported seqlock version {version}")
+        shape = rest[:MAX_NDIM][:ndim]
+        layout = cls(shape, dtype_str.rstrip(b"\0").decode("ascii"), num_slots)
+        if layout.segment_size > len(buf):
+            raise ValueError("segment smaller than its header describes")
+        return layout
+
+
+def is_seqlock_segment(buf) -> bool:
+    return len(buf) >= HEADER.size and bytes(buf[:len(SEQLOCK_MAGIC)]) == SEQLOCK_MAGIC
+
+
+class _SeqlockViews:
+    """헤더의 latest_seq/generation과 slot table, 슬롯 픽셀에 대한 numpy view 모음"""
+    def __init__(self, buf, layout: SeqlockLayout):
+        self.layout = layout
+        self.latest_seq = np.ndarray((1,), dtype="<u8", buffer=buf, offset=_LATEST_SEQ_OFFSET)
+        self.generation = np.ndarray((1,), dtype="<u8", buffer=buf, offset=_GENERATION_OFFSET)
+        self.slot_table = np.ndarray((layout.num_slots, 2), dtype="<u8", buffer=buf, offset=HEADER.size)
+        self.slots = [
+            np.ndarray(layout.shape, dtype=layout.dtype, buffer=buf, offset=layout.slot_offset(slot))
+            for slot in range(layout.num_slots)
+        ]
+
+    def release(self):
+        # SharedMemory.close() 전에 buffer를 참조하는 view를 모두 놓아야 한다
+        self.latest_seq = self.generation = self.slot_table = None
+        self.slots = []
+
+
+class SeqlockReader(_SeqlockViews):
+    """consumer 쪽: 가장 최근에 완성된 슬롯을 복사 없이 view로 돌려준다"""
+    def __init__(self, buf):
+        super().__init__(buf, SeqlockLayout.from_buffer(buf))
+
+    @property
+    def shape(self):
+        return self.layout.shape
+
+    @property
+    def dtype(self):
+        return self.layout.dtype
+
+    def current_generation(self) -> int:
+        return int(self.generation[0])
+
+    def read_latest(self, retries: int = 3):
+        """(frame_seq, stamp_ns, view) 또는 아직 완성된 프레임이 없으면 None.
+        view는 producer가 num_slots 프레임을 더 쓰기 전까지만 유효하므로 사용 후 is_valid()로 확인할 것"""
+        for _ in range(retries):
+            frame_seq = int(self.latest_seq[0])
+            if frame_seq == 0:
+                return None
+            slot = frame_seq % self.layout.num_slots
+            if int(self.slot_table[slot, 0]) == 2 * frame_seq:
+                stamp_ns = int(self.slot_table[slot, 1])
+                return frame_seq, stamp_ns, self.slots[slot]
+            # producer가 이 슬롯을 다시 쓰기 시작함: 새 latest_seq로 재시도
+        return None
+
+    def is_valid(self, frame_seq: int) -> bool:
+        slot = frame_seq % self.layout.num_slots
+        return int(self.slot_table[slot, 0]) == 2 * frame_seq
+
+
+class SeqlockWriter(_SeqlockViews):
+    """producer 쪽 (Isaac Sim 대신 shm_producer_sim.py 등에서 사용)"""
+    def __init__(self, buf, layout: SeqlockLayout, generation: int = 0):
+        buf[:HEADER.size] = layout.pack_header(generation=generation)
+        buf[HEADER.size:layout.data_offset] = bytes(layout.data_offset - HEADER.size)
+        super().__init__(buf, layout)
+        self.frame_seq = 0
+
+    @classmethod
+    def create(cls, name: str, shape, dtype, num_slots: int = DEFAULT_NUM_SLOTS, generation: int = 0):
+        """새 SharedMemory 세그먼트를 만들고 (shm, writer)를 반환. 같은 이름이 남아있으면 지우고 다시 만든다"""
+        layout = SeqlockLayout(shape, dtype, num_slots)
+        try:
+            stale = shared_memory.SharedMemory(name=name, create=False)
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        shm = shared_memory.SharedMemory(name=name, create=True, size=layout.segment_size)
+        return shm, cls(shm.buf, layout, generation=generation)
+
+    def begin_write(self):
+        """다음 슬롯을 '쓰는 중'으로 표시하고 (frame_seq, 쓰기용 view)를 반환"""
+        frame_seq = self.frame_seq + 1
+        slot = frame_seq % self.layout.num_slots
+        self.slot_table[slot, 0] = 2 * frame_seq - 1
+        return frame_seq, self.slots[slot]
+
+    def commit(self, frame_seq: int, stamp_ns: int):
+        slot = frame_seq % self.layout.num_slots
+        self.slot_table[slot, 1] = stamp_ns
+        self.slot_table[slot, 0] = 2 * frame_seq
+        self.latest_seq[0] = frame_seq
+        self.frame_seq = frame_seq
+
+    def write(self, frame: np.ndarray, stamp_ns: int) -> int:
+        frame_seq, view = self.begin_write()
+        np.copyto(view, frame)
+        self.commit(frame_seq, stamp_ns)
+        return frame_seq
+
+
+# --- consumer 쪽 attach ---
+SHM_DIR = "/dev/shm" # POSIX shared memory 이름이 파일로 보이는 곳 (Linux). 없으면 generation으로만 producer 재시작을 감지
+
+
+def _segment_inode(name: str):
+    """세그먼트 파일 inode (없으면 FileNotFoundError, 볼 수 없는 OS면 None)"""
+    if not os.path.isdir(SHM_DIR):
+        return None
+    return os.stat(os.path.join(SHM_DIR, name.lstrip("/"))).st_ino
+
+
+def attach_segment(name: str, untrack: bool = True) -> shared_memory.SharedMemory:
+    """기존 세그먼트에 consumer로 attach. Python 3.13 미만은 attach만 해도 resource_tracker에 등록되어
+    consumer 프로세스가 끝날 때 producer의 세그먼트를 unlink해 버리므로 등록을 바로 취소한다.
+    같은 프로세스가 만든 세그먼트면 untrack=False (등록은 이름 단위라 취소하면 producer 쪽 등록까지 사라짐)"""
+    if not untrack:
+        return shared_memory.SharedMemory(name=name, create=False)
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, create=False, track=False)
+    shm = shared_memory.SharedMemory(name=name, create=False)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class SegmentAttachment:
+    """consumer 쪽 세그먼트 하나의 attach 상태. changed()가 True일 때 refresh()를 부르면 attach / 다시 attach / detach 한다.
+    - seqlock 세그먼트: shape/dtype은 헤더 값 (fallback_shape/dtype은 쓰지 않음)
+    - 헤더 없는 기존 레이아웃: fallback_shape/dtype 으로 view (설정이 없으면 attach하지 않음)
+    refresh()/close()는 이 세그먼트의 view를 쓰는 쪽이 없을 때 호출해야 한다 (호출하는 쪽 lock)"""
+    def __init__(self, name: str, fallback_shape=None, fallback_dtype=None):
+        self.name = name
+        self.fallback_shape = tuple(fallback_shape) if fallback_shape is not None else None
+        self.fallback_dtype = np.dtype(fallback_dtype) if fallback_dtype is not None else None
+        self.shm = None
+        self.reader = None  # seqlock
+        self.view = None    # 헤더 없는 기존 레이아웃 (세그먼트 전체)
+        self.inode = None
+        self.generation = None
+        self.state = None # None (아직 확인 전) | missing | attached | error
+        self.error = None
+        self.attaches = 0
+        self.untrack = True # 같은 프로세스가 producer인 세그먼트 (서버 replay 모드)면 False
+
+    @property
+    def attached(self) -> bool:
+        return self.shm is not None
+
+    @property
+    def shape(self):
+        if self.reader is not None:
+            return self.reader.shape
+        return self.view.shape if self.view is not None else None
+
+    @property
+    def dtype(self):
+        if self.reader is not None:
+            return self.reader.dtype
+        return self.view.dtype if self.view is not None else None
+
+    def changed(self) -> bool:
+        """attach 상태를 바꿔야 하면 True: 세그먼트가 생김/사라짐, 다시 만들어짐 (inode), 헤더가 다시 초기화됨 (generation),
+        또는 헤더 없이 attach했는데 헤더가 생김 (producer가 초기화하는 도중에 attach한 경우). lock 없이 호출해도 됨"""
+        try:
+            inode = _segment_inode(self.name)
+        except FileNotFoundError:
+            return self.shm is not None
+        if self.shm is None:
+            return True
+        if inode is not None and inode != self.inode:
+            return True
+        if self.reader is not None:
+            return self.reader.current_generation() != self.generation
+        return is_seqlock_segment(self.shm.buf)
+
+    def refresh(self) -> str:
+        """지금 세그먼트에 다시 attach. "attached" | "reattached" | "detached" | "missing" | "error" """
+        was_attached = self.shm is not None
+        self.close()
+        try:
+            inode = _segment_inode(self.name)
+            shm = attach_segment(self.name, self.untrack)
+        except FileNotFoundError:
+            self.state, self.error = "missing", None
+            return "detached" if was_attached else "missing"
+        try:
+            if is_seqlock_segment(shm.buf):
+                self.reader = SeqlockReader(shm.buf)
+                self.generation = self.reader.current_generation()
+            elif self.fallback_shape is None or self.fallback_dtype is None:
+                raise ValueError("segment has no seqlock header and no configured shape/dtype")
+            else:
+                nbytes = int(np.prod(self.fallback_shape)) * self.fallback_dtype.itemsize
+                if shm.size < nbytes:
+                    raise ValueError(f"segment is {shm.size} bytes, configured {self.fallback_shape}/{self.fallback_dtype} needs {nbytes}")
+                self.view = np.ndarray(self.fallback_shape, dtype=self.fallback_dtype, buffer=shm.buf)
+        except Exception as e:
+            self.shm = shm
+            self.close()
+            self.state, self.error = "error", str(e)
+            return "error"
+        self.shm = shm
+        self.inode = inode
+        self.state, self.error = "attached", None
+        self.attaches += 1
+        return "reattached" if was_attached else "attached"
+
+    def close(self):
+        if self.reader is not None:
+            self.reader.release()
+        self.reader = self.view = None
+        self.generation = None
+        shm, self.shm = self.shm, None
+        if shm is not None:
+            try:
+                shm.close()
+            except BufferError: # 아직 남은 view가 있음: mapping은 그 view가 사라질 때 GC가 정리
+                pass
+        if self.state == "attached":
+            self.state = "missing"
+
+    def status(self) -> dict:
+        return {
+            "name": self.name, "state": self.state, "error": self.error,
+            "layout": "seqlock" if self.reader is not None else "raw" if self.view is not None else None,
+            "shape": list(self.shape) if self.shape is not None else None,
+            "dtype": self.dtype.str if self.dtype is not None else None,
+            "generation": self.generation, "inode": self.inode, "attaches": self.attaches,
+        }
@@ -30,7 +30,24 @@ export default function SettingInfo() {
     const socket = new WebSocket(`${baseWsUrl}/ws/setting`);
 
     socket.onopen = () => console.log("✅ /ws/setting 연결됨");
-    socket.onmessage = (e) => console.log("서버 응답:", e.data);
+    socket.onmessage = (e) => {
+      console.log("서버 응답:", e.data);
+      if (e.data.startsWith("ERROR:")) {
+        setSettingError(e.data.slice("ERROR:".length).trim()); // 예: 서버 recorder가 저장할 수 없는 fileFormat
+        return;
+      }
+      if (e.data.startsWith("ACK: dataset settings")) {
+        setSettingError("");
+        return;
+      }
+      if (!e.data.startsWith("{")) return;
+      const data = JSON.parse(e.data);
+      // 서버 안 recorder가 켜져 있으면 그 recorder가 쓸 수 있는 형식만 보여줌 (꺼져 있으면 외부 recorder node용 기본 목록)
+      if (data.type === "recorder_config" && data.enabled) {
+        setFormatOptions(data.formats);
+        setFileFormat((prev) => (data.formats.includes(prev) ? prev : data.fileFormat));
+      }
+    };
     socket.onerror = (err) => console.error("WebSocket 에러:", err);
     socket.onclose = () => console.log("❌ /ws/setting 연결 종료됨");
 
@@ -46,6 +63,8 @@ export default function SettingInfo() {
   const [robotSize, setRobotSize] = useState("");
   const [fileName, setFileName] = useState("");
   const [fileFormat, setFileFormat] = useState("json");
+  const [formatOptions, setFormatOptions] = useState(["json", "csv", "yaml", "hdf5"]);
+  const [settingError, setSettingError] = useState("");
 
 
   const [dataConfig, setDataConfig] = useState({
@@ -343,12 +362,13 @@ export default function SettingInfo() {
                   onChange={(e) => setFileFormat(e.target.value)}
                   className="w-full border border-gray-300 rounded-md px-3 py-1 text-gray-800 bg-white focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
                 >
-                  <option value="json">json</option>
-                  <option value="csv">csv</option>
-                  <option value="yaml">yaml</option>
-                  <option value="hdf5">hdf5</option>
-
+                  {formatOptions.map((format) => (
+                    <option key={format} value={format}>{format}</option>
+                  ))}
                 </select>
+                {settingError && (
+                  <p className="mt-1 text-xs text-red-600">{settingError}</p>
+                )}
               </div>
             </div>
           </section>
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# teleop_codec.py
+#
+# ControlValue (momad_msgs) 고정 레이아웃 record.
+# /ws/ros_teleop_bridge 경로에서 JSON <-> record <-> ROS 메시지 변환을 메시지마다 중간 array/list 없이 하기 위해
+# 연결(또는 콜백)마다 record 하나를 미리 만들어 두고 계속 덮어써서 사용한다.
+#
+# packed layout (little-endian, 201 bytes):
+#   stamp f8 | arm position f8[6] | arm velocity f8[6] | arm force f8[6]
+#   gripper f8[3] (position, velocity, force) | mobile f8[3] (linear_accel, linear_brake, steer) | gear u1
+#
+# numpy structured dtype도 검토했지만 원소 하나씩 대입/조회하는 비용이 커서
+# (ROS 메시지 필드가 Python float/list 단위) struct 기반 packed record를 사용한다.
+
+import struct
+
+import numpy as np
+
+ARM_JOINTS = 6
+DEFAULT_ARM_POSITION = (0.0, 0.0, 90.0, 90.0, 90.0, 90.0)
+
+CONTROL_VALUE_STRUCT = struct.Struct("<d6d6d6d3d3d?")
+# 같은 layout의 numpy dtype (packed record 여러 개를 한 번에 열 단위로 볼 때. dataset recorder 등)
+CONTROL_VALUE_DTYPE = np.dtype([
+    ("stamp", "<f8"), ("arm_position", "<f8", (ARM_JOINTS,)), ("arm_velocity", "<f8", (ARM_JOINTS,)),
+    ("arm_force", "<f8", (ARM_JOINTS,)), ("gripper", "<f8", (3,)), ("mobile", "<f8", (3,)), ("gear", "?"),
+])
+
+# /ws/ros_teleop_bridge binary framing (?format=binary 로 연결 시 협상). 양방향 같은 형식, 메시지 하나 = frame 하나
+#   magic "MMTB" | version u8 | pad 3 | seq u32 | ControlValue packed (위 layout)
+# seq는 보내는 쪽이 메시지마다 1씩 올리는 번호 (u32 wrap)
+TELEOP_FRAME_MAGIC = b"MMTB"
+TELEOP_FRAME_VERSION = 1
+TELEOP_FRAME_HEADER = struct.Struct("<4sB3xI")
+TELEOP_FRAME_SIZE = TELEOP_FRAME_HEADER.size + CONTROL_VALUE_STRUCT.size
+
+_GRIPPER_KEYS = ("position", "velocity", "force")
+_MOBILE_KEYS = ("linear_accel", "linear_brake", "steer")
+
+
+def _assign(target: list, values, field: str):
+    """길이가 고정된 list를 제자리에서 덮어씀 (slice 대입은 길이가 달라도 통과하므로 직접 검사)"""
+    if len(values) != len(target):
+        raise ValueError(f"{field} must have {len(target)} values, got {len(values)}")
+    target[:] = map(float, values)
+
+
+class ControlValueRecord:
+    """재사용하는 ControlValue record. load_*()는 기존 내용을 덮어쓰고, list 필드 객체는 record 수명 동안 유지된다"""
+    __slots__ = ("stamp", "arm_position", "arm_velocity", "arm_force", "gripper", "mobile", "gear")
+
+    def __init__(self):
+        self.arm_position = list(DEFAULT_ARM_POSITION)
+        self.arm_velocity = [0.0] * ARM_JOINTS
+        self.arm_force = [0.0] * ARM_JOINTS
+        self.gripper = [0.0] * 3
+        self.mobile = [0.0] * 3
+        self.reset()
+
+    def reset(self):
+        """JSON에서 필드가 빠졌을 때 쓰는 기존 기본값"""
+        self.stamp = 0.0
+        self.arm_position[:] = DEFAULT_ARM_POSITION
+        self.arm_velocity[:] = (0.0,) * ARM_JOINTS
+        self.arm_force[:] = (0.0,) * ARM_JOINTS
+        self.gripper[:] = (0.0, 0.0, 0.0)
+        self.mobile[:] = (0.0, 0.0, 0.0)
+        self.gear = True
+
+    def load_json(self, data: dict):
+        """/ws/ros_teleop_bridge JSON (RobotarmValue/GripperValue/MobileValue). 길이가 맞지 않는 배열은 ValueError"""
+        self.reset()
+        self.stamp = float(data.get("stamp", 0.0))
+        arm = data.get("RobotarmValue")
+        if arm:
+            if "position" in arm: _assign(self.arm_position, arm["position"], "position")
+            if "velocity" in arm: _assign(self.arm_velocity, arm["velocity"], "velocity")
+            if "force" in arm: _assign(self.arm_force, arm["force"], "force")
+        gripper = data.get("GripperValue")
+        if gripper:
+            for index, key in enumerate(_GRIPPER_KEYS):
+                if key in gripper: self.gripper[index] = float(gripper[key])
+        mobile = data.get("MobileValue")
+        if mobile:
+            for index, key in enumerate(_MOBILE_KEYS):
+                if key in mobile: self.mobile[index] = float(mobile[key])
+            if "gear" in mobile: self.gear = bool(mobile["gear"])
+
+    def load_values(self, values):
+        """CONTROL_VALUE_STRUCT.unpack*() 결과 (또는 같은 순서의 sequence)"""
+        self.stamp = values[0]
+        self.arm_position[:] = values[1:7]
+        self.arm_velocity[:] = values[7:13]
+        self.arm_force[:] = values[13:19]
+        self.gripper[:] = values[19:22]
+        self.mobile[:] = values[22:25]
+        self.gear = values[25]
+
+    def load_ros(self, msg):
+        """ControlValue 메시지 -> record"""
+        self.load_values(CONTROL_VALUE_STRUCT.unpack(pack_control_value_msg(msg)))
+
+    def fill_ros(self, msg):
+        """record -> 이미 만들어 둔 ControlValue 메시지 (하위 메시지도 새로 만들지 않고 채움).
+        배열 필드에는 record의 list를 그대로 넘기므로, 다음 load_*() 전에 publish 해야 한다"""
+        msg.stamp = self.stamp
+        arm, gripper, mobile = msg.robotarm_state, msg.gripper_state, msg.mobile_state
+        arm.position = self.arm_position
+        arm.velocity = self.arm_velocity
+        arm.force = self.arm_force
+        gripper.position, gripper.velocity, gripper.force = self.gripper
+        mobile.linear_accel, mobile.linear_brake, mobile.steer = self.mobile
+        mobile.gear = self.gear
+
+    def pack(self) -> bytes:
+        return CONTROL_VALUE_STRUCT.pack(
+            self.stamp, *self.arm_position, *self.arm_velocity, *self.arm_force,
+            *self.gripper, *self.mobile, self.gear,
+        )
+
+    def pack_into(self, buffer, offset: int = 0):
+        CONTROL_VALUE_STRUCT.pack_into(
+            buffer, offset, self.stamp, *self.arm_position, *self.arm_velocity, *self.arm_force,
+            *self.gripper, *self.mobile, self.gear,
+        )
+
+    def to_json(self) -> dict:
+        return control_value_to_json((self.stamp, *self.arm_position, *self.arm_velocity, *self.arm_force,
+                                      *self.gripper, *self.mobile, self.gear))
+
+
+def pack_control_value_msg(msg) -> bytes:
+    """ControlValue 메시지 -> packed bytes (중간 list/dict 없이 한 번에)"""
+    arm, gripper, mobile = msg.robotarm_state, msg.gripper_state, msg.mobile_state
+    return CONTROL_VALUE_STRUCT.pack(
+        msg.stamp, *arm.position, *arm.velocity, *arm.force,
+        gripper.position, gripper.velocity, gripper.force,
+        mobile.linear_accel, mobile.linear_brake, mobile.steer, bool(mobile.gear),
+    )
+
+
+def control_value_to_json(values) -> dict:
+    """unpack 결과(값 26개) -> 기존 /ws/ros_teleop_bridge JSON 형식"""
+    return {
+        "stamp": values[0],
+        "RobotarmValue": {"position": list(values[1:7]), "velocity": list(values[7:13]), "force": list(values[13:19])},
+        "GripperValue": {"position": values[19], "velocity": values[20], "force": values[21]},
+        "MobileValue": {"linear_accel": values[22], "linear_brake": values[23], "steer": values[24], "gear": values[25]},
+    }
+
+
+def pack_teleop_frame(seq: int, packed_value: bytes) -> bytes:
+    """binary frame = header + packed ControlValue (pack()/pack_control_value_msg() 결과)"""
+    return TELEOP_FRAME_HEADER.pack(TELEOP_FRAME_MAGIC, TELEOP_FRAME_VERSION, seq & 0xFFFFFFFF) + packed_value
+
+
+def unpack_teleop_frame(frame: bytes):
+    """(seq, ControlValue 값 26개 tuple). 형식이 맞지 않으면 ValueError"""
+    if len(frame) != TELEOP_FRAME_SIZE:
+        raise ValueError(f"teleop frame must be {TELEOP_FRAME_SIZE} bytes, got {len(frame)}")
+    magic, version, seq = TELEOP_FRAME_HEADER.unpack_from(frame, 0)
+    if magic != TELEOP_FRAME_MAGIC:
+        raise ValueError("bad teleop frame magic")
+    if version != TELEOP_FRAME_VERSION:
+        raise ValueError(f"unsupported teleop frame version {version}")
+    return seq, CONTROL_VALUE_STRUCT.unpack_from(frame, TELEOP_FRAME_HEADER.size)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# video_stream.py
+#
+# /ws/video/{camera} 용 CPU(소프트웨어) H.264 인코더. PyAV(libx264)가 있을 때만 사용 가능 (pip install av).
+#   encoder = H264StreamEncoder(640, 480, fps=30, bitrate=1_000_000, keyframe_interval=60)
+#   frame = encoder.to_video_frame(rgb)          # SHM 세그먼트를 잡은 상태에서 (여기서 복사됨)
+#   for data, keyframe, pts in encoder.encode(frame): ...   # lock 밖에서
+#
+# 출력은 H.264 Annex-B access unit (start code 포함). keyframe은 IDR이고 SPS/PPS를 매번 앞에 붙이므로
+# (x264 repeat-headers) 어느 keyframe에서든 디코딩을 시작할 수 있다. 브라우저에서는 WebCodecs VideoDecoder로 바로 디코딩.
+#
+# websocket binary 메시지 하나 = access unit 하나:
+#   magic "MMVF" | version u8 | flags u8 (bit0 = keyframe) | pad u16 | seq u32 | pts i64 | capture stamp (ns) i64 | Annex-B bytes
+
+import struct
+from fractions import Fraction
+
+import numpy as np
+
+try:
+    import av
+except ImportError: # 선택 의존성: 없으면 video 스트리밍만 꺼짐
+    av = None
+
+VIDEO_AVAILABLE = av is not None
+
+VIDEO_FRAME_MAGIC = b"MMVF"
+VIDEO_FRAME_VERSION = 1
+VIDEO_FRAME_HEADER = struct.Struct("<4sBBHIqq")
+VIDEO_FLAG_KEYFRAME = 0x01
+
+_NAL_TYPE_SPS = 7
+
+
+def pack_video_packet(seq: int, keyframe: bool, pts: int, capture_stamp_ns: int, data: bytes) -> bytes:
+    header = VIDEO_FRAME_HEADER.pack(
+        VIDEO_FRAME_MAGIC, VIDEO_FRAME_VERSION, VIDEO_FLAG_KEYFRAME if keyframe else 0, 0,
+        seq & 0xFFFFFFFF, pts, capture_stamp_ns,
+    )
+    return header + data
+
+
+def codec_string_from_annexb(data: bytes):
+    """Annex-B 안의 첫 SPS에서 WebCodecs/MSE용 codec 문자열 ("avc1.PPCCLL"). SPS가 없으면 None"""
+    start = 0
+    while True:
+        start = data.find(b"\x00\x00\x01", start)
+        if start < 0 or start + 6 > len(data):
+            return None
+        start += 3
+        if data[start] & 0x1F == _NAL_TYPE_SPS:
+            profile_idc, constraint_flags, level_idc = data[start + 1], data[start + 2], data[start + 3]
+            return f"avc1.{profile_idc:02X}{constraint_flags:02X}{level_idc:02X}"
+
+
+class H264StreamEncoder:
+    """카메라 하나의 H.264 인코더 (libx264 ultrafast/zerolatency, B-frame 없음). 한 번에 한 스레드에서만 encode()"""
+    def __init__(self, width: int, height: int, fps: float, bitrate: int, keyframe_interval: int,
+                 preset: str = "ultrafast", tune: str = "zerolatency"):
+        if av is None:
+            raise RuntimeError("PyAV is not installed (pip install av); video streaming is unavailable")
+        if width % 2 or height % 2:
+            raise ValueError(f"H.264 yuv420p needs even width/height, got {width}x{height}")
+        rate = Fraction(fps).limit_denominator(1000)
+        context = av.CodecContext.create("libx264", "w")
+        context.width = width
+        context.height = height
+        context.pix_fmt = "yuv420p"
+        context.time_base = 1 / rate
+        context.framerate = rate
+        context.bit_rate = int(bitrate)
+        context.gop_size = int(keyframe_interval)
+        context.max_b_frames = 0
+        context.options = {
+            "preset": preset, "tune": tune, "profile": "baseline",
+            # keyframe마다 SPS/PPS, 강제 keyframe은 IDR (중간에 들어온 클라이언트가 바로 디코딩 시작)
+            "x264-params": "repeat-headers=1:annexb=1:forced-idr=1",
+        }
+        self._context = context
+        self._pts = 0
+        self._keyframe_requested = True
+        self.width = width
+        self.height = height
+        self.codec_string = None # 첫 keyframe의 SPS에서 채움
+
+    def request_keyframe(self):
+        """다음 encode()를 keyframe으로 (어느 스레드에서 호출해도 됨)"""
+        self._keyframe_requested = True
+
+    def to_video_frame(self, rgb: np.ndarray):
+        """RGB uint8 (H, W, 3) -> PyAV 프레임 (픽셀 복사). yuv420p 변환은 encode()에서"""
+        return av.VideoFrame.from_ndarray(np.ascontiguousarray(rgb), format="rgb24")
+
+    def encode(self, frame):
+        """[(Annex-B bytes, keyframe, pts)]. zerolatency라 보통 프레임 하나당 packet 하나"""
+        frame.pts = self._pts
+        self._pts += 1
+        if self._keyframe_requested:
+            self._keyframe_requested = False
+            frame.pict_type = _PICT_TYPE_I
+        packets = []
+        for packet in self._context.encode(frame):
+            data = bytes(packet)
+            if packet.is_keyframe and self.codec_string is None:
+                self.codec_string = codec_string_from_annexb(data)
+            packets.append((data, packet.is_keyframe, packet.pts))
+        return packets
+
+
+# PyAV 버전에 따라 pict_type이 enum(PictureType.I) 또는 문자열("I")
+_PICT_TYPE_I = getattr(getattr(av.video.frame, "PictureType", None), "I", "I") if av is not None else None
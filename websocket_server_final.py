@@ -3,23 +3,37 @@
 
 import asyncio
 import base64
-import cv2
+import concurrent.futures
 import json
 import numpy as np
+import os
 import rclpy
-import simplejpeg
 import signal
+import struct
 import threading
 import time
 from collections import deque
-from multiprocessing import shared_memory
 import websockets
 
 from fastapi import FastAPI, WebSocket, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 
+from dataset_recorder import RECORDER_DEFAULT_FORMAT, RECORDER_FORMATS, DatasetRecorder, RecordSource, available_formats
+from downsample import DECIMATORS
+from encoder_workers import ProcessEncoderPool
+from episode_reader import EpisodeReader
+from frame_encoding import JPEG_DEFAULT_LEVEL, JPEG_LADDER, make_camera_encoder, make_depth_colorizer, new_encode_stats
+from metrics import REGISTRY, TimedLock
+from ring_buffers import FrameRing, TelemetryRing
+from shm_protocol import SegmentAttachment, SeqlockWriter
+from teleop_codec import (
+    CONTROL_VALUE_DTYPE, CONTROL_VALUE_STRUCT, ControlValueRecord, control_value_to_json, pack_control_value_msg,
+    pack_teleop_frame, unpack_teleop_frame,
+)
+from video_stream import VIDEO_AVAILABLE, H264StreamEncoder, pack_video_packet
+
 # ROS2 messages
 from rclpy.node import Node
 from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy
@@ -42,7 +56,8 @@ app.add_middleware(
 try:
     app.mount("/app", StaticFiles(directory="dist", html=True), name="static")
 except RuntimeError:
-    print("Warning: 'dist' directory not found for StaticFiles. UI will not be served.")
+    # dist/는 추적하지 않음: src/ 에서 npm run build 로 만든다
+    print("Warning: 'dist' directory not found for StaticFiles (run `npm run build`). UI will not be served.")
 
 @app.get("/")
 async def redirect_to_app():
@@ -50,34 +65,115 @@ async def redirect_to_app():
         return RedirectResponse(url="/app")
     return {"message": "FastAPI server is running. UI not found at /app."}
 
+# --- Metrics (GET /metrics, Prometheus text format) ---
+# hot path에서는 labels()로 얻은 child에 inc/observe만 함. 이미 다른 dict로 세고 있는 값은 scrape 시점에 callback으로 읽음
+LOCK_WAIT_SECONDS = REGISTRY.histogram("momad_lock_wait_seconds", "Time spent waiting to acquire shared-state locks", ("lock",))
+IMAGE_ENCODE_SECONDS = REGISTRY.histogram("momad_image_encode_seconds", "SHM read to JPEG encode done per camera job", ("camera",))
+IMAGE_JPEG_BYTES = REGISTRY.counter("momad_image_jpeg_bytes_total", "Bytes of JPEG produced by the encoder", ("camera",))
+WS_MESSAGES_SENT = REGISTRY.counter("momad_ws_messages_sent_total", "WebSocket messages sent", ("endpoint",))
+WS_BYTES_SENT = REGISTRY.counter("momad_ws_bytes_sent_total", "WebSocket payload size sent (characters for text frames)", ("endpoint",))
+WS_CLIENTS = REGISTRY.gauge("momad_ws_clients", "Connected WebSocket clients", ("endpoint",))
+VIDEO_ENCODE_SECONDS = REGISTRY.histogram("momad_video_encode_seconds", "H.264 encode time per frame (/ws/video)", ("camera",))
+VIDEO_BYTES = REGISTRY.counter("momad_video_bytes_total", "Bytes of H.264 produced for /ws/video", ("camera",))
+ROS_CALLBACK_SECONDS = REGISTRY.histogram("momad_ros_callback_seconds", "ROS subscription callback duration (count = messages)", ("topic",))
+SHM_ATTACH_EVENTS = REGISTRY.counter("momad_shm_attach_total", "SHM segment attach state changes (attached, reattached, detached, error)", ("camera", "event"))
+
 # --- Global Data Stores and Locks ---
+# sensor_data / slave_bridge_data는 불변 snapshot을 통째로 교체하는 방식으로 발행한다 (RCU 스타일).
+# writer는 새 record를 만든 뒤 전역 reference만 바꾸고, reader(event loop)는 reference를 한 번 읽어서 lock 없이 사용.
+# 발행된 snapshot의 dict/tuple은 절대 수정하지 않는다.
+class SensorDataSnapshot:
+    """sensor_data의 한 revision. fields: 필드 값, field_rev: 필드별 마지막 변경 revision"""
+    __slots__ = ("rev", "fields", "field_rev")
+
+    def __init__(self, rev: int, fields: dict, field_rev: dict):
+        self.rev = rev
+        self.fields = fields
+        self.field_rev = field_rev
+
+
+class SlaveBridgeSnapshot:
+    """'/slave_info' 메시지 하나의 불변 record (teleop_codec packed bytes).
+    JSON payload / binary frame은 처음 보낼 때 한 번만 만든다. seq는 '/slave_info' 수신 순번"""
+    __slots__ = ("seq", "stamp", "raw", "_payload", "_frame")
+
+    def __init__(self, seq: int, stamp: float, raw: bytes):
+        self.seq = seq
+        self.stamp = stamp
+        self.raw = raw
+        self._payload = None
+        self._frame = None
+
+    def payload(self) -> dict:
+        """/ws/ros_teleop_bridge로 보내는 기존 JSON 형식 (event loop에서만 호출)"""
+        if self._payload is None:
+            self._payload = control_value_to_json(CONTROL_VALUE_STRUCT.unpack(self.raw))
+        return self._payload
+
+    def frame(self) -> bytes:
+        """?format=binary 클라이언트용 frame (event loop에서만 호출)"""
+        if self._frame is None:
+            self._frame = pack_teleop_frame(self.seq, self.raw)
+        return self._frame
+
+
 # For sensor data from websocket_server_shm.py part
-sensor_data = {
+SENSOR_DATA_DEFAULTS = {
     "robot_status": "E-Stop",
     # Robot value
     "battery": 32, "linear_speed": 0.0, "angular_speed": 0.0, 
-    "gripper_opening": 0.0, "joint_angles": [0.0, 0.0, 90.0, 90.0, 90.0, 90.0], 
-    "cartesian_position": [0.0] * 6, "force_sensor": [0.0] * 6, 
+    "gripper_opening": 0.0, "joint_angles": (0.0, 0.0, 90.0, 90.0, 90.0, 90.0), 
+    "cartesian_position": (0.0,) * 6, "force_sensor": (0.0,) * 6, 
 
     # Controller value
-    "master_joint_angles": [0.0] * 6, "angle": 0.0, "accel": 0, "brake": 0, "gear_status": "중립",
+    "master_joint_angles": (0.0,) * 6, "angle": 0.0, "accel": 0, "brake": 0, "gear_status": "중립",
     
-    # 이제 안씀
+    # 이미지 파이프라인 통계 (encoder 루프가 LATENCY_REPORT_INTERVAL_S마다 갱신)
+    # camera1 = mobile_rgb, camera2 = hand_rgb. latency는 capture stamp -> 클라이언트 송신 완료 p50 (ms)
+    # 카메라/단계별 상세는 /ws/data에 싣지 않고 GET /stats/images ("fps", "latency"), /stats/latency 로
     "camera1_fps": 0.0, "camera2_fps": 0.0,
     "camera1_latency": 0.0, "camera2_latency": 0.0,
 }
 
+# /ws/data delta 모드 (?mode=delta): 연결 시 전체 snapshot, 이후 바뀐 필드만 revision과 함께 전송
+# rev는 값이 실제로 바뀐 update마다 1씩 증가, field_rev는 필드별 마지막 변경 revision
+sensor_data = SensorDataSnapshot(0, dict(SENSOR_DATA_DEFAULTS), {key: 0 for key in SENSOR_DATA_DEFAULTS})
+# writer(ROS 스레드, teleop recv)끼리만 잡는 lock. 새 dict를 만드는 동안만 잡고, reader는 잡지 않는다
+sensor_data_write_lock = TimedLock(LOCK_WAIT_SECONDS.labels("sensor_data"))
+
+# 그래프용 필드별 history (GET /history): SENSOR_DATA_DEFAULTS 중 숫자/숫자 tuple 필드를 float32 ring에 보관.
+# 필드마다 최대 HISTORY_MAX_HZ로 sampling (1 kHz '/slave_info'도 이 rate로), HISTORY_SECONDS * HISTORY_MAX_HZ slot을 미리 할당
+HISTORY_SECONDS = 600.0
+HISTORY_MAX_HZ = 100.0
+HISTORY_DEFAULT_SECONDS = 60.0
+HISTORY_DEFAULT_POINTS = 1000
+HISTORY_MAX_POINTS = 10000
+HISTORY_DEFAULT_METHOD = "minmax" # minmax (완전 벡터화) | lttb (bucket 순서대로, 점 1000개에 수십 ms) | none (원본)
+# 필드별 history ring (ring_buffers.TelemetryRing, "value" 필드 하나의 float32 record)
+telemetry_history = {
+    key: TelemetryRing([("value", "<f4", np.shape(default))], int(HISTORY_SECONDS * HISTORY_MAX_HZ))
+    for key, default in SENSOR_DATA_DEFAULTS.items()
+    if (isinstance(default, (int, float)) and not isinstance(default, bool))
+    or (isinstance(default, tuple) and all(isinstance(item, (int, float)) for item in default))
+}
+_history_last_ns = {key: 0 for key in telemetry_history}
+# ROS 콜백, encoder, sensor_data, replay 스레드가 모두 append: 시각을 잡고 throttle 확인 + append까지 한 번에 잡아야
+# ring의 시각 순서(at/range가 binary search로 찾음)가 보장된다. sensor_data_write_lock과 따로 둬서 snapshot 교체를 늘리지 않음
+history_lock = TimedLock(LOCK_WAIT_SECONDS.labels("history"))
+HISTORY_MIN_INTERVAL_NS = int(1_000_000_000 / HISTORY_MAX_HZ)
+
+TELEMETRY_KEYFRAME_S = 5.0   # delta 모드에서도 이 주기로 전체 snapshot(keyframe)을 보냄
+TELEMETRY_HEARTBEAT_S = 1.0  # 바뀐 게 없을 때 연결 유지용 heartbeat 주기
 
-sensor_data_lock = threading.Lock()
+# /ws/data, /ws/ros_teleop_bridge는 polling 대신 값이 바뀔 때 전송 (ROS 콜백이 notifier로 event loop를 깨움)
+# 클라이언트별 최대 전송률: 그 사이에 들어온 변경은 합쳐서 한 번에 보냄. ?max_hz=로 클라이언트가 낮추거나 올릴 수 있음
+TELEMETRY_MAX_RATE_HZ = 50.0
+TELEOP_BRIDGE_MAX_RATE_HZ = 200.0
+TELEMETRY_MAX_RATE_LIMIT_HZ = 1000.0
 
 # For the new ROS teleoperation bridge (from server_node.py part)
-slave_bridge_data = {
-    "stamp": 0.0,
-    "RobotarmValue": {"position": [0.0, 0.0, 90.0, 90.0, 90.0, 90.0], "velocity": [0.0]*6, "force": [0.0]*6},
-    "GripperValue": {"position": 0.0, "velocity": 0.0, "force": 0.0},
-    "MobileValue": {"linear_accel": 0.0, "linear_brake": 0.0, "steer": 0.0, "gear": True},
-}
-slave_bridge_data_lock = threading.Lock() # Changed from asyncio.Lock to threading.Lock
+# writer는 '/slave_info' 콜백 하나뿐이라 lock 없이 reference만 교체
+slave_bridge_data = SlaveBridgeSnapshot(0, 0.0, ControlValueRecord().pack())
 
 
 dataset_settings = {
@@ -88,14 +184,56 @@ dataset_settings = {
     "savePath": ".",
     "saveTask": "pick_and_place red cube",
     "fileName": "data_1",
-    "fileFormat": "json"  # New field for file format
+    "fileFormat": "json"  # 외부 recorder node 기본값. 서버 recorder를 켜면 npz로 바뀌고 npz / hdf5 / parquet 외에는 /ws/setting에서 거부
 }
 dataset_settings_lock = threading.Lock()
 
+# 서버 안 recorder (dataset_recorder.py): dataset_settings에서 고른 항목을 HZ로 sampling해서
+# "<savePath>/<fileName>/" 에피소드 디렉터리에 저장. 꺼져 있으면 예전처럼 /recording_state만 퍼블리시 (외부 recorder node가 저장)
+# 기본은 꺼짐: 외부 recorder node와 같이 켜면 같은 savePath에 에피소드가 두 번 저장된다.
+# 옮겨갈 때는 외부 recorder node를 내리고 True로 (또는 --record / MOMAD_RECORD=1, 아래 _load_launch_config)
+ENABLE_DATASET_RECORDER = False
+RECORDER_STATUS_INTERVAL_S = 1.0 # 녹화 중 /ws/setting으로 recording_status를 보내는 주기
+# dataset_settings["sensors"] 항목 -> SHM_CONFIG 카메라
+RECORDER_CAMERAS = {"camera1": "mobile_rgb", "camera2": "hand_rgb", "map": "map"}
+
+# 녹화한 에피소드 재생 (episode_reader.py): Isaac Sim / 로봇 / SHM producer 없이 live와 같은 경로로 서버를 구동
+#   python3 websocket_server_final.py --replay ./data/data_1 --speed 4 --loop
+# 카메라 열은 서버가 만든 seqlock SHM 세그먼트에 쓰고 (encoder가 그대로 읽음), /image_signal, /slave_info는 ROS 콜백을 직접 호출한다.
+# replay 중에는 live /image_signal, /slave_info, /robot_to_gui 를 구독하지 않음 (두 source가 섞이지 않도록)
+REPLAY_EPISODE = None          # 에피소드 디렉터리. None = live
+REPLAY_SPEED = 1.0             # 1.0 = 녹화 시간 그대로, N = N배속, 0 = 대기 없이 최대 속도 (websocket 처리량 벤치마크)
+REPLAY_LOOP = False            # 끝나면 처음부터 다시
+REPLAY_SHM_PREFIX = "replay_"  # live producer 세그먼트를 지우거나 덮어쓰지 않도록 SHM 이름 앞에 붙임
+
+# 실행 방법과 상관없이 같은 설정으로 뜨도록 replay/recorder는 환경 변수로도 켠다 (startup_event에서 읽음).
+#   MOMAD_REPLAY=./data/data_1 MOMAD_REPLAY_SPEED=4 MOMAD_REPLAY_LOOP=1 uvicorn websocket_server_final:app
+#   MOMAD_RECORD=1 uvicorn websocket_server_final:app
+# python3 websocket_server_final.py 의 --replay/--speed/--loop/--record 는 같은 환경 변수를 설정한다
+LAUNCH_ENV = {"replay": "MOMAD_REPLAY", "speed": "MOMAD_REPLAY_SPEED", "loop": "MOMAD_REPLAY_LOOP", "record": "MOMAD_RECORD"}
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+def _load_launch_config():
+    """환경 변수에 있는 설정만 모듈 설정에 반영 (없으면 위 기본값 또는 코드에서 바꾼 값 유지)"""
+    global ENABLE_DATASET_RECORDER, REPLAY_EPISODE, REPLAY_SPEED, REPLAY_LOOP
+    if _env_flag(LAUNCH_ENV["record"]):
+        ENABLE_DATASET_RECORDER = True
+    if os.environ.get(LAUNCH_ENV["replay"]):
+        REPLAY_EPISODE = os.environ[LAUNCH_ENV["replay"]]
+    speed = os.environ.get(LAUNCH_ENV["speed"], "").strip().lower()
+    if speed:
+        REPLAY_SPEED = 0.0 if speed == "max" else float(speed)
+    if _env_flag(LAUNCH_ENV["loop"]):
+        REPLAY_LOOP = True
+
 getting_state = False
 getting_state_lock = threading.Lock()
 
 # --- SHM Configuration and Variables ---
+# seqlock 세그먼트(shm_protocol.py)는 shape/dtype을 헤더에서 읽으므로 producer 해상도가 바뀌어도 여기를 고칠 필요 없음.
+# SHM_CONFIG의 "shape"/"dtype"은 헤더 없는 기존 레이아웃용 (seqlock만 쓰는 카메라는 "shape"를 빼도 됨)
 IMAGE_WIDTH = 640
 IMAGE_HEIGHT = 480
 RGB_CHANNELS = 3
@@ -119,27 +257,136 @@ SHM_CONFIG = {
     "map":          {"name": "shm_map",         "shape": (IMAGE_HEIGHT, IMAGE_WIDTH, RGB_CHANNELS), "dtype": RGB_DTYPE},
 }
 
-for key in SHM_CONFIG:
-    config_item = SHM_CONFIG[key]
-    config_item["size"] = int(np.prod(config_item["shape"]) * np.dtype(config_item["dtype"]).itemsize)
-
-shm_segments = {}
-shm_np_arrays = {}
-shm_lock = threading.Lock()
+# depth 카메라 (float32, m). 켜면 SHM_CONFIG에 추가되어 /ws/image로 같이 나감 (producer가 세그먼트를 만들면 attach)
+# depth_range/depth_format/depth_colormap 설명은 frame_encoding.py. png16/raw16은 uint16 mm 단위
+ENABLE_DEPTH_STREAMS = False
+DEPTH_SHM_CONFIG = {
+    "mobile_depth": {"name": "shm_mobile_depth", "shape": (IMAGE_HEIGHT, IMAGE_WIDTH), "dtype": DEPTH_DTYPE,
+                     "depth_range": (0.1, 2.0), "depth_format": "jpeg", "depth_colormap": "turbo"},
+    "hand_depth":   {"name": "shm_hand_depth",   "shape": (IMAGE_HEIGHT, IMAGE_WIDTH), "dtype": DEPTH_DTYPE,
+                     "depth_range": (0.1, 1.0), "depth_format": "jpeg", "depth_colormap": "turbo"},
+}
+if ENABLE_DEPTH_STREAMS:
+    SHM_CONFIG.update(DEPTH_SHM_CONFIG)
+
+# 카메라별 attach 상태 (shm_protocol.SegmentAttachment). 카메라마다 따로 attach하고, producer가 세그먼트를 다시 만들거나
+# (inode) 헤더를 다시 초기화하면 (generation) SHM_CHECK_INTERVAL_S 안에 다시 attach. 서버를 다시 띄울 필요 없음
+#   .reader: seqlock 레이아웃. 최신 완성 슬롯을 복사 없이 읽음
+#   .view:   헤더 없는 기존 레이아웃. 세그먼트 전체에 대한 view (producer와 동기화 없음 -> 복사해서 사용)
+SHM_CHECK_INTERVAL_S = 0.5
+shm_segments = {
+    key: SegmentAttachment(config["name"], config.get("shape"), config.get("dtype"))
+    for key, config in SHM_CONFIG.items()
+}
+shm_lock = TimedLock(LOCK_WAIT_SECONDS.labels("shm"))
+# 세그먼트별 lock: 카메라별 복사/인코딩이 서로 막지 않도록 (attach/cleanup은 shm_lock + 해당 lock)
+shm_segment_locks = {key: threading.Lock() for key in SHM_CONFIG.keys()}
+
+# 카메라별 복사+JPEG 인코딩을 병렬로 돌리는 worker 수와 한 사이클의 최대 대기 시간
+# simplejpeg는 인코딩 중 GIL을 놓으므로 스레드로 충분히 병렬화된다
+JPEG_ENCODE_WORKERS = len(SHM_CONFIG)
+JPEG_ENCODE_DEADLINE_S = 0.1
+
+# "thread": 이 프로세스의 스레드 pool에서 인코딩 (기본)
+# "process": 카메라별 worker 프로세스 (encoder_workers.py). 인코딩 전후의 Python 코드(변화 감지, resize, 결과 정리)가
+#            uvicorn/rclpy와 GIL을 나눠 쓰지 않으므로 카메라가 많거나 인코딩이 무거울 때 websocket 송신이 덜 끊긴다.
+#            worker는 SHM_CONFIG 세그먼트에 직접 attach하고 JPEG bytes만 pipe로 돌려준다
+ENCODER_MODE = "thread"
+
+# JPEG ladder / 변화 감지 설정은 frame_encoding.py (worker 프로세스와 공유)
+# 카메라별 인코딩(variant 단위)/스킵/torn(인코딩 중 덮어써짐) 횟수 (카메라당 동시에 하나의 job만 돌기 때문에 key별로 경합 없음)
+image_encode_stats = {key: new_encode_stats() for key in SHM_CONFIG.keys()}
+REGISTRY.register_callback(
+    "momad_image_frames_total", "Encoder results per camera (encoded = variants encoded, skipped = unchanged pixels reused)",
+    "counter", ("camera", "result"),
+    lambda: [((key, result), count) for key, counts in image_encode_stats.items() for result, count in counts.items()],
+)
+# 스레드 모드 카메라별 인코딩 cache (프로세스 모드에서는 각 worker가 자기 카메라 cache를 가짐)
+camera_encoders = {
+    key: make_camera_encoder(key, config, stats=image_encode_stats[key], on_encoded=IMAGE_JPEG_BYTES.labels(key).inc)
+    for key, config in SHM_CONFIG.items()
+}
+# 카메라별 /ws/image payload 형식 (RGB는 JPEG, depth는 depth_format에 따라). JSON 클라이언트 data URI와 "subscribed" 응답에 사용
+IMAGE_CAMERA_FORMATS = {}
+for key, config in SHM_CONFIG.items():
+    depth_colorizer = make_depth_colorizer(key, config)
+    IMAGE_CAMERA_FORMATS[key] = {"mime": "image/jpeg"} if depth_colorizer is None else {
+        "mime": depth_colorizer.mime, "depth_format": depth_colorizer.depth_format,
+        "depth_range": [depth_colorizer.min_m, depth_colorizer.max_m], "shape": list(config.get("shape", (0, 0))[:2]), # attach 때 헤더 값으로 갱신
+    }
+# 프로세스 모드: worker가 "변화 없음"으로 답했을 때 재사용할 카메라별 마지막 결과
+_worker_last_encoded = {key: {} for key in SHM_CONFIG.keys()}
 
 image_signal_event = threading.Event()
+# shutdown_event에서 set: encoder 루프가 종료 중에 pool에 새 작업을 넣지 않도록 (daemon 스레드라 interpreter 종료와 경합)
+encoder_stop = threading.Event()
 last_received_signal_stamp_ns = None
+# 마지막 signal의 (capture stamp -> signal 수신까지 ms (ROS clock 기준), 수신 시각 perf_counter_ns)
+# 이후 단계는 perf_counter_ns 차이로 재서 이 값에 더한다 (ROS sim time이어도 단계별 시간은 wall clock으로)
+last_signal_trace = (0.0, 0)
 signal_stamp_lock = threading.Lock()
 
-gui_image_processed_count = 0
-gui_fps_calc_start_time = time.perf_counter()
-latencies = {key: deque(maxlen=100) for key in SHM_CONFIG.keys()}
-latency_log_interval = 5.0
-last_latency_log_time = time.perf_counter()
+# 프레임 단계별 latency (capture stamp 기준 누적 ms)를 최근 LATENCY_WINDOW개로 p50/p95/p99 집계
+LATENCY_WINDOW = 512
+LATENCY_REPORT_INTERVAL_S = 1.0 # /ws/data(sensor_data)로 요약을 내보내는 주기
 
-latest_frame = {"images": {key: "" for key in SHM_CONFIG.keys()}}
-latest_frame_lock = threading.Lock()
-connected_clients_image_ws = set() # For /ws/image
+# 인코딩된 JPEG 원본 바이트를 카메라별 {variant: bytes}로 보관. JSON 클라이언트용 data URI는 프레임당 한 번만 lazy 생성
+latest_frame = {
+    "seq": 0,
+    "capture_stamp_ns": 0,
+    "trace": (0.0, 0), # 이 프레임의 last_signal_trace
+    "jpeg": {key: {} for key in SHM_CONFIG.keys()},
+}
+latest_frame_lock = TimedLock(LOCK_WAIT_SECONDS.labels("latest_frame"))
+
+# /ws/image 클라이언트별 송신 큐 길이. 가득 차면 가장 오래된 프레임을 버림 (느린 뷰어가 밀리지 않도록)
+IMAGE_CLIENT_QUEUE_SIZE = 2
+
+# 클라이언트별 level 자동 조정 (클라이언트가 {"type": "set_level", "level": n | "auto"}로 고정/해제 가능)
+ADAPT_DECISION_INTERVAL_S = 1.0   # level 조정 판단 주기
+ADAPT_UPGRADE_HOLD_S = 3.0        # 이 시간 동안 계속 여유가 있어야 한 단계 올림
+ADAPT_CONGESTED_SEND_RATIO = 0.5  # 송신 시간(EWMA)이 프레임 간격의 이 비율을 넘으면 혼잡 -> 한 단계 내림
+ADAPT_IDLE_SEND_RATIO = 0.15      # 이 비율 아래면 여유
+ADAPT_MAX_RTT_MS = 250.0          # ping/pong RTT가 이보다 크면 혼잡
+IMAGE_PING_INTERVAL_S = 2.0
+
+# 구독 메시지로 요청할 수 있는 최대 출력 해상도
+# {"type": "subscribe", "cameras": [...], "width": w, "height": h, "roi": [x, y, w, h]}
+IMAGE_MAX_OUTPUT_SIZE = 4096
+
+# /ws/video/{camera}: 카메라별 H.264 스트림 (PyAV/libx264, CPU). 천천히 바뀌는 map/mobile 카메라는 JPEG 스틸보다 대역폭이 훨씬 작다.
+# 구독자가 있는 카메라만 인코딩하고, 새 클라이언트가 들어오면 다음 프레임을 keyframe으로 강제한다.
+# SHM_CONFIG 항목에 "video_bitrate", "video_keyframe_interval"을 넣으면 카메라별로 덮어씀
+VIDEO_STREAM_FPS = 30
+VIDEO_STREAM_BITRATE = 1_000_000  # bps
+VIDEO_KEYFRAME_INTERVAL = 60      # 프레임 수 (30fps에서 2초)
+VIDEO_CLIENT_QUEUE_SIZE = 30      # 클라이언트별 대기 packet 수. 넘치면 비우고 다음 keyframe부터 다시 보냄
+
+# DVR (ring_buffers.py): 카메라별 최근 DVR_SECONDS초의 JPEG와 telemetry sample을 메모리에 보관해서 지나간 시점을 다시 볼 수 있게 함.
+# GET /dvr, /dvr/frame/{camera}, /dvr/frames/{camera}, /dvr/telemetry/{stream}, POST /dvr/save, /ws/dvr
+# 기본은 꺼짐. 켜면 DVR_CAMERAS는 /ws/image 구독자가 없어도 DVR_JPEG_LEVEL(원본 해상도)로 매 프레임 복사+인코딩한다
+# (구독자 없는 카메라 인코딩 생략을 그 카메라에 한해 무시함. 같은 variant를 보는 클라이언트가 있으면 추가 비용 없음).
+# CPU 비용: 640x480 30fps 기준 카메라당 약 1 core의 3~4% (bench, 카메라 3개: 구독자 0명일 때 서버 6% -> 17%)
+# 메모리 상한: 카메라당 DVR_CAMERA_MAX_BYTES + telemetry stream당 DVR_SECONDS * DVR_TELEMETRY_MAX_HZ sample (미리 할당)
+ENABLE_DVR = False
+DVR_CAMERAS = ("mobile_rgb", "hand_rgb") # 보관할 카메라 (SHM_CONFIG key). 필요한 카메라만 넣을 것
+DVR_SECONDS = 30.0
+DVR_JPEG_LEVEL = JPEG_DEFAULT_LEVEL
+DVR_MAX_FPS = 60                         # 카메라별 frame slot 수 = DVR_SECONDS * DVR_MAX_FPS
+DVR_CAMERA_MAX_BYTES = 64 * 1024 * 1024  # 카메라별 JPEG 바이트 상한 (넘으면 오래된 프레임부터 버림)
+DVR_TELEMETRY_MAX_HZ = 1000              # telemetry stream별 sample slot 수 = DVR_SECONDS * DVR_TELEMETRY_MAX_HZ
+DVR_TELEMETRY_RESPONSE_MAX = 10000       # /dvr/telemetry 한 번에 돌려주는 최대 sample 수
+DVR_RANGE_MAX_FRAMES = 2000              # /ws/dvr range 요청 한 번에 보내는 최대 프레임 수
+DVR_SAVE_DIR = "./dvr"
+
+# /ws/image binary framing (?format=binary 로 연결 시 협상)
+# header: magic, version, camera key length, ladder level, capture stamp (ns), server send stamp (ms), seq
+# (roi/해상도는 클라이언트가 subscribe로 요청한 값 그대로)
+# 이후 camera key (utf-8) + JPEG 원본 바이트가 이어짐. 카메라 하나당 메시지 하나.
+# 제어 메시지(ping, level 알림)는 text(JSON)로 보냄
+IMAGE_FRAME_MAGIC = b"MMIF"
+IMAGE_FRAME_VERSION = 2
+IMAGE_FRAME_HEADER = struct.Struct("<4sBBHqqI")
 
 
 # --- ROS 2 Global Variables ---
@@ -171,65 +418,761 @@ def log_debug(message):
     if logger: logger.debug(message) # Ensure logger level is set to DEBUG if these are needed
     else: print(f"DEBUG: {message}")
 
-# --- Shared Memory Utility Functions ---
-def _init_shared_memory():
-    global shm_segments, shm_np_arrays
-    log_info("Attempting to attach to shared memory segments...")
-    successful_attachments = 0
-    with shm_lock:
-        for key, config_item in SHM_CONFIG.items():
-            if key in shm_segments and shm_segments[key] is not None and \
-               key in shm_np_arrays and shm_np_arrays[key] is not None:
-                log_debug(f"SHM segment '{key}' already attached and view created. Skipping.")
-                successful_attachments +=1
-                continue
+# --- Telemetry Change Notification ---
+class ChangeNotifier:
+    """ROS 콜백 스레드에서 notify_threadsafe()로 '값이 바뀜'을 알리면 event loop의 대기자들을 깨운다.
+    여러 번 연달아 알려도 event loop에는 한 번만 예약되고, 대기자는 version으로 놓친 변경이 있는지 확인한다"""
+    def __init__(self):
+        self.loop = None
+        self.version = 0
+        self._waiters = set()
+        self._wake_pending = False
 
-            shm_name = config_item["name"]
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+
+    def notify_threadsafe(self):
+        loop = self.loop
+        if loop is None or loop.is_closed() or self._wake_pending:
+            return
+        self._wake_pending = True
+        try:
+            loop.call_soon_threadsafe(self._wake)
+        except RuntimeError: # loop가 이미 닫힘 (shutdown 중)
+            self._wake_pending = False
+
+    def _wake(self):
+        self._wake_pending = False
+        self.version += 1
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    async def wait_for_change(self, seen_version: int, timeout: float = None) -> int:
+        """seen_version 이후 변경이 있을 때까지(또는 timeout까지) 기다리고 현재 version을 반환"""
+        if self.version != seen_version:
+            return self.version
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiters.discard(waiter)
+        return self.version
+
+
+sensor_data_notifier = ChangeNotifier()
+slave_bridge_notifier = ChangeNotifier()
+
+def _client_min_send_interval(websocket: WebSocket, default_hz: float) -> float:
+    """?max_hz= 쿼리 파라미터(없으면 default_hz)를 최소 전송 간격(초)으로 변환"""
+    try:
+        max_hz = float(websocket.query_params.get("max_hz", default_hz))
+    except ValueError:
+        max_hz = default_hz
+    if not max_hz > 0:
+        max_hz = default_hz
+    return 1.0 / min(max_hz, TELEMETRY_MAX_RATE_LIMIT_HZ)
+
+async def _wait_send_slot(last_send_at: float, min_interval: float):
+    """직전 전송 후 min_interval이 지나지 않았으면 남은 시간만큼 기다림 (그 사이 변경은 다음 전송에 합쳐짐)"""
+    remaining = last_send_at + min_interval - time.monotonic()
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+
+# --- WebSocket Send Helpers (metrics) ---
+def _count_ws_sent(endpoint: str, size: int):
+    WS_MESSAGES_SENT.labels(endpoint).inc()
+    WS_BYTES_SENT.labels(endpoint).inc(size)
+
+async def _ws_send_text(websocket: WebSocket, endpoint: str, text: str):
+    await websocket.send_text(text)
+    _count_ws_sent(endpoint, len(text))
+
+async def _ws_send_bytes(websocket: WebSocket, endpoint: str, data: bytes):
+    await websocket.send_bytes(data)
+    _count_ws_sent(endpoint, len(data))
+
+async def _ws_send_json(websocket: WebSocket, endpoint: str, data):
+    # Starlette send_json과 같은 직렬화
+    await _ws_send_text(websocket, endpoint, json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+# --- Latency Tracing ---
+# 프레임 하나가 거치는 단계. 모두 capture stamp(/image_signal stamp) 기준 누적 ms
+#   signal: signal 콜백 수신, shm_read: SHM에서 픽셀 확보(seqlock은 view, raw는 복사 완료), encoded: JPEG 인코딩 완료
+#   enqueued: /ws/image 구독자 큐에 넣음, sent: 클라이언트 하나에게 송신 완료 (클라이언트 수만큼 샘플)
+LATENCY_STAGES = ("signal", "shm_read", "encoded", "enqueued", "sent")
+
+class RollingPercentiles:
+    """최근 window개 샘플의 분위수. add()는 list 한 칸 대입뿐이라 프레임/클라이언트마다 불러도 됨.
+    writer 하나(스레드 하나)를 가정하고, 다른 스레드의 summary()는 약간 어긋난 샘플을 볼 수 있음"""
+    __slots__ = ("_values", "_next")
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._values = [0.0] * window
+        self._next = 0
+
+    def add(self, value: float):
+        self._values[self._next % len(self._values)] = value
+        self._next += 1
+
+    @property
+    def count(self) -> int:
+        return min(self._next, len(self._values))
+
+    def percentiles(self, quantiles=(50, 95, 99)):
+        count = self.count
+        if not count:
+            return None
+        return [round(float(value), 2) for value in np.percentile(self._values[:count], quantiles)]
+
+    def summary(self) -> dict:
+        count = self.count
+        if not count:
+            return {"count": 0}
+        p50, p95, p99 = self.percentiles()
+        return {"count": count, "p50": p50, "p95": p95, "p99": p99, "max": round(max(self._values[:count]), 2)}
+
+
+# 카메라별 단계별 latency. signal/shm_read/encoded는 encoder 스레드, enqueued/sent는 event loop만 씀
+camera_latency = {key: {stage: RollingPercentiles() for stage in LATENCY_STAGES} for key in SHM_CONFIG.keys()}
+
+def _ms_since_capture(trace, perf_ns: int) -> float:
+    """trace = (capture -> signal ms, signal 수신 perf_counter_ns)"""
+    signal_latency_ms, signal_perf_ns = trace
+    return signal_latency_ms + (perf_ns - signal_perf_ns) / 1_000_000
+
+# encoder 루프가 LATENCY_REPORT_INTERVAL_S마다 통째로 교체하는 카메라별 fps (GET /stats/images)
+image_fps = {key: 0.0 for key in SHM_CONFIG.keys()}
+
+def _image_latency_summary() -> dict:
+    """{camera key: {stage: [p50, p95, p99]}} (값이 있는 단계만)"""
+    image_latency = {}
+    for cam_key, stages in camera_latency.items():
+        summary = {stage: stages[stage].percentiles() for stage in LATENCY_STAGES if stages[stage].count}
+        if summary:
+            image_latency[cam_key] = summary
+    return image_latency
+
+def _latency_telemetry(fps: dict) -> dict:
+    """sensor_data에 넣을 요약: GUI가 쓰는 기존 camera*_fps/latency 필드만 (상세는 /stats/images)"""
+    def glass_to_glass(cam_key):
+        stages = camera_latency.get(cam_key)
+        if not stages:
+            return 0.0
+        for stage in ("sent", "encoded"): # 보는 클라이언트가 없으면 인코딩 완료까지
+            if stages[stage].count:
+                return stages[stage].percentiles((50,))[0]
+        return 0.0
+
+    return {
+        "camera1_fps": round(fps.get("mobile_rgb", 0.0), 1), "camera2_fps": round(fps.get("hand_rgb", 0.0), 1),
+        "camera1_latency": glass_to_glass("mobile_rgb"), "camera2_latency": glass_to_glass("hand_rgb"),
+    }
+
+# --- Sensor Data Helpers ---
+def _update_sensor_data(updates: dict):
+    """값이 바뀐 필드만 반영한 새 snapshot을 만들어 sensor_data를 교체한다 (list 값은 tuple로 넘길 것)"""
+    global sensor_data
+    _history_append(updates) # 값이 그대로여도 sample은 history에 남김
+    with sensor_data_write_lock:
+        current = sensor_data
+        changed = [key for key, value in updates.items() if current.fields.get(key) != value]
+        if not changed:
+            return
+        rev = current.rev + 1
+        fields = current.fields.copy()
+        field_rev = current.field_rev.copy()
+        for key in changed:
+            fields[key] = updates[key]
+            field_rev[key] = rev
+        sensor_data = SensorDataSnapshot(rev, fields, field_rev)
+    sensor_data_notifier.notify_threadsafe()
+
+# event loop에서 나온 갱신은 이 스레드로 넘김: sensor_data_write_lock은 1 kHz ROS 콜백 스레드도 잡으므로
+# event loop가 그 lock을 기다리지 않게 한다. worker가 하나라 넘긴 순서대로 반영됨
+sensor_data_update_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="sensor_data")
+
+def _update_sensor_data_from_loop(updates: dict):
+    """event loop 전용 _update_sensor_data: 기다리지 않고 sensor_data 스레드에 맡긴다"""
+    try:
+        sensor_data_update_pool.submit(_update_sensor_data, updates)
+    except RuntimeError: # shutdown 중 (pool이 이미 닫힘)
+        pass
+
+def _history_append(updates: dict):
+    """_update_sensor_data가 받은 값(바뀌지 않은 값 포함)을 필드별 history ring에 (필드마다 최대 HISTORY_MAX_HZ)"""
+    keys = [key for key in updates if key in telemetry_history]
+    if not keys:
+        return
+    with history_lock:
+        now_ns = time.time_ns()
+        for key in keys:
+            if now_ns - _history_last_ns[key] < HISTORY_MIN_INTERVAL_NS:
+                continue
             try:
-                shm = shared_memory.SharedMemory(name=shm_name, create=False, size=config_item["size"])
-                shm_segments[key] = shm
-                shm_np_arrays[key] = np.ndarray(config_item["shape"], dtype=config_item["dtype"], buffer=shm.buf)
-                log_info(f"Successfully attached to SHM: {shm_name} (View shape: {shm_np_arrays[key].shape}, dtype: {shm_np_arrays[key].dtype})")
-                successful_attachments += 1
-            except FileNotFoundError:
-                log_error(f"SHM segment '{shm_name}' not found. Producer (e.g., Isaac Sim) must create it first.")
-                shm_segments[key] = None
-                shm_np_arrays[key] = None
-            except Exception as e:
-                log_error(f"Failed to attach or create view for SHM '{shm_name}': {e}")
-                shm_segments[key] = None
-                shm_np_arrays[key] = None
-        
-        if successful_attachments == len(SHM_CONFIG):
-            log_info("All shared memory segments successfully attached and views created.")
+                telemetry_history[key].append(now_ns, (updates[key],))
+            except (TypeError, ValueError): # 길이가 다른 배열 등
+                continue
+            _history_last_ns[key] = now_ns
+
+def _sensor_data_changes_since(rev: int):
+    """(현재 revision, rev 이후 바뀐 필드 dict)"""
+    snapshot = sensor_data
+    if rev >= snapshot.rev:
+        return snapshot.rev, {}
+    return snapshot.rev, {key: snapshot.fields[key] for key, field_rev in snapshot.field_rev.items() if field_rev > rev}
+
+def _sensor_data_snapshot():
+    """(현재 revision, 필드 dict). dict는 공유되는 불변 snapshot이므로 수정하지 말 것"""
+    snapshot = sensor_data
+    return snapshot.rev, snapshot.fields
+
+# --- /ws/image Payload Helpers ---
+def _pack_binary_image_frame(cam_key: str, jpeg_bytes: bytes, level: int, capture_stamp_ns: int, server_send_ms: int, seq: int) -> bytes:
+    key_bytes = cam_key.encode("utf-8")
+    header = IMAGE_FRAME_HEADER.pack(
+        IMAGE_FRAME_MAGIC, IMAGE_FRAME_VERSION, len(key_bytes), level,
+        capture_stamp_ns, server_send_ms, seq & 0xFFFFFFFF,
+    )
+    return b"".join((header, key_bytes, jpeg_bytes))
+
+def _pick_variant(encoded_variants: dict, variant: tuple):
+    """요청한 variant가 아직 인코딩되지 않았으면 같은 roi/해상도 중 가장 가까운(낮은 쪽 우선) level로 대체. (level, bytes)"""
+    level, roi, size = variant
+    if variant in encoded_variants:
+        return level, encoded_variants[variant]
+    candidates = [available for available in encoded_variants if available[1:] == (roi, size)]
+    if not candidates:
+        return level, b""
+    fallback = min(candidates, key=lambda available: (abs(available[0] - level), available[0] > level))
+    return fallback[0], encoded_variants[fallback]
+
+def _parse_view_request(payload: dict):
+    """subscribe 메시지의 roi/width/height 검증. (roi 또는 None, size 또는 None), 잘못된 값이면 ValueError"""
+    roi = payload.get("roi")
+    if roi is not None:
+        if not isinstance(roi, (list, tuple)) or len(roi) != 4:
+            raise ValueError("roi must be [x, y, width, height]")
+        x, y, width, height = (int(value) for value in roi)
+        if x < 0 or y < 0 or width <= 0 or height <= 0:
+            raise ValueError("roi must have non-negative origin and positive size")
+        roi = (x, y, width, height)
+    size = None
+    if payload.get("width") is not None or payload.get("height") is not None:
+        width, height = int(payload.get("width") or 0), int(payload.get("height") or 0)
+        if not (0 < width <= IMAGE_MAX_OUTPUT_SIZE and 0 < height <= IMAGE_MAX_OUTPUT_SIZE):
+            raise ValueError(f"width and height must both be in 1..{IMAGE_MAX_OUTPUT_SIZE}")
+        size = (width, height)
+    return roi, size
+
+
+class AdaptiveQualityController:
+    """클라이언트 하나의 ladder level. 송신 시간(EWMA), 큐에서 버려진 프레임, RTT를 보고 한 단계씩 조정"""
+    def __init__(self, level: int = JPEG_DEFAULT_LEVEL):
+        self.level = level
+        self.pinned = False
+        self.send_ms_ewma = None
+        self.rtt_ms = None
+        self._dropped_at_last_decision = 0
+        self._last_decision_at = time.monotonic()
+        self._idle_since = None
+
+    def pin(self, level: int):
+        self.level = max(0, min(len(JPEG_LADDER) - 1, int(level)))
+        self.pinned = True
+
+    def unpin(self):
+        self.pinned = False
+        self._idle_since = None
+
+    def on_sent(self, send_ms: float):
+        self.send_ms_ewma = send_ms if self.send_ms_ewma is None else 0.8 * self.send_ms_ewma + 0.2 * send_ms
+
+    def on_rtt(self, rtt_ms: float):
+        self.rtt_ms = rtt_ms if self.rtt_ms is None else 0.7 * self.rtt_ms + 0.3 * rtt_ms
+
+    def decide(self, frame_interval_ms: float, dropped_frames: int) -> bool:
+        """ADAPT_DECISION_INTERVAL_S마다 level 조정. level이 바뀌면 True"""
+        now = time.monotonic()
+        if self.pinned or now - self._last_decision_at < ADAPT_DECISION_INTERVAL_S or self.send_ms_ewma is None:
+            return False
+        self._last_decision_at = now
+        dropped_since_last = dropped_frames - self._dropped_at_last_decision
+        self._dropped_at_last_decision = dropped_frames
+        rtt_ms = self.rtt_ms or 0.0
+        congested = dropped_since_last > 0 or rtt_ms > ADAPT_MAX_RTT_MS or \
+            self.send_ms_ewma > ADAPT_CONGESTED_SEND_RATIO * frame_interval_ms
+        if congested:
+            self._idle_since = None
+            if self.level > 0:
+                self.level -= 1
+                return True
+            return False
+        idle = self.send_ms_ewma < ADAPT_IDLE_SEND_RATIO * frame_interval_ms and rtt_ms < ADAPT_MAX_RTT_MS / 2
+        if not idle:
+            self._idle_since = None
+            return False
+        if self._idle_since is None:
+            self._idle_since = now
+        elif now - self._idle_since >= ADAPT_UPGRADE_HOLD_S and self.level < len(JPEG_LADDER) - 1:
+            self.level += 1
+            self._idle_since = None
             return True
-        else:
-            log_error(f"Only {successful_attachments}/{len(SHM_CONFIG)} SHM segments were attached/views created.")
-            # Attempt to clean up any partially successful attachments to avoid lingering file handles
-            # This is a simplified cleanup for this specific init failure case
-            for key_to_clean in list(shm_segments.keys()):
-                if shm_segments[key_to_clean] is not None:
-                    try:
-                        shm_segments[key_to_clean].close()
-                    except Exception as e_clean:
-                        log_error(f"Error closing partially opened SHM {SHM_CONFIG[key_to_clean]['name']} during init failure: {e_clean}")
-                shm_segments[key_to_clean] = None
-                shm_np_arrays[key_to_clean] = None
+        return False
+
+
+class ImageSubscriber:
+    """/ws/image 클라이언트 하나. 허브가 넣어준 직렬화된 payload를 bounded 큐로 받는다."""
+    def __init__(self, websocket: WebSocket, binary_mode: bool, queue_size: int):
+        self.websocket = websocket
+        self.binary_mode = binary_mode
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped_frames = 0
+        self.quality = AdaptiveQualityController()
+        self.announced_level = None # 클라이언트에게 마지막으로 알린 (level, pinned)
+        self.last_ping_at = 0.0
+        self.send_lock = asyncio.Lock() # 송신 task와 제어 응답이 같은 소켓에 동시에 쓰지 않도록
+        # subscribe로 받은 카메라/영역/해상도 (기본: 전체 카메라, 원본 해상도)
+        self.cameras = tuple(SHM_CONFIG.keys())
+        self.roi = None
+        self.size = None
+        # binary 모드: 카메라별로 마지막으로 큐에 넣은 JPEG bytes (바뀌지 않은 카메라는 다시 보내지 않음)
+        self.sent_jpeg = {}
+        # 클라이언트별 latency: 큐 대기(enqueued -> 송신 시작), 송신 시간, capture -> 송신 완료
+        self.latency = {"queue": RollingPercentiles(), "send": RollingPercentiles(), "total": RollingPercentiles()}
+
+    @property
+    def variant(self):
+        return (self.quality.level, self.roi, self.size)
+
+    def make_room(self):
+        """큐가 가득 차 있으면 가장 오래된 프레임을 버린다. 버린 프레임에 담긴 카메라는 보내지 않은 것으로 되돌림"""
+        if not self.queue.full():
+            return
+        try:
+            _, _, cameras, _ = self.queue.get_nowait()
+            self.dropped_frames += 1
+        except asyncio.QueueEmpty:
+            return
+        for cam_key in cameras:
+            self.sent_jpeg.pop(cam_key, None)
+
+    def offer(self, payload, trace, cameras):
+        """새 프레임을 큐에 넣는다 (event loop에서만 호출, make_room() 다음에).
+        trace/cameras: 송신 완료 시 latency를 기록할 프레임 trace와 실제로 담긴 카메라들"""
+        self.make_room()
+        self.queue.put_nowait((payload, trace, cameras, time.perf_counter_ns()))
+
+
+class ImageBroadcastHub:
+    """프레임을 한 번만 직렬화하고 모든 /ws/image 구독자에게 같은 payload를 뿌린다.
+    encoder 스레드가 notify_threadsafe()로 새 프레임을 알리면 event loop에서 publish가 실행된다.
+    JSON payload는 (variant, 카메라 목록)별로, binary 메시지는 (카메라, variant)별로 프레임당 한 번만 만든다.
+    binary 구독자에게는 그 구독자에게 마지막으로 보낸 것과 bytes가 다른 카메라만 보낸다."""
+    def __init__(self, queue_size: int = IMAGE_CLIENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.subscribers = set()
+        self.last_published_seq = 0
+        self.loop = None
+        self._publish_pending = False
+        self._frame = None # (seq, capture_stamp_ns, server_send_ms, {camera key: {variant: JPEG bytes}}, trace)
+        self._payload_cache = {} # (variant, cameras) -> 직렬화된 JSON payload
+        self._binary_message_cache = {} # (camera key, variant) -> binary 메시지
+        self._last_publish_at = None
+        self.frame_interval_ms = 1000.0 / 30 # 프레임 간격 EWMA (adaptive quality 판단 기준)
+        # encoder 스레드가 읽는 {camera key: 인코딩할 variant 집합}. 통째로 교체하므로 lock 없이 읽어도 안전
+        # 아무도 보지 않는 카메라는 key가 없으므로 복사/인코딩을 아예 하지 않는다
+        self.demanded_variants = {}
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+
+    def notify_threadsafe(self):
+        """encoder 스레드에서 호출. 이미 예약된 publish가 있으면 합쳐서 한 번만 깨운다"""
+        loop = self.loop
+        if loop is None or loop.is_closed() or self._publish_pending:
+            return
+        self._publish_pending = True
+        try:
+            loop.call_soon_threadsafe(self._run_publish)
+        except RuntimeError: # loop가 이미 닫힘 (shutdown 중)
+            self._publish_pending = False
+
+    def _run_publish(self):
+        # flag를 먼저 내려야 publish 도중 들어온 새 프레임이 다시 예약된다
+        self._publish_pending = False
+        try:
+            self.publish_latest_frame()
+        except Exception as e:
+            log_error(f"Error publishing image frame: {e}")
+
+    def __len__(self):
+        return len(self.subscribers)
+
+    def refresh_demand(self):
+        """구독자들의 카메라/variant로 카메라별 인코딩 대상을 갱신"""
+        demand = {}
+        for subscriber in self.subscribers:
+            for cam_key in subscriber.cameras:
+                demand.setdefault(cam_key, set()).add(subscriber.variant)
+        self.demanded_variants = {cam_key: frozenset(variants) for cam_key, variants in demand.items()}
+
+    def subscribe(self, websocket: WebSocket, binary_mode: bool) -> ImageSubscriber:
+        subscriber = ImageSubscriber(websocket, binary_mode, self.queue_size)
+        self.subscribers.add(subscriber)
+        self.refresh_demand()
+        # 새 클라이언트는 다음 프레임을 기다리지 않고 마지막 프레임부터 받는다
+        self._offer_current(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: ImageSubscriber):
+        self.subscribers.discard(subscriber)
+        self.refresh_demand()
+
+    def _binary_message(self, cam_key: str, variant: tuple):
+        cache_key = (cam_key, variant)
+        if cache_key not in self._binary_message_cache:
+            seq, capture_stamp_ns, server_send_ms, jpeg_frames, _ = self._frame
+            level, jpeg = _pick_variant(jpeg_frames.get(cam_key, {}), variant)
+            self._binary_message_cache[cache_key] = \
+                _pack_binary_image_frame(cam_key, jpeg, level, capture_stamp_ns, server_send_ms, seq) if jpeg else None
+        return self._binary_message_cache[cache_key]
+
+    def _json_payload_for(self, subscriber: ImageSubscriber):
+        """현재 프레임에서 이 JSON 구독자가 받을 payload. (variant, 카메라 목록)별로 프레임당 한 번만 직렬화해서 캐시"""
+        variant = subscriber.variant
+        cache_key = (variant, subscriber.cameras)
+        if cache_key not in self._payload_cache:
+            _, _, server_send_ms, jpeg_frames, _ = self._frame
+            images = {}
+            for cam_key in subscriber.cameras:
+                _, jpeg = _pick_variant(jpeg_frames.get(cam_key, {}), variant)
+                mime = IMAGE_CAMERA_FORMATS[cam_key]["mime"]
+                images[cam_key] = f"data:{mime};base64,{base64.b64encode(jpeg).decode('ascii')}" if jpeg else ""
+            self._payload_cache[cache_key] = json.dumps(
+                {"images": images, "server_send_timestamp_ms": server_send_ms},
+                ensure_ascii=False, separators=(",", ":"),
+            )
+        return self._payload_cache[cache_key]
+
+    def _offer_current(self, subscriber: ImageSubscriber):
+        if self._frame is None:
+            return
+        jpeg_frames = self._frame[3]
+        if not subscriber.binary_mode:
+            payload = self._json_payload_for(subscriber)
+            cameras = tuple(cam_key for cam_key in subscriber.cameras if jpeg_frames.get(cam_key))
+            subscriber.offer(payload, self._frame[4], cameras)
+            return
+        # 먼저 자리를 비워야 버려진 프레임에 담겼던 카메라가 이번 payload에 다시 들어간다
+        subscriber.make_room()
+        variant = subscriber.variant
+        payload, cameras = [], []
+        for cam_key in subscriber.cameras:
+            _, jpeg = _pick_variant(jpeg_frames.get(cam_key, {}), variant)
+            if not jpeg or subscriber.sent_jpeg.get(cam_key) == jpeg:
+                continue
+            message = self._binary_message(cam_key, variant)
+            subscriber.sent_jpeg[cam_key] = jpeg
+            payload.append(message)
+            cameras.append(cam_key)
+        if payload:
+            subscriber.offer(payload, self._frame[4], tuple(cameras))
+
+    def publish_latest_frame(self):
+        """latest_frame의 seq가 마지막으로 보낸 것보다 새로우면 구독자 큐에 넣는다 (중복 전송 없음)"""
+        with latest_frame_lock:
+            seq = latest_frame["seq"]
+            if seq == self.last_published_seq or not any(latest_frame["jpeg"].values()):
+                return
+            capture_stamp_ns = latest_frame["capture_stamp_ns"]
+            trace = latest_frame["trace"]
+            jpeg_frames = dict(latest_frame["jpeg"])
+        self.last_published_seq = seq # seq는 인코더가 새 bytes를 만든 경우에만 올라감
+        now = time.monotonic()
+        if self._last_publish_at is not None:
+            self.frame_interval_ms = 0.9 * self.frame_interval_ms + 0.1 * (now - self._last_publish_at) * 1000
+        self._last_publish_at = now
+        # 서버 전송 타임스탬프 (밀리초 단위 UNIX epoch): 직렬화 시점 기준으로 프레임당 한 번
+        self._frame = (seq, capture_stamp_ns, int(time.time() * 1000), jpeg_frames, trace)
+        self._payload_cache = {}
+        self._binary_message_cache = {}
+        if self.subscribers:
+            enqueued_ms = _ms_since_capture(trace, time.perf_counter_ns())
+            for cam_key in self.demanded_variants:
+                if jpeg_frames.get(cam_key):
+                    camera_latency[cam_key]["enqueued"].add(enqueued_ms)
+        for subscriber in self.subscribers:
+            self._offer_current(subscriber)
+
+
+image_hub = ImageBroadcastHub()
+
+
+class VideoSubscriber:
+    """/ws/video/{camera} 클라이언트 하나. 첫 packet은 항상 keyframe, 밀리면 다음 keyframe까지 건너뜀 (event loop에서만 사용)"""
+    def __init__(self, websocket: WebSocket, cam_key: str):
+        self.websocket = websocket
+        self.cam_key = cam_key
+        self.queue = asyncio.Queue(maxsize=VIDEO_CLIENT_QUEUE_SIZE)
+        self.waiting_for_keyframe = True
+        self.dropped_packets = 0
+
+    def offer(self, packet: bytes, keyframe: bool) -> bool:
+        """packet을 큐에 넣는다. 큐가 넘쳐서 keyframe이 필요해졌으면 True"""
+        if self.waiting_for_keyframe:
+            if not keyframe:
+                self.dropped_packets += 1
+                return False
+            self.waiting_for_keyframe = False
+        if self.queue.full(): # inter-frame이라 중간 packet만 버릴 수 없음: 다 비우고 keyframe부터 다시
+            self.dropped_packets += self.queue.qsize() + 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.waiting_for_keyframe = True
+            return True
+        self.queue.put_nowait((packet, keyframe))
+        return False
+
+
+class VideoBroadcastHub:
+    """카메라별 H.264 인코더와 /ws/video 구독자. 인코딩은 video_encode 스레드, fan-out은 event loop"""
+    def __init__(self):
+        self.loop = None
+        self.subscribers = {} # camera key -> set(VideoSubscriber)
+        self.encoders = {}    # camera key -> H264StreamEncoder (첫 구독 시 생성, 이후 유지)
+        self.stats = {}       # camera key -> {"frames", "keyframes", "bytes"}
+        self._seq = {}
+        self._restarting = set() # restart_threadsafe()가 예약했지만 아직 처리 전인 카메라
+        # encoder 루프가 읽는 구독자가 있는 카메라. 통째로 교체하므로 lock 없이 읽어도 안전
+        self.demanded_cameras = frozenset()
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+
+    def _refresh_demand(self):
+        self.demanded_cameras = frozenset(cam_key for cam_key, subscribers in self.subscribers.items() if subscribers)
+
+    def subscribe(self, websocket: WebSocket, cam_key: str) -> VideoSubscriber:
+        encoder = self.encoders.get(cam_key)
+        if encoder is None:
+            config = SHM_CONFIG[cam_key]
+            segment = shm_segments[cam_key]
+            shape = segment.shape if segment.attached else config.get("shape") # 인코더 해상도 = 지금 producer 해상도
+            if shape is None:
+                raise ValueError(f"SHM segment for {cam_key} is not attached yet")
+            height, width = shape[:2]
+            encoder = H264StreamEncoder(
+                width, height, VIDEO_STREAM_FPS, config.get("video_bitrate", VIDEO_STREAM_BITRATE),
+                config.get("video_keyframe_interval", VIDEO_KEYFRAME_INTERVAL),
+            )
+            self.encoders[cam_key] = encoder
+            self.stats[cam_key] = {"frames": 0, "keyframes": 0, "bytes": 0}
+        subscriber = VideoSubscriber(websocket, cam_key)
+        self.subscribers.setdefault(cam_key, set()).add(subscriber)
+        encoder.request_keyframe() # 새 클라이언트가 다음 GOP까지 기다리지 않도록
+        self._refresh_demand()
+        return subscriber
+
+    def unsubscribe(self, subscriber: VideoSubscriber):
+        self.subscribers.get(subscriber.cam_key, set()).discard(subscriber)
+        self._refresh_demand()
+
+    def restart_threadsafe(self, cam_key: str, reason: str):
+        """video_encode 스레드에서 호출: 이 카메라의 인코더를 버리고 구독자 연결을 닫는다 (1012). 다시 연결하면 새 해상도로 시작"""
+        loop = self.loop
+        if loop is None or loop.is_closed() or cam_key in self._restarting:
+            return
+        self._restarting.add(cam_key)
+        try:
+            loop.call_soon_threadsafe(self._restart, cam_key, reason)
+        except RuntimeError: # loop가 이미 닫힘 (shutdown 중)
+            self._restarting.discard(cam_key)
+
+    def _restart(self, cam_key: str, reason: str):
+        self.encoders.pop(cam_key, None)
+        self._restarting.discard(cam_key)
+        log_info(f"/ws/video/{cam_key}: {reason}; closing {len(self.subscribers.get(cam_key, ()))} client(s) to restart the stream")
+        for subscriber in self.subscribers.get(cam_key, ()):
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            subscriber.queue.put_nowait((None, reason)) # send loop가 알리고 연결을 닫음
+
+    def publish_threadsafe(self, cam_key: str, packets, capture_stamp_ns: int):
+        """video_encode 스레드에서 호출 (packet 순서가 중요하므로 image_hub처럼 합치지 않고 매번 예약)"""
+        loop = self.loop
+        if loop is None or loop.is_closed() or not packets:
+            return
+        try:
+            loop.call_soon_threadsafe(self._publish, cam_key, packets, capture_stamp_ns)
+        except RuntimeError: # loop가 이미 닫힘 (shutdown 중)
+            pass
+
+    def _publish(self, cam_key: str, packets, capture_stamp_ns: int):
+        stats = self.stats[cam_key]
+        for data, keyframe, pts in packets:
+            seq = self._seq.get(cam_key, 0) + 1
+            self._seq[cam_key] = seq
+            message = pack_video_packet(seq, keyframe, pts, capture_stamp_ns, data)
+            stats["frames"] += 1
+            stats["keyframes"] += int(keyframe)
+            stats["bytes"] += len(data)
+            need_keyframe = False
+            for subscriber in self.subscribers.get(cam_key, ()):
+                need_keyframe |= subscriber.offer(message, keyframe)
+            if need_keyframe and cam_key in self.encoders:
+                self.encoders[cam_key].request_keyframe()
+
+
+video_hub = VideoBroadcastHub()
+
+# --- DVR Ring Buffers ---
+# '/robot_to_gui' (GuiValue) sample layout. '/slave_info'는 teleop_codec packed record 그대로 (CONTROL_VALUE_DTYPE)
+GUI_TELEMETRY_DTYPE = np.dtype([
+    ("battery", "<f8"), ("linear_speed", "<f8"), ("angular_speed", "<f8"), ("gripper_opening", "<f8"),
+    ("joint_angles", "<f8", (6,)), ("cartesian_position", "<f8", (6,)), ("force_sensor", "<f8", (6,)),
+])
+DVR_VARIANT = (DVR_JPEG_LEVEL, None, None) # (level, roi, size): 원본 해상도 전체
+DVR_VARIANTS = frozenset({DVR_VARIANT})
+dvr_frames = {
+    key: FrameRing(int(DVR_SECONDS * DVR_MAX_FPS), DVR_CAMERA_MAX_BYTES, DVR_SECONDS) for key in DVR_CAMERAS if key in SHM_CONFIG
+} if ENABLE_DVR else {}
+dvr_telemetry = {
+    stream: TelemetryRing(dtype, int(DVR_SECONDS * DVR_TELEMETRY_MAX_HZ))
+    for stream, dtype in (("slave_info", CONTROL_VALUE_DTYPE), ("robot_to_gui", GUI_TELEMETRY_DTYPE))
+} if ENABLE_DVR else {}
+
+
+def _encoder_demand():
+    """카메라별 인코딩할 variant: /ws/image 구독자 요청 + DVR_CAMERAS의 DVR 보관용 variant"""
+    demand = image_hub.demanded_variants
+    if not dvr_frames:
+        return demand
+    demand = dict(demand)
+    for key in dvr_frames:
+        demand[key] = demand.get(key, frozenset()) | DVR_VARIANTS
+    return demand
+
+
+def _dvr_append_frames(encoded_images: dict, capture_stamp_ns: int):
+    """encoder 스레드에서 호출. 새로 인코딩된 DVR variant만 보관 (변화 없어 재사용된 bytes는 FrameRing이 건너뜀)"""
+    now_ns = time.time_ns()
+    for cam_key, ring in dvr_frames.items():
+        encoded_variants = encoded_images.get(cam_key)
+        data = encoded_variants.get(DVR_VARIANT) if encoded_variants else None
+        if data:
+            ring.append(now_ns, data, capture_stamp_ns)
+
+# --- Teleop Command Gate ---
+# /ws/ros_teleop_bridge master 명령은 받은 순서대로 전부 publish하지 않고, 연결마다 가장 최근 명령 하나만 보관했다가 publish.
+# 네트워크가 잠깐 멈췄다가 한꺼번에 들어온 명령을 로봇이 하나씩 재생하지 않도록 한다.
+# 명령 stamp 기준으로 거르는 조건 (stamp가 없거나 0이면 검사하지 않음):
+#   - 직전에 publish한 stamp보다 새롭지 않으면 drop (순서 뒤집힘/중복)
+#   - 이 연결에서 본 가장 작은 지연(수신 시각 - stamp)보다 TELEOP_MAX_COMMAND_AGE_S 이상 늦으면 drop (오래된 명령)
+#     master와 서버의 시계가 달라도(ROS sim time 등) 상대 지연만 보므로 동작한다. 0이면 나이 검사 안 함
+TELEOP_MAX_COMMAND_AGE_S = 0.2
+
+teleop_command_stats = {"received": 0, "published": 0, "coalesced": 0, "dropped_stale": 0, "dropped_out_of_order": 0, "invalid": 0}
+REGISTRY.register_callback(
+    "momad_teleop_commands_total", "Master commands on /ws/ros_teleop_bridge by outcome", "counter", ("result",),
+    lambda: [((result,), count) for result, count in teleop_command_stats.items()],
+)
+
+class TeleopCommandGate:
+    """연결별 master 명령 수신함. reader가 offer()로 계속 덮어쓰고, publisher는 take()로 가장 최근 것만 가져간다.
+    event loop에서만 사용"""
+    def __init__(self, max_age_s: float = TELEOP_MAX_COMMAND_AGE_S):
+        self.max_age_s = max_age_s
+        self.pending = None # (websocket 메시지, 수신 시각 time.time())
+        self.ready = asyncio.Event()
+        self.closed = False
+        self.last_stamp = None
+        self.min_delay_s = None
+        self.stats = {key: 0 for key in teleop_command_stats}
+
+    def _count(self, key: str):
+        self.stats[key] += 1
+        teleop_command_stats[key] += 1
+
+    def offer(self, message: dict):
+        self._count("received")
+        if self.pending is not None:
+            self._count("coalesced") # 아직 publish 안 된 명령을 더 새 명령이 덮어씀
+        self.pending = (message, time.time())
+        self.ready.set()
+
+    def close(self):
+        self.closed = True
+        self.ready.set()
+
+    def take(self):
+        pending, self.pending = self.pending, None
+        self.ready.clear()
+        return pending
+
+    def check(self, stamp: float, received_at: float) -> bool:
+        """publish해도 되는 명령이면 True (거른 경우 카운터 증가)"""
+        if not stamp:
+            return True
+        if self.last_stamp is not None and stamp <= self.last_stamp:
+            self._count("dropped_out_of_order")
+            return False
+        delay = received_at - stamp
+        if self.min_delay_s is None or delay < self.min_delay_s:
+            self.min_delay_s = delay
+        if self.max_age_s > 0 and time.time() - stamp - self.min_delay_s > self.max_age_s:
+            self._count("dropped_stale")
             return False
+        return True
+
+    def reject_invalid(self):
+        """디코딩할 수 없는 명령 (publish하지 않음)"""
+        self._count("invalid")
+
+    def mark_published(self, stamp: float):
+        self._count("published")
+        if stamp:
+            self.last_stamp = stamp
+
+# --- Shared Memory Utility Functions ---
+def _refresh_shared_memory() -> int:
+    """카메라마다 attach 상태를 확인하고 바뀐 것만 다시 attach (producer가 늦게 뜨거나, 재시작하거나, 내려간 경우).
+    인코딩 중인 카메라는 그 카메라 lock에서 기다림. attach된 세그먼트 수를 반환"""
+    for key, segment in shm_segments.items():
+        if not segment.changed(): # stat + 헤더 generation만 확인 (lock 없이)
+            continue
+        with shm_lock, shm_segment_locks[key]:
+            previous_state, previous_error = segment.state, segment.error
+            event = segment.refresh()
+            if event in ("attached", "reattached"):
+                camera_encoders[key].reset()
+        if event in ("attached", "reattached"):
+            if "shape" in IMAGE_CAMERA_FORMATS[key]: # depth: 클라이언트가 raw16을 풀 때 쓰는 해상도
+                IMAGE_CAMERA_FORMATS[key]["shape"] = list(segment.shape[:2])
+            log_info(f"{'Re-attached' if event == 'reattached' else 'Attached'} SHM '{segment.name}' "
+                     f"({'seqlock, ' + str(segment.reader.layout.num_slots) + ' slots' if segment.reader is not None else 'raw'}, "
+                     f"shape: {segment.shape}, dtype: {segment.dtype})")
+        elif event == "detached":
+            log_warn(f"SHM '{segment.name}' was removed by its producer; waiting for it to come back.")
+        elif event == "error" and segment.error != previous_error:
+            log_error(f"Failed to attach SHM '{segment.name}': {segment.error}")
+        elif event == "missing" and previous_state != "missing":
+            log_warn(f"SHM '{segment.name}' not found. Producer (e.g., Isaac Sim) must create it first.")
+        if event != "missing" and not (event == "error" and previous_state == "error"):
+            SHM_ATTACH_EVENTS.labels(key, event).inc()
+    return sum(segment.attached for segment in shm_segments.values())
 
 
 def _cleanup_shared_memory():
     log_info("Closing shared memory segments (consumer side)...")
     with shm_lock:
-        for key in list(shm_segments.keys()): # Iterate over a copy of keys for safe removal
-            shm = shm_segments.pop(key, None)
-            shm_np_arrays.pop(key, None)
-            if shm is None: continue
-            try:
-                shm.close()
-                log_debug(f"Closed SHM: {SHM_CONFIG[key]['name']}")
-            except Exception as e:
-                log_error(f"Error closing SHM {SHM_CONFIG[key]['name']}: {e}")
+        for key, segment in shm_segments.items():
+            with shm_segment_locks[key]: # 인코딩 중인 카메라는 끝날 때까지 대기
+                segment.close()
     log_info("Shared memory segments closed by consumer.")
 
 # --- ROS 2 Node Definition ---
@@ -249,80 +1192,89 @@ class MergedROSNode(Node):
         self.dataset_settings_pub = self.create_publisher(String, '/dataset_settings', qos)
         self.recording_state_pub = self.create_publisher(String, '/recording_state', 10)
         
-        # Subscriptions
-        self.create_subscription(Header, "/image_signal", self.image_signal_callback, 10) # SHM에 이미지 저장 시 콜백
-        self.create_subscription(GuiValue, "/robot_to_gui", self.robot_to_gui_callback, 10)
-        self.create_subscription(Float32MultiArray, "/cartesian_position", self.cartesian_callback, 10) # 이후 웹소켓으로 받기
+        # Subscriptions (replay 모드에서는 에피소드 재생 스레드가 같은 콜백을 대신 호출)
+        if REPLAY_EPISODE is None:
+            self.create_subscription(Header, "/image_signal", self._timed_callback("/image_signal", self.image_signal_callback), 10) # SHM에 이미지 저장 시 콜백
+            self.create_subscription(GuiValue, "/robot_to_gui", self._timed_callback("/robot_to_gui", self.robot_to_gui_callback), 10)
+        self.create_subscription(Float32MultiArray, "/cartesian_position", self._timed_callback("/cartesian_position", self.cartesian_callback), 10) # 이후 웹소켓으로 받기
 
         # Subscription from server_node.py for the teleop bridge
-        self.create_subscription(ControlValue, '/slave_info', self.slave_info_bridge_callback, 10)
+        if REPLAY_EPISODE is None:
+            self.create_subscription(ControlValue, '/slave_info', self._timed_callback('/slave_info', self.slave_info_bridge_callback), 10)
         
         log_info("MergedROSNode initialized with publishers and subscribers.")
 
+    @staticmethod
+    def _timed_callback(topic: str, callback):
+        """콜백 실행 시간을 momad_ros_callback_seconds{topic}에 기록 (count가 곧 수신 메시지 수)"""
+        duration = ROS_CALLBACK_SECONDS.labels(topic)
+        def timed(msg):
+            started = time.perf_counter()
+            try:
+                callback(msg)
+            finally:
+                duration.observe(time.perf_counter() - started)
+        return timed
+
     def image_signal_callback(self, msg: Header):
-        global last_received_signal_stamp_ns, image_signal_event
+        global last_received_signal_stamp_ns, last_signal_trace, image_signal_event
         # log_debug(f"Signal: stamp={msg.stamp.sec}.{msg.stamp.nanosec:09d}, frame_id='{msg.frame_id}'")
         if msg.frame_id == "new_images_ready":
+            received_perf_ns = time.perf_counter_ns()
+            capture_stamp_ns = (msg.stamp.sec * 1_000_000_000) + msg.stamp.nanosec
+            signal_latency_ms = (self.get_clock().now().nanoseconds - capture_stamp_ns) / 1_000_000
             with signal_stamp_lock:
-                last_received_signal_stamp_ns = (msg.stamp.sec * 1_000_000_000) + msg.stamp.nanosec
+                last_received_signal_stamp_ns = capture_stamp_ns
+                last_signal_trace = (signal_latency_ms, received_perf_ns)
             image_signal_event.set()
             
     def robot_to_gui_callback(self, msg: GuiValue):
         """Callback for GuiValue messages from Isaac Sim to GUI."""
-        global sensor_data
-        with sensor_data_lock:
-            sensor_data["battery"] = msg.battery
-            sensor_data["linear_speed"] = msg.linear_accel
-            sensor_data["angular_speed"] = msg.steer
-            sensor_data["gripper_opening"] = msg.gripper_opening
-            sensor_data["joint_angles"] = list(msg.joint_angles)
-            sensor_data["cartesian_position"] = list(msg.cartesian_position)
-            sensor_data["force_sensor"] = list(msg.force_torque)            
+        _update_sensor_data({
+            "battery": msg.battery,
+            "linear_speed": msg.linear_accel,
+            "angular_speed": msg.steer,
+            "gripper_opening": msg.gripper_opening,
+            "joint_angles": tuple(msg.joint_angles),
+            "cartesian_position": tuple(msg.cartesian_position),
+            "force_sensor": tuple(msg.force_torque),
+        })
+        if ENABLE_DVR:
+            try:
+                dvr_telemetry["robot_to_gui"].append(time.time_ns(), (
+                    msg.battery, msg.linear_accel, msg.steer, msg.gripper_opening,
+                    tuple(msg.joint_angles), tuple(msg.cartesian_position), tuple(msg.force_torque),
+                ))
+            except ValueError as e: # 배열 길이가 GUI_TELEMETRY_DTYPE과 다름
+                log_debug(f"DVR: skipped /robot_to_gui sample: {e}")
         # log_debug(f"Received GuiValue: {msg}")
 
     # Callback from server_node.py for the teleop bridge
     def slave_info_bridge_callback(self, msg: ControlValue):
-        """'/slave_info' 콜백: 들어온 데이터를 slave_bridge_data에 저장"""
+        """'/slave_info' 콜백: 들어온 데이터로 새 slave_bridge_data snapshot을 발행 (1 kHz로 들어올 수 있음)"""
         global slave_bridge_data
-        with slave_bridge_data_lock:
-            slave_bridge_data = {
-                "stamp": msg.stamp,
-                "RobotarmValue": {
-                    "position": list(msg.robotarm_state.position),
-                    "velocity": list(msg.robotarm_state.velocity),
-                    "force":    list(msg.robotarm_state.force),
-                },
-                "GripperValue": {
-                    "position": msg.gripper_state.position,
-                    "velocity": msg.gripper_state.velocity,
-                    "force":    msg.gripper_state.force,
-                },
-                "MobileValue": {
-                    "linear_accel": msg.mobile_state.linear_accel,
-                    "linear_brake": msg.mobile_state.linear_brake,
-                    "steer": msg.mobile_state.steer,
-                    "gear": msg.mobile_state.gear
-                }
-            }
-        log_debug(f"Updated slave_bridge_data from /slave_info: stamp {msg.stamp}")
-        global sensor_data
+        # 메시지 -> packed bytes 한 번 (dict/list는 실제로 보낼 때만 만듦)
+        slave_bridge_data = SlaveBridgeSnapshot(slave_bridge_data.seq + 1, msg.stamp, pack_control_value_msg(msg))
+        slave_bridge_notifier.notify_threadsafe()
+        if ENABLE_DVR:
+            dvr_telemetry["slave_info"].append(time.time_ns(), slave_bridge_data.raw)
         
-        with sensor_data_lock:
-            sensor_data["robot_status"] = "AUTO"  # 예시로 상태 업데이트
-            # sensor_data["battery"] = msg.battery
-            sensor_data["linear_speed"] = msg.mobile_state.linear_accel
-            sensor_data["angular_speed"] = msg.mobile_state.steer
-            sensor_data["gripper_opening"] = np.clip((100.0 - msg.gripper_state.position)*1.5, 0.0, 150.0)  # 예시 변환
-            sensor_data["joint_angles"] = list(msg.robotarm_state.position)
-            # sensor_data["cartesian_position"] = list(msg.cartesian_position)
-            sensor_data["force_sensor"] = list(msg.robotarm_state.force)            
+        gripper, mobile = msg.gripper_state, msg.mobile_state
+        _update_sensor_data({
+            "robot_status": "AUTO",  # 예시로 상태 업데이트
+            # "battery": msg.battery,
+            "linear_speed": mobile.linear_accel,
+            "angular_speed": mobile.steer,
+            "gripper_opening": float(min(max((100.0 - gripper.position)*1.5, 0.0), 150.0)),  # 예시 변환
+            "joint_angles": tuple(msg.robotarm_state.position),
+            # "cartesian_position": list(msg.cartesian_position),
+            "force_sensor": tuple(msg.robotarm_state.force),
+        })
         # log_debug(f"Received GuiValue: {msg}")
 
     def cartesian_callback(self, msg: Float32MultiArray):
         """Cartesian position 콜백 (필요시 사용)"""
-        global sensor_data
-        with sensor_data_lock:
-            sensor_data["cartesian_position"] = list(msg.data)
+        _update_sensor_data({"cartesian_position": tuple(msg.data)})
         # log_debug(f"Received Cartesian Position: {msg.data}")
 
 
@@ -380,93 +1332,501 @@ def ros2_thread_spin():
         # rclpy.try_shutdown() will be called in FastAPI shutdown event
         log_info("ROS 2 node spin ended.")
 
+# --- Dataset Recorder ---
+# ENABLE_DATASET_RECORDER일 때만 startup_event에서 만듦 (writer 스레드를 띄우므로 import 시점에는 만들지 않음). 꺼져 있으면 None
+dataset_recorder = None
+
+def _start_dataset_recorder():
+    global dataset_recorder
+    dataset_recorder = DatasetRecorder()
+    with dataset_settings_lock:
+        if str(dataset_settings["fileFormat"]).lower() not in RECORDER_FORMATS: # 외부 recorder node용 기본값 (json)
+            dataset_settings["fileFormat"] = RECORDER_DEFAULT_FORMAT
+    log_info(f"Dataset recorder enabled (formats: {available_formats()}, default: {dataset_settings['fileFormat']})")
+
+def _recorder_config() -> dict:
+    """/ws/setting 연결 시 UI에 알리는 recorder 설정. 꺼져 있으면 UI는 외부 recorder node용 형식 목록을 그대로 씀"""
+    if dataset_recorder is None:
+        return {"type": "recorder_config", "enabled": False}
+    with dataset_settings_lock:
+        file_format = dataset_settings["fileFormat"]
+    return {"type": "recorder_config", "enabled": True, "formats": available_formats(), "fileFormat": file_format}
+
+# dataset_settings["robotArm"/"mobile"] 항목 -> '/slave_info' ControlValue record의 열
+# arm "current"는 ControlValue의 force (slave 관절 토크/전류), mobile 속도는 /ws/data와 같은 linear_accel/steer
+_RECORDER_CONTROL_FIELDS = {
+    ("robotArm", "position"): ("arm_position", lambda record: record["arm_position"]),
+    ("robotArm", "velocity"): ("arm_velocity", lambda record: record["arm_velocity"]),
+    ("robotArm", "current"): ("arm_current", lambda record: record["arm_force"]),
+    ("robotArm", "gripper"): ("gripper", lambda record: record["gripper"]),
+    ("mobile", "linearVelocity"): ("mobile_linear_velocity", lambda record: record["mobile"][:, 0]),
+    ("mobile", "angularVelocity"): ("mobile_angular_velocity", lambda record: record["mobile"][:, 2]),
+}
+# 이 서버에 데이터가 없는 항목 (선택해도 녹화되지 않고 status의 "unavailable"로 알려줌)
+_RECORDER_UNAVAILABLE = (("mobile", "odom"), ("sensors", "lidar"))
+
+
+def _control_value_source(fields: dict) -> RecordSource:
+    """slave_bridge_data의 packed record를 sample마다 그대로 복사하고, 저장할 때 고른 열만 꺼냄"""
+    def fill(row):
+        snapshot = slave_bridge_data
+        if snapshot.seq == 0: # 아직 '/slave_info'를 받지 못함
+            return None
+        row[:] = np.frombuffer(snapshot.raw, dtype=np.uint8)
+        return int(snapshot.stamp * 1_000_000_000)
+
+    def split(block):
+        record = block.view(CONTROL_VALUE_DTYPE)[:, 0]
+        return {name: np.ascontiguousarray(select(record)) for name, select in fields.values()}
+
+    return RecordSource("control_value", (CONTROL_VALUE_STRUCT.size,), np.uint8, fill, split)
+
+
+def _shm_camera_source(name: str, cam_id_key: str) -> RecordSource:
+    """SHM view에서 chunk row로 바로 복사 (seqlock이면 최신 완성 슬롯, 복사 중 덮어써지면 한 번 더).
+    열 shape/dtype은 녹화 시작 때 세그먼트 기준. 녹화 중 producer가 해상도를 바꾸면 그 뒤 sample은 missing"""
+    segment = shm_segments[cam_id_key]
+    config = SHM_CONFIG[cam_id_key]
+    shape = segment.shape if segment.attached else config.get("shape")
+    dtype = segment.dtype if segment.attached else config.get("dtype")
+    if shape is None or dtype is None: # seqlock 전용 카메라인데 아직 attach 전: 열 크기를 알 수 없음
+        return None
+    shape, dtype = tuple(shape), np.dtype(dtype)
+
+    def fill(row):
+        with shm_segment_locks[cam_id_key]:
+            if segment.shape != shape or segment.dtype != dtype: # detach 상태이거나 해상도가 바뀜
+                return None
+            reader = segment.reader
+            if reader is not None:
+                for _ in range(2):
+                    frame = reader.read_latest()
+                    if frame is None:
+                        return None
+                    frame_seq, stamp_ns, view = frame
+                    np.copyto(row, view)
+                    if reader.is_valid(frame_seq):
+                        return stamp_ns
+                return None
+            np.copyto(row, segment.view)
+            return last_received_signal_stamp_ns or 0
+
+    return RecordSource(name, shape, dtype, fill)
+
+
+def _recorder_sources(settings: dict):
+    """(sources, 선택했지만 녹화할 수 없는 항목 list)"""
+    fields = {key: column for key, column in _RECORDER_CONTROL_FIELDS.items() if settings.get(key[0], {}).get(key[1])}
+    sources = [_control_value_source(fields)] if fields else []
+    unavailable = [f"{group}.{key}" for group, key in _RECORDER_UNAVAILABLE if settings.get(group, {}).get(key)]
+    for name, cam_id_key in RECORDER_CAMERAS.items():
+        if settings["sensors"].get(name) and cam_id_key in SHM_CONFIG:
+            source = _shm_camera_source(name, cam_id_key)
+            if source is None:
+                unavailable.append(f"sensors.{name}")
+            else:
+                sources.append(source)
+    return sources, unavailable
+
+
+def _start_recording():
+    with dataset_settings_lock:
+        settings = json.loads(json.dumps(dataset_settings)) # 녹화 중 설정이 바뀌어도 이 에피소드에는 영향 없음
+    sources, unavailable = _recorder_sources(settings)
+    if not sources:
+        raise ValueError("no recordable streams selected in dataset settings")
+    directory = os.path.expanduser(str(settings["savePath"]))
+    dataset_recorder.start(
+        sources, hz=float(settings["HZ"]), file_format=settings["fileFormat"], directory=directory,
+        name=str(settings["fileName"]),
+        meta={"task": settings["saveTask"], "settings": settings, "cameras": {
+            source.name: RECORDER_CAMERAS[source.name] for source in sources if source.name in RECORDER_CAMERAS
+        }, "unavailable": unavailable},
+    )
+    if unavailable:
+        log_warn(f"Recording without {unavailable}: not available in this server")
+    log_info(f"Recording started: {[source.name for source in sources]} at {dataset_recorder.status()['target_hz']} Hz")
+
+
+def _recording_status() -> dict:
+    if dataset_recorder is None:
+        return {"type": "recording_status", "state": "disabled"}
+    status = dataset_recorder.status()
+    status["type"] = "recording_status"
+    return status
+
+
+async def _setting_status_loop(websocket: WebSocket):
+    """녹화 중에는 RECORDER_STATUS_INTERVAL_S마다 record rate / drop 통계를 보냄"""
+    while True:
+        await asyncio.sleep(RECORDER_STATUS_INTERVAL_S)
+        if dataset_recorder is not None and dataset_recorder.recording:
+            await _ws_send_json(websocket, "/ws/setting", _recording_status())
+
+
+async def _handle_recording_command(msg_type: str):
+    """start/save/discard를 서버 recorder에 적용 (sampling 스레드 join, 파일 확정은 event loop 밖에서)"""
+    if msg_type == "start_recording":
+        await asyncio.to_thread(_start_recording)
+    elif msg_type == "save_recording":
+        path = await asyncio.to_thread(dataset_recorder.save)
+        log_info(f"Recording saved: {path} ({dataset_recorder.status()['samples']} samples)")
+    else:
+        await asyncio.to_thread(dataset_recorder.discard)
+        log_info("Recording discarded")
+
+
 # --- GUI to Server data --- # 
 @app.websocket("/ws/setting")
 async def websocket_save_interval(websocket: WebSocket):
-    global dataset_settings, getting_state
     await websocket.accept()
+    WS_CLIENTS.labels("/ws/setting").inc()
     log_info(f"Client {websocket.client} connected to /ws/setting")
+    status_task = asyncio.create_task(_setting_status_loop(websocket))
     try:
-        while True:
-            msg = await websocket.receive_text()
+        await _ws_send_json(websocket, "/ws/setting", _recorder_config()) # UI가 형식 목록/기본값을 맞추도록
+        await _setting_recv_loop(websocket)
+    except Exception as e:
+        log_warn(f"/ws/setting closed: {e}")
+    finally:
+        status_task.cancel()
+        WS_CLIENTS.labels("/ws/setting").dec()
+        log_info(f"Client {websocket.client} disconnected from /ws/setting")
 
-            # JSON only (legacy 제거)
-            try:
-                payload = json.loads(msg)
-            except json.JSONDecodeError:
-                await websocket.send_text("ERROR: Only JSON payloads are supported.")
+
+async def _setting_recv_loop(websocket: WebSocket):
+    global dataset_settings, getting_state
+    while True:
+        msg = await websocket.receive_text()
+
+        # JSON only (legacy 제거)
+        try:
+            payload = json.loads(msg)
+        except json.JSONDecodeError:
+            await _ws_send_text(websocket, "/ws/setting", "ERROR: Only JSON payloads are supported.")
+            continue
+        msg_type = payload.get("type")
+
+        # === 데이터셋 설정 수신 ===
+        if msg_type == "dataset_setting":
+            file_format = payload.get("fileFormat")
+            if dataset_recorder is not None and file_format is not None and str(file_format).lower() not in RECORDER_FORMATS:
+                # 서버 recorder가 쓸 수 없는 형식을 받아 두면 녹화가 조용히 npz로 저장되므로 설정 전체를 거부
+                await _ws_send_text(websocket, "/ws/setting",
+                                    f"ERROR: unsupported fileFormat {file_format!r} (supported: {', '.join(RECORDER_FORMATS)})")
                 continue
-            msg_type = payload.get("type")
-
-            # === 데이터셋 설정 수신 ===
-            if msg_type == "dataset_setting":
-                with dataset_settings_lock:
-                    dataset_settings.update({
-                        "robotArm":    payload.get("robotArm", dataset_settings["robotArm"]),
-                        "mobile":      payload.get("mobile", dataset_settings["mobile"]),
-                        "sensors":     payload.get("sensors", dataset_settings["sensors"]),
-                        "HZ": payload.get("Hertz", dataset_settings["HZ"]),
-                        "savePath":    payload.get("savePath", dataset_settings["savePath"]),
-                        "saveTask":    payload.get("saveTask", dataset_settings["saveTask"]),
-                        "fileName":    payload.get("fileName", dataset_settings["fileName"]),
-                        "fileFormat":  payload.get("fileFormat", dataset_settings["fileFormat"]),                        
-                    })
-                    local_copy = dict(dataset_settings)  # ROS publish용 스냅샷
-
-                log_info(f"✅ Dataset settings updated: {dataset_settings}")
-
-                # ROS2 퍼블리시
+            with dataset_settings_lock:
+                dataset_settings.update({
+                    "robotArm":    payload.get("robotArm", dataset_settings["robotArm"]),
+                    "mobile":      payload.get("mobile", dataset_settings["mobile"]),
+                    "sensors":     payload.get("sensors", dataset_settings["sensors"]),
+                    "HZ": payload.get("Hertz", dataset_settings["HZ"]),
+                    "savePath":    payload.get("savePath", dataset_settings["savePath"]),
+                    "saveTask":    payload.get("saveTask", dataset_settings["saveTask"]),
+                    "fileName":    payload.get("fileName", dataset_settings["fileName"]),
+                    "fileFormat":  payload.get("fileFormat", dataset_settings["fileFormat"]),                        
+                })
+                local_copy = dict(dataset_settings)  # ROS publish용 스냅샷
+
+            log_info(f"✅ Dataset settings updated: {dataset_settings}")
+
+            # ROS2 퍼블리시
+            if ros2_node:
+                try:
+                    ros2_node.dataset_settings_publish(local_copy)
+                except Exception as e:
+                    log_error(f"Failed to publish dataset settings to ROS: {e}")
+            else:
+                log_warn("ROS node not ready; skipped publishing /dataset_settings")
+
+            await _ws_send_text(websocket, "/ws/setting", "ACK: dataset settings updated")
+            continue
+
+        # === recording_state ===
+        elif msg_type in ("start_recording", "save_recording", "discard_recording"):
+            try:
+                log_info(f"✅ Recording command received: {msg_type}")
+
                 if ros2_node:
                     try:
-                        ros2_node.dataset_settings_publish(local_copy)
+                        ros2_node.recording_state_publish(msg_type)
                     except Exception as e:
-                        log_error(f"Failed to publish dataset settings to ROS: {e}")
+                        log_error(f"Failed to publish dataset command to ROS: {e}")
                 else:
                     log_warn("ROS node not ready; skipped publishing /dataset_settings")
 
-                await websocket.send_text("ACK: dataset settings updated")
-                continue
+                if dataset_recorder is not None:
+                    await _handle_recording_command(msg_type)
+                await _ws_send_text(websocket, "/ws/setting", f"ACK: {msg_type}")
+                if dataset_recorder is not None:
+                    await _ws_send_json(websocket, "/ws/setting", _recording_status())
 
-            # === recording_state ===
-            elif msg_type in ("start_recording", "save_recording", "discard_recording"):
-                try:
-                    log_info(f"✅ Recording command received: {msg_type}")
+            except Exception as e:
+                log_error(f"Recording command {msg_type} failed: {e}")
+                await _ws_send_text(websocket, "/ws/setting", f"ERROR: {e}")
+            continue
 
-                    if ros2_node:
-                        try:
-                            ros2_node.recording_state_publish(msg_type)
-                        except Exception as e:
-                            log_error(f"Failed to publish dataset command to ROS: {e}")
-                    else:
-                        log_warn("ROS node not ready; skipped publishing /dataset_settings")
+        # === recorder 통계 요청 ===
+        elif msg_type == "recording_status":
+            await _ws_send_json(websocket, "/ws/setting", _recording_status())
+            continue
+        # === 잘못된 type ===
+        else:
+            await _ws_send_text(websocket, "/ws/setting", "ERROR: unknown payload type")
+            continue
 
-                    await websocket.send_text(f"ACK: {msg_type}")
 
-                except Exception as e:
-                    await websocket.send_text(f"ERROR: {e}")
-                continue
-            # === 잘못된 type ===
-            else:
-                await websocket.send_text("ERROR: unknown payload type")
-                continue
+# --- Episode Replay ---
+replay_segments = {} # cam_id_key -> (SharedMemory, SeqlockWriter): replay 모드에서 서버가 producer 역할
+replay_stop = threading.Event()
+replay_thread = None
+replay_stats = {
+    "state": "off", "episode": None, "speed": REPLAY_SPEED, "loop": REPLAY_LOOP, "rows": 0, "hz": 0.0,
+    "cameras": {}, "started": None, "rows_played": 0, "loops": 0, "frames": {}, "control_values": 0,
+    "behind_ms": 0.0, "error": None,
+}
+
 
+def _replay_cameras(episode: EpisodeReader) -> dict:
+    """{에피소드 열: cam_id_key}: 녹화 때 카메라 매핑 (meta "cameras") 중 이 서버 SHM_CONFIG에 있는 것"""
+    return {
+        column: cam_id_key for column, cam_id_key in episode.meta.get("cameras", {}).items()
+        if column in episode.columns and cam_id_key in SHM_CONFIG
+    }
+
+
+def _load_replay_control(record: ControlValueRecord, block: dict, row: int):
+    """에피소드 열 -> ControlValue record (_RECORDER_CONTROL_FIELDS의 반대). 녹화하지 않은 필드는 기본값"""
+    record.reset()
+    for column, target in (("arm_position", record.arm_position), ("arm_velocity", record.arm_velocity),
+                           ("arm_current", record.arm_force), ("gripper", record.gripper)):
+        if column in block:
+            target[:] = block[column][row].tolist()
+    if "mobile_linear_velocity" in block:
+        record.mobile[0] = float(block["mobile_linear_velocity"][row])
+    if "mobile_angular_velocity" in block:
+        record.mobile[2] = float(block["mobile_angular_velocity"][row])
+    record.stamp = time.time() # live /slave_info처럼 보낸 시각
+
+
+class _ReplayRow:
+    """row 하나를 live source처럼 내보냄: 새 프레임이면 SHM에 쓰고 /image_signal 콜백, 새 ControlValue면 /slave_info 콜백.
+    recorder가 같은 프레임/값을 여러 row에 sampling한 경우 (source stamp가 같음) 다시 보내지 않는다"""
+    def __init__(self, cameras: dict):
+        self.cameras = cameras
+        self.signal_callback = MergedROSNode._timed_callback("/image_signal", ros2_node.image_signal_callback)
+        self.slave_callback = MergedROSNode._timed_callback("/slave_info", ros2_node.slave_info_bridge_callback)
+        self.record = ControlValueRecord()
+        self.msg = ControlValue()
+        self.last_stamps = {}
+
+    def _is_new(self, block: dict, source: str, row: int) -> bool:
+        if not block[f"{source}_valid"][row]:
+            return False
+        stamp_ns = int(block[f"{source}_stamp_ns"][row])
+        if stamp_ns and stamp_ns == self.last_stamps.get(source):
+            return False
+        self.last_stamps[source] = stamp_ns
+        return True
+
+    def emit(self, block: dict, row: int):
+        now_ns = time.time_ns()
+        wrote_frame = False
+        for column, cam_id_key in self.cameras.items():
+            if self._is_new(block, column, row):
+                replay_segments[cam_id_key][1].write(block[column][row], now_ns)
+                replay_stats["frames"][column] += 1
+                wrote_frame = True
+        if wrote_frame:
+            header = Header()
+            header.stamp.sec, header.stamp.nanosec = divmod(now_ns, 1_000_000_000)
+            header.frame_id = "new_images_ready"
+            self.signal_callback(header)
+        if "control_value_valid" in block and self._is_new(block, "control_value", row):
+            _load_replay_control(self.record, block, row)
+            self.record.fill_ros(self.msg)
+            self.slave_callback(self.msg)
+            replay_stats["control_values"] += 1
+
+
+def _replay_pass(episode: EpisodeReader, replay_row: _ReplayRow) -> bool:
+    """에피소드 한 번 재생. row 간격 = 녹화 sampling 시각 차이 / REPLAY_SPEED. 중간에 멈추면 False"""
+    started, first_ns = time.perf_counter(), None
+    for block in episode.blocks():
+        timestamps = block["timestamp_ns"]
+        for row in range(len(timestamps)):
+            if replay_stop.is_set():
+                return False
+            stamp_ns = int(timestamps[row])
+            if first_ns is None:
+                first_ns = stamp_ns
+            if REPLAY_SPEED > 0:
+                delay = started + (stamp_ns - first_ns) / 1e9 / REPLAY_SPEED - time.perf_counter()
+                if delay > 0:
+                    replay_stop.wait(delay)
+                replay_stats["behind_ms"] = round(max(0.0, -delay) * 1000.0, 2)
+            replay_row.emit(block, row)
+            replay_stats["rows_played"] += 1
+    return True
+
+
+def _replay_loop(episode: EpisodeReader, cameras: dict):
+    while ros2_node is None and not replay_stop.is_set(): # 콜백을 받을 노드가 생길 때까지
+        replay_stop.wait(0.1)
+    try:
+        replay_row = _ReplayRow(cameras)
+        replay_stats["state"] = "playing"
+        replay_stats["started"] = time.time()
+        while _replay_pass(episode, replay_row):
+            replay_stats["loops"] += 1
+            if not REPLAY_LOOP:
+                break
+        replay_stats["state"] = "stopped" if replay_stop.is_set() else "finished"
+        log_info(f"Replay {replay_stats['state']}: {replay_stats['rows_played']} rows, {replay_stats['loops']} pass(es)")
     except Exception as e:
-        log_warn(f"/ws/setting closed: {e}")
+        replay_stats["state"] = "error"
+        replay_stats["error"] = str(e)
+        log_error(f"Replay failed: {e}")
     finally:
-        log_info(f"Client {websocket.client} disconnected from /ws/setting")
+        episode.close()
+
+
+def _start_replay():
+    """에피소드를 열고 SHM_CONFIG 카메라마다 seqlock 세그먼트를 만든 뒤 재생 스레드 시작 (encoder thread/process 모두 이 세그먼트에 attach).
+    세그먼트 shape/dtype은 녹화된 열 기준 (헤더로 전달되므로 녹화 해상도가 SHM_CONFIG와 달라도 됨)"""
+    global replay_thread
+    episode = EpisodeReader(REPLAY_EPISODE)
+    if not episode.rows:
+        raise ValueError(f"{REPLAY_EPISODE}: episode has no rows")
+    cameras = _replay_cameras(episode)
+    layouts = {cam_id_key: episode.columns[column] for column, cam_id_key in cameras.items()}
+    for key, config in SHM_CONFIG.items():
+        config["name"] = shm_segments[key].name = REPLAY_SHM_PREFIX + config["name"]
+        shm_segments[key].untrack = False # 이 프로세스가 만드는 세그먼트
+        shape, dtype = (layouts[key]["shape"], layouts[key]["dtype"]) if key in layouts else (config.get("shape"), config.get("dtype"))
+        if shape is None: # 녹화에 없고 SHM_CONFIG에도 shape가 없는 카메라: 세그먼트 없이 둠
+            continue
+        replay_segments[key] = SeqlockWriter.create(config["name"], shape, dtype, generation=time.time_ns())
+    replay_stats.update(
+        state="waiting", episode=os.path.abspath(REPLAY_EPISODE), speed=REPLAY_SPEED, loop=REPLAY_LOOP,
+        rows=episode.rows, hz=episode.hz, cameras=cameras, frames={column: 0 for column in cameras},
+    )
+    replay_thread = threading.Thread(target=_replay_loop, args=(episode, cameras), name="episode_replay", daemon=True)
+    replay_thread.start()
+    log_info(f"Replaying {REPLAY_EPISODE} ({episode.rows} rows, {episode.duration_s:.1f}s, cameras {cameras}) "
+             f"at {'max speed' if REPLAY_SPEED <= 0 else f'{REPLAY_SPEED:g}x'}{', looping' if REPLAY_LOOP else ''}")
+
+
+def _stop_replay():
+    """재생 스레드를 멈추고 replay SHM 세그먼트를 지움 (consumer 쪽 정리 후에 호출)"""
+    replay_stop.set()
+    if replay_thread is not None:
+        replay_thread.join(timeout=2.0)
+    for key in list(replay_segments):
+        shm, writer = replay_segments.pop(key)
+        writer.release()
+        shm.close()
+        shm.unlink()
 
 
 # --- Image Processing Loop (to be run in a thread) ---
+def _encode_shm_camera(cam_id_key: str, variants, trace: dict = None):
+    """SHM 세그먼트 하나를 요청된 variant (ladder level, roi, 해상도)들로 JPEG 인코딩 (jpeg_encode_pool 스레드에서 실행).
+    {variant: JPEG bytes (depth는 depth_format 형식)}를 반환하고, view가 없으면 {}.
+    픽셀이 바뀌지 않았으면 복사/인코딩 없이 이전 결과를 재사용하고 빠진 variant만 인코딩한다.
+    trace를 넘기면 "shm_read"/"encoded" 단계 시각(perf_counter_ns)을 기록한다."""
+    if trace is None:
+        trace = {}
+    encoder = camera_encoders[cam_id_key]
+    with shm_segment_locks[cam_id_key]: # 이 세그먼트만 잠금 (다른 카메라는 병렬로 진행)
+        segment = shm_segments[cam_id_key]
+        reader = segment.reader
+        if reader is not None:
+            encoded = encoder.encode_seqlock(reader, variants, trace)
+            trace["encoded"] = time.perf_counter_ns()
+            return encoded
+        # 헤더 없는 기존 레이아웃: producer와 동기화 수단이 없으므로 복사 후 인코딩
+        img_cv_shm = segment.view
+        if img_cv_shm is None:
+            return {}
+        img_cv, reusable, signature = encoder.read_raw(img_cv_shm, variants, trace)
+        if img_cv is None:
+            trace["encoded"] = trace["shm_read"]
+            return reusable
+
+    encoded = encoder.encode_copy(img_cv, variants, reusable, signature)
+    trace["encoded"] = time.perf_counter_ns()
+    return encoded
+
+def _encode_video_camera(cam_id_key: str, capture_stamp_ns: int):
+    """/ws/video 구독자가 있는 카메라의 현재 SHM 프레임을 H.264로 인코딩해서 video_hub로 보냄 (video_encode 스레드)"""
+    encoder = video_hub.encoders.get(cam_id_key)
+    if encoder is None:
+        return
+    with shm_segment_locks[cam_id_key]: # 픽셀 복사(to_video_frame)까지만 잡고 인코딩은 lock 밖에서
+        segment = shm_segments[cam_id_key]
+        if segment.shape is None:
+            return
+        if tuple(segment.shape[:2]) != (encoder.height, encoder.width): # producer 해상도가 바뀜: 새 해상도로 다시 연결하게 함
+            video_hub.restart_threadsafe(cam_id_key, f"resolution changed to {segment.shape[1]}x{segment.shape[0]}")
+            return
+        reader = segment.reader
+        if reader is not None:
+            frame = reader.read_latest()
+            if frame is None:
+                return
+            frame_seq, _, view = frame
+            video_frame = encoder.to_video_frame(view)
+            if not reader.is_valid(frame_seq): # 복사 도중 덮어써짐: 이번 프레임은 건너뜀
+                return
+        else:
+            video_frame = encoder.to_video_frame(segment.view)
+    started = time.perf_counter()
+    packets = encoder.encode(video_frame)
+    VIDEO_ENCODE_SECONDS.labels(cam_id_key).observe(time.perf_counter() - started)
+    VIDEO_BYTES.labels(cam_id_key).inc(sum(len(data) for data, _, _ in packets))
+    video_hub.publish_threadsafe(cam_id_key, packets, capture_stamp_ns)
+
+def _apply_worker_result(cam_id_key: str, result, job_trace: dict):
+    """프로세스 모드 worker 결과를 스레드 모드와 같은 형태로 (통계/metric 반영, trace 복사, 변화 없으면 직전 결과)"""
+    changed, encoded, trace, stats, jpeg_bytes = result
+    for key, count in stats.items():
+        image_encode_stats[cam_id_key][key] += count
+    if jpeg_bytes:
+        IMAGE_JPEG_BYTES.labels(cam_id_key).inc(jpeg_bytes)
+    job_trace.update(trace)
+    if not changed:
+        return _worker_last_encoded[cam_id_key]
+    _worker_last_encoded[cam_id_key] = encoded
+    return encoded
+
+def _collect_encode_job(cam_id_key: str, job, job_trace: dict, frame_trace, process_mode: bool):
+    """끝난 인코딩 작업의 결과. {variant: bytes}, 실패/SHM view 없음이면 {}, 인코딩 대상이 아닌 세그먼트면 None.
+    새로 인코딩된 결과면 카메라별 latency/metric을 그 작업이 읽은 프레임의 trace 기준으로 기록"""
+    try:
+        encoded_variants = job.result()
+        if process_mode:
+            encoded_variants = _apply_worker_result(cam_id_key, encoded_variants, job_trace)
+    except Exception as e:
+        log_error(f"Error processing/encoding image {cam_id_key} from SHM: {e}")
+        return {}
+    if encoded_variants:
+        stages = camera_latency[cam_id_key]
+        stages["signal"].add(frame_trace[0])
+        for stage in ("shm_read", "encoded"):
+            if stage in job_trace:
+                stages[stage].add(_ms_since_capture(frame_trace, job_trace[stage]))
+        if "shm_read" in job_trace and "encoded" in job_trace:
+            IMAGE_ENCODE_SECONDS.labels(cam_id_key).observe((job_trace["encoded"] - job_trace["shm_read"]) / 1e9)
+    return encoded_variants
+
 async def process_shm_images_loop_thread_func():
-    global latest_frame, latest_frame_lock, shm_np_arrays, image_signal_event, last_received_signal_stamp_ns
-    global gui_image_processed_count, gui_fps_calc_start_time
-    global latencies, last_latency_log_time, latency_log_interval
+    global latest_frame, latest_frame_lock, image_signal_event, last_received_signal_stamp_ns, image_fps
     global ros2_node # For get_clock
 
     log_info("process_shm_images_loop: Thread started.")
     
-    shm_fully_initialized = False
-    while not shm_fully_initialized and (not ros2_node or not rclpy.ok()): # Wait for rclpy.ok() and ros2_node
+    while not ros2_node or not rclpy.ok(): # Wait for rclpy.ok() and ros2_node
         log_debug("process_shm_images_loop: Waiting for RCLPY and ROS 2 node to be initialized...")
         time.sleep(1.0)
         if ros2_node and rclpy.ok(): break # Break if ready
@@ -475,285 +1835,783 @@ async def process_shm_images_loop_thread_func():
         log_error("process_shm_images_loop: RCLPY not OK or ROS2 node not available. Exiting thread.")
         return
 
-    while not shm_fully_initialized and rclpy.ok():
-        if hasattr(ros2_node, 'get_clock') and ros2_node.get_clock().now().nanoseconds > 0 : # Check if clock is active
-            log_info("process_shm_images_loop: ROS 2 node ready. Attempting SHM init...")
-            if _init_shared_memory():
-                shm_fully_initialized = True
-                log_info("process_shm_images_loop: All SHM segments ready.")
-            else:
-                log_warn("process_shm_images_loop: Not all SHM segments ready. Retrying in 1s...")
-                time.sleep(1.0)
-        else:
-            log_debug("process_shm_images_loop: Waiting for ROS 2 node clock to be active...")
-            time.sleep(1.0)
-        if not rclpy.ok():
-            log_warn("process_shm_images_loop: RCLPY not OK during SHM init wait. Exiting thread.")
-            return
-            
-    if not shm_fully_initialized:
-        log_error("process_shm_images_loop: Could not initialize SHM. Exiting thread.")
+    while rclpy.ok() and not (hasattr(ros2_node, 'get_clock') and ros2_node.get_clock().now().nanoseconds > 0): # Check if clock is active
+        log_debug("process_shm_images_loop: Waiting for ROS 2 node clock to be active...")
+        time.sleep(1.0)
+    if not rclpy.ok():
+        log_warn("process_shm_images_loop: RCLPY not OK during startup. Exiting thread.")
         return
 
-    node_clock = ros2_node.get_clock()
-    expected_cam_keys = list(SHM_CONFIG.keys()) # Use keys from SHM_CONFIG
-    jpeg_quality = 15
+    # 세그먼트가 다 생길 때까지 기다리지 않음: 카메라마다 생기는 대로 attach (아래 루프에서 SHM_CHECK_INTERVAL_S마다 확인)
+    attached = _refresh_shared_memory()
+    missing = [segment.name for segment in shm_segments.values() if not segment.attached]
+    log_info(f"process_shm_images_loop: ROS 2 node ready. {attached}/{len(SHM_CONFIG)} SHM segments attached"
+             + (f"; waiting for {missing} (attached as soon as the producer creates them)" if missing else "."))
+    last_shm_check_at = time.perf_counter()
 
-    while rclpy.ok():
-        if not image_signal_event.wait(timeout=1.0):
+    expected_cam_keys = list(SHM_CONFIG.keys()) # Use keys from SHM_CONFIG
+    process_mode = ENCODER_MODE == "process"
+    if process_mode:
+        jpeg_encode_pool = ProcessEncoderPool(SHM_CONFIG)
+        log_info(f"process_shm_images_loop: encoding in {len(SHM_CONFIG)} worker processes.")
+    else:
+        jpeg_encode_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, JPEG_ENCODE_WORKERS), thread_name_prefix="jpeg_encode"
+        )
+    # cam_id_key -> (Future, job_trace, frame_trace): deadline을 넘긴 작업. 끝나기 전엔 다시 제출하지 않고,
+    # 끝나면 다음 사이클 시작에서 결과를 가져간다 (쓴 CPU를 버리지 않고, 프로세스 모드 worker 상태와도 맞춤)
+    in_flight_jobs = {}
+    # /ws/video H.264 인코딩은 JPEG와 따로 (인코더가 카메라별 상태를 가지므로 카메라당 하나씩 순서대로, 결과를 기다리지 않음)
+    video_encode_pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(SHM_CONFIG), thread_name_prefix="video_encode")
+    in_flight_video_jobs = {}
+    frames_since_report = {key: 0 for key in expected_cam_keys} # 새로 인코딩/갱신된 프레임 수 (fps 계산용)
+    last_report_at = time.perf_counter()
+
+    while rclpy.ok() and not encoder_stop.is_set():
+        if time.perf_counter() - last_shm_check_at >= SHM_CHECK_INTERVAL_S: # producer 시작/재시작/종료 반영
+            _refresh_shared_memory()
+            last_shm_check_at = time.perf_counter()
+        if not image_signal_event.wait(timeout=SHM_CHECK_INTERVAL_S):
             if not rclpy.ok(): break # Exit if rclpy is not ok during wait
             continue 
         image_signal_event.clear()
+        if encoder_stop.is_set(): # shutdown_event가 깨운 경우
+            break
 
         with signal_stamp_lock:
             original_capture_stamp_ns = last_received_signal_stamp_ns
+            frame_trace = last_signal_trace
         if original_capture_stamp_ns is None:
             continue
 
-        current_ros_time_msg = node_clock.now().to_msg()
-        current_ros_time_total_ns = (current_ros_time_msg.sec * 1_000_000_000) + current_ros_time_msg.nanosec
-        
+        for cam_id_key in video_hub.demanded_cameras:
+            previous_job = in_flight_video_jobs.get(cam_id_key)
+            if previous_job is not None and not previous_job.done(): # 인코딩이 밀리면 이번 프레임은 건너뜀
+                continue
+            in_flight_video_jobs[cam_id_key] = video_encode_pool.submit(_encode_video_camera, cam_id_key, original_capture_stamp_ns)
+
         encoded_images_this_cycle = {}
-        all_images_valid_for_this_frame = True
 
+        # 카메라별 복사+인코딩을 pool에 동시에 제출 (지금 구독자가 있는 카메라의 요청된 variant만)
+        demanded_variants = _encoder_demand()
+        futures = {}
         for cam_id_key in expected_cam_keys:
-            if cam_id_key not in shm_np_arrays or shm_np_arrays[cam_id_key] is None:
-                # log_warn(f"SHM view for {cam_id_key} not available this cycle.")
-                all_images_valid_for_this_frame = False
-                encoded_images_this_cycle[cam_id_key] = "" # Ensure key exists even if empty
+            late_job = in_flight_jobs.get(cam_id_key)
+            if late_job is not None:
+                if not late_job[0].done(): # 이전 프레임 인코딩이 아직 진행 중
+                    continue
+                # 지난 사이클에 deadline을 넘겼다가 끝난 작업: 결과를 먼저 반영하고 이번 프레임도 제출
+                del in_flight_jobs[cam_id_key]
+                encoded_variants = _collect_encode_job(cam_id_key, *late_job, process_mode)
+                if encoded_variants is not None:
+                    encoded_images_this_cycle[cam_id_key] = encoded_variants
+                    if encoded_variants:
+                        frames_since_report[cam_id_key] += 1
+            if not demanded_variants.get(cam_id_key):
+                encoded_images_this_cycle[cam_id_key] = {} # 아무도 보지 않는 카메라: 복사/인코딩 생략
                 continue
+            job_trace = {}
+            if process_mode:
+                job = jpeg_encode_pool.submit(cam_id_key, demanded_variants[cam_id_key])
+            else:
+                job = jpeg_encode_pool.submit(_encode_shm_camera, cam_id_key, demanded_variants[cam_id_key], job_trace)
+            futures[job] = (cam_id_key, job_trace)
 
-            try:
-                with shm_lock: # Ensure exclusive access while reading from SHM buffer view
-                    # Check again if it's still valid after acquiring lock, might have been cleaned up
-                    if cam_id_key not in shm_np_arrays or shm_np_arrays[cam_id_key] is None:
-                        all_images_valid_for_this_frame = False
-                        encoded_images_this_cycle[cam_id_key] = ""
-                        continue
-                    img_cv_shm = shm_np_arrays[cam_id_key]
-                    img_cv = img_cv_shm.copy() # 중요: SHM에서 로컬로 복사
-
-                img_to_encode = None
-                is_depth_image = "depth" in cam_id_key
-                jpeg_bytes = None
-                
-                # jpeg로 인코딩
-                if is_depth_image:
-                    continue
-                    min_d, max_d = (0.1, 1.0) if "hand_depth" == cam_id_key else (0.1, 2.0)
-                    img_cv_float = img_cv.astype(np.float32)
-                    img_cv_float = np.nan_to_num(img_cv_float, nan=max_d, posinf=max_d, neginf=min_d)
-                    
-                    clipped_depth = np.clip(img_cv_float, min_d, max_d)
-                    if (max_d - min_d) == 0: normalized_depth = np.zeros_like(clipped_depth)
-                    else: normalized_depth = (clipped_depth - min_d) / (max_d - min_d)
-                    
-                    depth_8bit_gray = (normalized_depth * 255).astype(np.uint8)
-                    img_to_encode = depth_8bit_gray
-                    
-                    ret, buffer = cv2.imencode(".jpg", img_to_encode, [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality])
-                    if not ret: raise ValueError(f"cv2.imencode failed for GRACYSCALE depth image {cam_id_key}")
-                    jpeg_bytes = buffer.tobytes()
-                else: # RGB 이미지
-                    img_to_encode = img_cv
-                    jpeg_bytes = simplejpeg.encode_jpeg(
-                        img_to_encode, quality=jpeg_quality, colorspace='RGB', colorsubsampling='420'
-                    )
-                
-                # Base64 문자열로 변함
-                encoded_images_this_cycle[cam_id_key] = f"data:image/jpeg;base64,{base64.b64encode(jpeg_bytes).decode('utf-8')}"
-                latency_ns = current_ros_time_total_ns - original_capture_stamp_ns 
-                latencies[cam_id_key].append(latency_ns / 1_000_000) # ms
+        done_jobs, late_jobs = concurrent.futures.wait(futures, timeout=JPEG_ENCODE_DEADLINE_S)
 
-            except Exception as e:
-                log_error(f"Error processing/encoding image {cam_id_key} from SHM: {e}")
-                encoded_images_this_cycle[cam_id_key] = "" 
-                all_images_valid_for_this_frame = False
+        for job in done_jobs:
+            cam_id_key, job_trace = futures[job]
+            encoded_variants = _collect_encode_job(cam_id_key, job, job_trace, frame_trace, process_mode)
+            if encoded_variants is None: # 인코딩 대상이 아닌 세그먼트
+                continue
+            # 실패/SHM view 없음이면 {}. 원본 바이트 그대로 보관 (base64 변환은 JSON 클라이언트가 있을 때만)
+            encoded_images_this_cycle[cam_id_key] = encoded_variants
+            if encoded_variants:
+                frames_since_report[cam_id_key] += 1
+
+        if late_jobs:
+            # deadline을 넘긴 카메라는 이번 프레임에 이전 이미지를 유지. 작업이 끝나면 다음 사이클 시작에서 결과를 가져감
+            for job in late_jobs:
+                cam_id_key, job_trace = futures[job]
+                in_flight_jobs[cam_id_key] = (job, job_trace, frame_trace)
+            log_debug(f"JPEG encode deadline exceeded for: {', '.join(futures[job][0] for job in late_jobs)}")
         
         with latest_frame_lock:
+            # 변화 없음(재사용)/deadline 초과로 직전과 같은 bytes뿐이면 seq를 올리지 않음 -> 같은 프레임을 다시 보내지 않는다
+            new_bytes = False
             for key_cam in expected_cam_keys: # Ensure all expected keys are updated
-                 latest_frame["images"][key_cam] = encoded_images_this_cycle.get(key_cam, latest_frame["images"].get(key_cam, ""))
-            
-        if all_images_valid_for_this_frame:
-             gui_image_processed_count += 1
-        
-        # current_perf_time = time.perf_counter()
-        # elapsed_time_fps = current_perf_time - gui_fps_calc_start_time
-        # if elapsed_time_fps >= latency_log_interval:
-        #     if elapsed_time_fps > 0:
-        #         actual_fps_gui = gui_image_processed_count / elapsed_time_fps
-        #         log_info(f"Image Processing FPS (SHM): {actual_fps_gui:.2f} over {elapsed_time_fps:.2f}s")
-        #         with sensor_data_lock:
-        #             if "mobile_rgb" in latest_frame["images"]:
-        #                 sensor_data["camera1_fps"] = gui_image_processed_count / elapsed_time_fps if elapsed_time_fps > 0 else sensor_data["camera1_fps"]
-        #                 sensor_data["camera2_fps"] = gui_image_processed_count / elapsed_time_fps if elapsed_time_fps > 0 else sensor_data["camera2_fps"]
-
-        #     gui_image_processed_count = 0 
-        #     gui_fps_calc_start_time = current_perf_time 
-
-        # if current_perf_time - last_latency_log_time >= latency_log_interval:
-        #     log_output_parts = []
-        #     for cam_id, lat_deque in latencies.items():
-        #         if lat_deque: avg_lat = sum(lat_deque) / len(lat_deque); log_output_parts.append(f"{cam_id}: {avg_lat:.2f}")
-        #     if log_output_parts:
-        #         log_info(f"Average Image Latencies (ms) [ROS Time Based, SHM]: {' | '.join(log_output_parts)}")
-        #         with sensor_data_lock:
-        #             if "hand_rgb" in latest_frame["images"]:
-        #                 sensor_data["camera1_latency"] = float(np.mean(latencies["mobile_rgb"])) if latencies["mobile_rgb"] else sensor_data["camera1_latency"]
-        #                 sensor_data["camera2_latency"] = float(np.mean(latencies["hand_rgb"])) if latencies["hand_rgb"] else sensor_data["camera2_latency"]
-
-        #     else: log_debug("No latency data for SHM processing in this interval.")
-        #     last_latency_log_time = current_perf_time
-        
+                previous_variants = latest_frame["jpeg"].get(key_cam, {})
+                current_variants = encoded_images_this_cycle.get(key_cam, previous_variants)
+                if current_variants and current_variants != previous_variants:
+                    new_bytes = True
+                latest_frame["jpeg"][key_cam] = current_variants
+            if new_bytes:
+                latest_frame["seq"] += 1
+                latest_frame["capture_stamp_ns"] = original_capture_stamp_ns
+                latest_frame["trace"] = frame_trace
+        if new_bytes:
+            image_hub.notify_threadsafe() # 새 프레임이 생겼을 때만 /ws/image 쪽을 깨움
+        if ENABLE_DVR:
+            _dvr_append_frames(encoded_images_this_cycle, original_capture_stamp_ns)
             
+        # fps/latency 요약을 주기적으로 반영: camera*_fps/latency만 sensor_data로 (/ws/data), 상세는 GET /stats/images, /stats/latency
+        current_perf_time = time.perf_counter()
+        elapsed_report_s = current_perf_time - last_report_at
+        if elapsed_report_s >= LATENCY_REPORT_INTERVAL_S:
+            fps = {key: count / elapsed_report_s for key, count in frames_since_report.items()}
+            image_fps = fps
+            _update_sensor_data(_latency_telemetry(fps))
+            frames_since_report = {key: 0 for key in expected_cam_keys}
+            last_report_at = current_perf_time
 
         await asyncio.sleep(0.001) # Small sleep to yield control, adjust as needed. Original server_node.py used 0.01, process_shm was 0.04.
                                 # This loop is driven by image_signal_event, so sleep can be minimal.
     
-    log_info("Exiting process_shm_images_loop as rclpy is not ok.")
+    jpeg_encode_pool.shutdown(wait=False)
+    video_encode_pool.shutdown(wait=False)
+    log_info("Exiting process_shm_images_loop (rclpy not ok or server shutting down).")
+
+
+# --- HTTP Stats Endpoints ---
+@app.get("/stats/images")
+async def get_image_stats():
+    """카메라별 SHM attach 상태, fps와 단계별 latency 분위수, 인코딩/스킵(변화 없음) 횟수와 /ws/image 구독자별 ladder level/송신 상태"""
+    return {
+        "segments": {key: segment.status() for key, segment in shm_segments.items()},
+        "fps": {key: round(value, 1) for key, value in image_fps.items()},
+        "latency": _image_latency_summary(),
+        "encode": {key: dict(counts) for key, counts in image_encode_stats.items()},
+        "demanded": {key: [list(variant) for variant in variants] for key, variants in image_hub.demanded_variants.items()},
+        "frame_interval_ms": image_hub.frame_interval_ms,
+        "video": {
+            cam_key: {
+                **stats, "codec": video_hub.encoders[cam_key].codec_string,
+                "clients": [
+                    {"client": str(subscriber.websocket.client), "queued": subscriber.queue.qsize(), "dropped_packets": subscriber.dropped_packets}
+                    for subscriber in video_hub.subscribers.get(cam_key, ())
+                ],
+            }
+            for cam_key, stats in video_hub.stats.items()
+        },
+        "clients": [
+            {
+                "client": str(subscriber.websocket.client),
+                "format": "binary" if subscriber.binary_mode else "json",
+                "cameras": list(subscriber.cameras),
+                "roi": subscriber.roi,
+                "size": subscriber.size,
+                "level": subscriber.quality.level,
+                "auto": not subscriber.quality.pinned,
+                "send_ms": subscriber.quality.send_ms_ewma,
+                "rtt_ms": subscriber.quality.rtt_ms,
+                "dropped_frames": subscriber.dropped_frames,
+            }
+            for subscriber in image_hub.subscribers
+        ],
+    }
+
+
+@app.get("/stats/teleop")
+async def get_teleop_stats():
+    """/ws/ros_teleop_bridge master 명령 카운터 (서버 시작 이후 누적): 수신/publish/합쳐짐(coalesced)/오래됨/순서 뒤집힘/형식 오류"""
+    return {"max_command_age_s": TELEOP_MAX_COMMAND_AGE_S, "commands": dict(teleop_command_stats)}
+
+
+@app.get("/stats/replay")
+async def get_replay_stats():
+    """replay 모드 진행 상황 (live면 state "off"). rows_per_s / speed_actual로 REPLAY_SPEED = 0 (최대 속도) 처리량을 봄"""
+    stats = dict(replay_stats, frames=dict(replay_stats["frames"]))
+    elapsed = time.time() - stats["started"] if stats["started"] else 0.0
+    stats["rows_per_s"] = round(stats["rows_played"] / elapsed, 1) if elapsed > 0 else 0.0
+    stats["speed_actual"] = round(stats["rows_per_s"] / stats["hz"], 2) if stats["hz"] else None
+    return stats
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus text exposition format (metrics.py REGISTRY)"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/stats/latency")
+async def get_latency_stats():
+    """프레임 단계별(LATENCY_STAGES) latency 분위수 (capture stamp 기준 누적 ms) - 카메라별, /ws/image 클라이언트별"""
+    return {
+        "window": LATENCY_WINDOW,
+        "stages": list(LATENCY_STAGES),
+        "cameras": {
+            cam_key: {stage: rolling.summary() for stage, rolling in stages.items()}
+            for cam_key, stages in camera_latency.items()
+        },
+        "clients": [
+            {
+                "client": str(subscriber.websocket.client),
+                "cameras": list(subscriber.cameras),
+                **{f"{name}_ms": rolling.summary() for name, rolling in subscriber.latency.items()},
+            }
+            for subscriber in image_hub.subscribers
+        ],
+    }
+
+
+# --- Telemetry History ---
+def _history_field(ring, start_ns: int, end_ns: int, points: int, method: str) -> dict:
+    """구간 안 sample을 points개 근처로 decimation. 열(component)마다 {"t", "y"} (열마다 고른 시각이 다를 수 있음)"""
+    t_ns, records = ring.range(start_ns, end_ns)
+    values = records["value"]
+    shape = list(values.shape[1:])
+    values = values.reshape(len(values), int(np.prod(shape)))
+    if method == "none" or len(t_ns) <= points:
+        t_ns, values = t_ns[-points:], values[-points:] # none: 가장 최근 points개
+        indices = np.repeat(np.arange(len(t_ns))[:, None], values.shape[1], axis=1)
+    else:
+        indices = DECIMATORS[method](t_ns, values, points)
+    t = t_ns / 1e9
+    return {"shape": shape, "samples": len(records), "series": [
+        {"t": t[indices[:, column]].tolist(), "y": values[indices[:, column], column].tolist()}
+        for column in range(values.shape[1])
+    ]}
+
+
+@app.get("/history")
+async def get_history(fields: str = None, start: float = None, end: float = None, seconds: float = HISTORY_DEFAULT_SECONDS,
+                      points: int = HISTORY_DEFAULT_POINTS, method: str = HISTORY_DEFAULT_METHOD):
+    """필드별 history를 그래프용으로 줄여서 반환.
+    fields: 쉼표로 구분 (기본 전체), 구간: start/end (unix 초) 또는 최근 seconds초, points: 필드(열)당 최대 점 수,
+    method: minmax (bucket마다 최소/최대, spike 유지) | lttb (Largest-Triangle-Three-Buckets) | none (원본, 최근 points개)"""
+    names = [name.strip() for name in fields.split(",") if name.strip()] if fields else list(telemetry_history)
+    unknown = [name for name in names if name not in telemetry_history]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"unknown history fields {unknown} (available: {list(telemetry_history)})")
+    if method not in DECIMATORS and method != "none":
+        raise HTTPException(status_code=400, detail=f"method must be one of {[*DECIMATORS, 'none']}")
+    points = min(max(int(points), 3), HISTORY_MAX_POINTS)
+    end_ns = int(end * 1_000_000_000) if end is not None else time.time_ns()
+    start_ns = int(start * 1_000_000_000) if start is not None else end_ns - int(min(seconds, HISTORY_SECONDS) * 1_000_000_000)
+
+    def build():
+        return {name: _history_field(telemetry_history[name], start_ns, end_ns, points, method) for name in names}
+
+    # 10분 x 여러 필드면 수십 ms가 걸릴 수 있으므로 event loop 밖에서
+    return {"start": start_ns / 1e9, "end": end_ns / 1e9, "method": method, "points": points, "fields": await asyncio.to_thread(build)}
+
+
+# --- DVR Endpoints ---
+# 시각은 모두 unix time (초, float). t 대신 ago(지금부터 몇 초 전)로도 지정 가능
+def _dvr_time_ns(t: float = None, ago: float = None):
+    if t is not None:
+        return int(float(t) * 1_000_000_000)
+    if ago is not None:
+        return time.time_ns() - int(float(ago) * 1_000_000_000)
+    return None
+
+
+def _dvr_require(ring_map: dict, key: str, kind: str):
+    if not ENABLE_DVR:
+        raise HTTPException(status_code=404, detail="DVR is disabled (ENABLE_DVR = False)")
+    if key not in ring_map:
+        raise HTTPException(status_code=404, detail=f"unknown {kind}: {key} (available: {list(ring_map)})")
+    return ring_map[key]
+
+
+def _dvr_telemetry_json(stream: str, t_ns, records, limit: int) -> dict:
+    truncated = len(t_ns) > limit
+    if truncated: # 가장 최근 limit개
+        t_ns, records = t_ns[-limit:], records[-limit:]
+    return {
+        "stream": stream, "count": len(t_ns), "truncated": truncated, "t": (t_ns / 1e9).tolist(),
+        "fields": {name: records[name].tolist() for name in records.dtype.names},
+    }
+
+
+def _dvr_save(seconds: float) -> dict:
+    """최근 seconds초를 npz 파일 하나로 (한 번의 bulk write). 카메라별 JPEG는 한 배열로 이어 붙이고 offsets로 나눔"""
+    end_ns = time.time_ns()
+    start_ns = end_ns - int(seconds * 1_000_000_000)
+    arrays, summary = {}, {"frames": {}, "samples": {}}
+    for cam_key, ring in dvr_frames.items():
+        frames = ring.range(start_ns, end_ns)
+        sizes = np.array([len(frame[3]) for frame in frames], dtype=np.int64)
+        arrays[f"{cam_key}_t_ns"] = np.array([frame[0] for frame in frames], dtype=np.int64)
+        arrays[f"{cam_key}_capture_stamp_ns"] = np.array([frame[1] for frame in frames], dtype=np.int64)
+        arrays[f"{cam_key}_jpeg"] = np.frombuffer(b"".join(frame[3] for frame in frames), dtype=np.uint8)
+        arrays[f"{cam_key}_offsets"] = np.concatenate(([0], np.cumsum(sizes)))
+        summary["frames"][cam_key] = len(frames)
+    for stream, ring in dvr_telemetry.items():
+        arrays[f"{stream}_t_ns"], arrays[stream] = ring.range(start_ns, end_ns)
+        summary["samples"][stream] = len(arrays[stream])
+    meta = dict(summary, start=start_ns / 1e9, end=end_ns / 1e9, cameras=list(dvr_frames), telemetry=list(dvr_telemetry))
+    arrays["meta"] = np.array(json.dumps(meta))
+    os.makedirs(DVR_SAVE_DIR, exist_ok=True)
+    path = os.path.join(DVR_SAVE_DIR, time.strftime("dvr_%Y%m%d_%H%M%S.npz", time.localtime(end_ns / 1e9)))
+    np.savez(path, **arrays)
+    return dict(meta, path=os.path.abspath(path), bytes=os.path.getsize(path))
+
+
+@app.get("/dvr")
+async def get_dvr_status():
+    """DVR ring 상태: 카메라별 보관 프레임 수/바이트/가장 오래된·최신 시각, telemetry stream별 sample 수"""
+    return {
+        "enabled": ENABLE_DVR, "seconds": DVR_SECONDS, "jpeg_level": DVR_JPEG_LEVEL,
+        "memory_cap_bytes": len(dvr_frames) * DVR_CAMERA_MAX_BYTES + sum(ring.nbytes for ring in dvr_telemetry.values()),
+        "cameras": {key: ring.stats() for key, ring in dvr_frames.items()},
+        "telemetry": {stream: ring.stats() for stream, ring in dvr_telemetry.items()},
+    }
+
+
+@app.get("/dvr/frame/{camera}")
+async def get_dvr_frame(camera: str, t: float = None, ago: float = None):
+    """t (또는 ago) 시점에 마지막으로 인코딩되어 있던 프레임 (JPEG). 둘 다 없으면 최신"""
+    ring = _dvr_require(dvr_frames, camera, "camera")
+    entry = ring.at(_dvr_time_ns(t, ago))
+    if entry is None:
+        raise HTTPException(status_code=404, detail="no frame at or before the requested time")
+    t_ns, capture_stamp_ns, seq, data = entry
+    return Response(content=data, media_type=IMAGE_CAMERA_FORMATS[camera]["mime"], headers={
+        "X-Frame-Time": f"{t_ns / 1e9:.6f}", "X-Capture-Stamp-Ns": str(capture_stamp_ns), "X-Frame-Seq": str(seq),
+    })
+
+
+@app.get("/dvr/frames/{camera}")
+async def get_dvr_frame_index(camera: str, start: float = None, end: float = None, limit: int = DVR_RANGE_MAX_FRAMES):
+    """[start, end] 구간 프레임 목록 (시각/크기만. 이미지는 /dvr/frame?t= 또는 /ws/dvr range로)"""
+    ring = _dvr_require(dvr_frames, camera, "camera")
+    frames = ring.range(_dvr_time_ns(start) or 0, _dvr_time_ns(end) or time.time_ns(), limit=max(1, limit))
+    return {"camera": camera, "frames": [
+        {"t": t_ns / 1e9, "capture_stamp_ns": capture_stamp_ns, "seq": seq, "size": len(data)}
+        for t_ns, capture_stamp_ns, seq, data in frames
+    ]}
+
+
+@app.get("/dvr/telemetry/{stream}")
+async def get_dvr_telemetry(stream: str, start: float = None, end: float = None, limit: int = DVR_TELEMETRY_RESPONSE_MAX):
+    """[start, end] 구간 telemetry (stream: slave_info | robot_to_gui). 열(field)마다 list"""
+    ring = _dvr_require(dvr_telemetry, stream, "telemetry stream")
+    t_ns, records = ring.range(_dvr_time_ns(start) or 0, _dvr_time_ns(end) or time.time_ns())
+    return _dvr_telemetry_json(stream, t_ns, records, max(1, limit))
+
+
+@app.post("/dvr/save")
+async def post_dvr_save(seconds: float = DVR_SECONDS):
+    """최근 seconds초를 DVR_SAVE_DIR에 npz 하나로 저장"""
+    if not ENABLE_DVR:
+        raise HTTPException(status_code=404, detail="DVR is disabled (ENABLE_DVR = False)")
+    result = await asyncio.to_thread(_dvr_save, min(max(float(seconds), 0.0), DVR_SECONDS))
+    log_info(f"DVR saved: {result['path']} ({result['bytes']} bytes)")
+    return result
+
+
+@app.websocket("/ws/dvr")
+async def websocket_dvr(websocket: WebSocket):
+    """요청/응답 방식 scrub-back:
+    {"type": "frame", "camera", "t" | "ago"}            -> binary 프레임 하나 (/ws/image binary framing, server_send_ms = 프레임 시각 ms)
+    {"type": "range", "camera", "start", "end", "limit"} -> binary 프레임들 + {"type": "range_end", "camera", "count"}
+    {"type": "telemetry", "stream", "start", "end"}      -> {"type": "telemetry", ...} (GET /dvr/telemetry와 같은 내용)
+    {"type": "save", "seconds"}                          -> {"type": "saved", ...}
+    잘못된 요청은 {"type": "error", "message"}"""
+    await websocket.accept()
+    WS_CLIENTS.labels("/ws/dvr").inc()
+    log_info(f"Client {websocket.client} connected to /ws/dvr")
+    try:
+        while True:
+            try:
+                payload = json.loads(await websocket.receive_text())
+                msg_type = payload.get("type")
+                if msg_type in ("frame", "range"):
+                    camera = payload.get("camera")
+                    ring = _dvr_require(dvr_frames, camera, "camera")
+                    if msg_type == "frame":
+                        entry = ring.at(_dvr_time_ns(payload.get("t"), payload.get("ago")))
+                        if entry is None:
+                            raise HTTPException(status_code=404, detail="no frame at or before the requested time")
+                        frames = [entry]
+                    else:
+                        limit = min(int(payload.get("limit", DVR_RANGE_MAX_FRAMES)), DVR_RANGE_MAX_FRAMES)
+                        frames = ring.range(_dvr_time_ns(payload.get("start")) or 0,
+                                            _dvr_time_ns(payload.get("end")) or time.time_ns(), limit=max(1, limit))
+                    for t_ns, capture_stamp_ns, seq, data in frames:
+                        await _ws_send_bytes(websocket, "/ws/dvr", _pack_binary_image_frame(
+                            camera, data, DVR_JPEG_LEVEL, capture_stamp_ns, t_ns // 1_000_000, seq))
+                    if msg_type == "range":
+                        await _ws_send_json(websocket, "/ws/dvr", {"type": "range_end", "camera": camera, "count": len(frames)})
+                elif msg_type == "telemetry":
+                    stream = payload.get("stream")
+                    ring = _dvr_require(dvr_telemetry, stream, "telemetry stream")
+                    t_ns, records = ring.range(_dvr_time_ns(payload.get("start")) or 0, _dvr_time_ns(payload.get("end")) or time.time_ns())
+                    await _ws_send_json(websocket, "/ws/dvr", {"type": "telemetry", **_dvr_telemetry_json(stream, t_ns, records, DVR_TELEMETRY_RESPONSE_MAX)})
+                elif msg_type == "save":
+                    result = await post_dvr_save(payload.get("seconds", DVR_SECONDS))
+                    await _ws_send_json(websocket, "/ws/dvr", {"type": "saved", **result})
+                else:
+                    await _ws_send_json(websocket, "/ws/dvr", {"type": "error", "message": f"unknown request type: {msg_type}"})
+            except HTTPException as e:
+                await _ws_send_json(websocket, "/ws/dvr", {"type": "error", "message": e.detail})
+            except (json.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+                await _ws_send_json(websocket, "/ws/dvr", {"type": "error", "message": f"bad request: {e}"})
+    except Exception as e:
+        log_warn(f"/ws/dvr closed: {e}")
+    finally:
+        WS_CLIENTS.labels("/ws/dvr").dec()
+        log_info(f"Client {websocket.client} disconnected from /ws/dvr")
 
 
 # --- FastAPI WebSocket Endpoints --- websocket 경로(/ws/data, /ws/image 등)에 데이터 들어오면 자동 실행
 @app.websocket("/ws/data")
 async def websocket_data(websocket: WebSocket):
     await websocket.accept()
-    log_info(f"Client {websocket.client} connected to /ws/data")
+    WS_CLIENTS.labels("/ws/data").inc()
+    # ?mode=delta: 바뀐 필드만 전송 ("_type": snapshot | delta | heartbeat, "_rev": revision). 기본은 기존처럼 매번 전체 전송
+    # 필드는 기존과 같이 최상위에 두므로, 받은 필드만 갱신하는 클라이언트는 그대로 동작한다
+    delta_mode = websocket.query_params.get("mode", "full").lower() == "delta"
+    # 값이 바뀌면 바로 전송, 단 클라이언트별 최대 전송률(?max_hz=, 기본 TELEMETRY_MAX_RATE_HZ)로 합침
+    min_interval = _client_min_send_interval(websocket, TELEMETRY_MAX_RATE_HZ)
+    log_info(f"Client {websocket.client} connected to /ws/data ({'delta' if delta_mode else 'full'}, max {1.0 / min_interval:.0f} Hz)")
     try:
+        seen_version = sensor_data_notifier.version
+        last_send_at = 0.0
+        if not delta_mode:
+            # 기존 클라이언트용: 매번 전체 전송. 바뀐 게 없어도 heartbeat 주기로는 보냄
+            while True:
+                _, data_to_send = _sensor_data_snapshot()
+                await _ws_send_json(websocket, "/ws/data", data_to_send)
+                last_send_at = time.monotonic()
+                seen_version = await sensor_data_notifier.wait_for_change(seen_version, TELEMETRY_HEARTBEAT_S)
+                await _wait_send_slot(last_send_at, min_interval)
+
+        client_rev = -1
+        last_keyframe_at = 0.0
         while True:
-            with sensor_data_lock:
-                data_to_send = sensor_data.copy()
-            await websocket.send_json(data_to_send)
-            await asyncio.sleep(0.05)
+            now = time.monotonic()
+            if now - last_keyframe_at >= TELEMETRY_KEYFRAME_S:
+                client_rev, fields = _sensor_data_snapshot()
+                await _ws_send_json(websocket, "/ws/data", {"_type": "snapshot", "_rev": client_rev, **fields})
+                last_keyframe_at = last_send_at = now
+            else:
+                rev, changed = _sensor_data_changes_since(client_rev)
+                if changed:
+                    await _ws_send_json(websocket, "/ws/data", {"_type": "delta", "_rev": rev, **changed})
+                    client_rev = rev
+                    last_send_at = now
+                elif now - last_send_at >= TELEMETRY_HEARTBEAT_S:
+                    await _ws_send_json(websocket, "/ws/data", {"_type": "heartbeat", "_rev": client_rev})
+                    last_send_at = now
+            # 다음 변경, heartbeat, keyframe 중 가장 빠른 것까지 대기
+            now = time.monotonic()
+            timeout = max(0.0, min(last_send_at + TELEMETRY_HEARTBEAT_S, last_keyframe_at + TELEMETRY_KEYFRAME_S) - now)
+            seen_version = await sensor_data_notifier.wait_for_change(seen_version, timeout)
+            await _wait_send_slot(last_send_at, min_interval)
     except Exception as e:
         log_warn(f"/ws/data WebSocket connection closed for {websocket.client}: {e}")
     finally:
+        WS_CLIENTS.labels("/ws/data").dec()
         log_info(f"Client {websocket.client} disconnected from /ws/data")
 
+
+async def _image_send_loop(subscriber: ImageSubscriber):
+    """허브가 큐에 넣은 payload를 보내면서 송신 시간을 재서 ladder level을 조정"""
+    websocket = subscriber.websocket
+    quality = subscriber.quality
+    while True:
+        payload, trace, cameras, enqueued_ns = await subscriber.queue.get()
+        async with subscriber.send_lock:
+            send_started_ns = time.perf_counter_ns()
+            if subscriber.binary_mode:
+                for message in payload:
+                    await _ws_send_bytes(websocket, "/ws/image", message)
+            else:
+                await _ws_send_text(websocket, "/ws/image", payload)
+            sent_ns = time.perf_counter_ns()
+            quality.on_sent((sent_ns - send_started_ns) / 1_000_000)
+            sent_ms = _ms_since_capture(trace, sent_ns)
+            subscriber.latency["queue"].add((send_started_ns - enqueued_ns) / 1_000_000)
+            subscriber.latency["send"].add((sent_ns - send_started_ns) / 1_000_000)
+            subscriber.latency["total"].add(sent_ms)
+            for cam_key in cameras:
+                camera_latency[cam_key]["sent"].add(sent_ms)
+
+            if quality.decide(image_hub.frame_interval_ms, subscriber.dropped_frames):
+                image_hub.refresh_demand()
+            if subscriber.announced_level != (quality.level, quality.pinned):
+                subscriber.announced_level = (quality.level, quality.pinned)
+                await _ws_send_text(websocket, "/ws/image", json.dumps({
+                    "type": "level", "level": quality.level, "auto": not quality.pinned, **JPEG_LADDER[quality.level],
+                }))
+            now = time.monotonic()
+            if now - subscriber.last_ping_at >= IMAGE_PING_INTERVAL_S:
+                subscriber.last_ping_at = now
+                await _ws_send_text(websocket, "/ws/image", json.dumps({"type": "ping", "t": time.time() * 1000}))
+
+async def _image_recv_loop(subscriber: ImageSubscriber):
+    """클라이언트 제어 메시지: {"type": "pong", "t": ...}, {"type": "set_level", "level": n | "auto"},
+    {"type": "subscribe", "cameras": [...], "width": w, "height": h, "roi": [x, y, w, h]}"""
+    websocket = subscriber.websocket
+    quality = subscriber.quality
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        text = message.get("text")
+        if not text:
+            continue
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError:
+            continue
+        msg_type = payload.get("type")
+        if msg_type == "pong" and isinstance(payload.get("t"), (int, float)):
+            quality.on_rtt(time.time() * 1000 - payload["t"])
+        elif msg_type == "set_level":
+            level = payload.get("level")
+            if level == "auto":
+                quality.unpin()
+            elif isinstance(level, int) and 0 <= level < len(JPEG_LADDER):
+                quality.pin(level)
+            else:
+                continue
+            image_hub.refresh_demand()
+        elif msg_type == "subscribe":
+            try:
+                cameras = payload.get("cameras") or list(SHM_CONFIG.keys())
+                if not isinstance(cameras, list):
+                    raise ValueError("cameras must be a list of camera keys")
+                unknown = [cam_key for cam_key in cameras if cam_key not in SHM_CONFIG]
+                if unknown:
+                    raise ValueError(f"unknown cameras: {unknown}")
+                roi, size = _parse_view_request(payload)
+            except (TypeError, ValueError) as e:
+                async with subscriber.send_lock:
+                    await _ws_send_text(websocket, "/ws/image", json.dumps({"type": "error", "message": f"invalid subscribe: {e}"}))
+                continue
+            subscriber.cameras = tuple(dict.fromkeys(cameras)) # 순서 유지, 중복 제거
+            subscriber.roi = roi
+            subscriber.size = size
+            image_hub.refresh_demand()
+            async with subscriber.send_lock:
+                await _ws_send_text(websocket, "/ws/image", json.dumps({
+                    "type": "subscribed", "cameras": list(subscriber.cameras), "roi": roi, "size": size,
+                    "formats": {cam_key: IMAGE_CAMERA_FORMATS[cam_key] for cam_key in subscriber.cameras},
+                }))
+
 @app.websocket("/ws/image")
 async def websocket_image(websocket: WebSocket):
-    global latest_frame, latest_frame_lock, connected_clients_image_ws
     await websocket.accept()
-    connected_clients_image_ws.add(websocket)
-    log_info(f"Client {websocket.client} connected to /ws/image. Total clients: {len(connected_clients_image_ws)}")
+    # ?format=binary 이면 카메라별 binary 프레임 (IMAGE_FRAME_HEADER + key + JPEG), 아니면 기존 JSON
+    binary_mode = websocket.query_params.get("format", "json").lower() == "binary"
+    subscriber = image_hub.subscribe(websocket, binary_mode)
+    WS_CLIENTS.labels("/ws/image").inc()
+    log_info(f"Client {websocket.client} connected to /ws/image ({'binary' if binary_mode else 'json'}). Total clients: {len(image_hub)}")
+    tasks = [
+        asyncio.create_task(_image_send_loop(subscriber)),
+        asyncio.create_task(_image_recv_loop(subscriber)),
+    ]
     try:
-        while True:
-            frame_payload_to_send = None # 전송할 최종 페이로드
-            with latest_frame_lock:
-                if latest_frame and latest_frame.get("images") and any(latest_frame["images"].values()):
-                    # latest_frame을 직접 수정하지 않기 위해 복사본 사용
-                    current_frame_data = latest_frame.copy() 
-                    # 여기에 서버 전송 타임스탬프 추가 (밀리초 단위 UNIX epoch)
-                    current_frame_data["server_send_timestamp_ms"] = int(time.time() * 1000)
-                    frame_payload_to_send = current_frame_data
-            
-            if frame_payload_to_send:
-                await websocket.send_json(frame_payload_to_send)
-            else:
-                # 이미지가 없거나 비어있으면 아무것도 보내지 않거나, 빈 메시지를 정의할 수 있음
-                pass 
-
-            await asyncio.sleep(0.04) # 약 33Hz, 이미지 처리 속도에 따라 조절
-    except Exception as e: 
-        log_warn(f"/ws/image WebSocket connection closed for {websocket.client}: {e}")
+        # 송신/수신 중 하나가 끝나면(연결 종료, 송신 실패) 나머지도 정리
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is not None:
+                log_warn(f"/ws/image WebSocket connection closed for {websocket.client}: {task.exception()}")
     finally: 
-        if websocket in connected_clients_image_ws: # Check before removing
-            connected_clients_image_ws.remove(websocket)
-        log_info(f"Client {websocket.client} disconnected from /ws/image. Total clients: {len(connected_clients_image_ws)}")
+        for task in tasks:
+            task.cancel()
+        image_hub.unsubscribe(subscriber)
+        WS_CLIENTS.labels("/ws/image").dec()
+        log_info(f"Client {websocket.client} disconnected from /ws/image. Total clients: {len(image_hub)} (dropped frames: {subscriber.dropped_frames})")
+
+
+async def _video_send_loop(subscriber: VideoSubscriber):
+    websocket = subscriber.websocket
+    encoder = video_hub.encoders[subscriber.cam_key]
+    codec_announced = None
+    while True:
+        packet, keyframe = await subscriber.queue.get()
+        if packet is None: # VideoBroadcastHub._restart: keyframe 자리에 사유
+            await _ws_send_text(websocket, "/ws/video", json.dumps({"type": "restart", "reason": keyframe}))
+            await websocket.close(code=1012)
+            return
+        if keyframe and encoder.codec_string != codec_announced: # 디코더 설정용 codec 문자열 (첫 keyframe 직전에 한 번)
+            codec_announced = encoder.codec_string
+            await _ws_send_text(websocket, "/ws/video", json.dumps({"type": "codec", "codec": codec_announced}))
+        await _ws_send_bytes(websocket, "/ws/video", packet)
+
+async def _video_recv_loop(subscriber: VideoSubscriber):
+    """클라이언트 제어 메시지: {"type": "keyframe"} (디코더 오류 등으로 keyframe 재요청)"""
+    websocket = subscriber.websocket
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        try:
+            payload = json.loads(message.get("text") or "{}")
+        except json.JSONDecodeError:
+            continue
+        if isinstance(payload, dict) and payload.get("type") == "keyframe":
+            subscriber.waiting_for_keyframe = True
+            encoder = video_hub.encoders.get(subscriber.cam_key)
+            if encoder is not None:
+                encoder.request_keyframe()
+
+@app.websocket("/ws/video/{camera}")
+async def websocket_video(websocket: WebSocket, camera: str):
+    """카메라 하나의 H.264 Annex-B 스트림 (video_stream.py 의 binary framing). 처음 받는 packet은 항상 keyframe"""
+    await websocket.accept()
+    if not VIDEO_AVAILABLE or camera not in SHM_CONFIG or "depth" in camera:
+        reason = "video streaming needs PyAV (pip install av)" if not VIDEO_AVAILABLE else f"unknown or unsupported camera: {camera}"
+        await websocket.send_text(json.dumps({"type": "error", "message": reason}))
+        await websocket.close(code=1011 if not VIDEO_AVAILABLE else 1008)
+        return
+    try:
+        subscriber = video_hub.subscribe(websocket, camera)
+    except Exception as e:
+        log_error(f"Failed to start H.264 encoder for {camera}: {e}")
+        await websocket.send_text(json.dumps({"type": "error", "message": f"encoder failed: {e}"}))
+        await websocket.close(code=1011)
+        return
+    WS_CLIENTS.labels("/ws/video").inc()
+    encoder = video_hub.encoders[camera]
+    config = SHM_CONFIG[camera]
+    log_info(f"Client {websocket.client} connected to /ws/video/{camera}")
+    tasks = []
+    try:
+        await _ws_send_text(websocket, "/ws/video", json.dumps({
+            "type": "config", "camera": camera, "format": "h264-annexb", "width": encoder.width, "height": encoder.height,
+            "fps": VIDEO_STREAM_FPS, "bitrate": config.get("video_bitrate", VIDEO_STREAM_BITRATE),
+            "keyframe_interval": config.get("video_keyframe_interval", VIDEO_KEYFRAME_INTERVAL),
+        }))
+        tasks = [
+            asyncio.create_task(_video_send_loop(subscriber)),
+            asyncio.create_task(_video_recv_loop(subscriber)),
+        ]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is not None:
+                log_warn(f"/ws/video WebSocket connection closed for {websocket.client}: {task.exception()}")
+    except Exception as e:
+        log_warn(f"/ws/video/{camera} error for {websocket.client}: {e}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        video_hub.unsubscribe(subscriber)
+        WS_CLIENTS.labels("/ws/video").dec()
+        log_info(f"Client {websocket.client} disconnected from /ws/video/{camera} (dropped packets: {subscriber.dropped_packets})")
 
 
 # New WebSocket endpoint for the teleoperation bridge (from server_node.py)
-async def ros_teleop_bridge_send_loop(websocket: WebSocket):
-    """Periodically sends slave_bridge_data to the WebSocket client."""
-    log_info(f"ROS Teleop Bridge Send Loop started for {websocket.client}")
+async def ros_teleop_bridge_send_loop(websocket: WebSocket, binary_mode: bool = False):
+    """Sends slave_bridge_data to the WebSocket client whenever /slave_info updates it."""
+    # /slave_info가 들어오면 바로 전송 (최대 ?max_hz=, 기본 TELEOP_BRIDGE_MAX_RATE_HZ). 조용할 때는 heartbeat 주기로 재전송
+    min_interval = _client_min_send_interval(websocket, TELEOP_BRIDGE_MAX_RATE_HZ)
+    log_info(f"ROS Teleop Bridge Send Loop started for {websocket.client} (max {1.0 / min_interval:.0f} Hz)")
+    seen_version = slave_bridge_notifier.version
     while True: # Loop will be broken by gather if websocket closes or rclpy not ok
         if not rclpy.ok(): 
             log_warn("RCLPY not OK in ros_teleop_bridge_send_loop. Breaking.")
             break
-        payload_dict = {}
-        with slave_bridge_data_lock:
-            payload_dict = slave_bridge_data.copy() # Make a shallow copy
+        snapshot = slave_bridge_data # 불변 snapshot: lock/복사 없이 그대로 보냄
         
         try:
-            await websocket.send_json(payload_dict)
+            if binary_mode:
+                await _ws_send_bytes(websocket, "/ws/ros_teleop_bridge", snapshot.frame())
+            else:
+                await _ws_send_json(websocket, "/ws/ros_teleop_bridge", snapshot.payload())
             # log_debug(f"Sent to /ws/ros_teleop_bridge: {payload_dict['stamp']}")
         except Exception as e:
             log_warn(f"Error in ros_teleop_bridge_send_loop for {websocket.client}: {e}. Breaking.")
             break
-        await asyncio.sleep(0.01) # 100Hz, as in original server_node.py
+        last_send_at = time.monotonic()
+        seen_version = await slave_bridge_notifier.wait_for_change(seen_version, TELEMETRY_HEARTBEAT_S)
+        await _wait_send_slot(last_send_at, min_interval)
     log_info(f"ROS Teleop Bridge Send Loop stopped for {websocket.client}")
 
 ### Slave에게 Master 명령 전달 ###(마)
+async def _ros_teleop_bridge_reader(websocket: WebSocket, gate: TeleopCommandGate):
+    """websocket 메시지를 계속 받아 gate에 최신 것만 남긴다 (파싱은 publish할 명령만)"""
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                log_info(f"Client {websocket.client} closed /ws/ros_teleop_bridge connection.")
+                break
+            gate.offer(message)
+    except Exception as e:
+        log_warn(f"Error receiving on /ws/ros_teleop_bridge for {websocket.client}: {e}")
+    finally:
+        gate.close()
+
 async def ros_teleop_bridge_recv_loop(websocket: WebSocket):
-    """Receives master commands from WebSocket and publishes to /master_info."""
+    """Receives master commands from WebSocket and publishes the newest one to /master_info.
+    JSON text와 binary frame(teleop_codec) 둘 다 받는다 (보내는 형식만 연결 시 ?format=으로 정함)"""
     log_info(f"ROS Teleop Bridge Recv Loop started for {websocket.client}")
-    while True: # Loop will be broken by gather if websocket closes or rclpy not ok
-        if not rclpy.ok():
-            log_warn("RCLPY not OK in ros_teleop_bridge_recv_loop. Breaking.")
-            break
-        if not ros2_node or not ros2_node.master_info_bridge_pub:
-            log_warn("ROS node or master_info_bridge_pub not available yet. Retrying...")
-            await asyncio.sleep(0.1)
-            continue
-            
-        try:
-            text = await websocket.receive_text()
-            data = json.loads(text)
-            # log_debug(f"Received from /ws/ros_teleop_bridge: {data.get('stamp')}")
-
-            msg = ControlValue()
-            msg.stamp = data.get("stamp", 0.0) # Provide default for stamp
-
-            rv_data = data.get("RobotarmValue", {})
-            msg.robotarm_state = RobotarmValue(
-                position=np.array(rv_data.get("position", [0.0, 0.0, 90.0, 90.0, 90.0, 90.0]), dtype=np.float64).tolist(),
-                velocity=np.array(rv_data.get("velocity", [0.0]*6), dtype=np.float64).tolist(),
-                force=np.array(rv_data.get("force", [0.0]*6), dtype=np.float64).tolist()
-            )
+    gate = TeleopCommandGate()
+    reader_task = asyncio.create_task(_ros_teleop_bridge_reader(websocket, gate))
+    # 연결마다 record와 ROS 메시지를 하나씩 만들어 두고 매 메시지 덮어씀 (publish는 즉시 직렬화하므로 재사용 가능)
+    record = ControlValueRecord()
+    msg = ControlValue()
+    try:
+        while True: # Loop will be broken by gather if websocket closes or rclpy not ok
+            if not rclpy.ok():
+                log_warn("RCLPY not OK in ros_teleop_bridge_recv_loop. Breaking.")
+                break
+            if not ros2_node or not ros2_node.master_info_bridge_pub:
+                log_warn("ROS node or master_info_bridge_pub not available yet. Retrying...")
+                await asyncio.sleep(0.1)
+                continue
 
-            gv_data = data.get("GripperValue", {})
-            msg.gripper_state = GripperValue(
-                position=float(gv_data.get("position", 0.0)),
-                velocity=float(gv_data.get("velocity", 0.0)),
-                force=float(gv_data.get("force", 0.0))
-            )
+            await gate.ready.wait()
+            # 이미 도착해 있는 메시지를 reader가 마저 꺼내도록 한 번 양보 -> 그중 마지막 것만 publish
+            await asyncio.sleep(0)
+            pending = gate.take()
+            if pending is None:
+                if gate.closed:
+                    break
+                continue
+            message, received_at = pending
 
-            mv_data = data.get("MobileValue", {})
-            msg.mobile_state = MobileValue(
-                linear_accel=float(mv_data.get("linear_accel", 0.0)),
-                linear_brake=float(mv_data.get("linear_brake", 0.0)),
-                steer=float(mv_data.get("steer", 0.0)),
-                gear=bool(mv_data.get("gear", True))
-            )
-            
-            ros2_node.master_info_bridge_pub.publish(msg)
+            try:
+                if message.get("bytes") is not None:
+                    _, values = unpack_teleop_frame(message["bytes"])
+                    record.load_values(values)
+                else:
+                    data = json.loads(message["text"])
+                    # log_debug(f"Received from /ws/ros_teleop_bridge: {data.get('stamp')}")
+                    record.load_json(data)
+            except (ValueError, TypeError, AttributeError) as e:
+                gate.reject_invalid()
+                log_warn(f"Invalid teleop command from {websocket.client}: {e}")
+                continue
 
-            with sensor_data_lock:
-                sensor_data["master_joint_angles"] = list(msg.robotarm_state.position)
-                sensor_data["accel"] = msg.mobile_state.linear_accel*100
-                sensor_data["brake"] = msg.mobile_state.linear_brake*100
-                sensor_data["angle"] = msg.mobile_state.steer*90 # 임시로 angle에 각속도 저장(태은)
-                
-                sensor_data["gear_status"] = "전진" if msg.mobile_state.linear_accel > 0 else "후진" if msg.mobile_state.linear_accel < 0 else "중립"
-            await asyncio.sleep(0) # Yield control, effectively processing messages as fast as they come
-
-        except websockets.exceptions.ConnectionClosedOK:
-            log_info(f"Client {websocket.client} closed /ws/ros_teleop_bridge connection gracefully.")
-            break
-        except Exception as e:
-            log_warn(f"Error in ros_teleop_bridge_recv_loop for {websocket.client}: {e}. Breaking.")
-            # Consider if other exceptions should also break or be handled differently
-            break
-    log_info(f"ROS Teleop Bridge Recv Loop stopped for {websocket.client}")
+            if not gate.check(record.stamp, received_at):
+                continue
+
+            record.fill_ros(msg)
+            ros2_node.master_info_bridge_pub.publish(msg)
+            gate.mark_published(record.stamp)
+
+            linear_accel, linear_brake, steer = record.mobile
+            _update_sensor_data_from_loop({
+                "master_joint_angles": tuple(record.arm_position),
+                "accel": linear_accel*100,
+                "brake": linear_brake*100,
+                "angle": steer*90, # 임시로 angle에 각속도 저장(태은)
+                "gear_status": "전진" if linear_accel > 0 else "후진" if linear_accel < 0 else "중립",
+            })
+    except Exception as e:
+        log_warn(f"Error in ros_teleop_bridge_recv_loop for {websocket.client}: {e}. Breaking.")
+    finally:
+        reader_task.cancel()
+        log_info(f"ROS Teleop Bridge Recv Loop stopped for {websocket.client} (commands: {gate.stats})")
 
 
 @app.websocket("/ws/ros_teleop_bridge")
 async def websocket_ros_teleop_bridge(websocket: WebSocket):
     await websocket.accept()
-    log_info(f"Client {websocket.client} connected to /ws/ros_teleop_bridge")
+    # ?format=binary: slave -> master를 teleop_codec binary frame으로 보냄 (기본은 기존 JSON)
+    binary_mode = websocket.query_params.get("format", "json").lower() == "binary"
+    log_info(f"Client {websocket.client} connected to /ws/ros_teleop_bridge ({'binary' if binary_mode else 'json'})")
+    WS_CLIENTS.labels("/ws/ros_teleop_bridge").inc()
     try:
         # Run send and receive loops concurrently
         await asyncio.gather(
-            ros_teleop_bridge_send_loop(websocket),
+            ros_teleop_bridge_send_loop(websocket, binary_mode),
             ros_teleop_bridge_recv_loop(websocket),
         )
     except Exception as e:
@@ -761,6 +2619,7 @@ async def websocket_ros_teleop_bridge(websocket: WebSocket):
         # that isn't a normal closure.
         log_error(f"Exception in /ws/ros_teleop_bridge handler for {websocket.client}: {e}")
     finally:
+        WS_CLIENTS.labels("/ws/ros_teleop_bridge").dec()
         log_info(f"Client {websocket.client} disconnected from /ws/ros_teleop_bridge")
 
 
@@ -768,6 +2627,13 @@ async def websocket_ros_teleop_bridge(websocket: WebSocket):
 @app.on_event("startup")
 async def startup_event():
     log_info("FastAPI application startup initiated.")
+    _load_launch_config()
+    # /ws/image fan-out은 FastAPI event loop에서 실행 (encoder 스레드가 call_soon_threadsafe로 깨움)
+    image_hub.bind_loop(asyncio.get_running_loop())
+    video_hub.bind_loop(asyncio.get_running_loop())
+    # telemetry도 ROS 콜백이 같은 loop를 깨워서 변경 즉시 전송
+    sensor_data_notifier.bind_loop(asyncio.get_running_loop())
+    slave_bridge_notifier.bind_loop(asyncio.get_running_loop())
     # Initialize RCLPY globally once before starting any ROS-dependent threads
     if not rclpy.ok():
         try:
@@ -780,6 +2646,13 @@ async def startup_event():
             log_error("ROS functionalities will likely fail.")
             # return # Optionally prevent threads from starting if rclpy init fails
 
+    if ENABLE_DATASET_RECORDER:
+        _start_dataset_recorder()
+
+    # replay 모드: SHM 세그먼트를 encoder 스레드가 attach하기 전에 만듦 (실패하면 서버를 띄우지 않음)
+    if REPLAY_EPISODE is not None:
+        _start_replay()
+
     # Start ROS 2 node spinning in a separate thread
     ros_thread = threading.Thread(target=ros2_thread_spin, daemon=True)
     ros_thread.start()
@@ -805,11 +2678,20 @@ async def shutdown_event():
     log_info("FastAPI application shutting down...")
     
     # Signal image processing loop to stop (if it's waiting on this event)
+    encoder_stop.set()
     image_signal_event.set() 
 
+    # 녹화 중이면 버림 (sampling 스레드가 SHM을 읽지 않도록 SHM 정리 전에)
+    if dataset_recorder is not None:
+        dataset_recorder.shutdown()
+
+    sensor_data_update_pool.shutdown(wait=False)
+
     # Cleanup SHM
     _cleanup_shared_memory()
     log_info("Shared memory cleaned up.")
+    if REPLAY_EPISODE is not None:
+        _stop_replay()
 
     # Shutdown ROS 2
     if rclpy.ok():
@@ -826,7 +2708,23 @@ async def shutdown_event():
 
 # --- Main Execution Block (for running with Uvicorn) ---
 if __name__ == "__main__":
+    import argparse
     import uvicorn
+
+    parser = argparse.ArgumentParser(description="MOMAD web GUI server")
+    parser.add_argument("--replay", metavar="EPISODE_DIR", help="replay a recorded episode instead of live ROS/SHM sources")
+    parser.add_argument("--speed", default=str(REPLAY_SPEED), help="replay speed: 1 = real time, N = N x, max = no pacing")
+    parser.add_argument("--loop", action="store_true", help="restart the episode when it ends")
+    parser.add_argument("--record", action="store_true", help="record episodes in this server (stop the external recorder node first)")
+    args = parser.parse_args()
+    # uvicorn으로 띄울 때와 같은 경로로 적용되도록 환경 변수로 넘김 (startup_event의 _load_launch_config)
+    if args.record:
+        os.environ[LAUNCH_ENV["record"]] = "1"
+    if args.replay:
+        os.environ[LAUNCH_ENV["replay"]] = args.replay
+        os.environ[LAUNCH_ENV["speed"]] = args.speed
+        if args.loop:
+            os.environ[LAUNCH_ENV["loop"]] = "1"
     # Note: rclpy.init() is called in startup_event
     # It's generally better to initialize rclpy once, as early as possible,
     # but before any rclpy operations. Startup event is a good place.